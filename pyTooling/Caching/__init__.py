@@ -0,0 +1,783 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____           _     _                                                 #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  / ___|__ _  ___| |__ (_)_ __   __ _                                     #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` || |   / _` |/ __| '_ \| | '_ \ / _` |                                    #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| || |__| (_| | (__| | | | | | | | (_| |                                    #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____\__,_|\___|_| |_|_|_| |_|\__, |                                    #
+# |_|    |___/                          |___/                                |___/                                     #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Bounded caches (LRU, LFU, TTL) built on :mod:`pyTooling.LinkedList` and a memoization decorator.
+
+.. hint::
+
+   See :ref:`high-level help <COMMON/Caching>` for explanations and usage examples.
+"""
+from functools import wraps
+from threading import Lock
+from time      import monotonic
+from typing    import Generic, TypeVar, Optional as Nullable, Callable, Dict, Type, Any
+
+from pyTooling.Decorators  import readonly, export
+from pyTooling.MetaClasses import ExtendedType, abstractmethod
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.LinkedList  import Node, LinkedList
+
+
+_CacheKey =   TypeVar("_CacheKey")
+_CacheValue = TypeVar("_CacheValue")
+
+_MISSING =     object()  #: Sentinel to distinguish a cache miss from a cached ``None`` value.
+_KWARGS_MARK = object()  #: Separator between positional and keyword arguments in a memoization key.
+
+
+@export
+class CacheStatistics(metaclass=ExtendedType, slots=True):
+	"""
+	Hit, miss, eviction and expiration counters of a cache.
+	"""
+
+	_hits:        int  #: Number of lookups served from the cache.
+	_misses:      int  #: Number of lookups not served from the cache.
+	_evictions:   int  #: Number of entries removed to make room for new entries.
+	_expirations: int  #: Number of entries removed, because their time-to-live elapsed.
+
+	def __init__(self) -> None:
+		"""
+		Initialize all counters with zero.
+		"""
+		self.Reset()
+
+	@readonly
+	def Hits(self) -> int:
+		"""
+		Read-only property to access the number of cache hits.
+
+		:return: Number of lookups served from the cache.
+		"""
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		"""
+		Read-only property to access the number of cache misses.
+
+		:return: Number of lookups not served from the cache.
+		"""
+		return self._misses
+
+	@readonly
+	def Evictions(self) -> int:
+		"""
+		Read-only property to access the number of evicted entries.
+
+		:return: Number of entries removed to make room for new entries.
+		"""
+		return self._evictions
+
+	@readonly
+	def Expirations(self) -> int:
+		"""
+		Read-only property to access the number of expired entries.
+
+		:return: Number of entries removed, because their time-to-live elapsed.
+		"""
+		return self._expirations
+
+	@readonly
+	def Lookups(self) -> int:
+		"""
+		Read-only property to access the number of lookups.
+
+		:return: Sum of hits and misses.
+		"""
+		return self._hits + self._misses
+
+	@readonly
+	def HitRatio(self) -> float:
+		"""
+		Read-only property to access the ratio of hits to lookups.
+
+		:return: Hit ratio in range ``[0.0, 1.0]``. If no lookup was done yet, ``0.0`` is returned.
+		"""
+		lookups = self._hits + self._misses
+		return self._hits / lookups if lookups > 0 else 0.0
+
+	def Reset(self) -> None:
+		"""
+		Reset all counters to zero.
+		"""
+		self._hits = 0
+		self._misses = 0
+		self._evictions = 0
+		self._expirations = 0
+
+	def __str__(self) -> str:
+		return f"hits={self._hits}, misses={self._misses}, evictions={self._evictions}, expirations={self._expirations}"
+
+
+@export
+class Cache(Generic[_CacheKey, _CacheValue], metaclass=ExtendedType, slots=True):
+	"""
+	Abstract base-class of all bounded caches.
+
+	A cache stores up to :attr:`MaxSize` entries. When a new entry is stored into a full cache, an entry is evicted
+	according to the cache's replacement policy. Lookups, evictions and expirations are counted in :attr:`Statistics`.
+
+	If the cache is created with ``threadSafe=True``, all public operations are serialized by a lock.
+
+	.. hint::
+
+	   ``None`` can't be used as a cache key, because :class:`~pyTooling.LinkedList.Node` uses the node's value as a key,
+	   if no key is given.
+	"""
+
+	_maxSize:    int              #: Maximum number of entries.
+	_statistics: CacheStatistics  #: Hit/miss/eviction/expiration counters.
+	_lock:       Nullable[Lock]   #: Optional lock to serialize concurrent accesses.
+
+	def __init__(self, maxSize: int, threadSafe: bool = False) -> None:
+		"""
+		Initialize a cache.
+
+		:param maxSize:     Maximum number of entries.
+		:param threadSafe:  If true, all public operations are serialized by a lock.
+		:raises TypeError:  If parameter 'maxSize' is not of type :class:`int`.
+		:raises ValueError: If parameter 'maxSize' is less than 1.
+		"""
+		if not isinstance(maxSize, int):
+			ex = TypeError(f"Parameter 'maxSize' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(maxSize)}'.")
+			raise ex
+		elif maxSize < 1:
+			raise ValueError(f"Parameter 'maxSize' must be greater than 0.")
+
+		self._maxSize = maxSize
+		self._statistics = CacheStatistics()
+		self._lock = Lock() if threadSafe else None
+
+	@readonly
+	def MaxSize(self) -> int:
+		"""
+		Read-only property to access the maximum number of entries.
+
+		:return: Maximum number of entries.
+		"""
+		return self._maxSize
+
+	@readonly
+	def Count(self) -> int:
+		"""
+		Read-only property to access the number of entries.
+
+		:return: Number of entries in the cache.
+		"""
+		return self._Count()
+
+	@readonly
+	def Statistics(self) -> CacheStatistics:
+		"""
+		Read-only property to access the cache's statistics.
+
+		:return: Hit/miss/eviction/expiration counters.
+		"""
+		return self._statistics
+
+	@readonly
+	def IsThreadSafe(self) -> bool:
+		"""
+		Read-only property to check if the cache serializes concurrent accesses.
+
+		:return: ``True``, if the cache was created with ``threadSafe=True``.
+		"""
+		return self._lock is not None
+
+	@abstractmethod
+	def _Lookup(self, key: _CacheKey, default: Any) -> Any:
+		"""
+		Lookup a key and update the replacement policy and statistics.
+
+		:meta private:
+		:param key:     Key to lookup.
+		:param default: Value to return, if the key isn't cached.
+		:return:        Cached value or ``default``.
+		"""
+
+	@abstractmethod
+	def _Store(self, key: _CacheKey, value: _CacheValue) -> None:
+		"""
+		Store a value and evict an entry if the cache is full.
+
+		:meta private:
+		:param key:   Key to store.
+		:param value: Value to store.
+		"""
+
+	@abstractmethod
+	def _Discard(self, key: _CacheKey) -> _CacheValue:
+		"""
+		Remove an entry.
+
+		:meta private:
+		:param key:       Key to remove.
+		:return:          Removed value.
+		:raises KeyError: If the key isn't cached.
+		"""
+
+	@abstractmethod
+	def _Contains(self, key: _CacheKey) -> bool:
+		"""
+		Check if a key is cached without updating the replacement policy and statistics.
+
+		:meta private:
+		:param key: Key to check.
+		:return:    ``True``, if the key is cached.
+		"""
+
+	@abstractmethod
+	def _Count(self) -> int:
+		"""
+		Return the number of entries.
+
+		:meta private:
+		:return: Number of entries.
+		"""
+
+	@abstractmethod
+	def _Clear(self) -> None:
+		"""
+		Remove all entries.
+
+		:meta private:
+		"""
+
+	def Get(self, key: _CacheKey, default: Any = None) -> Any:
+		"""
+		Lookup a value by key.
+
+		A hit updates the replacement policy (e.g. the entry becomes the most recently used entry).
+
+		:param key:     Key to lookup.
+		:param default: Value to return, if the key isn't cached.
+		:return:        Cached value or ``default``.
+		"""
+		if self._lock is None:
+			return self._Lookup(key, default)
+
+		with self._lock:
+			return self._Lookup(key, default)
+
+	def Set(self, key: _CacheKey, value: _CacheValue) -> None:
+		"""
+		Store a value by key.
+
+		If the key is already cached, its value is replaced. Otherwise, an entry is evicted if the cache is full.
+
+		:param key:         Key to store.
+		:param value:       Value to store.
+		:raises ValueError: If parameter 'key' is ``None``.
+		"""
+		if key is None:
+			raise ValueError(f"Parameter 'key' is None.")
+
+		if self._lock is None:
+			self._Store(key, value)
+		else:
+			with self._lock:
+				self._Store(key, value)
+
+	def Remove(self, key: _CacheKey) -> _CacheValue:
+		"""
+		Remove an entry by key.
+
+		:param key:       Key to remove.
+		:return:          Removed value.
+		:raises KeyError: If the key isn't cached.
+		"""
+		if self._lock is None:
+			return self._Discard(key)
+
+		with self._lock:
+			return self._Discard(key)
+
+	def Clear(self) -> None:
+		"""
+		Remove all entries.
+
+		The statistics are not reset.
+		"""
+		if self._lock is None:
+			self._Clear()
+		else:
+			with self._lock:
+				self._Clear()
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of entries.
+
+		:returns: Number of entries in the cache.
+		"""
+		return self._Count()
+
+	def __contains__(self, key: _CacheKey) -> bool:
+		"""
+		Checks if a key is cached.
+
+		In contrast to :meth:`Get`, neither the replacement policy nor the statistics are updated.
+
+		:param key: Key to check.
+		:returns:   ``True``, if the key is cached.
+		"""
+		if self._lock is None:
+			return self._Contains(key)
+
+		with self._lock:
+			return self._Contains(key)
+
+	def __getitem__(self, key: _CacheKey) -> _CacheValue:
+		"""
+		Lookup a value by key.
+
+		:param key:       Key to lookup.
+		:returns:         Cached value.
+		:raises KeyError: If the key isn't cached.
+		"""
+		if (value := self.Get(key, _MISSING)) is _MISSING:
+			raise KeyError(key)
+
+		return value
+
+	def __setitem__(self, key: _CacheKey, value: _CacheValue) -> None:
+		"""
+		Store a value by key.
+
+		:param key:   Key to store.
+		:param value: Value to store.
+		"""
+		self.Set(key, value)
+
+	def __delitem__(self, key: _CacheKey) -> None:
+		"""
+		Remove an entry by key.
+
+		:param key:       Key to remove.
+		:raises KeyError: If the key isn't cached.
+		"""
+		self.Remove(key)
+
+
+@export
+class LRUCache(Cache[_CacheKey, _CacheValue]):
+	"""
+	A cache evicting the *least recently used* entry.
+
+	Entries are stored in a :class:`~pyTooling.LinkedList.LinkedList` with key index ordered from least to most recently
+	used entry. A hit moves the entry to the end of the list, an eviction removes the first node. All operations are
+	:math:`O(1)`.
+	"""
+
+	_entries: LinkedList[_CacheKey, _CacheValue]  #: Entries ordered from least to most recently used.
+
+	def __init__(self, maxSize: int, threadSafe: bool = False) -> None:
+		"""
+		Initialize an LRU cache.
+
+		:param maxSize:    Maximum number of entries.
+		:param threadSafe: If true, all public operations are serialized by a lock.
+		"""
+		super().__init__(maxSize, threadSafe)
+
+		self._entries = LinkedList(keyIndex=True)
+
+	def _Lookup(self, key: _CacheKey, default: Any) -> Any:
+		try:
+			node = self._entries.MoveToBack(key)
+		except KeyError:
+			self._statistics._misses += 1
+			return default
+
+		self._statistics._hits += 1
+		return node.Value
+
+	def _Store(self, key: _CacheKey, value: _CacheValue) -> None:
+		try:
+			node = self._entries.MoveToBack(key)
+		except KeyError:
+			if self._entries.Count >= self._maxSize:
+				self._entries.RemoveFirst()
+				self._statistics._evictions += 1
+
+			self._entries.InsertAfterLast(Node(value, key))
+		else:
+			node.Value = value
+
+	def _Discard(self, key: _CacheKey) -> _CacheValue:
+		return self._entries.RemoveByKey(key).Value
+
+	def _Contains(self, key: _CacheKey) -> bool:
+		return key in self._entries
+
+	def _Count(self) -> int:
+		return self._entries.Count
+
+	def _Clear(self) -> None:
+		self._entries.Clear()
+
+
+@export
+class LFUCache(Cache[_CacheKey, _CacheValue]):
+	"""
+	A cache evicting the *least frequently used* entry.
+
+	Entries are grouped into frequency buckets. The buckets are nodes in a :class:`~pyTooling.LinkedList.LinkedList`
+	ordered by ascending use count (node key). Each bucket's value is a :class:`~pyTooling.LinkedList.LinkedList` with
+	key index holding the entries with that use count, ordered from least to most recently used. A hit moves an entry
+	into the neighbouring bucket, an eviction removes the first entry of the first bucket, so ties are broken by recency.
+	All operations are :math:`O(1)`.
+	"""
+
+	_buckets:     LinkedList[int, LinkedList[_CacheKey, _CacheValue]]  #: Frequency buckets ordered by ascending use count.
+	_bucketOfKey: Dict[_CacheKey, Node[int, LinkedList]]              #: Mapping from key to the bucket holding the entry.
+
+	def __init__(self, maxSize: int, threadSafe: bool = False) -> None:
+		"""
+		Initialize an LFU cache.
+
+		:param maxSize:    Maximum number of entries.
+		:param threadSafe: If true, all public operations are serialized by a lock.
+		"""
+		super().__init__(maxSize, threadSafe)
+
+		self._buckets = LinkedList()
+		self._bucketOfKey = {}
+
+	def _Promote(self, key: _CacheKey, bucket: Node[int, LinkedList]) -> Node[_CacheKey, _CacheValue]:
+		"""
+		Increment the use count of an entry by moving it into the next frequency bucket.
+
+		:meta private:
+		:param key:    Key of the entry.
+		:param bucket: Bucket currently holding the entry.
+		:return:       Node of the entry.
+		"""
+		entries = bucket.Value
+		frequency = bucket.Key + 1
+		nextBucket = bucket.NextNode
+
+		# A bucket holding only this entry can be reused, if no bucket for the next use count exists.
+		if entries.Count == 1 and (nextBucket is None or nextBucket.Key != frequency):
+			bucket.Key = frequency
+			return entries.FirstNode
+
+		node = entries.RemoveByKey(key)
+		if nextBucket is None or nextBucket.Key != frequency:
+			nextBucket = Node(LinkedList(keyIndex=True), frequency)
+			bucket.InsertNodeAfter(nextBucket)
+
+		nextBucket.Value.InsertAfterLast(node)
+		self._bucketOfKey[key] = nextBucket
+
+		if entries.IsEmpty:
+			bucket.Remove()
+
+		return node
+
+	def _Lookup(self, key: _CacheKey, default: Any) -> Any:
+		if (bucket := self._bucketOfKey.get(key)) is None:
+			self._statistics._misses += 1
+			return default
+
+		self._statistics._hits += 1
+		return self._Promote(key, bucket).Value
+
+	def _Store(self, key: _CacheKey, value: _CacheValue) -> None:
+		if (bucket := self._bucketOfKey.get(key)) is not None:
+			self._Promote(key, bucket).Value = value
+			return
+
+		if len(self._bucketOfKey) >= self._maxSize:
+			bucket = self._buckets.FirstNode
+			victim = bucket.Value.RemoveFirst()
+			del self._bucketOfKey[victim.Key]
+			if bucket.Value.IsEmpty:
+				self._buckets.RemoveFirst()
+
+			self._statistics._evictions += 1
+
+		bucket = self._buckets.FirstNode
+		if bucket is None or bucket.Key != 1:
+			bucket = Node(LinkedList(keyIndex=True), 1)
+			self._buckets.InsertBeforeFirst(bucket)
+
+		bucket.Value.InsertAfterLast(Node(value, key))
+		self._bucketOfKey[key] = bucket
+
+	def _Discard(self, key: _CacheKey) -> _CacheValue:
+		bucket = self._bucketOfKey.pop(key)
+		node = bucket.Value.RemoveByKey(key)
+		if bucket.Value.IsEmpty:
+			bucket.Remove()
+
+		return node.Value
+
+	def _Contains(self, key: _CacheKey) -> bool:
+		return key in self._bucketOfKey
+
+	def _Count(self) -> int:
+		return len(self._bucketOfKey)
+
+	def _Clear(self) -> None:
+		self._buckets.Clear()
+		self._bucketOfKey = {}
+
+	def GetFrequency(self, key: _CacheKey) -> int:
+		"""
+		Return the use count of an entry.
+
+		Storing an entry counts as first use. Neither the replacement policy nor the statistics are updated.
+
+		:param key:       Key of the entry.
+		:return:          Number of uses.
+		:raises KeyError: If the key isn't cached.
+		"""
+		return self._bucketOfKey[key].Key
+
+
+@export
+class TTLCache(Cache[_CacheKey, _CacheValue]):
+	"""
+	A cache whose entries expire after a *time-to-live*.
+
+	Entries are stored in a :class:`~pyTooling.LinkedList.LinkedList` with key index ordered by expiration time. Because
+	all entries share the same time-to-live, storing an entry appends it at the end of the list and expired entries are
+	always at the beginning of the list. Expired entries are purged when new entries are stored, when they are looked up
+	and when :meth:`Expire` is called. If the cache is full, the entry expiring next is evicted.
+	"""
+
+	_ttl:     float                                #: Time-to-live of an entry in seconds.
+	_timer:   Callable[[], float]                  #: Clock used to compute expiration times.
+	_entries: LinkedList[_CacheKey, tuple]          #: Entries as ``(value, expiration)`` ordered by expiration time.
+
+	def __init__(self, maxSize: int, ttl: float, threadSafe: bool = False, timer: Callable[[], float] = monotonic) -> None:
+		"""
+		Initialize a TTL cache.
+
+		:param maxSize:     Maximum number of entries.
+		:param ttl:         Time-to-live of an entry in seconds.
+		:param threadSafe:  If true, all public operations are serialized by a lock.
+		:param timer:       Clock returning the current time in seconds. Default: :func:`time.monotonic`.
+		:raises TypeError:  If parameter 'ttl' is not of type :class:`int` or :class:`float`.
+		:raises ValueError: If parameter 'ttl' is not greater than 0.
+		"""
+		super().__init__(maxSize, threadSafe)
+
+		if not isinstance(ttl, (int, float)):
+			ex = TypeError(f"Parameter 'ttl' is not of type 'int' or 'float'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(ttl)}'.")
+			raise ex
+		elif ttl <= 0:
+			raise ValueError(f"Parameter 'ttl' must be greater than 0.")
+
+		self._ttl = ttl
+		self._timer = timer
+		self._entries = LinkedList(keyIndex=True)
+
+	@readonly
+	def TTL(self) -> float:
+		"""
+		Read-only property to access the time-to-live of entries.
+
+		:return: Time-to-live in seconds.
+		"""
+		return self._ttl
+
+	def _Purge(self, now: float) -> int:
+		"""
+		Remove all entries expired at the given point in time.
+
+		:meta private:
+		:param now: Current time.
+		:return:    Number of removed entries.
+		"""
+		count = 0
+		while (node := self._entries.FirstNode) is not None and node.Value[1] <= now:
+			self._entries.RemoveFirst()
+			count += 1
+
+		self._statistics._expirations += count
+		return count
+
+	def _Lookup(self, key: _CacheKey, default: Any) -> Any:
+		try:
+			node = self._entries.GetNodeByKey(key)
+		except KeyError:
+			self._statistics._misses += 1
+			return default
+
+		value, expiration = node.Value
+		if expiration <= self._timer():
+			node.Remove()
+			self._statistics._expirations += 1
+			self._statistics._misses += 1
+			return default
+
+		self._statistics._hits += 1
+		return value
+
+	def _Store(self, key: _CacheKey, value: _CacheValue) -> None:
+		now = self._timer()
+		self._Purge(now)
+
+		# A stored entry gets a new expiration time, thus it's moved to the end of the list.
+		try:
+			node = self._entries.MoveToBack(key)
+		except KeyError:
+			if self._entries.Count >= self._maxSize:
+				self._entries.RemoveFirst()
+				self._statistics._evictions += 1
+
+			self._entries.InsertAfterLast(Node((value, now + self._ttl), key))
+		else:
+			node.Value = (value, now + self._ttl)
+
+	def _Discard(self, key: _CacheKey) -> _CacheValue:
+		return self._entries.RemoveByKey(key).Value[0]
+
+	def _Contains(self, key: _CacheKey) -> bool:
+		try:
+			node = self._entries.GetNodeByKey(key)
+		except KeyError:
+			return False
+
+		return node.Value[1] > self._timer()
+
+	def _Count(self) -> int:
+		return self._entries.Count
+
+	def _Clear(self) -> None:
+		self._entries.Clear()
+
+	def Expire(self) -> int:
+		"""
+		Remove all expired entries.
+
+		:attr:`Count` includes expired entries, which haven't been purged yet.
+
+		:return: Number of removed entries.
+		"""
+		if self._lock is None:
+			return self._Purge(self._timer())
+
+		with self._lock:
+			return self._Purge(self._timer())
+
+
+def _MakeKey(args: tuple, kwargs: Dict[str, Any], typed: bool = False) -> Any:
+	"""
+	Create a hashable memoization key from a call's arguments.
+
+	:param args:   Positional arguments.
+	:param kwargs: Keyword arguments.
+	:param typed:  If true, the arguments' types are part of the key.
+	:return:       Memoization key.
+	"""
+	key = args
+	if kwargs:
+		key += (_KWARGS_MARK, ) + tuple(kwargs.items())
+
+	if typed:
+		key += tuple(type(value) for value in args)
+		if kwargs:
+			key += tuple(type(value) for value in kwargs.values())
+	elif len(key) == 1 and type(key[0]) in (int, str):
+		return key[0]
+
+	return key
+
+
+@export
+def cached(
+	maxSize:    int = 128,
+	ttl:        Nullable[float] = None,
+	policy:     Nullable[Type[Cache]] = None,
+	threadSafe: bool = True,
+	typed:      bool = False
+) -> Callable[[Callable], Callable]:
+	"""
+	Memoize a function's or method's results in a bounded cache.
+
+	The cache key is built from the positional and keyword arguments, thus all arguments must be hashable. When
+	decorating a method, ``self`` is part of the key. Each decorated function gets its own cache, even if one decorator
+	object is applied to multiple functions. The cache instance is accessible as ``<function>.__cache__``, e.g. to read
+	its :attr:`~Cache.Statistics` or to clear it.
+
+	.. admonition:: ``example.py``
+
+	   .. code-block:: python
+
+	      @cached(maxSize=256, ttl=60.0)
+	      def resolve(name: str) -> str:
+	        ...
+
+	      resolve("localhost")
+	      print(resolve.__cache__.Statistics)
+
+	:param maxSize:     Maximum number of cached results.
+	:param ttl:         Optional time-to-live of a cached result in seconds.
+	:param policy:      Cache class implementing the replacement policy. |br|
+	                    Default: :class:`LRUCache`, or :class:`TTLCache` if ``ttl`` is given.
+	:param threadSafe:  If true, cache accesses are serialized by a lock. The decorated function itself is called
+	                    outside the lock.
+	:param typed:       If true, arguments of different types are cached separately, e.g. ``1`` and ``True``.
+	:returns:           Decorator function.
+	:raises ValueError: If parameter 'ttl' is given, but parameter 'policy' isn't a subclass of :class:`TTLCache`.
+	"""
+	if policy is None:
+		policy = LRUCache if ttl is None else TTLCache
+
+	if ttl is not None:
+		if not issubclass(policy, TTLCache):
+			raise ValueError(f"Parameter 'ttl' requires a 'policy' derived from 'TTLCache'.")
+
+	def decorator(func: Callable) -> Callable:
+		if ttl is not None:
+			cache = policy(maxSize, ttl, threadSafe=threadSafe)
+		else:
+			cache = policy(maxSize, threadSafe=threadSafe)
+
+		@wraps(func)
+		def wrapper(*args, **kwargs):
+			key = _MakeKey(args, kwargs, typed)
+			if (result := cache.Get(key, _MISSING)) is _MISSING:
+				result = func(*args, **kwargs)
+				cache.Set(key, result)
+
+			return result
+
+		wrapper.__cache__ = cache
+		return wrapper
+
+	return decorator
@@ -0,0 +1,428 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+An asynchronous crawler downloading projects and releases from a :class:`~pyTooling.Dependency.Python.PythonPackageIndex`.
+
+The crawler shares one HTTP session for all requests, limits the number of concurrent requests by a semaphore, retries
+failed requests with exponential backoff and limits the request rate per host. The transitive dependency closure of a
+set of projects is downloaded breadth-first, thus all projects of one dependency level are downloaded concurrently.
+
+.. hint::
+
+   See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
+"""
+from asyncio      import run as asyncio_run, gather as asyncio_gather, sleep as asyncio_sleep, Semaphore, TimeoutError as AsyncTimeoutError, get_running_loop
+from json         import loads as json_loads
+from typing       import Optional as Nullable, Any, Dict, Iterable, List
+from urllib.parse import urlsplit
+
+try:
+	from aiohttp import ClientSession, ClientTimeout, ClientError
+except ImportError as ex:  # pragma: no cover
+	raise Exception(f"Optional dependency 'aiohttp' not installed. Either install pyTooling with extra dependencies 'pyTooling[pypi]' or install 'aiohttp' directly.") from ex
+
+try:
+	from packaging.utils import canonicalize_name
+except ImportError as ex:  # pragma: no cover
+	raise Exception(f"Optional dependency 'packaging' not installed. Either install pyTooling with extra dependencies 'pyTooling[pypi]' or install 'packaging' directly.") from ex
+
+from pyTooling.Decorators           import export, readonly
+from pyTooling.MetaClasses          import ExtendedType
+from pyTooling.Exceptions           import ToolingException
+from pyTooling.Common               import getFullyQualifiedName
+from pyTooling.Dependency.Python    import LazyLoaderState, PythonPackageIndex, Project, Release
+
+
+_RETRY_STATUS = frozenset((408, 429, 500, 502, 503, 504))  #: HTTP status codes of transient errors, which are retried.
+
+
+@export
+class HostRateLimiter(metaclass=ExtendedType, slots=True):
+	"""
+	Limits the request rate per host by spacing requests to the same host by a minimal interval.
+	"""
+	_interval: float             #: Minimal interval between two requests to the same host in seconds.
+	_next:     Dict[str, float]  #: Earliest point in time (event loop time) for the next request per host.
+
+	def __init__(self, requestsPerSecond: float) -> None:
+		"""
+		Initializes the rate limiter.
+
+		:param requestsPerSecond: Maximum number of requests per second and host.
+		:raises TypeError:        If parameter 'requestsPerSecond' is not a number.
+		:raises ValueError:       If parameter 'requestsPerSecond' is not positive.
+		"""
+		if not isinstance(requestsPerSecond, (int, float)):
+			ex = TypeError("Parameter 'requestsPerSecond' is not of type 'float'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(requestsPerSecond)}'.")
+			raise ex
+		elif requestsPerSecond <= 0:
+			raise ValueError(f"Parameter 'requestsPerSecond' must be positive.")
+
+		self._interval = 1.0 / requestsPerSecond
+		self._next = {}
+
+	@readonly
+	def Interval(self) -> float:
+		"""
+		Read-only property to access the minimal interval between two requests to the same host.
+
+		:returns: Interval in seconds.
+		"""
+		return self._interval
+
+	async def Wait(self, host: str) -> None:
+		"""
+		Wait until a request to ``host`` is allowed.
+
+		The slot is reserved before waiting, so concurrent callers are queued in calling order.
+
+		:param host: Host name (and port) of the request.
+		"""
+		now = get_running_loop().time()
+		start = max(now, self._next.get(host, now))
+		self._next[host] = start + self._interval
+
+		if start > now:
+			await asyncio_sleep(start - now)
+
+
+@export
+class PackageIndexCrawler(metaclass=ExtendedType, slots=True):
+	"""
+	Downloads projects, their releases and the transitive dependency closure from a Python package index.
+
+	If the index has a response cache, requests are conditional and in offline mode, all responses are served from the
+	cache (see :mod:`pyTooling.Dependency.HTTPCache`).
+	"""
+	_index:        PythonPackageIndex         #: Package index to populate.
+	_concurrency:  int                        #: Maximum number of concurrent requests.
+	_retries:      int                        #: Maximum number of retries per request.
+	_backoff:      float                      #: Initial delay in seconds before a retry. It's doubled for every further retry.
+	_timeout:      float                      #: Total timeout of a single request in seconds.
+	_rateLimiter:  Nullable[HostRateLimiter]  #: Optional rate limiter per host.
+
+	_session:      Nullable[ClientSession]    #: Shared HTTP session while crawling.
+	_semaphore:    Nullable[Semaphore]        #: Semaphore limiting concurrent requests while crawling.
+	_requestCount: int                        #: Number of sent HTTP requests.
+	_retryCount:   int                        #: Number of retried HTTP requests.
+	_failures:     Dict[str, Exception]       #: Projects or releases which couldn't be downloaded.
+
+	def __init__(
+		self,
+		index:             PythonPackageIndex,
+		concurrency:       int = 16,
+		retries:           int = 3,
+		backoff:           float = 0.5,
+		timeout:           float = 30.0,
+		requestsPerSecond: Nullable[float] = None
+	) -> None:
+		"""
+		Initializes the crawler.
+
+		:param index:             Package index to populate.
+		:param concurrency:       Maximum number of concurrent requests.
+		:param retries:           Maximum number of retries per request after transient errors.
+		:param backoff:           Initial delay in seconds before a retry. It's doubled for every further retry.
+		:param timeout:           Total timeout of a single request in seconds.
+		:param requestsPerSecond: Optional maximum number of requests per second and host.
+		:raises TypeError:        If parameter 'index' is not a :class:`~pyTooling.Dependency.Python.PythonPackageIndex`.
+		:raises TypeError:        If parameter 'concurrency' or 'retries' is not an integer.
+		:raises ValueError:       If parameter 'concurrency' is less than 1 or 'retries' is negative.
+		"""
+		if not isinstance(index, PythonPackageIndex):
+			ex = TypeError("Parameter 'index' is not of type 'PythonPackageIndex'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(index)}'.")
+			raise ex
+		elif not isinstance(concurrency, int):
+			ex = TypeError("Parameter 'concurrency' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(concurrency)}'.")
+			raise ex
+		elif concurrency < 1:
+			raise ValueError(f"Parameter 'concurrency' must be at least 1.")
+		elif not isinstance(retries, int):
+			ex = TypeError("Parameter 'retries' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(retries)}'.")
+			raise ex
+		elif retries < 0:
+			raise ValueError(f"Parameter 'retries' must not be negative.")
+
+		self._index = index
+		self._concurrency = concurrency
+		self._retries = retries
+		self._backoff = backoff
+		self._timeout = timeout
+		self._rateLimiter = HostRateLimiter(requestsPerSecond) if requestsPerSecond is not None else None
+
+		self._session = None
+		self._semaphore = None
+		self._requestCount = 0
+		self._retryCount = 0
+		self._failures = {}
+
+	@readonly
+	def Index(self) -> PythonPackageIndex:
+		"""
+		Read-only property to access the populated package index.
+
+		:returns: Package index.
+		"""
+		return self._index
+
+	@readonly
+	def RequestCount(self) -> int:
+		"""
+		Read-only property to access the number of sent HTTP requests.
+
+		:returns: Number of sent requests including retries.
+		"""
+		return self._requestCount
+
+	@readonly
+	def RetryCount(self) -> int:
+		"""
+		Read-only property to access the number of retried HTTP requests.
+
+		:returns: Number of retries.
+		"""
+		return self._retryCount
+
+	@readonly
+	def Failures(self) -> Dict[str, Exception]:
+		"""
+		Read-only property to access the projects and releases, which couldn't be downloaded.
+
+		:returns: Dictionary of failed project or release names and their exceptions.
+		"""
+		return self._failures
+
+	async def _FetchJSON(self, url: str, notFoundMessage: str) -> Any:
+		"""
+		Download a JSON document with retries, backoff and rate limiting.
+
+		In offline mode, the document is served by the index without network access.
+
+		:param url:               Requested API URL.
+		:param notFoundMessage:   Error message if the server answers with ``404 Not Found``.
+		:returns:                 Decoded JSON document.
+		:raises ToolingException: If the resource wasn't found or all retries failed.
+		"""
+		if self._index._offline:
+			return self._index._GetJSON(url, notFoundMessage)
+
+		cache = self._index._responseCache
+		cached = cache.Lookup(url) if cache is not None else None
+		headers = cached.ConditionalHeaders if cached is not None else None
+		host = urlsplit(url).netloc
+		lastError: Nullable[Exception] = None
+		for attempt in range(self._retries + 1):
+			if attempt > 0:
+				self._retryCount += 1
+				await asyncio_sleep(delay)
+
+			delay = self._backoff * 2 ** attempt
+			async with self._semaphore:
+				if self._rateLimiter is not None:
+					await self._rateLimiter.Wait(host)
+
+				self._requestCount += 1
+				try:
+					async with self._session.get(url, headers=headers) as response:
+						if response.status == 304 and cached is not None:
+							cache.Revalidated(cached)
+							return cached.JSON()
+						elif response.status == 404:
+							# TODO: ReleaseNotFoundException
+							raise ToolingException(notFoundMessage)
+						elif response.status in _RETRY_STATUS:
+							lastError = ToolingException(f"Server answered with status {response.status} for '{url}'.")
+							if (retryAfter := response.headers.get("Retry-After", "")).isdigit():
+								delay = max(delay, float(retryAfter))
+							continue
+						elif response.status >= 400:
+							raise ToolingException(f"Server answered with status {response.status} for '{url}'.")
+
+						body = await response.read()
+				except (ClientError, AsyncTimeoutError) as ex:
+					lastError = ex
+					continue
+
+			if cache is not None:
+				cache.Store(url, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+			return json_loads(body)
+
+		raise ToolingException(f"Couldn't download '{url}' after {self._retries + 1} attempts.") from lastError
+
+	async def _CrawlProject(self, projectName: str) -> Project:
+		"""
+		Download a project and the details of all its releases.
+
+		The project is requested by its normalized name (:pep:`503`) and named as reported by the index.
+
+		Releases, which couldn't be downloaded, are removed from the project and recorded in :attr:`Failures`.
+
+		:param projectName: Name of the project.
+		:returns:           The downloaded project.
+		"""
+		json = await self._FetchJSON(self._index._GetPyPIEndpoint(canonicalize_name(projectName)), f"Package '{projectName}' not found.")
+
+		project = Project(json["info"].get("name", projectName), "", index=self._index, lazy=LazyLoaderState.Initialized)
+		project.UpdateDetailsFromPyPIJSON(json)
+
+		await self._CrawlReleases(project)
+
+		return project
+
+	async def _FetchRelease(self, release: Release) -> Any:
+		return await self._FetchJSON(
+			f"{self._index._api}{release._GetPyPIEndpoint()}",
+			f"Release '{release._version}' of package '{release._package._name}' not found."
+		)
+
+	async def _CrawlReleases(self, project: Project) -> None:
+		releases: List[Release] = list(project._versions.values())
+		results = await asyncio_gather(*(self._FetchRelease(release) for release in releases), return_exceptions=True)
+
+		documents = {}
+		for release, result in zip(releases, results):
+			if isinstance(result, Exception):
+				self._failures[f"{project._name}=={release._version}"] = result
+				del project._versions[release._version]
+			else:
+				documents[release] = result
+
+		project.UpdateReleaseDetailsFromPyPIJSON(documents)
+		project.__lazy_state__ = LazyLoaderState.PostProcessed
+
+	async def _Run(self, coroutine) -> Any:
+		"""
+		Run a coroutine with a shared HTTP session and concurrency limit.
+
+		:param coroutine: Coroutine using :attr:`_session` and :attr:`_semaphore`.
+		:returns:         Result of the coroutine.
+		"""
+		timeout = ClientTimeout(total=self._timeout)
+		async with ClientSession(headers={"accept": "application/json"}, timeout=timeout) as session:
+			self._session = session
+			self._semaphore = Semaphore(self._concurrency)
+			try:
+				return await coroutine
+			finally:
+				self._session = None
+				self._semaphore = None
+
+	async def _CrawlClosure(self, projectNames: Iterable[str], maxDepth: Nullable[int]) -> Dict[str, Project]:
+		projects: Dict[str, Project] = {}
+		level: Dict[str, str] = {}
+		for projectName in projectNames:
+			level.setdefault(canonicalize_name(projectName), projectName)
+
+		depth = 0
+		while len(level) > 0:
+			results = await asyncio_gather(*(self._CrawlProject(name) for name in level.values()), return_exceptions=True)
+
+			nextLevel: Dict[str, str] = {}
+			for key, result in zip(level.keys(), results):
+				if isinstance(result, Exception):
+					if depth == 0:
+						raise result
+
+					self._failures[key] = result
+					continue
+
+				projects[key] = result
+				for release in result._versions.values():  # type: Release
+					for requirement in release._requirements.get(None, []):
+						requirementKey = canonicalize_name(requirement.name)
+						if requirementKey not in projects and requirementKey not in level:
+							nextLevel.setdefault(requirementKey, requirement.name)
+
+			depth += 1
+			if maxDepth is not None and depth > maxDepth:
+				break
+
+			level = nextLevel
+
+		self._LinkDependencies(projects)
+
+		return projects
+
+	def _LinkDependencies(self, projects: Dict[str, Project]) -> None:
+		"""
+		Add dependencies from every release to all matching releases of crawled projects.
+
+		Requirements on projects outside the crawled closure (e.g. due to ``maxDepth``) are ignored.
+
+		:param projects: Crawled projects by canonical name.
+		"""
+		for project in projects.values():
+			for release in project._versions.values():  # type: Release
+				for requirement in release._requirements.get(None, []):
+					if (dependency := projects.get(canonicalize_name(requirement.name))) is None:
+						continue
+
+					for dependencyRelease in dependency._versions.values():
+						if str(dependencyRelease._version) in requirement.specifier:
+							release.AddDependencyToPackageVersion(dependencyRelease)
+
+				release.SortDependencies()
+				release.__lazy_state__ = LazyLoaderState.PostProcessed
+
+	def Crawl(self, projectNames: Iterable[str], maxDepth: Nullable[int] = None) -> Dict[str, Project]:
+		"""
+		Download projects and their transitive dependency closure breadth-first.
+
+		All projects of a dependency level are downloaded concurrently. Afterwards, dependencies between all downloaded
+		releases are added to the dependency graph, so it can be resolved without further downloads.
+
+		:param projectNames:      Names of the projects to download.
+		:param maxDepth:          Optional number of dependency levels to follow. ``0`` downloads only the given projects.
+		:returns:                 Dictionary of downloaded projects by canonical project name.
+		:raises ToolingException: If one of the given projects couldn't be downloaded.
+		"""
+		if isinstance(projectNames, str):
+			projectNames = (projectNames, )
+
+		return asyncio_run(self._Run(self._CrawlClosure(projectNames, maxDepth)))
+
+	def DownloadReleaseDetails(self, project: Project) -> None:
+		"""
+		Download the details of all releases of a project concurrently.
+
+		Releases, which couldn't be downloaded, are removed from the project and recorded in :attr:`Failures`.
+
+		:param project: Project with releases to download.
+		"""
+		asyncio_run(self._Run(self._CrawlReleases(project)))
+
+	def __repr__(self) -> str:
+		return f"PackageIndexCrawler: {self._index._name} (concurrency={self._concurrency})"
@@ -0,0 +1,526 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Persistent caches for HTTP responses of package index APIs like the `PyPI JSON API <https://docs.pypi.org/api/json/>`__.
+
+A :class:`ResponseStore` keeps a response body together with its ``ETag`` and ``Last-Modified`` validators. These are
+sent as ``If-None-Match`` and ``If-Modified-Since`` headers in the next request to the same URL, so an unchanged
+resource is answered by the server with ``304 Not Modified`` and the cached body is reused. In offline mode, responses
+are served from the store without any network access.
+
+.. hint::
+
+   See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
+"""
+from hashlib   import sha256
+from json      import loads as json_loads, dumps as json_dumps
+from os        import replace as os_replace, utime as os_utime
+from pathlib   import Path
+from sqlite3   import connect as sqlite3_connect, Connection
+from tempfile  import NamedTemporaryFile
+from threading import Lock
+from time      import time
+from typing    import Optional as Nullable, Any, Dict, Union
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType, abstractmethod
+from pyTooling.Exceptions  import ToolingException
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.Caching     import CacheStatistics
+
+
+@export
+class OfflineCacheMissError(ToolingException):
+	"""
+	The exception is raised in offline mode, if a requested URL is not contained in the response store.
+	"""
+
+
+@export
+class CachedResponse(metaclass=ExtendedType, slots=True):
+	"""
+	A cached HTTP response body with its cache validators.
+	"""
+	_url:          str            #: Requested URL.
+	_body:         bytes          #: Response body.
+	_etag:         Nullable[str]  #: Value of the ``ETag`` response header.
+	_lastModified: Nullable[str]  #: Value of the ``Last-Modified`` response header.
+	_timestamp:    float          #: Point in time (seconds since epoch) when the response was received or revalidated.
+
+	def __init__(
+		self,
+		url:          str,
+		body:         bytes,
+		etag:         Nullable[str] = None,
+		lastModified: Nullable[str] = None,
+		timestamp:    Nullable[float] = None
+	) -> None:
+		"""
+		Initializes a cached response.
+
+		:param url:          Requested URL.
+		:param body:         Response body.
+		:param etag:         Optional value of the ``ETag`` response header.
+		:param lastModified: Optional value of the ``Last-Modified`` response header.
+		:param timestamp:    Optional point in time when the response was received. If omitted, the current time is used.
+		:raises TypeError:   If parameter 'url' is not a string.
+		:raises TypeError:   If parameter 'body' is not of type bytes.
+		"""
+		if not isinstance(url, str):
+			ex = TypeError("Parameter 'url' is not of type 'str'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(url)}'.")
+			raise ex
+		elif not isinstance(body, bytes):
+			ex = TypeError("Parameter 'body' is not of type 'bytes'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(body)}'.")
+			raise ex
+
+		self._url = url
+		self._body = body
+		self._etag = etag
+		self._lastModified = lastModified
+		self._timestamp = time() if timestamp is None else timestamp
+
+	@readonly
+	def URL(self) -> str:
+		"""
+		Read-only property to access the requested URL.
+
+		:returns: Requested URL.
+		"""
+		return self._url
+
+	@readonly
+	def Body(self) -> bytes:
+		"""
+		Read-only property to access the response body.
+
+		:returns: Response body.
+		"""
+		return self._body
+
+	@readonly
+	def ETag(self) -> Nullable[str]:
+		"""
+		Read-only property to access the entity tag of the response.
+
+		:returns: Value of the ``ETag`` response header, if any.
+		"""
+		return self._etag
+
+	@readonly
+	def LastModified(self) -> Nullable[str]:
+		"""
+		Read-only property to access the modification date of the response.
+
+		:returns: Value of the ``Last-Modified`` response header, if any.
+		"""
+		return self._lastModified
+
+	@readonly
+	def Timestamp(self) -> float:
+		"""
+		Read-only property to access the point in time when the response was received or revalidated.
+
+		:returns: Seconds since epoch.
+		"""
+		return self._timestamp
+
+	@readonly
+	def ConditionalHeaders(self) -> Dict[str, str]:
+		"""
+		Read-only property to access the request headers for a conditional request.
+
+		:returns: Dictionary containing ``If-None-Match`` and/or ``If-Modified-Since``.
+		"""
+		headers = {}
+		if self._etag is not None:
+			headers["If-None-Match"] = self._etag
+		if self._lastModified is not None:
+			headers["If-Modified-Since"] = self._lastModified
+
+		return headers
+
+	def JSON(self) -> Any:
+		"""
+		Decode the response body as JSON.
+
+		:returns: Decoded JSON document.
+		"""
+		return json_loads(self._body)
+
+	def __repr__(self) -> str:
+		return f"CachedResponse: {self._url} ({len(self._body)} bytes)"
+
+
+@export
+class ResponseStore(metaclass=ExtendedType, slots=True):
+	"""
+	Abstract base-class of persistent HTTP response stores.
+
+	Derived classes implement the storage specific methods :meth:`_Lookup`, :meth:`_Store`, :meth:`_Touch`,
+	:meth:`_Remove`, :meth:`_Count` and :meth:`_Clear`. Hits and misses are counted in :attr:`Statistics`.
+	"""
+	_statistics: CacheStatistics  #: Hit and miss counters.
+	_lock:       Lock             #: Lock serializing accesses to the underlying storage.
+
+	def __init__(self) -> None:
+		"""
+		Initializes the response store.
+		"""
+		self._statistics = CacheStatistics()
+		self._lock = Lock()
+
+	@readonly
+	def Statistics(self) -> CacheStatistics:
+		"""
+		Read-only property to access the store's hit and miss counters.
+
+		:returns: Cache statistics.
+		"""
+		return self._statistics
+
+	@abstractmethod
+	def _Lookup(self, url: str) -> Nullable[CachedResponse]:
+		"""Return the stored response for ``url`` or ``None``."""
+
+	@abstractmethod
+	def _Store(self, response: CachedResponse) -> None:
+		"""Store (or replace) ``response``."""
+
+	@abstractmethod
+	def _Touch(self, url: str, timestamp: float) -> bool:
+		"""Update the timestamp of the stored response for ``url`` and return if it was stored."""
+
+	@abstractmethod
+	def _Remove(self, url: str) -> bool:
+		"""Remove the response for ``url`` and return if it was stored."""
+
+	@abstractmethod
+	def _Count(self) -> int:
+		"""Return the number of stored responses."""
+
+	@abstractmethod
+	def _Clear(self) -> None:
+		"""Remove all stored responses."""
+
+	def Lookup(self, url: str) -> Nullable[CachedResponse]:
+		"""
+		Lookup a stored response.
+
+		:param url: Requested URL.
+		:returns:   The cached response or ``None``.
+		"""
+		with self._lock:
+			response = self._Lookup(url)
+
+		if response is None:
+			self._statistics._misses += 1
+		else:
+			self._statistics._hits += 1
+
+		return response
+
+	def Store(
+		self,
+		url:          str,
+		body:         bytes,
+		etag:         Nullable[str] = None,
+		lastModified: Nullable[str] = None
+	) -> CachedResponse:
+		"""
+		Store a response body with its cache validators.
+
+		An already stored response for the same URL is replaced.
+
+		:param url:          Requested URL.
+		:param body:         Response body.
+		:param etag:         Optional value of the ``ETag`` response header.
+		:param lastModified: Optional value of the ``Last-Modified`` response header.
+		:returns:            The cached response.
+		"""
+		response = CachedResponse(url, body, etag, lastModified)
+		with self._lock:
+			self._Store(response)
+
+		return response
+
+	def Revalidated(self, response: CachedResponse) -> CachedResponse:
+		"""
+		Record, that a server confirmed a cached response is unchanged (``304 Not Modified``).
+
+		Only the stored timestamp is updated. If the response was removed meanwhile, it's stored again.
+
+		:param response: Cached response.
+		:returns:        The cached response with an updated timestamp.
+		"""
+		revalidated = CachedResponse(response._url, response._body, response._etag, response._lastModified)
+		with self._lock:
+			if not self._Touch(revalidated._url, revalidated._timestamp):
+				self._Store(revalidated)
+
+		return revalidated
+
+	def Remove(self, url: str) -> bool:
+		"""
+		Remove a stored response.
+
+		:param url: Requested URL.
+		:returns:   ``True``, if a response was stored for that URL.
+		"""
+		with self._lock:
+			return self._Remove(url)
+
+	def Clear(self) -> None:
+		"""
+		Remove all stored responses and reset the statistics.
+		"""
+		with self._lock:
+			self._Clear()
+
+		self._statistics.Reset()
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of stored responses.
+
+		:returns: Number of stored responses.
+		"""
+		with self._lock:
+			return self._Count()
+
+	def __contains__(self, url: str) -> bool:
+		"""
+		Checks if a response is stored for an URL.
+
+		This check doesn't change the statistics.
+
+		:param url: Requested URL.
+		:returns:   ``True``, if a response is stored.
+		"""
+		with self._lock:
+			return self._Lookup(url) is not None
+
+
+@export
+class DirectoryResponseStore(ResponseStore):
+	"""
+	A response store keeping one JSON file per URL in a directory.
+
+	Files are named by the SHA-256 hash of the URL. Each write goes to a uniquely named temporary file, which atomically
+	replaces the response file. Thus, concurrent readers never observe a partially written file and concurrent writers
+	(also from other processes) don't interfere. The timestamp of a response is the file's modification time. Unreadable
+	or corrupt files are counted as misses and removed.
+	"""
+	_directory: Path  #: Directory containing the cached responses.
+
+	def __init__(self, directory: Union[str, Path]) -> None:
+		"""
+		Initializes a directory-backed response store.
+
+		The directory is created if it doesn't exist.
+
+		:param directory:  Directory containing the cached responses.
+		:raises TypeError: If parameter 'directory' is not a path.
+		"""
+		super().__init__()
+
+		if isinstance(directory, str):
+			directory = Path(directory)
+		elif not isinstance(directory, Path):
+			ex = TypeError("Parameter 'directory' is not of type 'Path'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(directory)}'.")
+			raise ex
+
+		directory.mkdir(parents=True, exist_ok=True)
+		self._directory = directory
+
+	@readonly
+	def Directory(self) -> Path:
+		"""
+		Read-only property to access the cache directory.
+
+		:returns: Directory containing the cached responses.
+		"""
+		return self._directory
+
+	def _GetPath(self, url: str) -> Path:
+		return self._directory / f"{sha256(url.encode('utf-8')).hexdigest()}.json"
+
+	def _Lookup(self, url: str) -> Nullable[CachedResponse]:
+		path = self._GetPath(url)
+		try:
+			content = path.read_bytes()
+			timestamp = path.stat().st_mtime
+		except FileNotFoundError:
+			return None
+
+		try:
+			entry = json_loads(content)
+			body = entry["body"].encode("utf-8")
+			etag = entry["etag"]
+			lastModified = entry["lastModified"]
+		except (ValueError, KeyError, TypeError, AttributeError):  # JSONDecodeError and UnicodeDecodeError are ValueErrors
+			path.unlink(missing_ok=True)
+			return None
+
+		if entry.get("url") != url:  # pragma: no cover
+			return None
+
+		return CachedResponse(url, body, etag, lastModified, timestamp)
+
+	def _Store(self, response: CachedResponse) -> None:
+		entry = {
+			"url":          response._url,
+			"etag":         response._etag,
+			"lastModified": response._lastModified,
+			"body":         response._body.decode("utf-8")
+		}
+		path = self._GetPath(response._url)
+		with NamedTemporaryFile("w", encoding="utf-8", dir=self._directory, prefix=f"{path.stem}.", suffix=".tmp", delete=False) as file:
+			file.write(json_dumps(entry))
+
+		try:
+			os_utime(file.name, (response._timestamp, response._timestamp))
+			os_replace(file.name, path)
+		except BaseException:
+			Path(file.name).unlink(missing_ok=True)
+			raise
+
+	def _Touch(self, url: str, timestamp: float) -> bool:
+		try:
+			os_utime(self._GetPath(url), (timestamp, timestamp))
+		except FileNotFoundError:
+			return False
+
+		return True
+
+	def _Remove(self, url: str) -> bool:
+		try:
+			self._GetPath(url).unlink()
+		except FileNotFoundError:
+			return False
+
+		return True
+
+	def _Count(self) -> int:
+		return sum(1 for _ in self._directory.glob("*.json"))
+
+	def _Clear(self) -> None:
+		for path in self._directory.glob("*.json"):
+			path.unlink()
+
+	def __repr__(self) -> str:
+		return f"DirectoryResponseStore: {self._directory}"
+
+
+@export
+class SQLiteResponseStore(ResponseStore):
+	"""
+	A response store keeping all responses in a single SQLite database file.
+	"""
+	_path:       Path        #: Path to the database file.
+	_connection: Connection  #: Database connection.
+
+	def __init__(self, path: Union[str, Path]) -> None:
+		"""
+		Initializes an SQLite-backed response store.
+
+		The database file and its parent directory are created if they don't exist.
+
+		:param path:       Path to the database file.
+		:raises TypeError: If parameter 'path' is not a path.
+		"""
+		super().__init__()
+
+		if isinstance(path, str):
+			path = Path(path)
+		elif not isinstance(path, Path):
+			ex = TypeError("Parameter 'path' is not of type 'Path'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(path)}'.")
+			raise ex
+
+		path.parent.mkdir(parents=True, exist_ok=True)
+		self._path = path
+		self._connection = sqlite3_connect(path, check_same_thread=False)
+		with self._connection:
+			self._connection.execute(
+				"CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT, lastModified TEXT, timestamp REAL, body BLOB)"
+			)
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to access the path to the database file.
+
+		:returns: Path to the database file.
+		"""
+		return self._path
+
+	def _Lookup(self, url: str) -> Nullable[CachedResponse]:
+		row = self._connection.execute(
+			"SELECT etag, lastModified, timestamp, body FROM responses WHERE url = ?", (url, )
+		).fetchone()
+		if row is None:
+			return None
+
+		return CachedResponse(url, bytes(row[3]), row[0], row[1], row[2])
+
+	def _Store(self, response: CachedResponse) -> None:
+		with self._connection:
+			self._connection.execute(
+				"INSERT OR REPLACE INTO responses (url, etag, lastModified, timestamp, body) VALUES (?, ?, ?, ?, ?)",
+				(response._url, response._etag, response._lastModified, response._timestamp, response._body)
+			)
+
+	def _Touch(self, url: str, timestamp: float) -> bool:
+		with self._connection:
+			return self._connection.execute("UPDATE responses SET timestamp = ? WHERE url = ?", (timestamp, url)).rowcount > 0
+
+	def _Remove(self, url: str) -> bool:
+		with self._connection:
+			return self._connection.execute("DELETE FROM responses WHERE url = ?", (url, )).rowcount > 0
+
+	def _Count(self) -> int:
+		return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+	def _Clear(self) -> None:
+		with self._connection:
+			self._connection.execute("DELETE FROM responses")
+
+	def Close(self) -> None:
+		"""
+		Close the database connection.
+		"""
+		self._connection.close()
+
+	def __repr__(self) -> str:
+		return f"SQLiteResponseStore: {self._path}"
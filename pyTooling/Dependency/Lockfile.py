@@ -0,0 +1,550 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Deterministic lockfiles storing the solution of a dependency problem of a
+:class:`~pyTooling.Dependency.PackageDependencyGraph`.
+
+A :class:`Lockfile` records the selected package versions together with a content hash of each package version's
+declared dependencies. When loaded, a lockfile is verified incrementally against the current graph: every locked package
+version must exist, its dependency declaration must be unchanged (same hash) and every dependency must be satisfied by
+another locked package version. Thus, a verified lockfile replaces re-solving the dependency problem.
+
+Verification proves that the locked package versions are a *valid* solution of the current graph, but not that they are
+still the *latest* solution: new package versions or changed declarations of package versions, which aren't locked, can
+allow a newer solution. Therefore, verified solutions are never stored as memoized results of
+:meth:`~pyTooling.Dependency.PackageVersion.SolveLatest`.
+
+Lockfiles are written as TOML or JSON with sorted entries, so identical solutions produce identical files.
+
+.. hint::
+
+   See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
+"""
+from hashlib import sha256
+from json    import dumps as json_dumps, loads as json_loads, JSONDecodeError
+from pathlib import Path
+from tomllib import loads as toml_loads, TOMLDecodeError
+from typing  import Optional as Nullable, Any, Dict, Iterable, List, Tuple, Union
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Exceptions  import ToolingException
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.Versioning  import SemanticVersion
+from pyTooling.Dependency  import PackageVersion, PackageDependencyGraph, SolverAlgorithm
+
+
+_FORMAT_VERSION = 1  #: Version of the lockfile format.
+
+
+def _hash(text: str) -> str:
+	return f"sha256:{sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def _versionString(version: SemanticVersion, versionStrings: Dict[SemanticVersion, str]) -> str:
+	if (string := versionStrings.get(version)) is None:
+		string = versionStrings[version] = str(version)
+
+	return string
+
+
+def _declarationHash(packageVersion: PackageVersion, versionStrings: Nullable[Dict[SemanticVersion, str]] = None) -> str:
+	"""
+	Compute the content hash of a package version's identity and declared dependencies.
+
+	:param packageVersion: Package version.
+	:param versionStrings: Optional memo of version strings shared by multiple calls.
+	:returns:              SHA-256 hash prefixed by ``sha256:``.
+	"""
+	if versionStrings is None:
+		versionStrings = {}
+
+	package = packageVersion._package
+	lines = [f"{package._storage._name}/{package._name}@{_versionString(packageVersion._version, versionStrings)}"]
+	for dependency, versions in sorted(packageVersion._dependsOn.items(), key=lambda item: (item[0]._storage._name, item[0]._name)):
+		lines.append(f"{dependency._storage._name}/{dependency._name}: {','.join(_versionString(version, versionStrings) for version in sorted(versions.keys(), reverse=True))}")
+
+	return _hash("\n".join(lines))
+
+
+@export
+class LockfileMismatchError(ToolingException):
+	"""
+	The exception is raised if a lockfile doesn't match the current package dependency graph.
+
+	Each mismatch is attached as a note.
+	"""
+	_mismatches: List[str]  #: Descriptions of all mismatches.
+
+	def __init__(self, message: str, mismatches: Iterable[str]) -> None:
+		"""
+		Initializes the exception.
+
+		:param message:    Error message.
+		:param mismatches: Descriptions of all mismatches.
+		"""
+		super().__init__(message)
+
+		self._mismatches = list(mismatches)
+		for mismatch in self._mismatches:
+			self.add_note(mismatch)
+
+	@readonly
+	def Mismatches(self) -> List[str]:
+		"""
+		Read-only property to access the descriptions of all mismatches.
+
+		:returns: List of mismatch descriptions.
+		"""
+		return self._mismatches
+
+
+@export
+class LockedPackageVersion(metaclass=ExtendedType, slots=True):
+	"""
+	A locked package version identified by storage name, package name and version string.
+	"""
+	_storage: str  #: Name of the package storage.
+	_package: str  #: Name of the package.
+	_version: str  #: Version string of the package version.
+	_hash:    str  #: Content hash of the package version's declared dependencies.
+
+	def __init__(self, storage: str, package: str, version: str, hash: str) -> None:
+		"""
+		Initializes a locked package version.
+
+		:param storage:    Name of the package storage.
+		:param package:    Name of the package.
+		:param version:    Version string of the package version.
+		:param hash:       Content hash of the package version's declared dependencies.
+		:raises TypeError: If a parameter is not a string.
+		"""
+		for name, value in (("storage", storage), ("package", package), ("version", version), ("hash", hash)):
+			if not isinstance(value, str):
+				ex = TypeError(f"Parameter '{name}' is not of type 'str'.")
+				ex.add_note(f"Got type '{getFullyQualifiedName(value)}'.")
+				raise ex
+
+		self._storage = storage
+		self._package = package
+		self._version = version
+		self._hash = hash
+
+	@classmethod
+	def FromPackageVersion(cls, packageVersion: PackageVersion) -> "LockedPackageVersion":
+		"""
+		Lock a package version.
+
+		:param packageVersion: Package version to lock.
+		:returns:              Locked package version.
+		"""
+		package = packageVersion._package
+		return cls(package._storage._name, package._name, str(packageVersion._version), _declarationHash(packageVersion))
+
+	@readonly
+	def Storage(self) -> str:
+		"""
+		Read-only property to access the name of the package storage.
+
+		:returns: Name of the package storage.
+		"""
+		return self._storage
+
+	@readonly
+	def Package(self) -> str:
+		"""
+		Read-only property to access the name of the package.
+
+		:returns: Name of the package.
+		"""
+		return self._package
+
+	@readonly
+	def Version(self) -> str:
+		"""
+		Read-only property to access the version string.
+
+		:returns: Version string of the package version.
+		"""
+		return self._version
+
+	@readonly
+	def Hash(self) -> str:
+		"""
+		Read-only property to access the content hash of the declared dependencies.
+
+		:returns: SHA-256 hash prefixed by ``sha256:``.
+		"""
+		return self._hash
+
+	def _SortKey(self) -> Tuple[str, str, str]:
+		return self._storage, self._package, self._version
+
+	def ToDict(self) -> Dict[str, str]:
+		"""
+		Convert the locked package version to a dictionary.
+
+		:returns: Dictionary with keys ``storage``, ``package``, ``version`` and ``hash``.
+		"""
+		return {"storage": self._storage, "package": self._package, "version": self._version, "hash": self._hash}
+
+	def __eq__(self, other: Any) -> bool:
+		if isinstance(other, LockedPackageVersion):
+			return self._SortKey() == other._SortKey() and self._hash == other._hash
+
+		return NotImplemented
+
+	def __hash__(self) -> int:
+		return hash((self._storage, self._package, self._version, self._hash))
+
+	def __str__(self) -> str:
+		return f"{self._storage}/{self._package}@{self._version}"
+
+
+@export
+class Lockfile(metaclass=ExtendedType, slots=True):
+	"""
+	A deterministic lockfile of a solved dependency problem.
+	"""
+	_root:        LockedPackageVersion               #: Root package version of the dependency problem.
+	_algorithm:   SolverAlgorithm                    #: Solver algorithm used to compute the solution.
+	_packages:    Tuple[LockedPackageVersion, ...]   #: Locked package versions sorted by storage, package and version.
+	_contentHash: str                                #: Content hash of the root and all locked package versions.
+
+	def __init__(
+		self,
+		root:      LockedPackageVersion,
+		packages:  Iterable[LockedPackageVersion],
+		algorithm: SolverAlgorithm = SolverAlgorithm.Backtracking
+	) -> None:
+		"""
+		Initializes a lockfile.
+
+		:param root:       Root package version of the dependency problem.
+		:param packages:   Locked package versions of the solution.
+		:param algorithm:  Solver algorithm used to compute the solution.
+		:raises TypeError: If parameter 'root' is not a :class:`LockedPackageVersion`.
+		:raises TypeError: If parameter 'algorithm' is not a :class:`~pyTooling.Dependency.SolverAlgorithm`.
+		"""
+		if not isinstance(root, LockedPackageVersion):
+			ex = TypeError("Parameter 'root' is not of type 'LockedPackageVersion'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(root)}'.")
+			raise ex
+		elif not isinstance(algorithm, SolverAlgorithm):
+			ex = TypeError("Parameter 'algorithm' is not of type 'SolverAlgorithm'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(algorithm)}'.")
+			raise ex
+
+		self._root = root
+		self._algorithm = algorithm
+		self._packages = tuple(sorted(packages, key=LockedPackageVersion._SortKey))
+		self._contentHash = _hash("\n".join(f"{package} {package._hash}" for package in (root, *self._packages)))
+
+	@classmethod
+	def FromSolution(
+		cls,
+		root:      PackageVersion,
+		solution:  Iterable[PackageVersion],
+		algorithm: SolverAlgorithm = SolverAlgorithm.Backtracking
+	) -> "Lockfile":
+		"""
+		Create a lockfile from a solution computed by :meth:`~pyTooling.Dependency.PackageVersion.SolveLatest`.
+
+		:param root:      Root package version of the dependency problem.
+		:param solution:  Package versions of the solution.
+		:param algorithm: Solver algorithm used to compute the solution.
+		:returns:         Lockfile of the solution.
+		"""
+		return cls(
+			LockedPackageVersion.FromPackageVersion(root),
+			(LockedPackageVersion.FromPackageVersion(packageVersion) for packageVersion in solution),
+			algorithm
+		)
+
+	@readonly
+	def Root(self) -> LockedPackageVersion:
+		"""
+		Read-only property to access the root package version of the dependency problem.
+
+		:returns: Locked root package version.
+		"""
+		return self._root
+
+	@readonly
+	def Algorithm(self) -> SolverAlgorithm:
+		"""
+		Read-only property to access the solver algorithm used to compute the solution.
+
+		:returns: Solver algorithm.
+		"""
+		return self._algorithm
+
+	@readonly
+	def Packages(self) -> Tuple[LockedPackageVersion, ...]:
+		"""
+		Read-only property to access the locked package versions.
+
+		:returns: Locked package versions sorted by storage, package and version.
+		"""
+		return self._packages
+
+	@readonly
+	def ContentHash(self) -> str:
+		"""
+		Read-only property to access the content hash of the lockfile.
+
+		:returns: SHA-256 hash over the root and all locked package versions including their hashes.
+		"""
+		return self._contentHash
+
+	def ToDict(self) -> Dict[str, Any]:
+		"""
+		Convert the lockfile to a dictionary.
+
+		:returns: Dictionary as written to JSON or TOML lockfiles.
+		"""
+		return {
+			"version":     _FORMAT_VERSION,
+			"algorithm":   self._algorithm.name,
+			"contentHash": self._contentHash,
+			"root":        self._root.ToDict(),
+			"packages":    [package.ToDict() for package in self._packages]
+		}
+
+	@classmethod
+	def FromDict(cls, document: Dict[str, Any]) -> "Lockfile":
+		"""
+		Create a lockfile from a dictionary as read from JSON or TOML lockfiles.
+
+		:param document:               Dictionary of a lockfile.
+		:returns:                      Lockfile.
+		:raises LockfileMismatchError: If the format version is unsupported, the document is incomplete or the content hash
+		                               doesn't match.
+		"""
+		try:
+			if (version := document["version"]) != _FORMAT_VERSION:
+				raise LockfileMismatchError(f"Unsupported lockfile format version '{version}'.", [])
+
+			lockfile = cls(
+				LockedPackageVersion(**document["root"]),
+				(LockedPackageVersion(**package) for package in document["packages"]),
+				SolverAlgorithm[document["algorithm"]]
+			)
+			contentHash = document["contentHash"]
+		except (KeyError, TypeError) as ex:
+			raise LockfileMismatchError(f"Lockfile is incomplete or malformed.", [str(ex)]) from ex
+
+		if lockfile._contentHash != contentHash:
+			raise LockfileMismatchError(f"Lockfile content hash doesn't match its content.", [f"Expected '{contentHash}', got '{lockfile._contentHash}'."])
+
+		return lockfile
+
+	def ToJSON(self) -> str:
+		"""
+		Serialize the lockfile as JSON.
+
+		:returns: JSON document with sorted keys.
+		"""
+		return json_dumps(self.ToDict(), indent=2, sort_keys=True) + "\n"
+
+	def ToTOML(self) -> str:
+		"""
+		Serialize the lockfile as TOML.
+
+		:returns: TOML document.
+		"""
+		document = self.ToDict()
+		lines = [
+			"# Generated by pyTooling.Dependency. Do not edit manually.",
+			f"version = {document['version']}",
+			f"algorithm = {json_dumps(document['algorithm'])}",
+			f"contentHash = {json_dumps(document['contentHash'])}",
+			"",
+			"[root]",
+			*(f"{key} = {json_dumps(value, ensure_ascii=False)}" for key, value in document["root"].items())
+		]
+		for package in document["packages"]:
+			lines.append("")
+			lines.append("[[packages]]")
+			lines.extend(f"{key} = {json_dumps(value, ensure_ascii=False)}" for key, value in package.items())
+
+		return "\n".join(lines) + "\n"
+
+	@classmethod
+	def Parse(cls, content: str, format: str) -> "Lockfile":
+		"""
+		Parse a lockfile.
+
+		:param content:                Content of the lockfile.
+		:param format:                 Either ``"toml"`` or ``"json"``.
+		:returns:                      Lockfile.
+		:raises ValueError:            If parameter 'format' is unsupported.
+		:raises LockfileMismatchError: If the lockfile is malformed.
+		"""
+		if format == "toml":
+			loads, decodeError = toml_loads, TOMLDecodeError
+		elif format == "json":
+			loads, decodeError = json_loads, JSONDecodeError
+		else:
+			raise ValueError(f"Unsupported lockfile format '{format}'.")
+
+		try:
+			document = loads(content)
+		except decodeError as ex:
+			raise LockfileMismatchError(f"Lockfile is malformed.", [str(ex)]) from ex
+
+		return cls.FromDict(document)
+
+	@staticmethod
+	def _GetFormat(path: Path) -> str:
+		if (format := path.suffix.lower()[1:]) not in ("toml", "json"):
+			raise ValueError(f"Unsupported lockfile format '{path.suffix}'. Use '.toml' or '.json'.")
+
+		return format
+
+	@classmethod
+	def Read(cls, path: Union[str, Path]) -> "Lockfile":
+		"""
+		Read a lockfile. The format is selected by the file suffix (``.toml`` or ``.json``).
+
+		:param path:                   Path to the lockfile.
+		:returns:                      Lockfile.
+		:raises ValueError:            If the file suffix is unsupported.
+		:raises LockfileMismatchError: If the lockfile is malformed.
+		"""
+		path = Path(path)
+		return cls.Parse(path.read_text(encoding="utf-8"), cls._GetFormat(path))
+
+	def Write(self, path: Union[str, Path]) -> None:
+		"""
+		Write the lockfile. The format is selected by the file suffix (``.toml`` or ``.json``).
+
+		:param path:        Path to the lockfile.
+		:raises ValueError: If the file suffix is unsupported.
+		"""
+		path = Path(path)
+		content = self.ToTOML() if self._GetFormat(path) == "toml" else self.ToJSON()
+		path.write_text(content, encoding="utf-8", newline="\n")
+
+	def Verify(self, graph: PackageDependencyGraph) -> List[PackageVersion]:
+		"""
+		Verify the lockfile against a package dependency graph without re-solving the dependency problem.
+
+		The check is incremental: each locked package version is looked up and its dependency declaration is compared by
+		content hash. Then, every dependency of a locked package version must be satisfied by the locked version of that
+		package.
+
+		.. note::
+
+		   A verified lockfile is a valid solution, but not necessarily the latest one. Only the declarations of locked
+		   package versions are hashed, thus a newer solution might exist. Hence, the locked solution isn't stored in the
+		   graph's :class:`~pyTooling.Dependency.ResolutionCache` and
+		   :meth:`~pyTooling.Dependency.PackageVersion.SolveLatest` still solves the dependency problem.
+
+		:param graph:                  Package dependency graph.
+		:returns:                      Locked package versions (root first) like a solution of
+		                               :meth:`~pyTooling.Dependency.PackageVersion.SolveLatest`.
+		:raises TypeError:             If parameter 'graph' is not a :class:`~pyTooling.Dependency.PackageDependencyGraph`.
+		:raises LockfileMismatchError: If the lockfile doesn't match the graph.
+		"""
+		if not isinstance(graph, PackageDependencyGraph):
+			ex = TypeError("Parameter 'graph' is not of type 'PackageDependencyGraph'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(graph)}'.")
+			raise ex
+
+		mismatches = []
+		versionsByString = {}
+		versionStrings = {}
+		selected = {}
+
+		def lookup(locked: LockedPackageVersion) -> Nullable[PackageVersion]:
+			if (storage := graph._storages.get(locked._storage)) is None or (package := storage._packages.get(locked._package)) is None:
+				mismatches.append(f"Package '{locked._storage}/{locked._package}' is not in the graph.")
+				return None
+
+			if (versions := versionsByString.get(package)) is None:
+				versions = versionsByString[package] = {_versionString(version, versionStrings): packageVersion for version, packageVersion in package._versions.items()}
+
+			if (packageVersion := versions.get(locked._version)) is None:
+				mismatches.append(f"Package version '{locked}' is not in the graph.")
+			elif _declarationHash(packageVersion, versionStrings) != locked._hash:
+				mismatches.append(f"Dependencies of package version '{locked}' changed.")
+
+			return packageVersion
+
+		root = lookup(self._root)
+		for locked in self._packages:
+			if (packageVersion := root if locked == self._root else lookup(locked)) is None:
+				continue
+			elif (other := selected.setdefault(packageVersion._package, packageVersion)) is not packageVersion:
+				mismatches.append(f"Package '{locked._storage}/{locked._package}' is locked in versions '{other._version}' and '{locked._version}'.")
+
+		if root is not None and selected.get(root._package) is not root:
+			mismatches.append(f"Root package version '{self._root}' is not part of the solution.")
+
+		if len(mismatches) == 0:
+			for packageVersion in selected.values():
+				for dependency, versions in packageVersion._dependsOn.items():
+					if (locked := selected.get(dependency)) is None:
+						mismatches.append(f"Dependency '{dependency._name}' of '{packageVersion._package._name}@{packageVersion._version}' is not locked.")
+					elif locked._version not in versions:
+						mismatches.append(f"Locked version '{locked._version}' of '{dependency._name}' doesn't satisfy '{packageVersion._package._name}@{packageVersion._version}'.")
+
+		if len(mismatches) > 0:
+			raise LockfileMismatchError(f"Lockfile for '{self._root}' doesn't match the dependency graph '{graph._name}'.", mismatches)
+
+		return [root] + [packageVersion for packageVersion in selected.values() if packageVersion is not root]
+
+	def IsValid(self, graph: PackageDependencyGraph) -> bool:
+		"""
+		Check if the lockfile matches a package dependency graph (see :meth:`Verify`).
+
+		:param graph: Package dependency graph.
+		:returns:     ``True``, if the lockfile matches the graph.
+		"""
+		try:
+			self.Verify(graph)
+		except LockfileMismatchError:
+			return False
+
+		return True
+
+	def __eq__(self, other: Any) -> bool:
+		if isinstance(other, Lockfile):
+			return self._contentHash == other._contentHash and self._algorithm is other._algorithm
+
+		return NotImplemented
+
+	def __hash__(self) -> int:
+		return hash(self._contentHash)
+
+	def __str__(self) -> str:
+		return f"Lockfile: {self._root} ({len(self._packages)} package versions)"
@@ -35,20 +35,17 @@ Implementation of package dependencies.
 
    See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
 """
-from asyncio   import run as asyncio_run, gather as asyncio_gather
 from datetime  import datetime
 from enum      import IntEnum
 from functools import wraps, update_wrapper
+from json      import loads as json_loads
 from threading import RLock
-from typing    import Optional as Nullable, List, Dict, Union, Iterable, Mapping
-
-try:
-	from aiohttp import ClientSession
-except ImportError as ex:  # pragma: no cover
-	raise Exception(f"Optional dependency 'aiohttp' not installed. Either install pyTooling with extra dependencies 'pyTooling[pypi]' or install 'aiohttp' directly.") from ex
+from typing    import Optional as Nullable, Any, List, Dict, Union, Iterable, Mapping, Tuple, ClassVar
 
 try:
+	from packaging.markers      import Marker, Variable
 	from packaging.requirements import Requirement
+	from packaging.utils        import canonicalize_name
 except ImportError as ex:  # pragma: no cover
 	raise Exception(f"Optional dependency 'packaging' not installed. Either install pyTooling with extra dependencies 'pyTooling[pypi]' or install 'packaging' directly.") from ex
 
@@ -57,13 +54,15 @@ try:
 except ImportError as ex:  # pragma: no cover
 	raise Exception(f"Optional dependency 'requests' not installed. Either install pyTooling with extra dependencies 'pyTooling[pypi]' or install 'requests' directly.") from ex
 
-from pyTooling.Decorators      import export, readonly
-from pyTooling.MetaClasses     import ExtendedType, abstractmethod
-from pyTooling.Exceptions      import ToolingException
-from pyTooling.Common          import getFullyQualifiedName, firstValue
-from pyTooling.Dependency      import Package, PackageStorage, PackageVersion, PackageDependencyGraph
-from pyTooling.GenericPath.URL import URL
-from pyTooling.Versioning      import SemanticVersion, PythonVersion, Parts
+from pyTooling.Decorators           import export, readonly
+from pyTooling.MetaClasses          import ExtendedType, abstractmethod
+from pyTooling.Exceptions           import ToolingException
+from pyTooling.Common               import getFullyQualifiedName, firstValue
+from pyTooling.Caching              import CacheStatistics, LRUCache
+from pyTooling.Dependency           import Package, PackageStorage, PackageVersion, PackageDependencyGraph
+from pyTooling.Dependency.HTTPCache import ResponseStore, OfflineCacheMissError
+from pyTooling.GenericPath.URL      import URL
+from pyTooling.Versioning           import SemanticVersion, PythonVersion, Parts
 
 
 @export
@@ -136,6 +135,31 @@ class LazyLoadableMixin(metaclass=ExtendedType, mixin=True):
 		pass
 
 
+def _extractExtra(marker: Marker) -> Nullable[str]:
+	"""
+	Extract the extra name of a marker, if the marker is a conjunction containing exactly one ``extra == "..."`` clause.
+
+	:param marker: Marker of a requirement.
+	:returns:      The extra name as written in the marker or ``None``, if the marker has no such clause or another structure.
+	"""
+	try:
+		markers = marker._markers
+		if "or" in markers:
+			return None
+
+		extras = []
+		for item in markers:
+			if isinstance(item, tuple) and item[1].value == "==":
+				if isinstance(item[0], Variable) and item[0].value == "extra":
+					extras.append(item[2].value)
+				elif isinstance(item[2], Variable) and item[2].value == "extra":
+					extras.append(item[0].value)
+	except (AttributeError, IndexError, TypeError):  # pragma: no cover
+		return None
+
+	return extras[0] if len(extras) == 1 else None
+
+
 @export
 class Distribution(metaclass=ExtendedType, slots=True):
 	_filename:   str
@@ -187,6 +211,8 @@ class Distribution(metaclass=ExtendedType, slots=True):
 
 @export
 class Release(PackageVersion, LazyLoadableMixin):
+	_requirementCache: ClassVar[Nullable[LRUCache]] = LRUCache(16384, threadSafe=True)  #: Shared cache of parsed requirements keyed by requirement string.
+
 	_files:        List[Distribution]
 	_requirements: Dict[Union[str, None], List[Requirement]]
 
@@ -244,52 +270,129 @@ class Release(PackageVersion, LazyLoadableMixin):
 		return f"{self._package._name.lower()}/{self._version}/json"
 
 	def DownloadDetails(self) -> None:
-		if self._session is None:
-			# TODO: NoSessionAvailableException
-			raise ToolingException(f"No session available.")
-
-		response = self._session.get(url=f"{self._api}{self._GetPyPIEndpoint()}")
-		try:
-			response.raise_for_status()
-		except HTTPError as ex:
-			if ex.response.status_code == 404:
-				# TODO: ReleaseNotFoundException
-				raise ToolingException(f"Release '{self._version}' of package '{self._package._name}' not found.")
-
-		self.UpdateDetailsFromPyPIJSON(response.json())
-
 		index: PythonPackageIndex = self._package._storage
+		json = index._GetJSON(
+			f"{self._api}{self._GetPyPIEndpoint()}",
+			f"Release '{self._version}' of package '{self._package._name}' not found."
+		)
+		self.UpdateDetailsFromPyPIJSON(json)
+
 		for requirement in self._requirements[None]:
 			packageName = requirement.name
 			index.DownloadProject(packageName, True)
 
-	def UpdateDetailsFromPyPIJSON(self, json) -> None:
-		infoNode = json["info"]
-		if (extras := infoNode["provides_extra"]) is not None:
-			self._requirements = {extra: [] for extra in extras}
-			self._requirements[None] = []
-
-		if (requirements := infoNode["requires_dist"]) is not None:
-			brokenRequirements = []
-			for requirement in requirements:
-				req = Requirement(requirement)
-
-				# Handle requirements without an extra marker
-				if req.marker is None:
-					self._requirements[None].append(req)
-					continue
-
-				for extra in self._requirements.keys():
-					if extra is not None and req.marker.evaluate({"extra": extra}):
-						self._requirements[extra].append(req)
+	@staticmethod
+	def ConfigureRequirementCache(maxSize: int = 16384) -> None:
+		"""
+		Resize or disable the cache of parsed requirements shared by all releases.
+
+		Any previously cached requirements and the cache statistics are discarded.
+
+		:param maxSize:     Maximum number of cached requirements. ``0`` disables the requirement cache.
+		:raises TypeError:  If parameter 'maxSize' is not of type :class:`int`.
+		:raises ValueError: If parameter 'maxSize' is negative.
+		"""
+		if not isinstance(maxSize, int):
+			ex = TypeError(f"Parameter 'maxSize' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(maxSize)}'.")
+			raise ex
+		elif maxSize < 0:
+			raise ValueError(f"Parameter 'maxSize' is negative.")
+
+		Release._requirementCache = LRUCache(maxSize, threadSafe=True) if maxSize > 0 else None
+
+	@staticmethod
+	def ClearRequirementCache() -> None:
+		"""Remove all entries from the requirement cache shared by all releases."""
+		if Release._requirementCache is not None:
+			Release._requirementCache.Clear()
+
+	@staticmethod
+	def GetRequirementCacheStatistics() -> Nullable[CacheStatistics]:
+		"""
+		Return the statistics of the requirement cache shared by all releases.
+
+		:returns: Cache statistics or ``None``, if the requirement cache is disabled.
+		"""
+		if Release._requirementCache is None:
+			return None
+
+		return Release._requirementCache.Statistics
+
+	@staticmethod
+	def _ParseRequirement(requirementString: str) -> Tuple[Requirement, Nullable[str], bool]:
+		"""
+		Parse a requirement string and pre-classify its marker (cached).
+
+		:param requirementString: Requirement like ``pytest >= 8.0; extra == "test"``.
+		:returns:                 A tuple of parsed requirement, normalized extra name of a top-level ``extra == "..."``
+		                          clause (or ``None``) and the marker's result for that extra in the current environment.
+		"""
+		if (cache := Release._requirementCache) is not None and (parsed := cache.Get(requirementString)) is not None:
+			return parsed
+
+		requirement = Requirement(requirementString)
+		if requirement.marker is not None and (extra := _extractExtra(requirement.marker)) is not None:
+			parsed = (requirement, canonicalize_name(extra), requirement.marker.evaluate({"extra": extra}))
+		else:
+			parsed = (requirement, None, True)
+
+		if cache is not None:
+			cache.Set(requirementString, parsed)
+
+		return parsed
+
+	@staticmethod
+	def _ClassifyRequirements(
+		extras:       Nullable[Iterable[str]],
+		requirements: Nullable[Iterable[str]]
+	) -> Dict[Union[str, None, int], List[Requirement]]:
+		"""
+		Parse requirement strings and group them by extra.
+
+		Requirements without a marker are grouped under key ``None``. Requirements with an ``extra == "..."`` clause are
+		grouped by a dictionary lookup of that extra. Other markers are evaluated for each extra. Requirements matching no
+		extra are grouped under key ``0``.
+
+		:param extras:       Extras provided by the release.
+		:param requirements: Requirement strings of the release.
+		:returns:            Dictionary of requirement lists per extra.
+		"""
+		classified: Dict[Union[str, None, int], List[Requirement]] = {extra: [] for extra in extras} if extras is not None else {}
+		classified[None] = []
+		if requirements is None:
+			return classified
+
+		extraKeys = {canonicalize_name(extra): extra for extra in classified.keys() if extra is not None}
+		brokenRequirements = []
+		for requirementString in requirements:
+			requirement, extra, applies = Release._ParseRequirement(requirementString)
+
+			# Handle requirements without an extra marker
+			if requirement.marker is None:
+				classified[None].append(requirement)
+			elif extra is not None:
+				if applies and (key := extraKeys.get(extra)) is not None:
+					classified[key].append(requirement)
+				else:
+					brokenRequirements.append(requirement)
+			else:
+				for key in classified.keys():
+					if key is not None and requirement.marker.evaluate({"extra": key}):
+						classified[key].append(requirement)
 						break
 				else:
-					brokenRequirements.append(req)
+					brokenRequirements.append(requirement)
 
-			# TODO: raise a warning
-			if len(brokenRequirements) > 0:
-				self._requirements[0] = brokenRequirements
+		# TODO: raise a warning
+		if len(brokenRequirements) > 0:
+			classified[0] = brokenRequirements
 
+		return classified
+
+	def UpdateDetailsFromPyPIJSON(self, json) -> None:
+		infoNode = json["info"]
+		self._requirements = self._ClassifyRequirements(infoNode["provides_extra"], infoNode["requires_dist"])
 		self.__lazy_state__ = LazyLoaderState.FullyLoaded
 
 	def PostProcess(self) -> None:
@@ -381,19 +484,9 @@ class Project(Package, LazyLoadableMixin):
 		return f"{self._name.lower()}/json"
 
 	def DownloadDetails(self) -> None:
-		if self._session is None:
-			# TODO: NoSessionAvailableException
-			raise ToolingException(f"No session available.")
-
-		response = self._session.get(url=f"{self._api}{self._GetPyPIEndpoint()}")
-		try:
-			response.raise_for_status()
-		except HTTPError as ex:
-			if ex.response.status_code == 404:
-				# TODO: ReleaseNotFoundException
-				raise ToolingException(f"Package '{self._name}' not found.")
-
-		self.UpdateDetailsFromPyPIJSON(response.json())
+		index: PythonPackageIndex = self._storage
+		json = index._GetJSON(f"{self._api}{self._GetPyPIEndpoint()}", f"Package '{self._name}' not found.")
+		self.UpdateDetailsFromPyPIJSON(json)
 
 	def UpdateDetailsFromPyPIJSON(self, json) -> None:
 		infoNode = json["info"]
@@ -403,16 +496,13 @@ class Project(Package, LazyLoadableMixin):
 		self._url = URL.Parse(infoNode["project_url"])
 
 		# Convert key to Version number, skip empty releases
-		convertedReleasesNode = {}
-		for k, v in releasesNode.items():
-			if len(v) == 0:
-				continue
+		versionStrings = [k for k, v in releasesNode.items() if len(v) > 0]
+		versions, failures = PythonVersion.ParseMany(versionStrings, onError="collect")
+		for k, ex in failures:
+			print(f"Unsupported version format '{k}' - {ex}")
 
-			try:
-				version = PythonVersion.Parse(k)
-				convertedReleasesNode[version] = v
-			except ValueError as ex:
-				print(f"Unsupported version format '{k}' - {ex}")
+		failed = {k for k, _ in failures}
+		convertedReleasesNode = {version: releasesNode[k] for version, k in zip(versions, (k for k in versionStrings if k not in failed))}
 
 		for version, releaseNode in sorted(convertedReleasesNode.items(), key=lambda t: t[0]):
 			if Parts.Postfix in version._parts:
@@ -432,36 +522,37 @@ class Project(Package, LazyLoadableMixin):
 		self.SortVersions()
 		self.__lazy_state__ = LazyLoaderState.FullyLoaded
 
+	def UpdateReleaseDetailsFromPyPIJSON(self, documents: Mapping[Release, Any]) -> None:
+		"""
+		Update the details of many releases of this project from their PyPI JSON documents.
+
+		Consecutive releases often declare identical extras and requirements, therefore each distinct combination is parsed
+		and classified only once.
+
+		:param documents: Mapping of releases to their PyPI JSON documents.
+		"""
+		classifications = {}
+		for release, json in documents.items():
+			infoNode = json["info"]
+			extras = infoNode["provides_extra"]
+			requirements = infoNode["requires_dist"]
+
+			key = (None if extras is None else tuple(extras), None if requirements is None else tuple(requirements))
+			if (classified := classifications.get(key)) is None:
+				classified = classifications[key] = Release._ClassifyRequirements(extras, requirements)
+
+			release._requirements = {extra: list(requirementList) for extra, requirementList in classified.items()}
+			release.__lazy_state__ = LazyLoaderState.FullyLoaded
+
 	def DownloadReleaseDetails(self) -> None:
-		async def ParallelDownloadReleaseDetails():
-			async def routine(session, release: Release):
-				if Parts.Postfix in release._version._parts:
-					pass
-
-				async with session.get(self._GetPyPIEndpoint()) as response:
-					json = await response.json()
-					response.raise_for_status()
-
-					release.UpdateDetailsFromPyPIJSON(json)
-
-			async with ClientSession(base_url=str(self._api), headers={"accept": "application/json"}) as session:
-				tasks = []
-				for release in self._versions.values():  # type: Release
-					tasks.append(routine(session, release))
-
-				results = await asyncio_gather(*tasks, return_exceptions=True)
-				delList = []
-				for release, result in zip(self.Releases.values(), results):
-					if isinstance(result, Exception):
-						delList.append((release, result))
-
-				# TODO: raise a warning
-				for release, ex in delList:
-					print(f"  Removing {release.Project._name} {release.Version} - {ex}")
-					del self.Releases[release.Version]
-
-		asyncio_run(ParallelDownloadReleaseDetails())
-		self.__lazy_state__ = LazyLoaderState.PostProcessed
+		from pyTooling.Dependency.Crawler import PackageIndexCrawler
+
+		crawler = PackageIndexCrawler(self._storage)
+		crawler.DownloadReleaseDetails(self)
+
+		# TODO: raise a warning
+		for release, ex in crawler.Failures.items():
+			print(f"  Removing {release} - {ex}")
 
 	def __repr__(self) -> str:
 		return f"Project: {self._name} latest: {self.LatestRelease._version}"
@@ -472,12 +563,22 @@ class Project(Package, LazyLoadableMixin):
 
 @export
 class PythonPackageIndex(PackageStorage):
-	_url:     URL
+	_url:           URL
 
-	_api:     URL
-	_session: Session
+	_api:           URL
+	_session:       Session
+	_responseCache: Nullable[ResponseStore]
+	_offline:       bool
 
-	def __init__(self, name: str, url: Union[str, URL], api: Union[str, URL], graph: "PackageDependencyGraph") -> None:
+	def __init__(
+		self,
+		name:          str,
+		url:           Union[str, URL],
+		api:           Union[str, URL],
+		graph:         "PackageDependencyGraph",
+		responseCache: Nullable[ResponseStore] = None,
+		offline:       bool = False
+	) -> None:
 		super().__init__(name, graph)
 
 		if isinstance(url, str):
@@ -498,6 +599,16 @@ class PythonPackageIndex(PackageStorage):
 
 		self._api = api
 
+		if responseCache is not None and not isinstance(responseCache, ResponseStore):
+			ex = TypeError("Parameter 'responseCache' is not of type 'ResponseStore'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(responseCache)}'.")
+			raise ex
+		elif offline and responseCache is None:
+			raise ValueError("Parameter 'offline' requires a response cache.")
+
+		self._responseCache = responseCache
+		self._offline = offline
+
 		self._session = Session()
 		self._session.headers["accept"] = "application/json"
 
@@ -509,6 +620,21 @@ class PythonPackageIndex(PackageStorage):
 	def API(self) -> URL:
 		return self._api
 
+	@readonly
+	def ResponseCache(self) -> Nullable[ResponseStore]:
+		return self._responseCache
+
+	@property
+	def Offline(self) -> bool:
+		return self._offline
+
+	@Offline.setter
+	def Offline(self, value: bool) -> None:
+		if value and self._responseCache is None:
+			raise ValueError("Offline mode requires a response cache.")
+
+		self._offline = value
+
 	@readonly
 	def Projects(self) -> Dict[str, Project]:
 		return self._packages
@@ -520,6 +646,51 @@ class PythonPackageIndex(PackageStorage):
 	def _GetPyPIEndpoint(self, projectName: str) -> str:
 		return f"{self._api}{projectName.lower()}/json"
 
+	def _GetJSON(self, url: str, notFoundMessage: str) -> Any:
+		"""
+		Get a JSON document from the index API.
+
+		If a response cache is configured, a conditional request is sent using the cached ``ETag`` and ``Last-Modified``
+		validators. On ``304 Not Modified``, the cached document is returned. In offline mode, the document is served from
+		the cache only.
+
+		:param url:                    Requested API URL.
+		:param notFoundMessage:        Error message if the server answers with ``404 Not Found``.
+		:returns:                      Decoded JSON document.
+		:raises OfflineCacheMissError: In offline mode, if the URL isn't cached.
+		:raises ToolingException:      If no session is available or the resource wasn't found.
+		"""
+		cached = self._responseCache.Lookup(url) if self._responseCache is not None else None
+		if self._offline:
+			if cached is None:
+				raise OfflineCacheMissError(f"URL '{url}' is not cached.")
+
+			return cached.JSON()
+
+		if self._session is None:
+			# TODO: NoSessionAvailableException
+			raise ToolingException(f"No session available.")
+
+		headers = cached.ConditionalHeaders if cached is not None else None
+		response = self._session.get(url=url, headers=headers)
+		if response.status_code == 304 and cached is not None:
+			self._responseCache.Revalidated(cached)
+			return cached.JSON()
+
+		try:
+			response.raise_for_status()
+		except HTTPError as ex:
+			if ex.response.status_code == 404:
+				# TODO: ReleaseNotFoundException
+				raise ToolingException(notFoundMessage)
+
+			raise
+
+		if self._responseCache is not None:
+			self._responseCache.Store(url, response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+		return json_loads(response.content)
+
 	def DownloadProject(self, projectName: str, lazy: LazyLoaderState = LazyLoaderState.PartiallyLoaded) -> Project:
 		project = Project(projectName, "", index=self, lazy=lazy)
 
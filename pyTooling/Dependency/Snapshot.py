@@ -0,0 +1,445 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Local, file-backed package indexes serving projects and releases from a snapshot of the
+`PyPI JSON API <https://docs.pypi.org/api/json/>`__ without network access.
+
+A :class:`Snapshot` maps API endpoints like ``pytooling/json`` (project) or ``pytooling/8.0.0/json`` (release) to JSON
+documents. Snapshots are stored as a mirror directory, a single compressed JSON file or an SQLite database. A
+:class:`LocalPackageIndex` reads projects and releases on demand, thus projects are loaded lazily like in a
+:class:`~pyTooling.Dependency.Python.PythonPackageIndex`.
+
+.. hint::
+
+   See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
+"""
+from bz2       import open as bz2_open
+from gzip      import open as gzip_open
+from json      import load as json_load, loads as json_loads, dump as json_dump, dumps as json_dumps
+from lzma      import open as lzma_open
+from pathlib   import Path
+from sqlite3   import connect as sqlite3_connect, Connection
+from threading import Lock
+from typing    import Optional as Nullable, Any, Dict, List, Mapping, Union
+from zlib      import compress as zlib_compress, decompress as zlib_decompress
+
+try:
+	from packaging.utils import canonicalize_name
+except ImportError as ex:  # pragma: no cover
+	raise Exception(f"Optional dependency 'packaging' not installed. Either install pyTooling with extra dependencies 'pyTooling[pypi]' or install 'packaging' directly.") from ex
+
+from pyTooling.Decorators        import export, readonly
+from pyTooling.MetaClasses       import ExtendedType, abstractmethod
+from pyTooling.Exceptions        import ToolingException
+from pyTooling.Common            import getFullyQualifiedName
+from pyTooling.Dependency        import PackageDependencyGraph
+from pyTooling.Dependency.Python import PythonPackageIndex
+from pyTooling.GenericPath.URL   import URL
+
+
+_OPENERS = {".gz": gzip_open, ".xz": lzma_open, ".bz2": bz2_open}  #: File openers per compression suffix.
+
+
+def _normalizeEndpoint(endpoint: str) -> str:
+	"""
+	Normalize the project name in an API endpoint according to :pep:`503`.
+
+	:param endpoint: API endpoint like ``Py_Tooling/json``.
+	:returns:        Normalized endpoint like ``py-tooling/json``.
+	"""
+	projectName, _, rest = endpoint.strip("/").partition("/")
+	return f"{canonicalize_name(projectName)}/{rest}"
+
+
+def _toPath(path: Union[str, Path], parameterName: str) -> Path:
+	if isinstance(path, str):
+		return Path(path)
+	elif not isinstance(path, Path):
+		ex = TypeError(f"Parameter '{parameterName}' is not of type 'Path'.")
+		ex.add_note(f"Got type '{getFullyQualifiedName(path)}'.")
+		raise ex
+
+	return path
+
+
+@export
+class Snapshot(metaclass=ExtendedType, slots=True):
+	"""
+	Abstract base-class of package index snapshots mapping API endpoints to JSON documents.
+
+	Endpoints are relative to the API's base URL. Project names in endpoints are normalized according to :pep:`503`.
+	"""
+
+	@abstractmethod
+	def _Load(self, endpoint: str) -> Nullable[Any]:
+		"""Return the JSON document for a normalized ``endpoint`` or ``None``."""
+
+	@abstractmethod
+	def _Endpoints(self) -> List[str]:
+		"""Return all normalized endpoints."""
+
+	def Load(self, endpoint: str) -> Nullable[Any]:
+		"""
+		Load the JSON document of an API endpoint.
+
+		:param endpoint: API endpoint like ``pytooling/json`` or ``pytooling/8.0.0/json``.
+		:returns:        Decoded JSON document or ``None``, if the endpoint isn't contained in the snapshot.
+		"""
+		return self._Load(_normalizeEndpoint(endpoint))
+
+	def ProjectNames(self) -> List[str]:
+		"""
+		Return the normalized names of all projects contained in the snapshot.
+
+		:returns: Sorted list of project names.
+		"""
+		return sorted(endpoint[:-5] for endpoint in self._Endpoints() if endpoint.count("/") == 1 and endpoint.endswith("/json"))
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of JSON documents in the snapshot.
+
+		:returns: Number of documents.
+		"""
+		return len(self._Endpoints())
+
+
+@export
+class MirrorDirectory(Snapshot):
+	"""
+	A snapshot stored as a directory tree mirroring the API's URL structure.
+
+	The document of endpoint ``pytooling/8.0.0/json`` is stored in file ``pytooling/8.0.0/json``. Files can be compressed
+	by gzip, which is indicated by an additional ``.gz`` suffix.
+	"""
+	_directory: Path  #: Root directory of the mirror.
+
+	def __init__(self, directory: Union[str, Path]) -> None:
+		"""
+		Initializes a mirror directory snapshot.
+
+		:param directory:         Root directory of the mirror.
+		:raises TypeError:        If parameter 'directory' is not a path.
+		:raises ToolingException: If the directory doesn't exist.
+		"""
+		directory = _toPath(directory, "directory")
+		if not directory.is_dir():
+			raise ToolingException(f"Mirror directory '{directory}' doesn't exist.")
+
+		self._directory = directory
+
+	@classmethod
+	def Create(cls, directory: Union[str, Path], documents: Mapping[str, Any], compress: bool = False) -> "MirrorDirectory":
+		"""
+		Write JSON documents into a mirror directory.
+
+		:param directory: Root directory of the mirror. It's created if it doesn't exist.
+		:param documents: Mapping of API endpoints to JSON documents.
+		:param compress:  If true, files are gzip compressed.
+		:returns:         The mirror directory snapshot.
+		"""
+		directory = _toPath(directory, "directory")
+		for endpoint, document in documents.items():
+			path = directory / _normalizeEndpoint(endpoint)
+			path.parent.mkdir(parents=True, exist_ok=True)
+			if compress:
+				with gzip_open(path.with_name(f"{path.name}.gz"), "wt", encoding="utf-8") as file:
+					json_dump(document, file)
+			else:
+				path.write_text(json_dumps(document), encoding="utf-8")
+
+		return cls(directory)
+
+	@readonly
+	def Directory(self) -> Path:
+		"""
+		Read-only property to access the root directory of the mirror.
+
+		:returns: Root directory.
+		"""
+		return self._directory
+
+	def _Load(self, endpoint: str) -> Nullable[Any]:
+		path = self._directory / endpoint
+		try:
+			return json_loads(path.read_bytes())
+		except FileNotFoundError:
+			pass
+
+		try:
+			with gzip_open(path.with_name(f"{path.name}.gz"), "rb") as file:
+				return json_load(file)
+		except FileNotFoundError:
+			return None
+
+	def _Endpoints(self) -> List[str]:
+		endpoints = []
+		for pattern, suffixLength in (("json", 0), ("json.gz", 3)):
+			for path in self._directory.rglob(pattern):
+				relative = path.relative_to(self._directory).as_posix()
+				endpoints.append(relative[:len(relative) - suffixLength])
+
+		return endpoints
+
+	def __repr__(self) -> str:
+		return f"MirrorDirectory: {self._directory}"
+
+
+@export
+class JSONSnapshot(Snapshot):
+	"""
+	A snapshot stored as a single JSON file mapping endpoints to documents.
+
+	The file is compressed according to its suffix: ``.gz`` (gzip), ``.xz`` (LZMA) or ``.bz2`` (bzip2). As a compressed
+	file can't be read partially, the whole file is read and decoded at the first access.
+	"""
+	_path:      Path                       #: Path to the snapshot file.
+	_documents: Nullable[Dict[str, Any]]   #: Decoded documents, after the file was read.
+	_lock:      Lock                       #: Lock serializing the first read.
+
+	def __init__(self, path: Union[str, Path]) -> None:
+		"""
+		Initializes a JSON file snapshot.
+
+		:param path:              Path to the snapshot file.
+		:raises TypeError:        If parameter 'path' is not a path.
+		:raises ToolingException: If the file doesn't exist.
+		"""
+		path = _toPath(path, "path")
+		if not path.is_file():
+			raise ToolingException(f"Snapshot file '{path}' doesn't exist.")
+
+		self._path = path
+		self._documents = None
+		self._lock = Lock()
+
+	@classmethod
+	def Create(cls, path: Union[str, Path], documents: Mapping[str, Any]) -> "JSONSnapshot":
+		"""
+		Write JSON documents into a single (compressed) JSON file.
+
+		:param path:      Path to the snapshot file. The suffix selects the compression.
+		:param documents: Mapping of API endpoints to JSON documents.
+		:returns:         The JSON file snapshot.
+		"""
+		path = _toPath(path, "path")
+		path.parent.mkdir(parents=True, exist_ok=True)
+		normalized = {_normalizeEndpoint(endpoint): document for endpoint, document in documents.items()}
+
+		with _OPENERS.get(path.suffix, open)(path, "wt", encoding="utf-8") as file:
+			json_dump(normalized, file, sort_keys=True)
+
+		return cls(path)
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to access the path to the snapshot file.
+
+		:returns: Path to the snapshot file.
+		"""
+		return self._path
+
+	def _GetDocuments(self) -> Dict[str, Any]:
+		with self._lock:
+			if self._documents is None:
+				with _OPENERS.get(self._path.suffix, open)(self._path, "rt", encoding="utf-8") as file:
+					self._documents = json_load(file)
+
+		return self._documents
+
+	def _Load(self, endpoint: str) -> Nullable[Any]:
+		return self._GetDocuments().get(endpoint)
+
+	def _Endpoints(self) -> List[str]:
+		return list(self._GetDocuments().keys())
+
+	def __repr__(self) -> str:
+		return f"JSONSnapshot: {self._path}"
+
+
+@export
+class SQLiteSnapshot(Snapshot):
+	"""
+	A snapshot stored as an SQLite database with one zlib compressed document per endpoint.
+
+	Documents are read on demand, so loading a single project doesn't require to read the whole snapshot.
+	"""
+	_path:       Path        #: Path to the database file.
+	_connection: Connection  #: Database connection.
+	_lock:       Lock        #: Lock serializing accesses to the database connection.
+
+	def __init__(self, path: Union[str, Path]) -> None:
+		"""
+		Initializes an SQLite snapshot.
+
+		:param path:              Path to the database file.
+		:raises TypeError:        If parameter 'path' is not a path.
+		:raises ToolingException: If the file doesn't exist.
+		"""
+		path = _toPath(path, "path")
+		if not path.is_file():
+			raise ToolingException(f"Snapshot file '{path}' doesn't exist.")
+
+		self._path = path
+		self._connection = sqlite3_connect(path, check_same_thread=False)
+		self._lock = Lock()
+
+	@classmethod
+	def Create(cls, path: Union[str, Path], documents: Mapping[str, Any]) -> "SQLiteSnapshot":
+		"""
+		Write JSON documents into an SQLite database.
+
+		Existing documents of the same endpoints are replaced.
+
+		:param path:      Path to the database file.
+		:param documents: Mapping of API endpoints to JSON documents.
+		:returns:         The SQLite snapshot.
+		"""
+		path = _toPath(path, "path")
+		path.parent.mkdir(parents=True, exist_ok=True)
+
+		connection = sqlite3_connect(path)
+		try:
+			with connection:
+				connection.execute("CREATE TABLE IF NOT EXISTS documents (endpoint TEXT PRIMARY KEY, body BLOB)")
+				connection.executemany(
+					"INSERT OR REPLACE INTO documents (endpoint, body) VALUES (?, ?)",
+					((_normalizeEndpoint(endpoint), zlib_compress(json_dumps(document).encode("utf-8"))) for endpoint, document in documents.items())
+				)
+		finally:
+			connection.close()
+
+		return cls(path)
+
+	@readonly
+	def Path(self) -> Path:
+		"""
+		Read-only property to access the path to the database file.
+
+		:returns: Path to the database file.
+		"""
+		return self._path
+
+	def _Load(self, endpoint: str) -> Nullable[Any]:
+		with self._lock:
+			row = self._connection.execute("SELECT body FROM documents WHERE endpoint = ?", (endpoint, )).fetchone()
+
+		return json_loads(zlib_decompress(row[0])) if row is not None else None
+
+	def _Endpoints(self) -> List[str]:
+		with self._lock:
+			return [row[0] for row in self._connection.execute("SELECT endpoint FROM documents")]
+
+	def Close(self) -> None:
+		"""
+		Close the database connection.
+		"""
+		self._connection.close()
+
+	def __repr__(self) -> str:
+		return f"SQLiteSnapshot: {self._path}"
+
+
+@export
+class LocalPackageIndex(PythonPackageIndex):
+	"""
+	A Python package index serving projects and releases from a local :class:`Snapshot`.
+
+	It behaves like a :class:`~pyTooling.Dependency.Python.PythonPackageIndex` in offline mode: :meth:`DownloadProject`
+	creates projects, which load their details and releases lazily from the snapshot.
+	"""
+	_snapshot: Snapshot  #: Snapshot serving the JSON documents.
+
+	def __init__(
+		self,
+		name:     str,
+		snapshot: Snapshot,
+		graph:    PackageDependencyGraph,
+		url:      Union[str, URL] = "https://pypi.org/",
+		api:      Union[str, URL] = "https://pypi.org/pypi/"
+	) -> None:
+		"""
+		Initializes a local package index.
+
+		:param name:       Name of the package index.
+		:param snapshot:   Snapshot serving the JSON documents.
+		:param graph:      PackageDependencyGraph instance (parent).
+		:param url:        URL of the mirrored package index.
+		:param api:        API URL of the mirrored package index.
+		:raises TypeError: If parameter 'snapshot' is not a :class:`Snapshot`.
+		"""
+		if not isinstance(snapshot, Snapshot):
+			ex = TypeError("Parameter 'snapshot' is not of type 'Snapshot'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(snapshot)}'.")
+			raise ex
+
+		super().__init__(name, url, api, graph)
+
+		self._snapshot = snapshot
+		self._offline = True
+
+	@readonly
+	def Snapshot(self) -> Snapshot:
+		"""
+		Read-only property to access the snapshot.
+
+		:returns: Snapshot serving the JSON documents.
+		"""
+		return self._snapshot
+
+	@readonly
+	def Offline(self) -> bool:
+		"""
+		Read-only property to access the offline mode. A local package index is always offline.
+
+		:returns: Always ``True``.
+		"""
+		return True
+
+	def _GetJSON(self, url: str, notFoundMessage: str) -> Any:
+		"""
+		Get a JSON document from the snapshot.
+
+		:param url:               Requested API URL.
+		:param notFoundMessage:   Error message if the snapshot doesn't contain the document.
+		:returns:                 Decoded JSON document.
+		:raises ToolingException: If the snapshot doesn't contain the document.
+		"""
+		api = str(self._api)
+		if (document := self._snapshot.Load(url[len(api):] if url.startswith(api) else url)) is None:
+			# TODO: ReleaseNotFoundException
+			raise ToolingException(notFoundMessage)
+
+		return document
+
+	def __repr__(self) -> str:
+		return f"{self._name} ({self._snapshot!r})"
@@ -0,0 +1,781 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A conflict-driven dependency solver for :class:`~pyTooling.Dependency.PackageVersion` graphs.
+
+The solver follows the `PubGrub <https://github.com/dart-lang/pub/blob/master/doc/solver.md>`__ algorithm: it assigns
+package versions via decisions and unit propagation, derives new incompatibilities from conflicts (conflict-driven
+clause learning) and backjumps to the decision level causing a conflict. A failure is explained by the chain of learned
+incompatibilities.
+
+As dependencies in :mod:`pyTooling.Dependency` are finite sets of package versions, a :class:`Term` refers to a set of
+:class:`~pyTooling.Dependency.PackageVersion` instances.
+
+.. hint::
+
+   See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
+"""
+from enum   import Enum
+from typing import Optional as Nullable, Any, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Exceptions  import ToolingException
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.Dependency  import Package, PackageVersion, PackageDependencyGraph
+
+
+@export
+class IncompatibilityCause(Enum):
+	"""Enumeration describing, why an :class:`Incompatibility` exists."""
+	Root =       0  #: The root package version is required.
+	Dependency = 1  #: A package version depends on a set of versions of another package.
+	Conflict =   2  #: The incompatibility was derived from two other incompatibilities by conflict resolution.
+
+
+@export
+class Term(metaclass=ExtendedType, slots=True):
+	"""
+	A statement about a package's selected version.
+
+	A positive term is true, if the package is selected in one of the term's versions. A negative term is true, if the
+	package is not selected or is selected in a version not contained in the term's versions.
+	"""
+	_package:  Package                    #: Package this term refers to.
+	_versions: FrozenSet[PackageVersion]  #: Set of package versions.
+	_positive: bool                       #: True, if the term is positive.
+
+	def __init__(self, package: Package, versions: Iterable[PackageVersion], positive: bool = True) -> None:
+		"""
+		Initializes a term.
+
+		:param package:  Package this term refers to.
+		:param versions: Package versions allowed (positive) or excluded (negative) by this term.
+		:param positive: True, if the term is positive.
+		"""
+		self._package = package
+		self._versions = versions if isinstance(versions, frozenset) else frozenset(versions)
+		self._positive = positive
+
+	@readonly
+	def Package(self) -> Package:
+		"""
+		Read-only property to access the package this term refers to.
+
+		:returns: Referenced package.
+		"""
+		return self._package
+
+	@readonly
+	def Versions(self) -> FrozenSet[PackageVersion]:
+		"""
+		Read-only property to access the set of package versions.
+
+		:returns: Package versions allowed (positive) or excluded (negative) by this term.
+		"""
+		return self._versions
+
+	@readonly
+	def IsPositive(self) -> bool:
+		"""
+		Read-only property to check if the term is positive.
+
+		:returns: True, if the term is positive.
+		"""
+		return self._positive
+
+	@readonly
+	def IsEmpty(self) -> bool:
+		"""
+		Read-only property to check if the term can't be fulfilled.
+
+		:returns: True, if the term is positive and contains no versions.
+		"""
+		return self._positive and len(self._versions) == 0
+
+	def Negate(self) -> "Term":
+		"""
+		Create the inverse term.
+
+		:returns: New term with inverted polarity.
+		"""
+		return Term(self._package, self._versions, not self._positive)
+
+	def Intersect(self, other: "Term") -> "Term":
+		"""
+		Create a term, which is true if both terms are true.
+
+		:param other: Term referring to the same package.
+		:returns:     New term.
+		"""
+		if self._positive:
+			if other._positive:
+				return Term(self._package, self._versions & other._versions)
+			else:
+				return Term(self._package, self._versions - other._versions)
+		elif other._positive:
+			return Term(self._package, other._versions - self._versions)
+		else:
+			return Term(self._package, self._versions | other._versions, False)
+
+	def Satisfies(self, other: "Term") -> bool:
+		"""
+		Check if this term implies the other term.
+
+		:param other: Term referring to the same package.
+		:returns:     True, if other is true whenever this term is true.
+		"""
+		if self._positive:
+			if other._positive:
+				return self._versions <= other._versions
+			else:
+				return self._versions.isdisjoint(other._versions)
+		elif other._positive:
+			return False
+		else:
+			return other._versions <= self._versions
+
+	def Contradicts(self, other: "Term") -> bool:
+		"""
+		Check if this term and the other term can't be true at the same time.
+
+		:param other: Term referring to the same package.
+		:returns:     True, if the intersection of both terms is empty.
+		"""
+		if self._positive:
+			if other._positive:
+				return self._versions.isdisjoint(other._versions)
+			else:
+				return self._versions <= other._versions
+		elif other._positive:
+			return other._versions <= self._versions
+		else:
+			return False
+
+	def __str__(self) -> str:
+		"""
+		Return a string representation of this term.
+
+		:returns: The term in human-readable form.
+		"""
+		if len(self._versions) == 1:
+			text = f"{self._package._name} {next(iter(self._versions))._version}"
+		elif len(self._versions) == len(self._package._versions):
+			text = f"any version of {self._package._name}"
+		else:
+			versions = ", ".join(str(version) for version in sorted(packageVersion._version for packageVersion in self._versions))
+			text = f"{self._package._name} in [{versions}]"
+
+		return text if self._positive else f"not {text}"
+
+
+@export
+class Incompatibility(metaclass=ExtendedType, slots=True):
+	"""
+	A set of terms, which must not be true at the same time.
+
+	Terms referring to the same package are merged by intersection. Terms, which are always true (negative terms without
+	versions), are dropped.
+	"""
+	_terms:  Dict[Package, Term]                                         #: Terms by package.
+	_cause:  IncompatibilityCause                                        #: Reason for this incompatibility.
+	_causes: Nullable[Tuple["Incompatibility", "Incompatibility"]]  #: Incompatibilities this one was derived from.
+
+	def __init__(
+		self,
+		terms: Iterable[Term],
+		cause: IncompatibilityCause,
+		causes: Nullable[Tuple["Incompatibility", "Incompatibility"]] = None
+	) -> None:
+		"""
+		Initializes an incompatibility.
+
+		:param terms:  Terms, which must not be true at the same time.
+		:param cause:  Reason for this incompatibility.
+		:param causes: For derived incompatibilities, the two incompatibilities this one was derived from.
+		"""
+		self._terms = {}
+		for term in terms:
+			if (package := term._package) in self._terms:
+				term = self._terms[package].Intersect(term)
+
+			self._terms[package] = term
+
+		for package in [package for package, term in self._terms.items() if not term._positive and len(term._versions) == 0]:
+			del self._terms[package]
+
+		self._cause = cause
+		self._causes = causes
+
+	@readonly
+	def Terms(self) -> Dict[Package, Term]:
+		"""
+		Read-only property to access the terms by package.
+
+		:returns: Dictionary of terms.
+		"""
+		return self._terms
+
+	@readonly
+	def Cause(self) -> IncompatibilityCause:
+		"""
+		Read-only property to access the reason for this incompatibility.
+
+		:returns: Cause of this incompatibility.
+		"""
+		return self._cause
+
+	@readonly
+	def Causes(self) -> Nullable[Tuple["Incompatibility", "Incompatibility"]]:
+		"""
+		Read-only property to access the incompatibilities this one was derived from.
+
+		:returns: A 2-tuple of incompatibilities for derived incompatibilities, otherwise ``None``.
+		"""
+		return self._causes
+
+	def IsFailure(self, root: PackageVersion) -> bool:
+		"""
+		Check if this incompatibility proves, that the dependency problem has no solution.
+
+		:param root: Root package version of the dependency problem.
+		:returns:    True, if the incompatibility has no terms or forbids the root package version.
+		"""
+		if len(self._terms) == 0:
+			return True
+		elif len(self._terms) > 1:
+			return False
+
+		term = next(iter(self._terms.values()))
+		return term._positive and term._package is root._package and root in term._versions
+
+	def Explain(self) -> List[str]:
+		"""
+		Explain how this incompatibility was derived.
+
+		Each derived incompatibility becomes a numbered line referring to its two causes. Incompatibilities reused by later
+		lines are referenced by their number.
+
+		:returns: List of explanation lines in derivation order.
+		"""
+		lines: List[str] = []
+		numbers: Dict[Incompatibility, int] = {}
+
+		stack: List[Tuple[Incompatibility, bool]] = [(self, False)]
+		while stack:
+			incompatibility, visited = stack.pop()
+			if incompatibility._causes is None or incompatibility in numbers:
+				continue
+			elif not visited:
+				stack.append((incompatibility, True))
+				for cause in reversed(incompatibility._causes):
+					stack.append((cause, False))
+				continue
+
+			reasons = []
+			for cause in incompatibility._causes:
+				if cause in numbers:
+					reasons.append(f"{cause} ({numbers[cause]})")
+				else:
+					reasons.append(str(cause))
+
+			numbers[incompatibility] = len(lines) + 1
+			lines.append(f"({len(lines) + 1}) Because {reasons[0]} and {reasons[1]}, {incompatibility}.")
+
+		return lines
+
+	def _ToView(self, ids: Dict[PackageVersion, int]) -> Tuple[Tuple[Any, ...], ...]:
+		"""
+		Serialize this incompatibility and its derivation into a picklable view.
+
+		Packages are referenced by storage and package name, package versions by their indices in a serialized graph view
+		(see :meth:`~pyTooling.Dependency.PackageDependencyGraph._ToView`).
+
+		:param ids: Indices of package versions.
+		:returns:   Tuple of ``(terms, cause, causes)`` tuples in derivation order (causes first). The last entry is this
+		            incompatibility.
+		"""
+		entries = []
+		numbers: Dict[Incompatibility, int] = {}
+
+		stack: List[Tuple[Incompatibility, bool]] = [(self, False)]
+		while stack:
+			incompatibility, visited = stack.pop()
+			if incompatibility in numbers:
+				continue
+			elif not visited and incompatibility._causes is not None:
+				stack.append((incompatibility, True))
+				for cause in reversed(incompatibility._causes):
+					stack.append((cause, False))
+				continue
+
+			terms = tuple(
+				(term._package._storage._name, term._package._name, tuple(ids[packageVersion] for packageVersion in term._versions), term._positive)
+				for term in incompatibility._terms.values()
+			)
+			causes = None if incompatibility._causes is None else tuple(numbers[cause] for cause in incompatibility._causes)
+
+			numbers[incompatibility] = len(entries)
+			entries.append((terms, incompatibility._cause, causes))
+
+		return tuple(entries)
+
+	@staticmethod
+	def _FromView(view: Tuple[Tuple[Any, ...], ...], graph: PackageDependencyGraph, packageVersions: Sequence[PackageVersion]) -> "Incompatibility":
+		"""
+		Reconstruct an incompatibility serialized by :meth:`_ToView`.
+
+		:param view:            Serialized incompatibility.
+		:param graph:           Package dependency graph containing the referenced packages.
+		:param packageVersions: Package versions by index.
+		:returns:               Reconstructed incompatibility.
+		"""
+		incompatibilities: List[Incompatibility] = []
+		for terms, cause, causes in view:
+			incompatibilities.append(Incompatibility(
+				(
+					Term(graph._storages[storageName]._packages[packageName], (packageVersions[index] for index in indices), positive)
+					for storageName, packageName, indices, positive in terms
+				),
+				cause,
+				None if causes is None else (incompatibilities[causes[0]], incompatibilities[causes[1]])
+			))
+
+		return incompatibilities[-1]
+
+	def __str__(self) -> str:
+		"""
+		Return a string representation of this incompatibility.
+
+		:returns: The incompatibility in human-readable form.
+		"""
+		positives = [term for term in self._terms.values() if term._positive]
+		negatives = [term for term in self._terms.values() if not term._positive]
+
+		if len(self._terms) == 0:
+			return "version solving failed"
+		elif self._cause is IncompatibilityCause.Dependency and len(positives) == 1 and len(negatives) == 1:
+			return f"{positives[0]} depends on {negatives[0].Negate()}"
+		elif len(negatives) == 0:
+			if len(positives) == 1:
+				return f"{positives[0]} is forbidden"
+			else:
+				return f"{' and '.join(str(term) for term in positives)} are incompatible"
+		elif len(negatives) == 1:
+			if len(positives) == 0:
+				return f"{negatives[0].Negate()} is required"
+			else:
+				return f"{' and '.join(str(term) for term in positives)} requires {negatives[0].Negate()}"
+		else:
+			return f"one of {', '.join(str(term) for term in self._terms.values())} must be false"
+
+
+@export
+class Assignment(metaclass=ExtendedType, slots=True):
+	"""
+	A term added to the solver's partial solution, either as a decision or derived from an incompatibility.
+	"""
+	_term:          Term                       #: Assigned term.
+	_decisionLevel: int                        #: Number of decisions made when this assignment was added.
+	_cause:         Nullable[Incompatibility]  #: Incompatibility this assignment was derived from, or ``None`` for decisions.
+
+	def __init__(self, term: Term, decisionLevel: int, cause: Nullable[Incompatibility] = None) -> None:
+		"""
+		Initializes an assignment.
+
+		:param term:          Assigned term.
+		:param decisionLevel: Number of decisions made when this assignment was added.
+		:param cause:         Incompatibility this assignment was derived from, or ``None`` for decisions.
+		"""
+		self._term = term
+		self._decisionLevel = decisionLevel
+		self._cause = cause
+
+	@readonly
+	def Term(self) -> Term:
+		"""
+		Read-only property to access the assigned term.
+
+		:returns: Assigned term.
+		"""
+		return self._term
+
+	@readonly
+	def DecisionLevel(self) -> int:
+		"""
+		Read-only property to access the decision level.
+
+		:returns: Number of decisions made when this assignment was added.
+		"""
+		return self._decisionLevel
+
+	@readonly
+	def Cause(self) -> Nullable[Incompatibility]:
+		"""
+		Read-only property to access the incompatibility this assignment was derived from.
+
+		:returns: Cause of this assignment or ``None`` for decisions.
+		"""
+		return self._cause
+
+	@readonly
+	def IsDecision(self) -> bool:
+		"""
+		Read-only property to check if this assignment is a decision.
+
+		:returns: True, if this assignment is a decision.
+		"""
+		return self._cause is None
+
+
+@export
+class UnsolvableDependencyError(ToolingException):
+	"""
+	The exception is raised when a dependency problem has no solution.
+
+	The explanation of the failure is attached as a note.
+	"""
+	_incompatibility: Incompatibility  #: Incompatibility proving the failure.
+
+	def __init__(self, message: str, incompatibility: Incompatibility) -> None:
+		"""
+		Initializes the exception.
+
+		:param message:         Error message.
+		:param incompatibility: Incompatibility proving the failure.
+		"""
+		super().__init__(message)
+
+		self._incompatibility = incompatibility
+		self.add_note("\n".join(incompatibility.Explain()))
+
+	@readonly
+	def Incompatibility(self) -> Incompatibility:
+		"""
+		Read-only property to access the incompatibility proving the failure.
+
+		:returns: Root cause of the failure.
+		"""
+		return self._incompatibility
+
+	@readonly
+	def Explanation(self) -> List[str]:
+		"""
+		Read-only property to access the explanation of the failure.
+
+		:returns: List of explanation lines (see :meth:`Incompatibility.Explain`).
+		"""
+		return self._incompatibility.Explain()
+
+
+_SATISFIED =    0
+_ALMOST =       1
+_CONTRADICTED = 2
+_INCONCLUSIVE = 3
+
+
+@export
+class ConflictDrivenSolver(metaclass=ExtendedType, slots=True):
+	"""
+	A conflict-driven dependency solver preferring latest versions.
+
+	The solver keeps a partial solution (a list of :class:`Assignment`) and a list of :class:`Incompatibility` per
+	package. Unit propagation derives assignments from incompatibilities, which are satisfied except for one term. If an
+	incompatibility is completely satisfied, conflict resolution learns a new incompatibility and backjumps. Otherwise,
+	the solver decides for the latest allowed version of the most constrained undecided package.
+
+	The solver is iterative and thus not limited by Python's recursion limit.
+	"""
+	_root:              PackageVersion                          #: Root package version of the dependency problem.
+	_incompatibilities: Dict[Package, List[Incompatibility]]    #: Incompatibilities by package.
+	_assignments:       List[Assignment]                        #: Partial solution.
+	_terms:             Dict[Package, Term]                     #: Intersection of all assigned terms by package.
+	_decisions:         Dict[Package, PackageVersion]           #: Decided package versions in decision order.
+	_expanded:          Set[PackageVersion]                     #: Package versions, whose dependencies were added.
+	_conflictCount:     int                                     #: Number of resolved conflicts.
+	_learnedCount:      int                                     #: Number of learned incompatibilities.
+
+	def __init__(self, root: PackageVersion) -> None:
+		"""
+		Initializes a conflict-driven solver.
+
+		:param root:       Root package version of the dependency problem.
+		:raises TypeError: When parameter 'root' is not of type 'PackageVersion'.
+		"""
+		if not isinstance(root, PackageVersion):
+			ex = TypeError("Parameter 'root' is not of type 'PackageVersion'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(root)}'.")
+			raise ex
+
+		self._root = root
+		self._incompatibilities = {}
+		self._assignments = []
+		self._terms = {}
+		self._decisions = {}
+		self._expanded = set()
+		self._conflictCount = 0
+		self._learnedCount = 0
+
+	@readonly
+	def Root(self) -> PackageVersion:
+		"""
+		Read-only property to access the root package version.
+
+		:returns: Root package version of the dependency problem.
+		"""
+		return self._root
+
+	@readonly
+	def DecisionCount(self) -> int:
+		"""
+		Read-only property to access the number of current decisions.
+
+		:returns: Number of decided packages.
+		"""
+		return len(self._decisions)
+
+	@readonly
+	def ConflictCount(self) -> int:
+		"""
+		Read-only property to access the number of resolved conflicts.
+
+		:returns: Number of conflicts.
+		"""
+		return self._conflictCount
+
+	@readonly
+	def LearnedCount(self) -> int:
+		"""
+		Read-only property to access the number of learned incompatibilities.
+
+		:returns: Number of incompatibilities derived by conflict resolution.
+		"""
+		return self._learnedCount
+
+	def Solve(self) -> List[PackageVersion]:
+		"""
+		Solve the dependency problem, while using preferably latest versions.
+
+		:returns:                          A list of :class:`~pyTooling.Dependency.PackageVersion`s fulfilling the
+		                                   constraints of the dependency problem. The root package version is the first
+		                                   element.
+		:raises UnsolvableDependencyError: When there is no valid solution to the problem.
+		"""
+		root = self._root
+		self._AddIncompatibility(Incompatibility((Term(root._package, (root, ), False), ), IncompatibilityCause.Root))
+
+		package: Nullable[Package] = root._package
+		while package is not None:
+			self._Propagate(package)
+			package = self._Decide()
+
+		return list(self._decisions.values())
+
+	def _AddIncompatibility(self, incompatibility: Incompatibility) -> None:
+		for package in incompatibility._terms:
+			if package in self._incompatibilities:
+				self._incompatibilities[package].append(incompatibility)
+			else:
+				self._incompatibilities[package] = [incompatibility]
+
+	def _Assign(self, term: Term, cause: Nullable[Incompatibility]) -> None:
+		self._assignments.append(Assignment(term, len(self._decisions), cause))
+
+		package = term._package
+		if package in self._terms:
+			self._terms[package] = self._terms[package].Intersect(term)
+		else:
+			self._terms[package] = term
+
+	def _Backtrack(self, decisionLevel: int) -> None:
+		assignments = self._assignments
+		packages = set()
+		while assignments and assignments[-1]._decisionLevel > decisionLevel:
+			assignment = assignments.pop()
+			packages.add(assignment._term._package)
+			if assignment._cause is None:
+				del self._decisions[assignment._term._package]
+
+		for package in packages:
+			del self._terms[package]
+		for assignment in assignments:
+			if (package := assignment._term._package) in packages:
+				if package in self._terms:
+					self._terms[package] = self._terms[package].Intersect(assignment._term)
+				else:
+					self._terms[package] = assignment._term
+
+	def _Relation(self, incompatibility: Incompatibility) -> Tuple[int, Nullable[Term]]:
+		unsatisfied = None
+		for package, term in incompatibility._terms.items():
+			if (assigned := self._terms.get(package)) is None:
+				if term._positive and len(term._versions) == 0:
+					return _CONTRADICTED, None
+			elif assigned.Satisfies(term):
+				continue
+			elif assigned.Contradicts(term):
+				return _CONTRADICTED, None
+
+			if unsatisfied is not None:
+				return _INCONCLUSIVE, None
+			unsatisfied = term
+
+		if unsatisfied is None:
+			return _SATISFIED, None
+		else:
+			return _ALMOST, unsatisfied
+
+	def _Propagate(self, package: Package) -> None:
+		changed = [package]
+		contradicted: Set[Incompatibility] = set()
+
+		while changed:
+			package = changed.pop()
+			for incompatibility in reversed(self._incompatibilities.get(package, ())):
+				if incompatibility in contradicted:
+					continue
+
+				relation, term = self._Relation(incompatibility)
+				if relation == _SATISFIED:
+					rootCause = self._ResolveConflict(incompatibility)
+					relation, term = self._Relation(rootCause)
+
+					self._Assign(term.Negate(), rootCause)
+					changed = [term._package]
+					contradicted.add(rootCause)
+					break
+				elif relation == _ALMOST:
+					self._Assign(term.Negate(), incompatibility)
+					if term._package not in changed:
+						changed.append(term._package)
+					contradicted.add(incompatibility)
+				elif relation == _CONTRADICTED:
+					contradicted.add(incompatibility)
+
+	def _Satisfier(self, incompatibility: Incompatibility) -> Tuple[int, Term, int]:
+		terms = incompatibility._terms
+		assignments = self._assignments
+
+		satisfiedAt: Dict[Package, int] = {}
+		accumulated: Dict[Package, Term] = {}
+		remaining = set(terms)
+		for index, assignment in enumerate(assignments):
+			package = assignment._term._package
+			if package not in remaining:
+				continue
+
+			term = assignment._term if package not in accumulated else accumulated[package].Intersect(assignment._term)
+			accumulated[package] = term
+			if term.Satisfies(terms[package]):
+				satisfiedAt[package] = index
+				remaining.discard(package)
+				if len(remaining) == 0:
+					break
+
+		satisfierPackage = max(satisfiedAt, key=satisfiedAt.__getitem__)
+		satisfierIndex = satisfiedAt[satisfierPackage]
+		satisfierTerm = terms[satisfierPackage]
+		satisfier = assignments[satisfierIndex]
+
+		previousIndex = max((index for package, index in satisfiedAt.items() if package is not satisfierPackage), default=-1)
+		if not satisfier._term.Satisfies(satisfierTerm):
+			term = satisfier._term
+			for index in range(satisfierIndex):
+				assignment = assignments[index]
+				if assignment._term._package is satisfierPackage:
+					term = term.Intersect(assignment._term)
+					if term.Satisfies(satisfierTerm):
+						previousIndex = max(previousIndex, index)
+						break
+
+		previousLevel = max(assignments[previousIndex]._decisionLevel, 1) if previousIndex >= 0 else 1
+		return satisfierIndex, satisfierTerm, previousLevel
+
+	def _ResolveConflict(self, incompatibility: Incompatibility) -> Incompatibility:
+		self._conflictCount += 1
+
+		learned = False
+		while not incompatibility.IsFailure(self._root):
+			satisfierIndex, term, previousLevel = self._Satisfier(incompatibility)
+			satisfier = self._assignments[satisfierIndex]
+
+			if satisfier._cause is None or previousLevel < satisfier._decisionLevel:
+				if learned:
+					self._AddIncompatibility(incompatibility)
+					self._learnedCount += 1
+
+				self._Backtrack(previousLevel)
+				return incompatibility
+
+			package = term._package
+			priorTerms = [t for p, t in incompatibility._terms.items() if p is not package]
+			priorTerms.extend(t for p, t in satisfier._cause._terms.items() if p is not package)
+			if not satisfier._term.Satisfies(term):
+				priorTerms.append(satisfier._term.Intersect(term.Negate()).Negate())
+
+			incompatibility = Incompatibility(priorTerms, IncompatibilityCause.Conflict, (incompatibility, satisfier._cause))
+			learned = True
+
+		raise UnsolvableDependencyError(f"Could not resolve dependencies for '{self._root}'.", incompatibility)
+
+	def _Decide(self) -> Nullable[Package]:
+		package = None
+		candidates = None
+		for p, term in self._terms.items():
+			if term._positive and p not in self._decisions:
+				if candidates is None or len(term._versions) < len(candidates):
+					package = p
+					candidates = term._versions
+
+		if package is None:
+			return None
+
+		packageVersion = max(candidates, key=lambda pv: pv._version)
+
+		conflict = False
+		if packageVersion not in self._expanded:
+			self._expanded.add(packageVersion)
+			for dependency, versions in packageVersion._dependsOn.items():
+				incompatibility = Incompatibility(
+					(Term(package, (packageVersion, )), Term(dependency, versions.values(), False)),
+					IncompatibilityCause.Dependency
+				)
+				self._AddIncompatibility(incompatibility)
+
+				if dependency is not package and (assigned := self._terms.get(dependency)) is not None:
+					if assigned.Satisfies(incompatibility._terms[dependency]):
+						conflict = True
+
+		if not conflict:
+			self._decisions[package] = packageVersion
+			self._Assign(Term(package, (packageVersion, )), None)
+
+		return package
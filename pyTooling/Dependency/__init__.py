@@ -35,14 +35,26 @@ Implementation of package dependencies.
 
    See :ref:`high-level help <DEPENDENCIES>` for explanations and usage examples.
 """
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
 from datetime import datetime
-from typing   import Optional as Nullable, Dict, Union, Iterable, Set, Self, Iterator
+from enum     import Enum
+from os       import cpu_count
+from pathlib  import Path
+from typing   import Optional as Nullable, Dict, Union, Iterable, Set, Self, Iterator, List, Tuple, FrozenSet, Generator
 
 from pyTooling.Decorators  import export, readonly
 from pyTooling.MetaClasses import ExtendedType
 from pyTooling.Exceptions  import ToolingException
 from pyTooling.Common      import getFullyQualifiedName, firstKey
 from pyTooling.Versioning  import SemanticVersion
+from pyTooling.Caching     import CacheStatistics
+
+
+@export
+class SolverAlgorithm(Enum):
+	"""Enumeration of dependency solver algorithms selectable in :meth:`PackageVersion.SolveLatest`."""
+	Backtracking =   0  #: Recursive backtracking over candidate versions.
+	ConflictDriven = 1  #: Conflict-driven solver learning incompatibilities (see :mod:`pyTooling.Dependency.Solver`).
 
 
 @export
@@ -88,6 +100,7 @@ class PackageVersion(metaclass=ExtendedType, slots=True):
 			raise ex
 
 		self._package = package
+		package._storage._graph._resolutionCache.Invalidate()
 
 		if releasedAt is not None and not isinstance(releasedAt, datetime):
 			ex = TypeError("Parameter 'releasedAt' is not of type 'datetime'.")
@@ -143,6 +156,8 @@ class PackageVersion(metaclass=ExtendedType, slots=True):
 
 		:param packageVersion: Dependency to be added.
 		"""
+		self._package._storage._graph._resolutionCache.Invalidate(self)
+
 		if (package := packageVersion._package) in self._dependsOn:
 			pack = self._dependsOn[package]
 			if (version := packageVersion._version) in pack:
@@ -160,6 +175,8 @@ class PackageVersion(metaclass=ExtendedType, slots=True):
 		"""
 		# TODO: check for iterable
 
+		self._package._storage._graph._resolutionCache.Invalidate(self)
+
 		for packageVersion in packageVersions:
 			if (package := packageVersion._package) in self._dependsOn:
 				pack = self._dependsOn[package]
@@ -223,91 +240,147 @@ class PackageVersion(metaclass=ExtendedType, slots=True):
 			self._dependsOn[package] = {version: versions[version] for version in sorted(versions.keys(), reverse=True)}
 		return self
 
-	def SolveLatest(self) -> Iterable["PackageVersion"]:
+	def SolveLatest(self, algorithm: SolverAlgorithm = SolverAlgorithm.Backtracking) -> Iterable["PackageVersion"]:
 		"""
 		Solve the dependency problem, while using preferably latest versions.
 
-		.. todo::
+		The default :attr:`SolverAlgorithm.Backtracking` algorithm performs an iterative depth-first search. Required
+		packages and their allowed versions (intersection of all constraints by selected package versions) are updated
+		incrementally when a package version is selected and undone when backtracking. The most constrained required
+		package (fewest allowed versions) is resolved next, trying its versions from latest to oldest. Candidates
+		contradicting the current solution or leaving no allowed version for an unresolved dependency are skipped.
+
+		Solutions and failures are memoized in the graph's :class:`ResolutionCache` until the graph is modified. A memoized
+		failure is raised as a fresh copy of the original exception (same type, message and notes).
+
+		:param algorithm:         Solver algorithm to use. |br|
+		                          :attr:`SolverAlgorithm.ConflictDriven` uses
+		                          :class:`~pyTooling.Dependency.Solver.ConflictDrivenSolver`, which raises an
+		                          :exc:`~pyTooling.Dependency.Solver.UnsolvableDependencyError` explaining the conflict.
+		:returns:                 A list of :class:`PackageVersion`s fulfilling the constraints of the dependency problem.
+		:raises TypeError:        When parameter 'algorithm' is not of type 'SolverAlgorithm'.
+		:raises ToolingException: When there is no valid solution to the problem.
+		"""
+		if not isinstance(algorithm, SolverAlgorithm):
+			ex = TypeError("Parameter 'algorithm' is not of type 'SolverAlgorithm'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(algorithm)}'.")
+			raise ex
+
+		cache = self._package._storage._graph._resolutionCache
+		if (cached := cache._LookupSolution(self, algorithm)) is not None:
+			if isinstance(cached, ToolingException):
+				raise cached  # a fresh copy without traceback
+
+			return list(cached)
+
+		try:
+			if algorithm is SolverAlgorithm.ConflictDriven:
+				from pyTooling.Dependency.Solver import ConflictDrivenSolver
 
-			 Describe algorithm.
+				result = ConflictDrivenSolver(self).Solve()
+			else:
+				result = self._SolveLatestByBacktracking(cache)
+		except ToolingException as ex:
+			cache._StoreSolution(self, algorithm, ex)
+			raise
+
+		cache._StoreSolution(self, algorithm, tuple(result))
+		return result
 
+	def _SolveLatestByBacktracking(self, cache: "ResolutionCache") -> List["PackageVersion"]:
+		"""
+		Backtracking algorithm of :meth:`SolveLatest`.
+
+		:param cache:             Resolution cache of the package dependency graph.
 		:returns:                 A list of :class:`PackageVersion`s fulfilling the constraints of the dependency problem.
 		:raises ToolingException: When there is no valid solution to the problem.
 		"""
+		constraintsOf = cache.Constraints
+		intersect = cache.Intersect
+
 		solution: Dict["Package", "PackageVersion"] = {self._package: self}
+		allowed:  Dict["Package", FrozenSet[SemanticVersion]] = {}
+		missing:  Dict["Package", None] = {}  # ordered set
+
+		def _select(packageVersion: "PackageVersion") -> Nullable[List[Tuple["Package", Nullable[FrozenSet[SemanticVersion]]]]]:
+			# Add a package version to the solution and narrow the allowed versions of its dependencies.
+			# Returns an undo log or None, if the package version is incompatible with the current solution.
+			package = packageVersion._package
+			solution[package] = packageVersion
+
+			narrowed = []
+			for dependency, versions in constraintsOf(packageVersion).items():
+				if (selected := solution.get(dependency)) is not None:
+					if selected._version not in versions:
+						del solution[package]
+						return None
+				elif (previous := allowed.get(dependency)) is None:
+					narrowed.append((dependency, None, versions))
+				elif len(versions := intersect(previous, versions)) == 0:
+					del solution[package]
+					return None
+				else:
+					narrowed.append((dependency, previous, versions))
+
+			undoLog = []
+			del missing[package]
+			for dependency, previous, versions in narrowed:
+				if previous is None:
+					missing[dependency] = None
+				allowed[dependency] = versions
+				undoLog.append((dependency, previous))
+
+			return undoLog
+
+		def _unselect(package: "Package", undoLog: List[Tuple["Package", Nullable[FrozenSet[SemanticVersion]]]]) -> None:
+			for dependency, previous in reversed(undoLog):
+				if previous is None:
+					del allowed[dependency]
+					del missing[dependency]
+				else:
+					allowed[dependency] = previous
 
-		def _recursion(currentSolution: Dict["Package", "PackageVersion"]) -> bool:
-			# 1. Identify all required packages based on current selection
-			requiredPackages: Set["Package"] = set()
-			for packageVersion in currentSolution.values():
-				requiredPackages.update(packageVersion.DependsOn.keys())
-
-			# 2. Identify which required packages are missing from the solution
-			missingPackages = requiredPackages - currentSolution.keys()
-
-			# Base Case: If no packages are missing, the graph is complete and valid
-			if len(missingPackages) == 0:
-				return True
-
-			# 3. Pick the next package to resolve
-			# (Heuristic: we just pick the first one, but could be optimized)
-			targetPackage = next(iter(missingPackages))
-
-			# 4. Determine valid candidates
-			# The candidate version must satisfy the constraints of all parents currently in the solution
-			allowedVersions: Nullable[Set[SemanticVersion]] = None
-
-			for parentPackageVersion in currentSolution.values():
-				if targetPackage in parentPackageVersion.DependsOn:
-					# Get the set of versions allowed by this specific parent
-					# (Keys of the inner dict are SemanticVersion objects)
-					parentConstraints = set(parentPackageVersion.DependsOn[targetPackage].keys())
-
-					if allowedVersions is None:
-						allowedVersions = parentConstraints
-					else:
-						# Intersect with existing constraints (must satisfy everyone)
-						allowedVersions &= parentConstraints
-
-			# If the intersection is empty, no version satisfies all parents -> backtrack
-			if not allowedVersions:
-				return False
-
-			# 5. Try candidates (sorted descending to prioritize latest)
-			# We convert the set to a list and sort it reverse
-			for version_key in sorted(list(allowedVersions), reverse=True):
-				candidate = targetPackage.Versions[version_key]
-
-				# 6. Check compatibility (reverse dependencies)
-				# Does the candidate depend on anything we have already selected?
-				# If so, does the candidate accept the version we already picked?
-				isCompatible = True
-				for existingPackage, existingPackageVersion in currentSolution.items():
-					if existingPackage in candidate.DependsOn:
-						# If candidate relies on 'existingPackage', check if 'existingPackageVersion' is in the allowed list
-						if existingPackageVersion._version not in candidate.DependsOn[existingPackage]:
-							isCompatible = False
-							break
-
-				if isCompatible:
-					# Tentatively add to solution
-					currentSolution[targetPackage] = candidate
-
-					# Recurse
-					if _recursion(currentSolution):
-						return True
-
-					# If recursion failed, remove (backtrack) and try next version
-					del currentSolution[targetPackage]
-
-			# If we run out of versions for this package, this path is dead
-			return False
-
-		# Run the solver
-		if _recursion(solution):
-			return list(solution.values())
-		else:
-			raise ToolingException(f"Could not resolve dependencies for '{self}'.")
+			del solution[package]
+			missing[package] = None
+
+		missing[self._package] = None
+		del solution[self._package]
+		if _select(self) is None:
+			ex = ToolingException(f"Could not resolve dependencies for '{self}'.")
+			ex.add_note(f"Package version '{self}' contradicts its own dependencies.")
+			raise ex
+
+		# Iterative depth-first search: each frame holds the target package, its candidates (latest first), the index of
+		# the next candidate and the undo log of the currently selected candidate.
+		stack: List[List] = []
+		while len(missing) > 0:
+			# Choose the most constrained package (fewest allowed versions) first.
+			target = min(missing, key=lambda package: len(allowed[package]))
+			stack.append([target, sorted(allowed[target], reverse=True), 0, None])
+
+			while len(stack) > 0:
+				frame = stack[-1]
+				target, candidates, index, undoLog = frame
+				if undoLog is not None:
+					_unselect(target, undoLog)
+					frame[3] = None
+
+				while index < len(candidates):
+					undoLog = _select(target._versions[candidates[index]])
+					index += 1
+					if undoLog is not None:
+						frame[2] = index
+						frame[3] = undoLog
+						break
+				else:
+					stack.pop()
+					continue
+
+				break
+			else:
+				raise ToolingException(f"Could not resolve dependencies for '{self}'.")
+
+		return list(solution.values())
 
 	def __len__(self) -> int:
 		"""
@@ -580,13 +653,251 @@ class PackageStorage(metaclass=ExtendedType, slots=True):
 			return f"{self._name} ({len(self._packages)})"
 
 
+def _CopyFailure(ex: ToolingException) -> ToolingException:
+	"""
+	Copy a dependency resolution failure without its traceback.
+
+	Memoized failures are stored and raised as copies, thus tracebacks don't accumulate and the cache doesn't keep frames
+	alive. The exception type, message and notes are preserved.
+
+	:param ex: Exception raised by a solver.
+	:returns:  New exception of the same type.
+	"""
+	from pyTooling.Dependency.Solver import UnsolvableDependencyError
+
+	if isinstance(ex, UnsolvableDependencyError):
+		copy = UnsolvableDependencyError(str(ex), ex._incompatibility)
+	else:
+		copy = ToolingException(str(ex))
+
+	copy.__notes__ = list(ex.Notes)
+	return copy
+
+
+@export
+class ResolutionCache(metaclass=ExtendedType, slots=True):
+	"""
+	A cache of intermediate and final results of dependency resolution, scoped to a :class:`PackageDependencyGraph`.
+
+	The cache holds:
+
+	* the dependency constraints of each :class:`PackageVersion` as interned frozen sets of versions,
+	* memoized intersections of constraint sets (keyed by the pair of frozen sets), and
+	* solutions (or failures) of :meth:`PackageVersion.SolveLatest` per root package version and algorithm.
+
+	Intersections are pure functions of their keys and stay valid. Mutating the graph invalidates the remaining entries:
+	adding a dependency invalidates the constraints of the modified package version, creating a package version or
+	adding a dependency invalidates all solutions.
+	"""
+	_maxSize:       int                                                                            #: Maximum number of memoized intersections.
+	_constraints:   Dict[PackageVersion, Dict[Package, FrozenSet[SemanticVersion]]]                #: Frozen dependency constraints per package version.
+	_interned:      Dict[FrozenSet[SemanticVersion], FrozenSet[SemanticVersion]]                   #: Interned constraint sets.
+	_intersections: Dict[Tuple[FrozenSet[SemanticVersion], FrozenSet[SemanticVersion]], FrozenSet[SemanticVersion]]  #: Memoized intersections.
+	_solutions:     Dict[Tuple[PackageVersion, SolverAlgorithm], Union[Tuple[PackageVersion, ...], ToolingException]]  #: Memoized solutions.
+	_intersectionStatistics: CacheStatistics                                                       #: Hit/miss counters of intersection lookups.
+	_solutionStatistics:     CacheStatistics                                                       #: Hit/miss counters of solution lookups.
+
+	def __init__(self, maxSize: int = 65536) -> None:
+		"""
+		Initializes a resolution cache.
+
+		:param maxSize:     Maximum number of memoized intersections. If exceeded, memoized intersections and interned sets
+		                    are dropped.
+		:raises TypeError:  When parameter 'maxSize' is not of type 'int'.
+		:raises ValueError: When parameter 'maxSize' is not positive.
+		"""
+		if not isinstance(maxSize, int):
+			ex = TypeError("Parameter 'maxSize' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(maxSize)}'.")
+			raise ex
+		elif maxSize <= 0:
+			raise ValueError(f"Parameter 'maxSize' must be positive.")
+
+		self._maxSize = maxSize
+		self._constraints = {}
+		self._interned = {}
+		self._intersections = {}
+		self._solutions = {}
+		self._intersectionStatistics = CacheStatistics()
+		self._solutionStatistics = CacheStatistics()
+
+	@readonly
+	def IntersectionStatistics(self) -> CacheStatistics:
+		"""
+		Read-only property to access the hit/miss counters of intersection lookups.
+
+		:returns: Cache statistics of memoized intersections.
+		"""
+		return self._intersectionStatistics
+
+	@readonly
+	def SolutionStatistics(self) -> CacheStatistics:
+		"""
+		Read-only property to access the hit/miss counters of solution lookups.
+
+		:returns: Cache statistics of memoized solutions and failures.
+		"""
+		return self._solutionStatistics
+
+	@readonly
+	def SolutionCount(self) -> int:
+		"""
+		Read-only property to access the number of memoized solutions and failures.
+
+		:returns: Number of memoized solutions.
+		"""
+		return len(self._solutions)
+
+	def Constraints(self, packageVersion: PackageVersion) -> Dict[Package, FrozenSet[SemanticVersion]]:
+		"""
+		Return the dependency constraints of a package version as frozen sets of allowed versions.
+
+		Equal constraint sets are interned, thus they share one frozen set object.
+
+		:param packageVersion: Package version.
+		:returns:              Dictionary of allowed versions per dependency.
+		"""
+		if (constraints := self._constraints.get(packageVersion)) is None:
+			interned = self._interned
+			constraints = {}
+			for package, versions in packageVersion._dependsOn.items():
+				versions = frozenset(versions)
+				constraints[package] = interned.setdefault(versions, versions)
+
+			self._constraints[packageVersion] = constraints
+
+		return constraints
+
+	def Intersect(self, first: FrozenSet[SemanticVersion], second: FrozenSet[SemanticVersion]) -> FrozenSet[SemanticVersion]:
+		"""
+		Return the memoized intersection of two constraint sets.
+
+		:param first:  First set of allowed versions.
+		:param second: Second set of allowed versions.
+		:returns:      Interned intersection of both sets.
+		"""
+		key = (first, second)
+		if (result := self._intersections.get(key)) is not None:
+			self._intersectionStatistics._hits += 1
+			return result
+
+		self._intersectionStatistics._misses += 1
+		if len(self._intersections) >= self._maxSize:
+			self._intersectionStatistics._evictions += len(self._intersections)
+			self._intersections.clear()
+			self._interned.clear()
+
+		result = first & second
+		result = self._interned.setdefault(result, result)
+		self._intersections[key] = result
+		return result
+
+	def _LookupSolution(self, root: PackageVersion, algorithm: SolverAlgorithm) -> Union[None, Tuple[PackageVersion, ...], ToolingException]:
+		if (result := self._solutions.get((root, algorithm))) is None:
+			self._solutionStatistics._misses += 1
+		elif isinstance(result, ToolingException):
+			self._solutionStatistics._hits += 1
+			return _CopyFailure(result)
+		else:
+			self._solutionStatistics._hits += 1
+
+		return result
+
+	def _StoreSolution(self, root: PackageVersion, algorithm: SolverAlgorithm, result: Union[Tuple[PackageVersion, ...], ToolingException]) -> None:
+		if isinstance(result, ToolingException):
+			result = _CopyFailure(result)
+
+		self._solutions[(root, algorithm)] = result
+
+	def Invalidate(self, packageVersion: Nullable[PackageVersion] = None) -> None:
+		"""
+		Invalidate cache entries after the graph was modified.
+
+		:param packageVersion: The package version, whose dependencies were modified. If ``None``, only solutions are
+		                       invalidated.
+		"""
+		if packageVersion is not None:
+			self._constraints.pop(packageVersion, None)
+
+		self._solutions.clear()
+
+	def Clear(self) -> None:
+		"""
+		Drop all cache entries and reset the statistics.
+		"""
+		self._constraints.clear()
+		self._interned.clear()
+		self._intersections.clear()
+		self._solutions.clear()
+		self._intersectionStatistics.Reset()
+		self._solutionStatistics.Reset()
+
+
+GraphView = Tuple[
+	str,
+	Tuple[Tuple[str, str], ...],
+	Tuple[Tuple[int, SemanticVersion, Nullable[datetime]], ...],
+	Tuple[Tuple[int, ...], ...]
+]
+"""
+A read-only serialized view of a :class:`PackageDependencyGraph`: graph name, ``(storageName, packageName)`` per package,
+``(packageIndex, version, releasedAt)`` per package version and a tuple of dependency indices per package version.
+"""
+
+_solveManyVersions: Nullable[List[PackageVersion]] = None        #: Package versions reconstructed in a worker process.
+_solveManyIDs:      Nullable[Dict[PackageVersion, int]] = None  #: Indices of reconstructed package versions.
+
+
+def _SolveManyInitializer(view: GraphView) -> None:
+	"""
+	Reconstruct a package dependency graph from its serialized view once per worker process.
+
+	This function is defined at module level, so it can be shipped to a :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+	:param view: Serialized view of the graph.
+	"""
+	global _solveManyVersions, _solveManyIDs
+
+	_solveManyVersions = PackageDependencyGraph._FromView(view)
+	_solveManyIDs = {packageVersion: index for index, packageVersion in enumerate(_solveManyVersions)}
+
+
+def _SolveManyChunk(rootIDs: List[int], algorithm: "SolverAlgorithm") -> List[Tuple[int, bool, Tuple]]:
+	"""
+	Solve a chunk of root package versions within a worker process.
+
+	This function is defined at module level, so it can be shipped to a :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+	:param rootIDs:   Indices of root package versions.
+	:param algorithm: Solver algorithm to use.
+	:returns:         List of ``(rootID, True, solutionIDs)`` or ``(rootID, False, (message, notes, incompatibility))``
+	                  tuples. For an :exc:`~pyTooling.Dependency.Solver.UnsolvableDependencyError`, ``incompatibility`` is
+	                  the serialized :class:`~pyTooling.Dependency.Solver.Incompatibility`, otherwise ``None``.
+	"""
+	from pyTooling.Dependency.Solver import UnsolvableDependencyError
+
+	results = []
+	for rootID in rootIDs:
+		try:
+			solution = _solveManyVersions[rootID].SolveLatest(algorithm)
+		except UnsolvableDependencyError as ex:
+			results.append((rootID, False, (str(ex), ex.Notes, ex._incompatibility._ToView(_solveManyIDs))))
+		except ToolingException as ex:
+			results.append((rootID, False, (str(ex), ex.Notes, None)))
+		else:
+			results.append((rootID, True, tuple(_solveManyIDs[packageVersion] for packageVersion in solution)))
+
+	return results
+
+
 @export
 class PackageDependencyGraph(metaclass=ExtendedType, slots=True):
 	"""
 	A package dependency graph collecting all known packages.
 	"""
-	_name:     str                        #: Package dependency graph name
-	_storages: Dict[str, PackageStorage]  #: Dictionary of known package storages.
+	_name:            str                        #: Package dependency graph name
+	_storages:        Dict[str, PackageStorage]  #: Dictionary of known package storages.
+	_resolutionCache: ResolutionCache            #: Cache of dependency resolution results.
 
 	def __init__(self, name: str) -> None:
 		"""
@@ -602,6 +913,7 @@ class PackageDependencyGraph(metaclass=ExtendedType, slots=True):
 		self._name = name
 
 		self._storages = {}
+		self._resolutionCache = ResolutionCache()
 
 	@readonly
 	def Name(self) -> str:
@@ -621,6 +933,15 @@ class PackageDependencyGraph(metaclass=ExtendedType, slots=True):
 		"""
 		return self._storages
 
+	@readonly
+	def ResolutionCache(self) -> ResolutionCache:
+		"""
+		Read-only property to access the graph's resolution cache.
+
+		:returns: Cache of dependency resolution results.
+		"""
+		return self._resolutionCache
+
 	# def CreatePackage(self, packageName: str) -> Package:
 	# 	"""
 	# 	Create a new package in the package dependency graph.
@@ -668,6 +989,260 @@ class PackageDependencyGraph(metaclass=ExtendedType, slots=True):
 		for storage in self._storages.values():
 			storage.SortPackageVersions()
 
+	def _ToView(self) -> Tuple[GraphView, Dict[PackageVersion, int]]:
+		"""
+		Serialize the graph into a compact, picklable read-only view.
+
+		:returns: A 2-tuple of the view and a dictionary mapping package versions to their indices in the view.
+		"""
+		packages = []
+		versions = []
+		ids: Dict[PackageVersion, int] = {}
+		for storage in self._storages.values():
+			for package in storage._packages.values():
+				packageIndex = len(packages)
+				packages.append((storage._name, package._name))
+				for packageVersion in package._versions.values():
+					ids[packageVersion] = len(versions)
+					versions.append((packageIndex, packageVersion._version, packageVersion._releasedAt))
+
+		dependsOn = tuple(
+			tuple(ids[dependency] for dependencies in packageVersion._dependsOn.values() for dependency in dependencies.values())
+			for packageVersion in ids
+		)
+
+		return (self._name, tuple(packages), tuple(versions), dependsOn), ids
+
+	@staticmethod
+	def _FromView(view: GraphView) -> List[PackageVersion]:
+		"""
+		Reconstruct a graph from a serialized view.
+
+		:param view: Serialized view of a graph.
+		:returns:    List of package versions in order of the view. The graph is accessible via these package versions.
+		"""
+		name, packages, versions, dependsOn = view
+
+		graph = PackageDependencyGraph(name)
+		packageObjects = []
+		for storageName, packageName in packages:
+			if (storage := graph._storages.get(storageName)) is None:
+				storage = PackageStorage(storageName, graph)
+			packageObjects.append(Package(packageName, storage=storage))
+
+		packageVersions = [PackageVersion(version, packageObjects[index], releasedAt) for index, version, releasedAt in versions]
+		for packageVersion, dependencies in zip(packageVersions, dependsOn):
+			packageVersion.AddDependencyToPackageVersions([packageVersions[index] for index in dependencies])
+
+		return packageVersions
+
+	def SolveMany(
+		self,
+		packageVersions: Iterable[PackageVersion],
+		workers: Nullable[int] = None,
+		algorithm: SolverAlgorithm = SolverAlgorithm.Backtracking,
+		chunkSize: Nullable[int] = None
+	) -> Generator[Tuple[PackageVersion, Union[List[PackageVersion], ToolingException]], None, None]:
+		"""
+		Solve the dependency problems of many root package versions, e.g. to compute a compatibility matrix.
+
+		Results are yielded as soon as they are available as tuples of the root package version and either its solution
+		(see :meth:`PackageVersion.SolveLatest`) or the :exc:`~pyTooling.Exceptions.ToolingException` describing the
+		failure. Results already memoized in the graph's :class:`ResolutionCache` are yielded first. New results are stored
+		in the cache.
+
+		If ``workers`` is 1, roots are solved sequentially in the calling process. Otherwise, chunks of roots are solved by
+		a :class:`~concurrent.futures.ProcessPoolExecutor`. Each worker process receives a read-only serialized view of the
+		graph once at start-up and returns solutions as indices into this view. Failures in worker processes are rebuilt
+		with their original type, message and notes, thus the result doesn't depend on the number of workers. An
+		:exc:`~pyTooling.Dependency.Solver.UnsolvableDependencyError` is rebuilt with its
+		:class:`~pyTooling.Dependency.Solver.Incompatibility` referring to this graph's package versions.
+
+		:param packageVersions: Root package versions of this graph.
+		:param workers:         Optional number of worker processes. Default: CPU count.
+		:param algorithm:       Solver algorithm to use.
+		:param chunkSize:       Optional number of roots per task. Default: number of roots divided by 4x workers.
+		:returns:               A generator of ``(root, solution or exception)`` tuples in order of completion.
+		:raises TypeError:      When parameter 'workers' is not of type 'int'.
+		:raises TypeError:      When parameter 'algorithm' is not of type 'SolverAlgorithm'.
+		:raises ValueError:     When parameter 'workers' is not positive.
+		:raises ValueError:     When a package version doesn't belong to this graph.
+		"""
+		if workers is None:
+			workers = cpu_count() or 1
+		elif not isinstance(workers, int):
+			ex = TypeError("Parameter 'workers' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(workers)}'.")
+			raise ex
+		elif workers < 1:
+			raise ValueError(f"Parameter 'workers' must be positive.")
+
+		if not isinstance(algorithm, SolverAlgorithm):
+			ex = TypeError("Parameter 'algorithm' is not of type 'SolverAlgorithm'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(algorithm)}'.")
+			raise ex
+
+		roots = list(packageVersions)
+		for root in roots:
+			if not isinstance(root, PackageVersion) or root._package._storage._graph is not self:
+				raise ValueError(f"Package version '{root}' doesn't belong to graph '{self._name}'.")
+
+		return self._SolveMany(roots, workers, algorithm, chunkSize)
+
+	def _SolveMany(
+		self,
+		roots: List[PackageVersion],
+		workers: int,
+		algorithm: SolverAlgorithm,
+		chunkSize: Nullable[int]
+	) -> Generator[Tuple[PackageVersion, Union[List[PackageVersion], ToolingException]], None, None]:
+		cache = self._resolutionCache
+
+		pending = []
+		for root in roots:
+			if (cached := cache._LookupSolution(root, algorithm)) is None:
+				pending.append(root)
+			elif isinstance(cached, ToolingException):
+				yield root, cached
+			else:
+				yield root, list(cached)
+
+		if workers == 1:
+			for root in pending:
+				try:
+					yield root, root.SolveLatest(algorithm)
+				except ToolingException as ex:
+					yield root, ex
+
+			return
+		elif len(pending) == 0:
+			return
+
+		if chunkSize is None:
+			chunkSize = max(1, len(pending) // (4 * workers))
+
+		view, ids = self._ToView()
+		packageVersions = list(ids)
+
+		executor = ProcessPoolExecutor(max_workers=workers, initializer=_SolveManyInitializer, initargs=(view, ))
+		try:
+			futures: Set[Future] = set()
+			for start in range(0, len(pending), chunkSize):
+				futures.add(executor.submit(_SolveManyChunk, [ids[root] for root in pending[start:start + chunkSize]], algorithm))
+
+			while futures:
+				done, futures = wait(futures, return_when=FIRST_COMPLETED)
+				for future in done:
+					for rootID, solved, payload in future.result():
+						root = packageVersions[rootID]
+						if solved:
+							solution = [packageVersions[index] for index in payload]
+							cache._StoreSolution(root, algorithm, tuple(solution))
+							yield root, solution
+						else:
+							message, notes, incompatibility = payload
+							if incompatibility is None:
+								ex = ToolingException(message)
+							else:
+								from pyTooling.Dependency.Solver import Incompatibility, UnsolvableDependencyError
+
+								ex = UnsolvableDependencyError(message, Incompatibility._FromView(incompatibility, self, packageVersions))
+							ex.__notes__ = list(notes)
+							cache._StoreSolution(root, algorithm, ex)
+							yield root, ex
+		finally:
+			executor.shutdown(wait=True, cancel_futures=True)
+
+	def _CheckRoot(self, root: PackageVersion) -> None:
+		if not isinstance(root, PackageVersion):
+			ex = TypeError("Parameter 'root' is not of type 'PackageVersion'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(root)}'.")
+			raise ex
+		elif root._package._storage._graph is not self:
+			raise ValueError(f"Package version '{root}' is not part of graph '{self._name}'.")
+
+	def WriteLockfile(
+		self,
+		path:      Union[str, Path],
+		root:      PackageVersion,
+		algorithm: SolverAlgorithm = SolverAlgorithm.Backtracking
+	) -> "Lockfile":
+		"""
+		Solve the dependency problem of a root package version and write the solution to a deterministic lockfile.
+
+		The format is selected by the file suffix (``.toml`` or ``.json``). See :mod:`pyTooling.Dependency.Lockfile`.
+
+		:param path:              Path to the lockfile.
+		:param root:              Root package version of the dependency problem.
+		:param algorithm:         Solver algorithm (see :meth:`PackageVersion.SolveLatest`).
+		:returns:                 The written lockfile.
+		:raises TypeError:        If parameter 'root' is not a :class:`PackageVersion`.
+		:raises ValueError:       If parameter 'root' is not part of this graph.
+		:raises ToolingException: When there is no valid solution to the problem.
+		"""
+		from pyTooling.Dependency.Lockfile import Lockfile
+
+		self._CheckRoot(root)
+
+		lockfile = Lockfile.FromSolution(root, root.SolveLatest(algorithm), algorithm)
+		lockfile.Write(path)
+
+		return lockfile
+
+	def ReadLockfile(self, path: Union[str, Path]) -> List[PackageVersion]:
+		"""
+		Read a lockfile and verify it incrementally against this graph instead of re-solving the dependency problem.
+
+		A verified lockfile is a valid, but not necessarily the latest solution. It's not memoized as a result of
+		:meth:`PackageVersion.SolveLatest`.
+
+		:param path:                   Path to the lockfile.
+		:returns:                      Locked package versions (root first).
+		:raises LockfileMismatchError: If the lockfile is malformed or doesn't match this graph (see
+		                               :class:`~pyTooling.Dependency.Lockfile.LockfileMismatchError`).
+		"""
+		from pyTooling.Dependency.Lockfile import Lockfile
+
+		return Lockfile.Read(path).Verify(self)
+
+	def SolveLocked(
+		self,
+		path:      Union[str, Path],
+		root:      PackageVersion,
+		algorithm: SolverAlgorithm = SolverAlgorithm.Backtracking
+	) -> List[PackageVersion]:
+		"""
+		Solve the dependency problem of a root package version using a lockfile.
+
+		If the lockfile exists, was written for the same root package version and algorithm and matches this graph, the
+		locked solution is returned without solving. Otherwise, the problem is solved and the lockfile is (re)written.
+
+		A valid lockfile is kept, even if a newer solution exists. Delete the lockfile to upgrade to the latest solution.
+
+		:param path:              Path to the lockfile.
+		:param root:              Root package version of the dependency problem.
+		:param algorithm:         Solver algorithm (see :meth:`PackageVersion.SolveLatest`).
+		:returns:                 A list of :class:`PackageVersion`s fulfilling the constraints of the dependency problem.
+		:raises TypeError:        If parameter 'root' is not a :class:`PackageVersion`.
+		:raises ValueError:       If parameter 'root' is not part of this graph.
+		:raises ToolingException: When there is no valid solution to the problem.
+		"""
+		from pyTooling.Dependency.Lockfile import Lockfile, LockedPackageVersion, LockfileMismatchError
+
+		self._CheckRoot(root)
+
+		path = Path(path)
+		if path.exists():
+			try:
+				lockfile = Lockfile.Read(path)
+				if lockfile._algorithm is algorithm and lockfile._root == LockedPackageVersion.FromPackageVersion(root):
+					return lockfile.Verify(self)
+			except LockfileMismatchError:
+				pass
+
+		self.WriteLockfile(path, root, algorithm)
+		return root.SolveLatest(algorithm)
+
 	def __len__(self) -> int:
 		"""
 		Returns the number of known packages.
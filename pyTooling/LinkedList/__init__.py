@@ -30,8 +30,14 @@
 #
 """An object-oriented doubly linked-list data structure for Python."""
 
+from asyncio         import AbstractEventLoop, Future, get_running_loop, wait_for
+from collections     import deque
 from collections.abc import Sized
-from typing          import Generic, TypeVar, Optional as Nullable, Callable, Iterable, Generator, Tuple, List, Any
+from itertools       import chain
+from random          import random
+from threading       import Condition, Lock
+from time            import monotonic
+from typing          import Generic, TypeVar, Optional as Nullable, Callable, Iterable, Iterator, Generator, Tuple, List, Dict, Deque, Any
 
 from pyTooling.Decorators  import readonly, export
 from pyTooling.Exceptions  import ToolingException
@@ -87,7 +93,7 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 		self._previousNode = previousNode
 		self._nextNode = nextNode
 		self._value = value
-		self._key = value
+		self._key = value if key is None else key
 
 		# Attache to previous node
 		if previousNode is not None:
@@ -98,6 +104,9 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 
 			# PreviousNode is part of a list
 			if previousNode._linkedList is not None:
+				if previousNode._linkedList._keyIndex is not None:
+					previousNode._linkedList._AddKey(self)
+
 				self._linkedList = previousNode._linkedList
 				self._linkedList._count += 1
 
@@ -133,6 +142,9 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 
 			# NextNode is part of a list
 			if nextNode._linkedList is not None:
+				if nextNode._linkedList._keyIndex is not None:
+					nextNode._linkedList._AddKey(self)
+
 				self._linkedList = nextNode._linkedList
 				self._linkedList._count += 1
 
@@ -186,7 +198,10 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 		"""
 		Property to access the node's internal key.
 
-		The key can be a scalar or a reference to an object.
+		The key can be a scalar or a reference to an object. If no key was given at node creation time, the node's value is
+		used as a key.
+
+		If the node is part of a linked list with a key index, the index is updated.
 
 		:return: The node's key.
 		"""
@@ -194,6 +209,13 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 
 	@Key.setter
 	def Key(self, key: _NodeKey) -> None:
+		if self._linkedList is not None and (keyIndex := self._linkedList._keyIndex) is not None:
+			if key in keyIndex and keyIndex[key] is not self:
+				raise ValueError(f"Key '{key}' already exists in this linked list.")
+
+			del keyIndex[self._key]
+			keyIndex[key] = self
+
 		self._key = key
 
 	@property
@@ -231,6 +253,9 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 		if node._linkedList is not None:
 			raise LinkedListException(f"Parameter 'node' belongs to another linked list.")
 
+		if self._linkedList._keyIndex is not None:
+			self._linkedList._AddKey(node)
+
 		node._linkedList = self._linkedList
 		node._nextNode = self
 		node._previousNode = self._previousNode
@@ -261,6 +286,9 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 		if node._linkedList is not None:
 			raise LinkedListException(f"Parameter 'node' belongs to another linked list.")
 
+		if self._linkedList._keyIndex is not None:
+			self._linkedList._AddKey(node)
+
 		node._linkedList = self._linkedList
 		node._previousNode = self
 		node._nextNode = self._nextNode
@@ -293,6 +321,9 @@ class Node(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=True):
 		"""
 		Remove this node from the linked list.
 		"""
+		if self._linkedList is not None and self._linkedList._keyIndex is not None:
+			del self._linkedList._keyIndex[self._key]
+
 		if self._previousNode is None:
 			if self._linkedList is not None:
 				self._linkedList._firstNode = self._nextNode
@@ -378,19 +409,27 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 	_firstNode: Nullable[Node[_NodeKey, _NodeValue]]  #: Reference to the first node of the linked list.
 	_lastNode:  Nullable[Node[_NodeKey, _NodeValue]]  #: Reference to the last node of the linked list.
 	_count:     int                                   #: Number of nodes in the linked list.
+	_keyIndex:  Nullable[Dict[_NodeKey, Node[_NodeKey, _NodeValue]]]  #: Optional key-to-node index. ``None`` if not used.
 
 	# allow iterable to initialize the list
-	def __init__(self, nodes: Nullable[Iterable[Node[_NodeKey, _NodeValue]]] = None) -> None:
+	def __init__(self, nodes: Nullable[Iterable[Node[_NodeKey, _NodeValue]]] = None, keyIndex: bool = False) -> None:
 		"""
 		Initialize an empty linked list.
 
 		Optionally, an iterable can be given to initialize the linked list. The order is preserved.
 
+		Optionally, a key index can be maintained, which maps each node's key to the node. Then, keys must be unique within
+		the linked list and keyed operations like :meth:`GetNodeByKey` are :math:`O(1)`.
+
 		:param nodes:                Optional iterable to initialize the linked list.
+		:param keyIndex:             If ``True``, maintain a key-to-node index.
 		:raises TypeError:           If parameter 'nodes' is not an :class:`iterable <typing.Iterable>`.
 		:raises TypeError:           If parameter 'nodes' items are not of type :class:`Node`.
 		:raises LinkedListException: If parameter 'nodes' contains items which are already part of another linked list.
+		:raises ValueError:          If parameter 'nodes' contains duplicate keys, while a key index is used.
 		"""
+		self._keyIndex = {} if keyIndex else None
+
 		if nodes is None:
 			self._firstNode = None
 			self._lastNode = None
@@ -445,6 +484,34 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 			self._count = position
 			node._nextNode = None
 
+			if self._keyIndex is not None:
+				node = self._firstNode
+				while node is not None:
+					self._AddKey(node)
+					node = node._nextNode
+
+	def _AddKey(self, node: Node[_NodeKey, _NodeValue]) -> None:
+		"""
+		Register a node's key in the key index.
+
+		:meta private:
+		:param node:        Node to register.
+		:raises ValueError: If the node's key already exists in the linked list.
+		"""
+		if node._key in self._keyIndex:
+			raise ValueError(f"Key '{node._key}' already exists in this linked list.")
+
+		self._keyIndex[node._key] = node
+
+	@readonly
+	def HasKeyIndex(self) -> bool:
+		"""
+		Read-only property to check if the linked list maintains a key index.
+
+		:return: ``True`` if a key-to-node index is maintained.
+		"""
+		return self._keyIndex is not None
+
 	@readonly
 	def IsEmpty(self) -> int:
 		"""
@@ -494,6 +561,8 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 		self._firstNode = None
 		self._lastNode = None
 		self._count = 0
+		if self._keyIndex is not None:
+			self._keyIndex = {}
 
 	def InsertBeforeFirst(self, node: Node[_NodeKey, _NodeValue]) -> None:
 		"""
@@ -515,6 +584,9 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 		if node._linkedList is not None:
 			raise LinkedListException(f"Parameter 'node' belongs to another linked list.")
 
+		if self._keyIndex is not None:
+			self._AddKey(node)
+
 		node._linkedList = self
 		node._previousNode = None
 		node._nextNode = self._firstNode
@@ -545,6 +617,9 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 		if node._linkedList is not None:
 			raise LinkedListException(f"Parameter 'node' belongs to another linked list.")
 
+		if self._keyIndex is not None:
+			self._AddKey(node)
+
 		node._linkedList = self
 		node._nextNode = None
 		node._previousNode = self._lastNode
@@ -566,6 +641,9 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 			raise LinkedListException(f"Linked list is empty.")
 
 		node = self._firstNode
+		if self._keyIndex is not None:
+			del self._keyIndex[node._key]
+
 		self._firstNode = node._nextNode
 		if self._firstNode is None:
 			self._lastNode = None
@@ -589,6 +667,9 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 			raise LinkedListException(f"Linked list is empty.")
 
 		node = self._lastNode
+		if self._keyIndex is not None:
+			del self._keyIndex[node._key]
+
 		self._lastNode = node._previousNode
 		if self._lastNode is None:
 			self._firstNode = None
@@ -651,6 +732,94 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 			else:  # pragma: no cover
 				raise LinkedListException(f"Node position not found.")
 
+	def GetNodeByKey(self, key: _NodeKey) -> Node[_NodeKey, _NodeValue]:
+		"""
+		Access a node in the linked list by its key.
+
+		:param key:       Key of the node to access.
+		:return:          Node with the given key.
+		:raises KeyError: If no node with the given key exists.
+
+		.. note::
+
+		   If the linked list maintains a key index, the lookup is :math:`O(1)`, otherwise the linked list is scanned.
+		"""
+		if self._keyIndex is not None:
+			return self._keyIndex[key]
+
+		node = self._firstNode
+		while node is not None:
+			if node._key == key:
+				return node
+
+			node = node._nextNode
+
+		raise KeyError(key)
+
+	def RemoveByKey(self, key: _NodeKey) -> Node[_NodeKey, _NodeValue]:
+		"""
+		Remove a node from the linked list by its key.
+
+		:param key:       Key of the node to remove.
+		:return:          Removed node.
+		:raises KeyError: If no node with the given key exists.
+		"""
+		node = self.GetNodeByKey(key)
+		node.Remove()
+		return node
+
+	def MoveToFront(self, key: _NodeKey) -> Node[_NodeKey, _NodeValue]:
+		"""
+		Move a node addressed by its key to the front of the linked list.
+
+		:param key:       Key of the node to move.
+		:return:          Moved node.
+		:raises KeyError: If no node with the given key exists.
+		"""
+		node = self.GetNodeByKey(key)
+		if node is self._firstNode:
+			return node
+
+		# Unlink node (it has a previous node, because it's not the first node)
+		node._previousNode._nextNode = node._nextNode
+		if node._nextNode is None:
+			self._lastNode = node._previousNode
+		else:
+			node._nextNode._previousNode = node._previousNode
+
+		node._previousNode = None
+		node._nextNode = self._firstNode
+		self._firstNode._previousNode = node
+		self._firstNode = node
+
+		return node
+
+	def MoveToBack(self, key: _NodeKey) -> Node[_NodeKey, _NodeValue]:
+		"""
+		Move a node addressed by its key to the back of the linked list.
+
+		:param key:       Key of the node to move.
+		:return:          Moved node.
+		:raises KeyError: If no node with the given key exists.
+		"""
+		node = self.GetNodeByKey(key)
+		if node is self._lastNode:
+			return node
+
+		# Unlink node (it has a next node, because it's not the last node)
+		node._nextNode._previousNode = node._previousNode
+		if node._previousNode is None:
+			self._firstNode = node._nextNode
+		else:
+			node._previousNode._nextNode = node._nextNode
+
+		node._nextNode = None
+		node._previousNode = self._lastNode
+		self._lastNode._nextNode = node
+		self._lastNode = node
+
+		return node
+
 	def Search(self, predicate: Callable[[Node], bool], reverse: bool = False) -> Node[_NodeKey, _NodeValue]:
 		if self._firstNode is None:
 			raise LinkedListException(f"Linked list is empty.")
@@ -689,8 +858,8 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 			last = node
 			node = last._nextNode
 			last._nextNode = last._previousNode
+			last._previousNode = node
 
-		last._previousNode = node
 		self._firstNode = last
 
 	def Sort(self, key: Nullable[Callable[[Node[_NodeKey, _NodeValue]], Any]] = None, reverse: bool = False) -> None:
@@ -704,8 +873,10 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 
 		.. note::
 
-		   The linked list is converted to an array, which is sorted by quicksort using the builtin :meth:`~list.sort`.
-		   Afterward, the sorted array is used to reconstruct the linked list in requested order.
+		   The linked list is converted to an array, which is sorted using the builtin :meth:`~list.sort` (Timsort).
+		   Afterward, the sorted array is used to reconstruct the linked list in requested order. Timsort detects already
+		   sorted runs, thus an already sorted list (or a concatenation of :math:`k` sorted lists) is sorted in :math:`O(n)`
+		   (or :math:`O(n log k)`).
 		"""
 		if (self._firstNode is None) or (self._firstNode is self._lastNode):
 			return
@@ -733,6 +904,144 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 		self._count = position
 		node._nextNode = None
 
+	def Splice(self, otherList: "LinkedList[_NodeKey, _NodeValue]", afterNode: Nullable[Node[_NodeKey, _NodeValue]] = None) -> None:
+		"""
+		Move all nodes of another linked list into this linked list after the given node.
+
+		The nodes are moved as a whole run, thus only the links at both ends of the run are updated. But each moved node's
+		back-reference to its linked list (and if used, the key index) is updated, thus the operation takes :math:`O(m)`
+		for :math:`m` moved nodes. Afterward, the other linked list is empty.
+
+		:param otherList:            Linked list whose nodes are moved.
+		:param afterNode:            Node after which the nodes are inserted. If ``None``, nodes are inserted before the
+		                             first node.
+		:raises TypeError:           If parameter 'otherList' is not of type :class:`LinkedList`.
+		:raises TypeError:           If parameter 'afterNode' is not of type :class:`Node`.
+		:raises LinkedListException: If parameter 'otherList' is this linked list.
+		:raises LinkedListException: If parameter 'afterNode' is not part of this linked list.
+		:raises ValueError:          If a moved node's key already exists in this linked list, while a key index is used.
+		"""
+		if not isinstance(otherList, LinkedList):
+			ex = TypeError(f"Parameter 'otherList' is not of type LinkedList.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(otherList)}'.")
+			raise ex
+		elif otherList is self:
+			raise LinkedListException(f"Parameter 'otherList' is the same linked list.")
+
+		if afterNode is not None:
+			if not isinstance(afterNode, Node):
+				ex = TypeError(f"Parameter 'afterNode' is not of type Node.")
+				ex.add_note(f"Got type '{getFullyQualifiedName(afterNode)}'.")
+				raise ex
+			elif afterNode._linkedList is not self:
+				raise LinkedListException(f"Parameter 'afterNode' is not part of this linked list.")
+
+		if (first := otherList._firstNode) is None:
+			return
+
+		last = otherList._lastNode
+
+		# Register keys first, so a duplicate key leaves both lists unchanged.
+		if self._keyIndex is not None:
+			node = first
+			try:
+				while node is not None:
+					self._AddKey(node)
+					node = node._nextNode
+			except ValueError:
+				while first is not node:
+					del self._keyIndex[first._key]
+					first = first._nextNode
+				raise
+
+		node = first
+		while node is not None:
+			node._linkedList = self
+			node = node._nextNode
+
+		if afterNode is None:
+			last._nextNode = self._firstNode
+			if self._firstNode is None:
+				self._lastNode = last
+			else:
+				self._firstNode._previousNode = last
+			self._firstNode = first
+		else:
+			first._previousNode = afterNode
+			last._nextNode = afterNode._nextNode
+			if afterNode._nextNode is None:
+				self._lastNode = last
+			else:
+				afterNode._nextNode._previousNode = last
+			afterNode._nextNode = first
+
+		self._count += otherList._count
+		otherList.Clear()
+
+	def Extend(self, otherList: "LinkedList[_NodeKey, _NodeValue]") -> None:
+		"""
+		Move all nodes of another linked list to the end of this linked list.
+
+		Afterward, the other linked list is empty.
+
+		:param otherList: Linked list whose nodes are appended.
+
+		.. seealso::
+
+		   :meth:`Splice` |br|
+		      |rarr| Move all nodes of another linked list after a given node.
+		"""
+		self.Splice(otherList, self._lastNode)
+
+	def SplitAt(self, node: Node[_NodeKey, _NodeValue]) -> "LinkedList[_NodeKey, _NodeValue]":
+		"""
+		Split the linked list before the given node.
+
+		The given node and all following nodes are moved as a whole run into a new linked list of the same type. The new
+		linked list uses a key index, if this linked list uses a key index. Only the links at the split point are updated,
+		but each moved node's back-reference to its linked list (and if used, the key index) is updated, thus the operation
+		takes :math:`O(m)` for :math:`m` moved nodes.
+
+		:param node:                 First node of the new linked list.
+		:return:                     New linked list containing the given node and all following nodes.
+		:raises TypeError:           If parameter 'node' is not of type :class:`Node`.
+		:raises LinkedListException: If parameter 'node' is not part of this linked list.
+		"""
+		if not isinstance(node, Node):
+			ex = TypeError(f"Parameter 'node' is not of type Node.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(node)}'.")
+			raise ex
+		elif node._linkedList is not self:
+			raise LinkedListException(f"Parameter 'node' is not part of this linked list.")
+
+		newList = self.__class__(keyIndex=self._keyIndex is not None)
+
+		count = 0
+		current = node
+		while current is not None:
+			current._linkedList = newList
+			if self._keyIndex is not None:
+				del self._keyIndex[current._key]
+				newList._keyIndex[current._key] = current
+
+			current = current._nextNode
+			count += 1
+
+		newList._firstNode = node
+		newList._lastNode = self._lastNode
+		newList._count = count
+
+		if node._previousNode is None:
+			self._firstNode = None
+			self._lastNode = None
+		else:
+			self._lastNode = node._previousNode
+			self._lastNode._nextNode = None
+			node._previousNode = None
+		self._count -= count
+
+		return newList
+
 	def IterateFromFirst(self) -> Generator[Node[_NodeKey, _NodeValue], None, None]:
 		"""
 		Return a generator iterating forward from list's first node to list's last node.
@@ -832,6 +1141,29 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 		"""
 		return self._count
 
+	def __contains__(self, key: _NodeKey) -> bool:
+		"""
+		Check if a node with the given key is part of the linked list.
+
+		:param key: Key to check.
+		:return:    ``True`` if a node with the given key exists.
+
+		.. note::
+
+		   If the linked list maintains a key index, the check is :math:`O(1)`, otherwise the linked list is scanned.
+		"""
+		if self._keyIndex is not None:
+			return key in self._keyIndex
+
+		node = self._firstNode
+		while node is not None:
+			if node._key == key:
+				return True
+
+			node = node._nextNode
+
+		return False
+
 	def __getitem__(self, index: int) -> _NodeValue:
 		"""
 		Access a node's value by its index.
@@ -865,3 +1197,1462 @@ class LinkedList(Generic[_NodeKey, _NodeValue], metaclass=ExtendedType, slots=Tr
 		node = self.GetNodeByIndex(index)
 		node.Remove()
 		return node._value
+
+
+_SKIPLIST_PROBABILITY = 0.25  #: Probability to promote a node of an :class:`IndexedLinkedList` to the next skip-list level.
+_SKIPLIST_MAXLEVEL =    32    #: Maximum number of skip-list levels above the doubly linked list.
+
+
+@export
+class IndexedNode(Node[_NodeKey, _NodeValue]):
+	"""
+	A node in an :class:`IndexedLinkedList`.
+
+	Besides the references to the previous and next node (level 0), a node might be part of further skip-list levels. The
+	number of levels is chosen randomly at node creation time. Per level, the node stores a reference to the next
+	(:attr:`_skipNext`) and previous (:attr:`_skipPrevious`) node on that level as well as the distance (span) to the next
+	node (:attr:`_skipSpan`).
+
+	The node offers the same API as :class:`Node`. Inserting or removing a node via a node handle also updates the
+	skip-list levels in expected :math:`O(log n)`.
+	"""
+
+	_skipNext:     List[Nullable["IndexedNode[_NodeKey, _NodeValue]"]]  #: References to the next node per skip-list level.
+	_skipPrevious: List[Nullable["IndexedNode[_NodeKey, _NodeValue]"]]  #: References to the previous node per skip-list level.
+	_skipSpan:     List[int]                                            #: Distances to the next node per skip-list level.
+
+	def __init__(
+		self,
+		value:        _NodeValue,
+		key:          Nullable[_NodeKey] = None,
+		previousNode: Nullable["IndexedNode[_NodeKey, _NodeValue]"] = None,
+		nextNode:     Nullable["IndexedNode[_NodeKey, _NodeValue]"] = None
+	) -> None:
+		"""
+		Initialize an indexed linked list node.
+
+		:param value:        Value to store in the node.
+		:param key:          Optional sortable key to store in the node.
+		:param previousNode: Optional reference to the previous node.
+		:param nextNode:     Optional reference to the next node.
+		:raises TypeError:   If parameter 'previous' is not of type :class:`Node`.
+		:raises TypeError:   If parameter 'next' is not of type :class:`Node`.
+		"""
+		levels = 0
+		while levels < _SKIPLIST_MAXLEVEL and random() < _SKIPLIST_PROBABILITY:
+			levels += 1
+
+		if levels == 0:
+			# Share an empty tuple for nodes only present in the doubly linked list (level 0).
+			self._skipNext = self._skipPrevious = self._skipSpan = ()
+		else:
+			self._skipNext = [None] * levels
+			self._skipPrevious = [None] * levels
+			self._skipSpan = [0] * levels
+
+		super().__init__(value, key, previousNode, nextNode)
+
+		if isinstance(self._linkedList, IndexedLinkedList):
+			self._linkedList._IndexInsert(self)
+
+	def InsertNodeBefore(self, node: "IndexedNode[_NodeKey, _NodeValue]") -> None:
+		"""
+		Insert a node before this node.
+
+		:param node:                 Node to insert.
+		:raises ValueError:          If parameter 'node' is ``None``.
+		:raises TypeError:           If parameter 'node' is not of type :class:`IndexedNode`.
+		:raises LinkedListException: If parameter 'node' is already part of another linked list.
+		"""
+		if node is not None and not isinstance(node, IndexedNode):
+			ex = TypeError(f"Parameter 'node' is not of type IndexedNode.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(node)}'.")
+			raise ex
+
+		super().InsertNodeBefore(node)
+		if isinstance(self._linkedList, IndexedLinkedList):
+			self._linkedList._IndexInsert(node)
+
+	def InsertNodeAfter(self, node: "IndexedNode[_NodeKey, _NodeValue]") -> None:
+		"""
+		Insert a node after this node.
+
+		:param node:                 Node to insert.
+		:raises ValueError:          If parameter 'node' is ``None``.
+		:raises TypeError:           If parameter 'node' is not of type :class:`IndexedNode`.
+		:raises LinkedListException: If parameter 'node' is already part of another linked list.
+		"""
+		if node is not None and not isinstance(node, IndexedNode):
+			ex = TypeError(f"Parameter 'node' is not of type IndexedNode.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(node)}'.")
+			raise ex
+
+		super().InsertNodeAfter(node)
+		if isinstance(self._linkedList, IndexedLinkedList):
+			self._linkedList._IndexInsert(node)
+
+	def Remove(self) -> _NodeValue:
+		"""
+		Remove this node from the linked list.
+		"""
+		if isinstance(self._linkedList, IndexedLinkedList):
+			self._linkedList._IndexRemove(self)
+
+		return super().Remove()
+
+
+@export
+class IndexedLinkedList(LinkedList[_NodeKey, _NodeValue]):
+	"""
+	An object-oriented doubly linked-list with an indexable skip-list for positional access.
+
+	Additionally to the doubly linked list, nodes (:class:`IndexedNode`) are linked on randomly chosen skip-list levels.
+	Each link stores its span (number of skipped nodes), thus positional access (:meth:`GetNodeByIndex`,
+	:meth:`GetIndexOfNode`, ``__getitem__``, ``__setitem__``, ``__delitem__``) and positional insertion
+	(:meth:`InsertAtIndex`) take expected :math:`O(log n)` instead of :math:`O(n)`.
+
+	Inserting and removing nodes via node handles (e.g. :meth:`IndexedNode.InsertNodeAfter`) or at the list's ends update
+	the spans along the skip-list levels in expected :math:`O(log n)`.
+	"""
+
+	_headNext: List[Nullable[IndexedNode[_NodeKey, _NodeValue]]]  #: References to the first node per skip-list level.
+	_headSpan: List[int]                                          #: Positions (1-based) of the first node per skip-list level.
+
+	def __init__(self, nodes: Nullable[Iterable[IndexedNode[_NodeKey, _NodeValue]]] = None, keyIndex: bool = False) -> None:
+		"""
+		Initialize an empty indexed linked list.
+
+		Optionally, an iterable can be given to initialize the linked list. The order is preserved.
+
+		:param nodes:                Optional iterable to initialize the linked list.
+		:param keyIndex:             If ``True``, maintain a key-to-node index.
+		:raises TypeError:           If parameter 'nodes' is not an :class:`iterable <typing.Iterable>`.
+		:raises TypeError:           If parameter 'nodes' items are not of type :class:`IndexedNode`.
+		:raises LinkedListException: If parameter 'nodes' contains items which are already part of another linked list.
+		"""
+		self._headNext = []
+		self._headSpan = []
+
+		super().__init__(nodes, keyIndex)
+
+		node = self._firstNode
+		while node is not None:
+			if not isinstance(node, IndexedNode):
+				ex = TypeError(f"Element in parameter 'nodes' is not of type IndexedNode.")
+				ex.add_note(f"Got type '{getFullyQualifiedName(node)}'.")
+				raise ex
+
+			node = node._nextNode
+
+		self._RebuildIndex()
+
+	def _RebuildIndex(self) -> None:
+		"""
+		Relink all skip-list levels in :math:`O(n)` based on the order of the doubly linked list.
+
+		Each node keeps its number of skip-list levels.
+
+		:meta private:
+		"""
+		headNext = self._headNext = []
+		headSpan = self._headSpan = []
+		lastNodes: List[Nullable[IndexedNode]] = []
+		lastPositions: List[int] = []
+
+		position = 0
+		node = self._firstNode
+		while node is not None:
+			position += 1
+			for level in range(len(node._skipNext)):
+				if level == len(headNext):
+					headNext.append(node)
+					headSpan.append(position)
+					lastNodes.append(None)
+					lastPositions.append(0)
+					node._skipPrevious[level] = None
+				else:
+					previous = lastNodes[level]
+					previous._skipNext[level] = node
+					previous._skipSpan[level] = position - lastPositions[level]
+					node._skipPrevious[level] = previous
+
+				node._skipNext[level] = None
+				node._skipSpan[level] = 0
+				lastNodes[level] = node
+				lastPositions[level] = position
+
+			node = node._nextNode
+
+	def _IndexInsert(self, node: IndexedNode[_NodeKey, _NodeValue]) -> None:
+		"""
+		Link a node, which was already inserted into the doubly linked list, into all skip-list levels.
+
+		For each level, the nearest predecessor being part of that level is searched by climbing the levels backward from
+		the inserted node. If the node is part of the level, it's linked after the predecessor, otherwise the predecessor's
+		span is incremented.
+
+		:meta private:
+		:param node: The inserted node.
+		"""
+		headNext = self._headNext
+		headSpan = self._headSpan
+		nodeLevels = len(node._skipNext)
+		while len(headNext) < nodeLevels:
+			headNext.append(None)
+			headSpan.append(0)
+
+		current = node._previousNode  # None represents the list's head
+		offset = 1                    # Distance from current to node
+		for level in range(len(headNext)):
+			while current is not None and len(current._skipNext) <= level:
+				if level == 0:
+					current = current._previousNode
+					offset += 1
+				else:
+					previous = current._skipPrevious[level - 1]
+					offset += headSpan[level - 1] if previous is None else previous._skipSpan[level - 1]
+					current = previous
+
+			if current is None:
+				nextNode = headNext[level]
+				span = headSpan[level]
+			else:
+				nextNode = current._skipNext[level]
+				span = current._skipSpan[level]
+
+			if level < nodeLevels:
+				node._skipNext[level] = nextNode
+				node._skipPrevious[level] = current
+				if nextNode is not None:
+					node._skipSpan[level] = span + 1 - offset
+					nextNode._skipPrevious[level] = node
+
+				if current is None:
+					headNext[level] = node
+					headSpan[level] = offset
+				else:
+					current._skipNext[level] = node
+					current._skipSpan[level] = offset
+			elif nextNode is not None:
+				if current is None:
+					headSpan[level] += 1
+				else:
+					current._skipSpan[level] += 1
+
+	def _IndexRemove(self, node: IndexedNode[_NodeKey, _NodeValue]) -> None:
+		"""
+		Unlink a node, which is still part of the doubly linked list, from all skip-list levels.
+
+		:meta private:
+		:param node: The node to be removed.
+		"""
+		headNext = self._headNext
+		headSpan = self._headSpan
+		nodeLevels = len(node._skipNext)
+
+		current = node._previousNode if nodeLevels == 0 else node._skipPrevious[nodeLevels - 1]
+		for level in range(nodeLevels):
+			previous = node._skipPrevious[level]
+			nextNode = node._skipNext[level]
+			if previous is None:
+				headNext[level] = nextNode
+				if nextNode is not None:
+					headSpan[level] += node._skipSpan[level] - 1
+			else:
+				previous._skipNext[level] = nextNode
+				if nextNode is not None:
+					previous._skipSpan[level] += node._skipSpan[level] - 1
+
+			if nextNode is not None:
+				nextNode._skipPrevious[level] = previous
+
+			node._skipNext[level] = None
+			node._skipPrevious[level] = None
+			node._skipSpan[level] = 0
+
+		for level in range(nodeLevels, len(headNext)):
+			while current is not None and len(current._skipNext) <= level:
+				current = current._previousNode if level == 0 else current._skipPrevious[level - 1]
+
+			if current is None:
+				if headNext[level] is not None:
+					headSpan[level] -= 1
+			elif current._skipNext[level] is not None:
+				current._skipSpan[level] -= 1
+
+		while len(headNext) > 0 and headNext[-1] is None:
+			headNext.pop()
+			headSpan.pop()
+
+	def Clear(self) -> None:
+		"""
+		Clear the linked list.
+		"""
+		super().Clear()
+		self._headNext = []
+		self._headSpan = []
+
+	def InsertBeforeFirst(self, node: IndexedNode[_NodeKey, _NodeValue]) -> None:
+		"""
+		Insert a node before the first node.
+
+		:param node:                 Node to insert.
+		:raises ValueError:          If parameter 'node' is ``None``.
+		:raises TypeError:           If parameter 'node' is not of type :class:`IndexedNode`.
+		:raises LinkedListException: If parameter 'node' is already part of another linked list.
+		"""
+		if node is not None and not isinstance(node, IndexedNode):
+			ex = TypeError(f"Parameter 'node' is not of type IndexedNode.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(node)}'.")
+			raise ex
+
+		super().InsertBeforeFirst(node)
+		self._IndexInsert(node)
+
+	def InsertAfterLast(self, node: IndexedNode[_NodeKey, _NodeValue]) -> None:
+		"""
+		Insert a node after the last node.
+
+		:param node:                 Node to insert.
+		:raises ValueError:          If parameter 'node' is ``None``.
+		:raises TypeError:           If parameter 'node' is not of type :class:`IndexedNode`.
+		:raises LinkedListException: If parameter 'node' is already part of another linked list.
+		"""
+		if node is not None and not isinstance(node, IndexedNode):
+			ex = TypeError(f"Parameter 'node' is not of type IndexedNode.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(node)}'.")
+			raise ex
+
+		super().InsertAfterLast(node)
+		self._IndexInsert(node)
+
+	def InsertAtIndex(self, index: int, node: IndexedNode[_NodeKey, _NodeValue]) -> None:
+		"""
+		Insert a node at the given position, so it can be accessed by ``index`` afterward.
+
+		:param index:                Position of the inserted node. ``Count`` appends the node.
+		:param node:                 Node to insert.
+		:raises ValueError:          If parameter 'index' is out of range.
+		:raises TypeError:           If parameter 'node' is not of type :class:`IndexedNode`.
+		:raises LinkedListException: If parameter 'node' is already part of another linked list.
+		"""
+		if index == 0:
+			self.InsertBeforeFirst(node)
+		elif index == self._count:
+			self.InsertAfterLast(node)
+		else:
+			self.GetNodeByIndex(index).InsertNodeBefore(node)
+
+	def RemoveFirst(self) -> IndexedNode[_NodeKey, _NodeValue]:
+		"""
+		Remove first node from linked list.
+
+		:return:                     First node.
+		:raises LinkedListException: If linked list is empty.
+		"""
+		if self._firstNode is None:
+			raise LinkedListException(f"Linked list is empty.")
+
+		self._IndexRemove(self._firstNode)
+		return super().RemoveFirst()
+
+	def RemoveLast(self) -> IndexedNode[_NodeKey, _NodeValue]:
+		"""
+		Remove last node from linked list.
+
+		:return:                     Last node.
+		:raises LinkedListException: If linked list is empty.
+		"""
+		if self._lastNode is None:
+			raise LinkedListException(f"Linked list is empty.")
+
+		self._IndexRemove(self._lastNode)
+		return super().RemoveLast()
+
+	def MoveToFront(self, key: _NodeKey) -> IndexedNode[_NodeKey, _NodeValue]:
+		"""
+		Move a node addressed by its key to the front of the linked list.
+
+		:param key:       Key of the node to move.
+		:return:          Moved node.
+		:raises KeyError: If no node with the given key exists.
+		"""
+		node = self.GetNodeByKey(key)
+		self._IndexRemove(node)
+		super().MoveToFront(key)
+		self._IndexInsert(node)
+
+		return node
+
+	def MoveToBack(self, key: _NodeKey) -> IndexedNode[_NodeKey, _NodeValue]:
+		"""
+		Move a node addressed by its key to the back of the linked list.
+
+		:param key:       Key of the node to move.
+		:return:          Moved node.
+		:raises KeyError: If no node with the given key exists.
+		"""
+		node = self.GetNodeByKey(key)
+		self._IndexRemove(node)
+		super().MoveToBack(key)
+		self._IndexInsert(node)
+
+		return node
+
+	def GetNodeByIndex(self, index: int) -> IndexedNode[_NodeKey, _NodeValue]:
+		"""
+		Access a node in the linked list by position.
+
+		:param index:       Node position to access.
+		:return:            Node at the given position.
+		:raises ValueError: If parameter 'position' is out of range.
+
+		.. note::
+
+		   The algorithm descends the skip-list levels, thus the time complexity is expected :math:`O(log n)`.
+		"""
+		if index < 0 or index >= self._count:
+			ex = ValueError("Parameter 'position' is out of range.")
+			if self._count == 0:
+				ex.add_note(f"Linked list is empty.")
+			else:
+				ex.add_note(f"Linked list has {self._count} elements. Requested index: {index}.")
+			raise ex
+
+		target = index + 1
+		position = 0
+		current = None  # None represents the list's head
+		for level in range(len(self._headNext) - 1, -1, -1):
+			while True:
+				if current is None:
+					nextNode = self._headNext[level]
+					span = self._headSpan[level]
+				else:
+					nextNode = current._skipNext[level]
+					span = current._skipSpan[level]
+
+				if nextNode is None or position + span > target:
+					break
+
+				current = nextNode
+				position += span
+
+			if position == target:
+				return current
+
+		node = self._firstNode if current is None else current._nextNode
+		position += 1
+		while position < target:
+			node = node._nextNode
+			position += 1
+
+		return node
+
+	def GetIndexOfNode(self, node: IndexedNode[_NodeKey, _NodeValue]) -> int:
+		"""
+		Compute the position of a node in the linked list.
+
+		:param node:                 Node of this linked list.
+		:return:                     Position of the node.
+		:raises LinkedListException: If parameter 'node' is not part of this linked list.
+
+		.. note::
+
+		   The algorithm climbs the skip-list levels backward, thus the time complexity is expected :math:`O(log n)`.
+		"""
+		if node._linkedList is not self:
+			raise LinkedListException(f"Parameter 'node' is not part of this linked list.")
+
+		position = -1
+		current = node
+		while current is not None:
+			levels = len(current._skipNext)
+			if levels == 0:
+				current = current._previousNode
+				position += 1
+			else:
+				previous = current._skipPrevious[levels - 1]
+				position += self._headSpan[levels - 1] if previous is None else previous._skipSpan[levels - 1]
+				current = previous
+
+		return position
+
+	def Reverse(self) -> None:
+		"""
+		Reverse the order of nodes in the linked list.
+		"""
+		super().Reverse()
+		self._RebuildIndex()
+
+	def Sort(self, key: Nullable[Callable[[Node[_NodeKey, _NodeValue]], Any]] = None, reverse: bool = False) -> None:
+		"""
+		Sort the linked list in ascending or descending order.
+
+		The sort operation is **stable**. Afterward, the skip-list levels are relinked in :math:`O(n)`.
+
+		:param key:     Optional function to access a user-defined key for sorting.
+		:param reverse: Optional parameter, if ``True`` sort in descending order, otherwise in ascending order.
+		"""
+		super().Sort(key, reverse)
+		self._RebuildIndex()
+
+	def Splice(self, otherList: "IndexedLinkedList[_NodeKey, _NodeValue]", afterNode: Nullable[IndexedNode[_NodeKey, _NodeValue]] = None) -> None:
+		"""
+		Move all nodes of another indexed linked list into this linked list after the given node.
+
+		Afterward, the skip-list levels are relinked in :math:`O(n)`.
+
+		:param otherList:            Indexed linked list whose nodes are moved.
+		:param afterNode:            Node after which the nodes are inserted. If ``None``, nodes are inserted before the
+		                             first node.
+		:raises TypeError:           If parameter 'otherList' is not of type :class:`IndexedLinkedList`.
+		:raises LinkedListException: If parameter 'otherList' is this linked list.
+		:raises LinkedListException: If parameter 'afterNode' is not part of this linked list.
+		"""
+		if not isinstance(otherList, IndexedLinkedList):
+			ex = TypeError(f"Parameter 'otherList' is not of type IndexedLinkedList.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(otherList)}'.")
+			raise ex
+
+		super().Splice(otherList, afterNode)
+		self._RebuildIndex()
+
+	def SplitAt(self, node: IndexedNode[_NodeKey, _NodeValue]) -> "IndexedLinkedList[_NodeKey, _NodeValue]":
+		"""
+		Split the linked list before the given node.
+
+		Afterward, the skip-list levels of both linked lists are relinked in :math:`O(n)`.
+
+		:param node:                 First node of the new linked list.
+		:return:                     New indexed linked list containing the given node and all following nodes.
+		:raises LinkedListException: If parameter 'node' is not part of this linked list.
+		"""
+		newList = super().SplitAt(node)
+		self._RebuildIndex()
+		newList._RebuildIndex()
+
+		return newList
+
+
+@export
+class Chunk(Generic[_NodeValue], metaclass=ExtendedType, slots=True):
+	"""
+	A chunk in an unrolled linked list.
+
+	It contains a reference to the unrolled linked list (:attr:`_linkedList`), the previous chunk (:attr:`_previousChunk`),
+	the next chunk (:attr:`_nextChunk`) and a contiguous array of up to :attr:`UnrolledLinkedList.ChunkSize` values
+	(:attr:`_values`).
+	"""
+
+	_linkedList:    Nullable["UnrolledLinkedList[_NodeValue]"]  #: Reference to the unrolled linked list instance.
+	_previousChunk: Nullable["Chunk[_NodeValue]"]               #: Reference to the previous chunk.
+	_nextChunk:     Nullable["Chunk[_NodeValue]"]               #: Reference to the next chunk.
+	_values:        List[_NodeValue]                            #: Values stored in this chunk.
+
+	def __init__(self, linkedList: "UnrolledLinkedList[_NodeValue]", values: Nullable[List[_NodeValue]] = None) -> None:
+		"""
+		Initialize an unlinked chunk.
+
+		:param linkedList: Unrolled linked list owning the chunk.
+		:param values:     Optional list of values to store in the chunk.
+		"""
+		self._linkedList = linkedList
+		self._previousChunk = None
+		self._nextChunk = None
+		self._values = [] if values is None else values
+
+	@readonly
+	def PreviousChunk(self) -> Nullable["Chunk[_NodeValue]"]:
+		"""
+		Read-only property to access the previous chunk.
+
+		:return: The chunk before the current chunk or ``None``.
+		"""
+		return self._previousChunk
+
+	@readonly
+	def NextChunk(self) -> Nullable["Chunk[_NodeValue]"]:
+		"""
+		Read-only property to access the next chunk.
+
+		:return: The chunk after the current chunk or ``None``.
+		"""
+		return self._nextChunk
+
+	@readonly
+	def Count(self) -> int:
+		"""
+		Read-only property to access the number of values in the chunk.
+
+		:return: Number of values.
+		"""
+		return len(self._values)
+
+	def __repr__(self) -> str:
+		return f"Chunk: {self._values}"
+
+
+@export
+class Cursor(Generic[_NodeValue], metaclass=ExtendedType, slots=True):
+	"""
+	A cursor pointing to a value in an unrolled linked list.
+
+	A cursor is yielded by :meth:`UnrolledLinkedList.IterateCursorFromFirst`. It allows to read, replace and remove the
+	current value while iterating. After :meth:`Remove`, the iteration continues with the value following the removed
+	value.
+	"""
+
+	_chunk:   Nullable[Chunk[_NodeValue]]  #: Chunk containing the current value.
+	_index:   int                          #: Index of the current value within the chunk.
+	_removed: bool                         #: True, if the current value was removed.
+
+	def __init__(self, chunk: Nullable[Chunk[_NodeValue]] = None, index: int = 0) -> None:
+		"""
+		Initialize a cursor.
+
+		:param chunk: Chunk containing the current value.
+		:param index: Index of the current value within the chunk.
+		"""
+		self._chunk = chunk
+		self._index = index
+		self._removed = False
+
+	@property
+	def Value(self) -> _NodeValue:
+		"""
+		Property to access the current value.
+
+		:return:                     The current value.
+		:raises LinkedListException: If the current value was removed.
+		"""
+		if self._removed:
+			raise LinkedListException(f"Value was removed.")
+
+		return self._chunk._values[self._index]
+
+	@Value.setter
+	def Value(self, value: _NodeValue) -> None:
+		if self._removed:
+			raise LinkedListException(f"Value was removed.")
+
+		self._chunk._values[self._index] = value
+
+	def Remove(self) -> _NodeValue:
+		"""
+		Remove the current value from the unrolled linked list.
+
+		If the chunk becomes empty, it's unlinked from the unrolled linked list.
+
+		:return:                     The removed value.
+		:raises LinkedListException: If the current value was already removed.
+		"""
+		if self._removed:
+			raise LinkedListException(f"Value was already removed.")
+
+		chunk = self._chunk
+		value = chunk._values.pop(self._index)
+		chunk._linkedList._count -= 1
+		if len(chunk._values) == 0:
+			chunk._linkedList._UnlinkChunk(chunk)
+
+		self._removed = True
+		return value
+
+
+@export
+class UnrolledLinkedList(Generic[_NodeValue], metaclass=ExtendedType, slots=True):
+	"""
+	An object-oriented unrolled (chunked) doubly linked-list.
+
+	Values are stored in contiguous arrays of up to :attr:`ChunkSize` values (:class:`Chunk`), which are doubly linked.
+	Compared to :class:`LinkedList`, no node object is allocated per value and iteration follows one reference per chunk
+	instead of one reference per value.
+
+	The unrolled linked list offers a compatible subset of the :class:`LinkedList` API operating on values instead of
+	nodes: inserting and removing at both ends, iterating in both directions, sorting, converting and removing values via
+	a :class:`Cursor` while iterating.
+	"""
+
+	_firstChunk: Nullable[Chunk[_NodeValue]]  #: Reference to the first chunk of the unrolled linked list.
+	_lastChunk:  Nullable[Chunk[_NodeValue]]  #: Reference to the last chunk of the unrolled linked list.
+	_count:      int                          #: Number of values in the unrolled linked list.
+	_chunkSize:  int                          #: Maximum number of values per chunk.
+
+	def __init__(self, values: Nullable[Iterable[_NodeValue]] = None, chunkSize: int = 64) -> None:
+		"""
+		Initialize an empty unrolled linked list.
+
+		Optionally, an iterable can be given to initialize the unrolled linked list. The order is preserved.
+
+		:param values:      Optional iterable to initialize the unrolled linked list.
+		:param chunkSize:   Maximum number of values per chunk.
+		:raises TypeError:  If parameter 'values' is not an :class:`iterable <typing.Iterable>`.
+		:raises TypeError:  If parameter 'chunkSize' is not of type :class:`int`.
+		:raises ValueError: If parameter 'chunkSize' is less than 1.
+		"""
+		if not isinstance(chunkSize, int):
+			ex = TypeError(f"Parameter 'chunkSize' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(chunkSize)}'.")
+			raise ex
+		elif chunkSize < 1:
+			raise ValueError(f"Parameter 'chunkSize' must be greater than 0.")
+
+		self._chunkSize = chunkSize
+		self._firstChunk = None
+		self._lastChunk = None
+		self._count = 0
+
+		if values is None:
+			return
+		elif not isinstance(values, Iterable):
+			ex = TypeError(f"Parameter 'values' is not an iterable.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(values)}'.")
+			raise ex
+
+		self._Fill(list(values))
+
+	def _Fill(self, values: List[_NodeValue]) -> None:
+		"""
+		Replace all chunks by new chunks filled with the given values.
+
+		:meta private:
+		:param values: Values to store.
+		"""
+		self._firstChunk = None
+		self._lastChunk = None
+		self._count = len(values)
+
+		chunkSize = self._chunkSize
+		previous = None
+		for start in range(0, len(values), chunkSize):
+			chunk = Chunk(self, values[start:start + chunkSize])
+			if previous is None:
+				self._firstChunk = chunk
+			else:
+				previous._nextChunk = chunk
+				chunk._previousChunk = previous
+			previous = chunk
+
+		self._lastChunk = previous
+
+	def _UnlinkChunk(self, chunk: Chunk[_NodeValue]) -> None:
+		"""
+		Unlink an empty chunk.
+
+		The chunk keeps its references to neighbouring chunks, so an ongoing iteration can continue.
+
+		:meta private:
+		:param chunk: Chunk to unlink.
+		"""
+		if chunk._previousChunk is None:
+			self._firstChunk = chunk._nextChunk
+		else:
+			chunk._previousChunk._nextChunk = chunk._nextChunk
+
+		if chunk._nextChunk is None:
+			self._lastChunk = chunk._previousChunk
+		else:
+			chunk._nextChunk._previousChunk = chunk._previousChunk
+
+		chunk._linkedList = None
+
+	@readonly
+	def IsEmpty(self) -> bool:
+		"""
+		Read-only property to check if the unrolled linked list is empty.
+
+		:return: ``True``, if the unrolled linked list contains no values.
+		"""
+		return self._count == 0
+
+	@readonly
+	def Count(self) -> int:
+		"""
+		Read-only property to access the number of values.
+
+		:return: Number of values.
+		"""
+		return self._count
+
+	@readonly
+	def ChunkSize(self) -> int:
+		"""
+		Read-only property to access the maximum number of values per chunk.
+
+		:return: Maximum number of values per chunk.
+		"""
+		return self._chunkSize
+
+	@readonly
+	def ChunkCount(self) -> int:
+		"""
+		Read-only property to access the number of chunks.
+
+		The number of chunks is computed by iterating all chunks.
+
+		:return: Number of chunks.
+		"""
+		count = 0
+		chunk = self._firstChunk
+		while chunk is not None:
+			count += 1
+			chunk = chunk._nextChunk
+
+		return count
+
+	@readonly
+	def FirstChunk(self) -> Nullable[Chunk[_NodeValue]]:
+		"""
+		Read-only property to access the first chunk.
+
+		:return: Reference to the first chunk. ``None``, if the unrolled linked list is empty.
+		"""
+		return self._firstChunk
+
+	@readonly
+	def LastChunk(self) -> Nullable[Chunk[_NodeValue]]:
+		"""
+		Read-only property to access the last chunk.
+
+		:return: Reference to the last chunk. ``None``, if the unrolled linked list is empty.
+		"""
+		return self._lastChunk
+
+	def Clear(self) -> None:
+		"""
+		Clear the unrolled linked list.
+		"""
+		self._firstChunk = None
+		self._lastChunk = None
+		self._count = 0
+
+	def InsertBeforeFirst(self, value: _NodeValue) -> None:
+		"""
+		Insert a value before the first value.
+
+		If the first chunk is full, a new chunk is linked before the first chunk.
+
+		:param value: Value to insert.
+		"""
+		chunk = self._firstChunk
+		if chunk is None or len(chunk._values) >= self._chunkSize:
+			chunk = Chunk(self, [value])
+			chunk._nextChunk = self._firstChunk
+			if self._firstChunk is None:
+				self._lastChunk = chunk
+			else:
+				self._firstChunk._previousChunk = chunk
+			self._firstChunk = chunk
+		else:
+			chunk._values.insert(0, value)
+
+		self._count += 1
+
+	def InsertAfterLast(self, value: _NodeValue) -> None:
+		"""
+		Insert a value after the last value.
+
+		If the last chunk is full, a new chunk is linked after the last chunk.
+
+		:param value: Value to insert.
+		"""
+		chunk = self._lastChunk
+		if chunk is None or len(chunk._values) >= self._chunkSize:
+			chunk = Chunk(self, [value])
+			chunk._previousChunk = self._lastChunk
+			if self._lastChunk is None:
+				self._firstChunk = chunk
+			else:
+				self._lastChunk._nextChunk = chunk
+			self._lastChunk = chunk
+		else:
+			chunk._values.append(value)
+
+		self._count += 1
+
+	def RemoveFirst(self) -> _NodeValue:
+		"""
+		Remove first value from the unrolled linked list.
+
+		:return:                     First value.
+		:raises LinkedListException: If the unrolled linked list is empty.
+		"""
+		if (chunk := self._firstChunk) is None:
+			raise LinkedListException(f"Linked list is empty.")
+
+		value = chunk._values.pop(0)
+		self._count -= 1
+		if len(chunk._values) == 0:
+			self._UnlinkChunk(chunk)
+
+		return value
+
+	def RemoveLast(self) -> _NodeValue:
+		"""
+		Remove last value from the unrolled linked list.
+
+		:return:                     Last value.
+		:raises LinkedListException: If the unrolled linked list is empty.
+		"""
+		if (chunk := self._lastChunk) is None:
+			raise LinkedListException(f"Linked list is empty.")
+
+		value = chunk._values.pop()
+		self._count -= 1
+		if len(chunk._values) == 0:
+			self._UnlinkChunk(chunk)
+
+		return value
+
+	def Compact(self) -> None:
+		"""
+		Repack all values into full chunks.
+
+		Removing values via a cursor or at the ends leaves partially filled chunks behind. Compacting restores the minimal
+		number of chunks.
+		"""
+		self._Fill(self.ToList())
+
+	def Reverse(self) -> None:
+		"""
+		Reverse the order of values in the unrolled linked list.
+		"""
+		chunk = self._firstChunk
+		while chunk is not None:
+			chunk._values.reverse()
+			chunk._previousChunk, chunk._nextChunk = chunk._nextChunk, chunk._previousChunk
+			chunk = chunk._previousChunk
+
+		self._firstChunk, self._lastChunk = self._lastChunk, self._firstChunk
+
+	def Sort(self, key: Nullable[Callable[[_NodeValue], Any]] = None, reverse: bool = False) -> None:
+		"""
+		Sort the unrolled linked list in ascending or descending order.
+
+		The sort operation is **stable**.
+
+		:param key:     Optional function to access a user-defined key for sorting.
+		:param reverse: Optional parameter, if ``True`` sort in descending order, otherwise in ascending order.
+
+		.. note::
+
+		   In contrast to :meth:`LinkedList.Sort`, the key function is applied to values, not nodes. The values are sorted
+		   by the builtin :meth:`~list.sort` and repacked into full chunks.
+		"""
+		values = self.ToList()
+		values.sort(key=key, reverse=reverse)
+		self._Fill(values)
+
+	def _IterateChunkValues(self) -> Generator[List[_NodeValue], None, None]:
+		"""
+		Return a generator iterating the value arrays of all chunks from first to last chunk.
+
+		:meta private:
+		:return: A sequence of value arrays.
+		"""
+		chunk = self._firstChunk
+		while chunk is not None:
+			nextChunk = chunk._nextChunk
+			yield chunk._values
+			chunk = nextChunk
+
+	def _IterateReversedChunkValues(self) -> Generator[Iterator[_NodeValue], None, None]:
+		"""
+		Return a generator iterating the reversed value arrays of all chunks from last to first chunk.
+
+		:meta private:
+		:return: A sequence of reversed value arrays.
+		"""
+		chunk = self._lastChunk
+		while chunk is not None:
+			previousChunk = chunk._previousChunk
+			yield reversed(chunk._values)
+			chunk = previousChunk
+
+	def IterateFromFirst(self) -> Iterator[_NodeValue]:
+		"""
+		Return an iterator iterating forward from the first value to the last value.
+
+		The values within a chunk are iterated by the builtin list iterator, thus only one step per chunk is executed in
+		Python.
+
+		:return: A sequence of values towards the last value.
+		"""
+		return chain.from_iterable(self._IterateChunkValues())
+
+	def IterateFromLast(self) -> Iterator[_NodeValue]:
+		"""
+		Return an iterator iterating backward from the last value to the first value.
+
+		:return: A sequence of values towards the first value.
+		"""
+		return chain.from_iterable(self._IterateReversedChunkValues())
+
+	def IterateCursorFromFirst(self) -> Generator[Cursor[_NodeValue], None, None]:
+		"""
+		Return a generator iterating forward from the first value to the last value using a cursor.
+
+		The same :class:`Cursor` instance is yielded for every value. The current value can be read, replaced or removed
+		via the cursor. Other modifications of the unrolled linked list while iterating are not supported.
+
+		:return: A sequence of cursor positions towards the last value.
+		"""
+		cursor = Cursor()
+		chunk = self._firstChunk
+		while chunk is not None:
+			index = 0
+			while index < len(chunk._values):
+				cursor._chunk = chunk
+				cursor._index = index
+				cursor._removed = False
+				yield cursor
+
+				if not cursor._removed:
+					index += 1
+
+			chunk = chunk._nextChunk
+
+	def ToList(self, reverse: bool = False) -> List[_NodeValue]:
+		"""
+		Convert the unrolled linked list to a :class:`list`.
+
+		Optionally, the resulting list can be constructed in reverse order.
+
+		:param reverse: Optional parameter, if ``True`` return in reversed order, otherwise in normal order.
+		:return:        A list (array) of this unrolled linked list's values.
+		"""
+		result = []
+		chunk = self._firstChunk
+		while chunk is not None:
+			result.extend(chunk._values)
+			chunk = chunk._nextChunk
+
+		if reverse:
+			result.reverse()
+
+		return result
+
+	def ToTuple(self, reverse: bool = False) -> Tuple[_NodeValue, ...]:
+		"""
+		Convert the unrolled linked list to a :class:`tuple`.
+
+		Optionally, the resulting tuple can be constructed in reverse order.
+
+		:param reverse: Optional parameter, if ``True`` return in reversed order, otherwise in normal order.
+		:return:        A tuple of this unrolled linked list's values.
+		"""
+		return tuple(self.ToList(reverse))
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of values in the unrolled linked list.
+
+		:returns: Number of values.
+		"""
+		return self._count
+
+	def __iter__(self) -> Iterator[_NodeValue]:
+		"""
+		Iterate all values from first to last value.
+
+		:returns: A sequence of values.
+		"""
+		return self.IterateFromFirst()
+
+	def __getitem__(self, index: int) -> _NodeValue:
+		"""
+		Access a value by its index.
+
+		:param index:       Index to access.
+		:return:            Value at the given index.
+		:raises ValueError: If parameter 'index' is out of range.
+
+		.. note::
+
+		   The algorithm skips whole chunks starting from the shorter end.
+		"""
+		if not 0 <= index < self._count:
+			ex = ValueError("Parameter 'index' is out of range.")
+			ex.add_note(f"Linked list has {self._count} elements. Requested index: {index}.")
+			raise ex
+
+		if index < self._count // 2:
+			chunk = self._firstChunk
+			while index >= len(chunk._values):
+				index -= len(chunk._values)
+				chunk = chunk._nextChunk
+
+			return chunk._values[index]
+		else:
+			index = self._count - 1 - index
+			chunk = self._lastChunk
+			while index >= len(chunk._values):
+				index -= len(chunk._values)
+				chunk = chunk._previousChunk
+
+			return chunk._values[-1 - index]
+
+
+def _WakeUp(future: Future) -> None:
+	"""
+	Complete a waiting future, if it's not yet done.
+
+	This function is scheduled via :meth:`asyncio.loop.call_soon_threadsafe` into the future's event loop.
+
+	:param future: Future to complete.
+	"""
+	if not future.done():
+		future.set_result(None)
+
+
+@export
+class LinkedQueue(Generic[_NodeValue], metaclass=ExtendedType, slots=True):
+	"""
+	A thread-safe FIFO queue based on a singly linked chain of :class:`Node` instances.
+
+	The queue uses two locks: producers (:meth:`PushLast`) synchronize on the tail lock, consumers (:meth:`PopFirst`)
+	synchronize on the head lock. Thus, a producer and a consumer can operate concurrently. The head of the chain is a
+	dummy node, so producers and consumers never modify the same node reference.
+
+	Blocking operations wait on condition variables (:class:`threading.Condition`). If a capacity is given, producers
+	block while the queue is full (backpressure). Awaitable variants (:meth:`PushLastAsync`, :meth:`PopFirstAsync`) allow
+	coroutines to share the same queue with threads without blocking the event loop.
+
+	The number of values is tracked by two monotonic counters: pushed values (modified by producers only) and popped
+	values (modified by consumers only). Therefore, :attr:`Count` is exact only, if no operation is in progress.
+	"""
+
+	_head:          Node[_NodeValue, _NodeValue]            #: Dummy node before the first value. Guarded by the head lock.
+	_tail:          Node[_NodeValue, _NodeValue]            #: Last node. Guarded by the tail lock.
+	_capacity:      Nullable[int]                           #: Optional maximum number of values.
+	_pushed:        int                                     #: Number of pushed values. Modified under the tail lock.
+	_popped:        int                                     #: Number of popped values. Modified under the head lock.
+	_closed:        bool                                    #: True, if the queue was closed.
+	_headLock:      Lock                                    #: Lock synchronizing consumers.
+	_tailLock:      Lock                                    #: Lock synchronizing producers.
+	_notEmpty:      Condition                               #: Condition signaled, when a value becomes available.
+	_notFull:       Condition                               #: Condition signaled, when space becomes available.
+	_asyncPoppers:  Deque[Tuple[AbstractEventLoop, Future]]  #: Waiting consumer coroutines. Guarded by the head lock.
+	_asyncPushers:  Deque[Tuple[AbstractEventLoop, Future]]  #: Waiting producer coroutines. Guarded by the tail lock.
+
+	def __init__(self, capacity: Nullable[int] = None) -> None:
+		"""
+		Initialize an empty linked queue.
+
+		:param capacity:    Optional maximum number of values. If ``None``, the queue is unbounded.
+		:raises TypeError:  If parameter 'capacity' is not of type :class:`int`.
+		:raises ValueError: If parameter 'capacity' is less than 1.
+		"""
+		if capacity is not None:
+			if not isinstance(capacity, int):
+				ex = TypeError(f"Parameter 'capacity' is not of type 'int'.")
+				ex.add_note(f"Got type '{getFullyQualifiedName(capacity)}'.")
+				raise ex
+			elif capacity < 1:
+				raise ValueError(f"Parameter 'capacity' must be greater than 0.")
+
+		self._head = self._tail = Node(None)
+		self._capacity = capacity
+		self._pushed = 0
+		self._popped = 0
+		self._closed = False
+		self._headLock = Lock()
+		self._tailLock = Lock()
+		self._notEmpty = Condition(self._headLock)
+		self._notFull = Condition(self._tailLock)
+		self._asyncPoppers = deque()
+		self._asyncPushers = deque()
+
+	@readonly
+	def Capacity(self) -> Nullable[int]:
+		"""
+		Read-only property to access the queue's capacity.
+
+		:return: Maximum number of values or ``None``, if the queue is unbounded.
+		"""
+		return self._capacity
+
+	@readonly
+	def Count(self) -> int:
+		"""
+		Read-only property to access the number of values.
+
+		:return: Number of values. The result is a snapshot, if operations are in progress.
+		"""
+		return max(0, self._pushed - self._popped)
+
+	@readonly
+	def IsEmpty(self) -> bool:
+		"""
+		Read-only property to check if the queue is empty.
+
+		:return: ``True``, if the queue contains no values.
+		"""
+		return self._head._nextNode is None
+
+	@readonly
+	def IsFull(self) -> bool:
+		"""
+		Read-only property to check if the queue is full.
+
+		:return: ``True``, if the queue is bounded and contains :attr:`Capacity` values.
+		"""
+		return self._capacity is not None and self._pushed - self._popped >= self._capacity
+
+	@readonly
+	def IsClosed(self) -> bool:
+		"""
+		Read-only property to check if the queue was closed.
+
+		:return: ``True``, if :meth:`Close` was called.
+		"""
+		return self._closed
+
+	def _SignalNotEmpty(self) -> None:
+		"""
+		Wake up one waiting consumer thread and one waiting consumer coroutine.
+
+		Must be called while holding the head lock.
+
+		:meta private:
+		"""
+		self._notEmpty.notify()
+		while self._asyncPoppers:
+			loop, future = self._asyncPoppers.popleft()
+			if not future.done():
+				loop.call_soon_threadsafe(_WakeUp, future)
+				break
+
+	def _SignalNotFull(self) -> None:
+		"""
+		Wake up one waiting producer thread and one waiting producer coroutine.
+
+		Must be called while holding the tail lock.
+
+		:meta private:
+		"""
+		self._notFull.notify()
+		while self._asyncPushers:
+			loop, future = self._asyncPushers.popleft()
+			if not future.done():
+				loop.call_soon_threadsafe(_WakeUp, future)
+				break
+
+	def _Enqueue(self, value: _NodeValue) -> bool:
+		"""
+		Append a value.
+
+		Must be called while holding the tail lock and if the queue is not full.
+
+		:meta private:
+		:param value: Value to append.
+		:return:      ``True``, if the queue was empty before, so consumers need to be signaled.
+		"""
+		node = Node(value)
+		self._tail._nextNode = node
+		self._tail = node
+		self._pushed += 1
+
+		count = self._pushed - self._popped
+		if self._capacity is not None and count < self._capacity:
+			self._SignalNotFull()
+
+		return count <= 1
+
+	def _Dequeue(self) -> Tuple[_NodeValue, bool]:
+		"""
+		Remove the first value.
+
+		Must be called while holding the head lock and if the queue is not empty.
+
+		:meta private:
+		:return: A tuple of the removed value and a flag, if the queue was full before, so producers need to be signaled.
+		"""
+		first = self._head._nextNode
+		value = first._value
+		first._value = None
+		self._head = first
+		self._popped += 1
+
+		if first._nextNode is not None:
+			self._SignalNotEmpty()
+
+		return value, self._capacity is not None and self._pushed - self._popped + 1 >= self._capacity
+
+	def PushLast(self, value: _NodeValue, timeout: Nullable[float] = None) -> None:
+		"""
+		Append a value at the end of the queue.
+
+		If the queue is full, the calling thread blocks until space becomes available.
+
+		:param value:                Value to append.
+		:param timeout:              Optional maximum time in seconds to wait for space. ``0`` doesn't block.
+		:raises TimeoutError:        If the queue is still full after the timeout.
+		:raises LinkedListException: If the queue was closed.
+		"""
+		with self._tailLock:
+			if self._closed:
+				raise LinkedListException(f"Queue is closed.")
+
+			if self._capacity is not None and self._pushed - self._popped >= self._capacity:
+				deadline = None if timeout is None else monotonic() + timeout
+				while self._pushed - self._popped >= self._capacity:
+					if deadline is None:
+						self._notFull.wait()
+					elif (remaining := deadline - monotonic()) <= 0:
+						raise TimeoutError(f"Queue is full.")
+					else:
+						self._notFull.wait(remaining)
+
+					if self._closed:
+						raise LinkedListException(f"Queue is closed.")
+
+			wasEmpty = self._Enqueue(value)
+
+		if wasEmpty:
+			with self._headLock:
+				self._SignalNotEmpty()
+
+	def PopFirst(self, timeout: Nullable[float] = None) -> _NodeValue:
+		"""
+		Remove and return the first value of the queue.
+
+		If the queue is empty, the calling thread blocks until a value becomes available.
+
+		:param timeout:              Optional maximum time in seconds to wait for a value. ``0`` doesn't block.
+		:return:                     First value.
+		:raises TimeoutError:        If the queue is still empty after the timeout.
+		:raises LinkedListException: If the queue is empty and was closed.
+		"""
+		with self._headLock:
+			if self._head._nextNode is None:
+				deadline = None if timeout is None else monotonic() + timeout
+				while self._head._nextNode is None:
+					if self._closed:
+						raise LinkedListException(f"Queue is closed.")
+					elif deadline is None:
+						self._notEmpty.wait()
+					elif (remaining := deadline - monotonic()) <= 0:
+						raise TimeoutError(f"Queue is empty.")
+					else:
+						self._notEmpty.wait(remaining)
+
+			value, wasFull = self._Dequeue()
+
+		if wasFull:
+			with self._tailLock:
+				self._SignalNotFull()
+
+		return value
+
+	async def PushLastAsync(self, value: _NodeValue, timeout: Nullable[float] = None) -> None:
+		"""
+		Append a value at the end of the queue.
+
+		If the queue is full, the calling coroutine is suspended until space becomes available. The event loop isn't
+		blocked.
+
+		:param value:                Value to append.
+		:param timeout:              Optional maximum time in seconds to wait for space.
+		:raises TimeoutError:        If the queue is still full after the timeout.
+		:raises LinkedListException: If the queue was closed.
+		"""
+		loop = get_running_loop()
+		deadline = None if timeout is None else loop.time() + timeout
+		while True:
+			with self._tailLock:
+				if self._closed:
+					raise LinkedListException(f"Queue is closed.")
+				elif self._capacity is None or self._pushed - self._popped < self._capacity:
+					wasEmpty = self._Enqueue(value)
+					break
+
+				future = loop.create_future()
+				self._asyncPushers.append((loop, future))
+
+			try:
+				if deadline is None:
+					await future
+				else:
+					await wait_for(future, deadline - loop.time())
+			except BaseException:
+				# This coroutine might have consumed a wake-up, thus forward it to the next waiting producer.
+				with self._tailLock:
+					if self._pushed - self._popped < self._capacity:
+						self._SignalNotFull()
+				raise
+
+		if wasEmpty:
+			with self._headLock:
+				self._SignalNotEmpty()
+
+	async def PopFirstAsync(self, timeout: Nullable[float] = None) -> _NodeValue:
+		"""
+		Remove and return the first value of the queue.
+
+		If the queue is empty, the calling coroutine is suspended until a value becomes available. The event loop isn't
+		blocked.
+
+		:param timeout:              Optional maximum time in seconds to wait for a value.
+		:return:                     First value.
+		:raises TimeoutError:        If the queue is still empty after the timeout.
+		:raises LinkedListException: If the queue is empty and was closed.
+		"""
+		loop = get_running_loop()
+		deadline = None if timeout is None else loop.time() + timeout
+		while True:
+			with self._headLock:
+				if self._head._nextNode is not None:
+					value, wasFull = self._Dequeue()
+					break
+				elif self._closed:
+					raise LinkedListException(f"Queue is closed.")
+
+				future = loop.create_future()
+				self._asyncPoppers.append((loop, future))
+
+			try:
+				if deadline is None:
+					await future
+				else:
+					await wait_for(future, deadline - loop.time())
+			except BaseException:
+				# This coroutine might have consumed a wake-up, thus forward it to the next waiting consumer.
+				with self._headLock:
+					if self._head._nextNode is not None:
+						self._SignalNotEmpty()
+				raise
+
+		if wasFull:
+			with self._tailLock:
+				self._SignalNotFull()
+
+		return value
+
+	def Close(self) -> None:
+		"""
+		Close the queue.
+
+		Afterward, pushing values raises an exception. Consumers can pop the remaining values. Then, popping from the empty
+		queue raises an exception. All waiting threads and coroutines are woken up.
+		"""
+		with self._tailLock:
+			with self._headLock:
+				self._closed = True
+				self._notEmpty.notify_all()
+				for loop, future in self._asyncPoppers:
+					loop.call_soon_threadsafe(_WakeUp, future)
+				self._asyncPoppers.clear()
+
+			self._notFull.notify_all()
+			for loop, future in self._asyncPushers:
+				loop.call_soon_threadsafe(_WakeUp, future)
+			self._asyncPushers.clear()
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of values in the queue.
+
+		:returns: Number of values. The result is a snapshot, if operations are in progress.
+		"""
+		return max(0, self._pushed - self._popped)
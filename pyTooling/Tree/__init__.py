@@ -30,8 +30,11 @@
 #
 """A powerful tree data structure for Python."""
 from collections   import deque
-from typing        import TypeVar, Generic, List, Tuple, Dict, Deque, Union, Optional as Nullable
-from typing        import Callable, Iterator, Generator, Iterable, Mapping, Hashable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from io            import StringIO
+from os            import cpu_count
+from typing        import Any, TypeVar, Generic, List, Tuple, Dict, Deque, Union, Optional as Nullable
+from typing        import Callable, Iterator, Generator, Iterable, Mapping, Hashable, TextIO
 
 from pyTooling.Decorators  import export, readonly
 from pyTooling.MetaClasses import ExtendedType
@@ -51,6 +54,9 @@ DictKeyType = TypeVar("DictKeyType")
 DictValueType = TypeVar("DictValueType")
 """A type variable for a tree's dictionary values."""
 
+AggregateType = TypeVar("AggregateType")
+"""A type variable for results of a tree's aggregate functions."""
+
 
 @export
 class TreeException(ToolingException):
@@ -98,6 +104,48 @@ class NotInSameTreeError(TreeException):
 	"""The exception is raised when the current node and the other node are not in the same tree."""
 
 
+_MAPREDUCE_NODE = 0        #: Map-reduce operation on a :class:`Node` object.
+_MAPREDUCE_SERIALIZED = 1  #: Map-reduce operation on a serialized node ``(nodeID, value, keyValuePairs)``.
+_MAPREDUCE_RESULT = 2      #: Map-reduce operation pushing the precomputed results of a child chunk.
+
+
+def _MapReduceChunk(
+	operations: List[Tuple[int, Any, int]],
+	mapFunc: Callable[['Node'], Any],
+	reduceFunc: Callable[[Any, List[AggregateType]], AggregateType]
+) -> List[AggregateType]:
+	"""
+	Evaluate a chunk of a tree encoded as a post-order list of operations on a result stack.
+
+	Each operation is a tuple of kind, payload and child count. A node operation pops the results of its children from the
+	stack and pushes its own reduced result. A result operation pushes the precomputed results of a child chunk.
+
+	This function is defined at module level, so it can be shipped to a :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+	:param operations: Post-order list of operations describing the chunk.
+	:param mapFunc:    Function mapping a node to an intermediate value.
+	:param reduceFunc: Function combining a node's intermediate value with the results of its children.
+	:returns:          The results of the chunk's root nodes (consecutive siblings) in order.
+	"""
+	stack: List[Any] = []
+	for kind, payload, childCount in operations:
+		if kind == _MAPREDUCE_RESULT:
+			stack.extend(payload)
+			continue
+		elif kind == _MAPREDUCE_SERIALIZED:
+			payload = Node(*payload)
+
+		if childCount > 0:
+			childResults = stack[-childCount:]
+			del stack[-childCount:]
+		else:
+			childResults = []
+
+		stack.append(reduceFunc(mapFunc(payload), childResults))
+
+	return stack
+
+
 @export
 class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=ExtendedType, slots=True):
 	"""
@@ -143,6 +191,7 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 	_id: Nullable[IDType]                         #: Unique identifier of a node. ``None`` if not used.
 	_nodesWithID: Nullable[Dict[IDType, 'Node']]  #: Dictionary of all IDs in the tree. ``None`` if it's not the root node.
 	_nodesWithoutID: Nullable[List['Node']]       #: List of all nodes without an ID in the tree. ``None`` if it's not the root node.
+	_indexes: Nullable[Dict[Nullable[DictKeyType], Dict[Any, Dict['Node', None]]]]  #: Secondary indexes of the tree. ``None`` if it's not the root node.
 	_root: 'Node'                                 #: Reference to the root of a tree. ``self`` if it's the root node.
 	_parent: Nullable['Node']                     #: Reference to the parent node. ``None`` if it's the root node.
 	_children: List['Node']                       #: List of all children
@@ -154,6 +203,11 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 
 	_format: Nullable[Callable[["Node"], str]]    #: A node formatting function returning a one-line representation for tree-rendering.
 
+	_subtreeSize: Nullable[int]                   #: Maintained count of nodes in the subtree. ``None`` if aggregates are not maintained.
+	_subtreeHeight: Nullable[int]                 #: Maintained height of the subtree. ``None`` if aggregates are not maintained.
+	_leafCount: Nullable[int]                     #: Maintained count of leafs in the subtree. ``None`` if aggregates are not maintained.
+	_aggregates: Nullable[Dict[Callable, Any]]    #: Memoized results of :meth:`Aggregate`. ``None`` if nothing is cached (dirty).
+
 	def __init__(
 		self,
 		nodeID: Nullable[IDType] = None,
@@ -184,6 +238,8 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 		self._dict = {key: value for key, value in keyValuePairs.items()} if keyValuePairs is not None else {}
 
 		self._format = format
+		self._children = []
+		self._aggregates = None
 
 		if parent is not None and not isinstance(parent, Node):
 			ex = TypeError("Parameter 'parent' is not of type 'Node'.")
@@ -201,12 +257,16 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 				self._nodesWithoutID.append(self)
 			else:
 				self._nodesWithID[nodeID] = self
+
+			self._indexes = {}
+			self._subtreeSize = self._subtreeHeight = self._leafCount = None
 		else:
 			self._root = parent._root
 			self._parent = parent
 			self._level = parent._level + 1
 			self._nodesWithID = None
 			self._nodesWithoutID = None
+			self._indexes = None
 
 			if nodeID is None:
 				self._root._nodesWithoutID.append(self)
@@ -215,9 +275,19 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 			else:
 				self._root._nodesWithID[nodeID] = self
 
+			if self._root._indexes:
+				self._AddToIndexes(self._root._indexes)
+
+			if parent._subtreeSize is None:
+				self._subtreeSize = self._subtreeHeight = self._leafCount = None
+			else:
+				self._subtreeSize = 1
+				self._subtreeHeight = 0
+				self._leafCount = 1
+
 			parent._children.append(self)
+			parent._AddToAggregates(self)
 
-		self._children = []
 		if children is not None:
 			if not isinstance(children, Iterable):
 				ex = TypeError("Parameter 'children' is not iterable.")
@@ -254,7 +324,13 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 
 	@Value.setter
 	def Value(self, value: Nullable[ValueType]) -> None:
+		if (index := self._root._indexes.get(None)) is not None:
+			self._RemoveFromIndex(index, self._value)
+			self._AddToIndex(index, value)
+
 		self._value = value
+		if self._aggregates is not None:
+			self.InvalidateAggregates()
 
 	def __getitem__(self, key: DictKeyType) -> DictValueType:
 		"""
@@ -274,14 +350,26 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 		:param key:   The key to create or update.
 		:param value: The value to associate to the given key.
 		"""
+		if (index := self._root._indexes.get(key)) is not None:
+			if key in self._dict:
+				self._RemoveFromIndex(index, self._dict[key])
+			self._AddToIndex(index, value)
+
 		self._dict[key] = value
+		if self._aggregates is not None:
+			self.InvalidateAggregates()
 
 	def __delitem__(self, key: DictKeyType) -> None:
 		"""
 		.. todo:: TREE::Node::__delitem__ Needs documentation.
 
 		"""
+		if (index := self._root._indexes.get(key)) is not None and key in self._dict:
+			self._RemoveFromIndex(index, self._dict[key])
+
 		del self._dict[key]
+		if self._aggregates is not None:
+			self.InvalidateAggregates()
 
 	def __contains__(self, key: DictKeyType) -> bool:
 		"""
@@ -337,7 +425,7 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 				self._root._nodesWithoutID.remove(self)
 			else:
 				self._nodesWithID[self._id] = self
-				del self._nodesWithID[self._id]
+				del self._root._nodesWithID[self._id]
 
 			for sibling in self.GetDescendants():
 				sibling._root = self
@@ -347,12 +435,22 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 					self._root._nodesWithoutID.remove(sibling)
 				else:
 					self._nodesWithID[sibling._id] = sibling
-					del self._nodesWithID[sibling._id]
+					del self._root._nodesWithID[sibling._id]
+
+			oldIndexes = self._root._indexes
+			self._indexes = {key: {} for key in oldIndexes}
+			if oldIndexes:
+				for node in self.IteratePreOrder():
+					node._RemoveFromIndexes(oldIndexes)
+					node._AddToIndexes(self._indexes)
 
-			self._parent._children.remove(self)
+			parent = self._parent
+			parent._children.remove(self)
 
 			self._root = self
 			self._parent = None
+
+			parent._RemoveFromAggregates(self)
 		elif not isinstance(parent, Node):
 			ex = TypeError("Parameter 'parent' is not of type 'Node'.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(parent)}'.")
@@ -367,8 +465,9 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 			for node in self.GetDescendants():
 				node._level = node._parent._level + 1
 			self._SetNewRoot(self._nodesWithID, self._nodesWithoutID)
-			self._nodesWithID = self._nodesWithoutID = None
+			self._nodesWithID = self._nodesWithoutID = self._indexes = None
 			parent._children.append(self)
+			parent._AddToAggregates(self)
 
 	@readonly
 	def Siblings(self) -> Tuple['Node', ...]:
@@ -513,17 +612,465 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 		"""
 		return len(self._children) > 0
 
+	@readonly
+	def AggregatesEnabled(self) -> bool:
+		"""
+		Read-only property to check if subtree aggregates (size, height, leaf count) are maintained for this tree.
+
+		:returns: ``True``, if aggregates are maintained incrementally.
+
+		.. seealso::
+
+		   :meth:`EnableAggregates` |br|
+		      |rarr| Enable maintained aggregates for the whole tree.
+		"""
+		return self._subtreeSize is not None
+
+	@readonly
+	def SubtreeSize(self) -> int:
+		"""
+		Read-only property to return the number of nodes in the subtree, which subtree root is the current node.
+
+		If aggregates are maintained, the value is returned in :math:`O(1)`, otherwise the subtree is traversed.
+
+		:returns: Count of all nodes in the subtree including the node itself.
+		"""
+		if self._subtreeSize is not None:
+			return self._subtreeSize
+
+		size = 0
+		stack = [self]
+		while stack:
+			node = stack.pop()
+			size += 1
+			stack.extend(node._children)
+
+		return size
+
+	@readonly
+	def SubtreeHeight(self) -> int:
+		"""
+		Read-only property to return the height of the subtree, which subtree root is the current node.
+
+		The height is the longest distance from the current node to a leaf. A leaf has a height of ``0``. |br|
+		If aggregates are maintained, the value is returned in :math:`O(1)`, otherwise the subtree is traversed.
+
+		:returns: Height of the subtree.
+		"""
+		if self._subtreeHeight is not None:
+			return self._subtreeHeight
+
+		height = 0
+		stack = [(self, 0)]
+		while stack:
+			node, distance = stack.pop()
+			if distance > height:
+				height = distance
+			stack.extend((child, distance + 1) for child in node._children)
+
+		return height
+
+	@readonly
+	def LeafCount(self) -> int:
+		"""
+		Read-only property to return the number of leafs in the subtree, which subtree root is the current node.
+
+		If aggregates are maintained, the value is returned in :math:`O(1)`, otherwise the subtree is traversed.
+
+		:returns: Count of leafs in the subtree. A leaf counts itself.
+		"""
+		if self._leafCount is not None:
+			return self._leafCount
+
+		count = 0
+		stack = [self]
+		while stack:
+			node = stack.pop()
+			if node._children:
+				stack.extend(node._children)
+			else:
+				count += 1
+
+		return count
+
+	def EnableAggregates(self) -> None:
+		"""
+		Enable maintained subtree aggregates (size, height, leaf count) for the whole tree.
+
+		All aggregates are computed once bottom-up. Afterwards, they are updated incrementally along the ancestor path when
+		nodes are added to or removed from the tree. If another tree is merged into this tree, its aggregates get computed
+		too.
+
+		.. seealso::
+
+		   :attr:`SubtreeSize` |br|
+		      |rarr| Number of nodes in a subtree.
+		   :attr:`SubtreeHeight` |br|
+		      |rarr| Height of a subtree.
+		   :attr:`LeafCount` |br|
+		      |rarr| Number of leafs in a subtree.
+		"""
+		self._root._ComputeAggregates()
+
+	def DisableAggregates(self) -> None:
+		"""Disable maintained subtree aggregates for the whole tree."""
+		self._root._DisableSubtreeAggregates()
+
+	def _DisableSubtreeAggregates(self) -> None:
+		"""
+		Disable maintained subtree aggregates for all nodes in the subtree, which subtree root is the current node.
+
+		Nodes without maintained aggregates aren't descended into, as aggregates are maintained for all or none of a
+		subtree's nodes.
+
+		:meta private:
+		"""
+		stack = [self]
+		while stack:
+			node = stack.pop()
+			if node._subtreeSize is not None:
+				node._subtreeSize = node._subtreeHeight = node._leafCount = None
+				stack.extend(node._children)
+
+	def _ComputeAggregates(self) -> None:
+		"""
+		Compute subtree aggregates bottom-up for all nodes in the subtree, which subtree root is the current node.
+
+		:meta private:
+		"""
+		stack = [(self, False)]
+		while stack:
+			node, expanded = stack.pop()
+			if expanded:
+				size = 1
+				height = 0
+				leafs = 0 if node._children else 1
+				for child in node._children:
+					size += child._subtreeSize
+					leafs += child._leafCount
+					if child._subtreeHeight >= height:
+						height = child._subtreeHeight + 1
+
+				node._subtreeSize = size
+				node._subtreeHeight = height
+				node._leafCount = leafs
+			else:
+				stack.append((node, True))
+				stack.extend((child, False) for child in node._children)
+
+	def _AddToAggregates(self, child: 'Node') -> None:
+		"""
+		Update aggregates along the ancestor path after a child node (subtree) was appended to the current node.
+
+		:meta private:
+		:param child: The appended child node.
+		"""
+		if self._aggregates is not None:
+			self.InvalidateAggregates()
+
+		if self._subtreeSize is None:
+			if child._subtreeSize is not None:
+				child._DisableSubtreeAggregates()
+			return
+		elif child._subtreeSize is None:
+			child._ComputeAggregates()
+
+		size = child._subtreeSize
+		leafs = child._leafCount - 1 if len(self._children) == 1 else child._leafCount
+		height = child._subtreeHeight + 1
+
+		node = self
+		while node is not None:
+			node._subtreeSize += size
+			node._leafCount += leafs
+			if height > node._subtreeHeight:
+				node._subtreeHeight = height
+			height = node._subtreeHeight + 1
+			node = node._parent
+
+	def _RemoveFromAggregates(self, child: 'Node') -> None:
+		"""
+		Update aggregates along the ancestor path after a child node (subtree) was removed from the current node.
+
+		:meta private:
+		:param child: The removed child node.
+		"""
+		if self._aggregates is not None:
+			self.InvalidateAggregates()
+
+		if self._subtreeSize is None:
+			return
+
+		size = child._subtreeSize
+		leafs = child._leafCount - 1 if len(self._children) == 0 else child._leafCount
+		heightChanged = True
+
+		node = self
+		while node is not None:
+			node._subtreeSize -= size
+			node._leafCount -= leafs
+			if heightChanged:
+				height = max((c._subtreeHeight for c in node._children), default=-1) + 1
+				heightChanged = height != node._subtreeHeight
+				node._subtreeHeight = height
+			node = node._parent
+
+	def InvalidateAggregates(self) -> None:
+		"""
+		Invalidate all memoized results of :meth:`Aggregate` for the current node and all its ancestors.
+
+		Structural changes and changes of a node's value or key-value-pairs invalidate cached results automatically. Call
+		this method, if data referenced by a node (e.g. a mutable value) was modified in-place.
+		"""
+		node = self
+		while node is not None and node._aggregates is not None:
+			node._aggregates = None
+			node = node._parent
+
+	def Aggregate(self, func: Callable[['Node', List[AggregateType]], AggregateType]) -> AggregateType:
+		"""
+		Compute a user-defined bottom-up reduction over the subtree, which subtree root is the current node.
+
+		The function ``func`` is called for every node with the node itself and a list of results computed for its children.
+		Results are memoized per node and per function, thus repeated calls only recompute nodes, which were invalidated
+		(marked dirty) by a modification in their subtree.
+
+		.. code-block:: python
+
+		   def sumSizes(node: Node, childResults: List[int]) -> int:
+		     return node.Value + sum(childResults)
+
+		   totalSize = root.Aggregate(sumSizes)
+
+		.. hint::
+
+		   Memoization uses the function object as a key. Pass the same function object (not a new lambda) on each call to
+		   benefit from cached results.
+
+		:param func: Reduction function receiving a node and a list of its children's results.
+		:returns:    Result of the reduction for the current node.
+		"""
+		if self._aggregates is not None and func in self._aggregates:
+			return self._aggregates[func]
+
+		stack = [(self, False)]
+		while stack:
+			node, expanded = stack.pop()
+			if expanded:
+				result = func(node, [child._aggregates[func] for child in node._children])
+				if node._aggregates is None:
+					node._aggregates = {func: result}
+				else:
+					node._aggregates[func] = result
+			elif node._aggregates is None or func not in node._aggregates:
+				stack.append((node, True))
+				stack.extend((child, False) for child in node._children)
+
+		return self._aggregates[func]
+
+	def MapReduce(
+		self,
+		mapFunc: Callable[['Node'], Any],
+		reduceFunc: Callable[[Any, List[AggregateType]], AggregateType],
+		executor: Nullable[Executor] = None,
+		chunkSize: Nullable[int] = None,
+		serialize: Nullable[bool] = None
+	) -> AggregateType:
+		"""
+		Compute a bottom-up map-reduce over the subtree, which subtree root is the current node.
+
+		Every node is mapped by ``mapFunc``. Then, the mapped value is combined with the list of its children's results by
+		``reduceFunc``. The result of the current node is returned.
+
+		The subtree is split into independent chunks of roughly ``chunkSize`` nodes. A chunk is either a node with its
+		remaining subtree or a run of consecutive sibling subtrees, thus also wide and flat trees (e.g. a root with many leaf
+		children) are split into multiple chunks. Each chunk is evaluated as a single task on ``executor`` (e.g. a :class:`~concurrent.futures.ThreadPoolExecutor` or
+		:class:`~concurrent.futures.ProcessPoolExecutor`) as soon as the results of all chunks below it are available. If no
+		executor is given, chunks are evaluated sequentially in the calling thread.
+
+		If ``serialize`` is true (default for process pools), chunks are shipped as a compact post-order list of
+		``(nodeID, value, keyValuePairs)`` tuples instead of pickling the linked node objects. Then, ``mapFunc`` receives a
+		detached node without parent and children, ``mapFunc`` and ``reduceFunc`` need to be picklable (module-level)
+		functions, and IDs, values and key-value-pairs need to be picklable.
+
+		:param mapFunc:    Function mapping a node to an intermediate value. It should only depend on the node's ID, value
+		                   and key-value-pairs.
+		:param reduceFunc: Function combining a node's mapped value with the list of its children's results.
+		:param executor:   Optional executor to evaluate chunks in parallel.
+		:param chunkSize:  Optional approximate number of nodes per chunk. Default: subtree size divided by 4x CPU count.
+		:param serialize:  Optional flag to ship serialized chunks. Default: ``True`` for process pools.
+		:returns:          Result of the reduction for the current node.
+		"""
+		if chunkSize is None:
+			chunkSize = max(1, self.SubtreeSize // (4 * (cpu_count() or 1)))
+		if serialize is None:
+			serialize = isinstance(executor, ProcessPoolExecutor)
+
+		# Compute chunks in post-order, so chunks below a chunk are listed before it. A chunk is a run of consecutive sibling
+		# subtrees. Runs of small sibling subtrees are cut into chunks of roughly chunkSize nodes, so wide nodes are split
+		# into multiple chunks. A node whose remaining (uncut) subtree reaches chunkSize becomes a single-rooted chunk.
+		chunks: List[List[Node]] = []
+		chunkOf: Dict[Node, int] = {}
+		uncutSizes: Dict[Node, int] = {}
+		stack = [(self, False)]
+		while stack:
+			node, expanded = stack.pop()
+			if expanded:
+				size = 1
+				runStart = 0
+				runSize = 0
+				for index, child in enumerate(node._children):
+					childSize = uncutSizes.pop(child)
+					if childSize == 0:  # child is a chunk already
+						size += runSize
+						runStart = index + 1
+						runSize = 0
+						continue
+
+					runSize += childSize
+					if runSize >= chunkSize:
+						for member in node._children[runStart:index + 1]:
+							chunkOf[member] = len(chunks)
+						chunks.append(node._children[runStart:index + 1])
+						runStart = index + 1
+						runSize = 0
+				size += runSize
+
+				if size >= chunkSize or node is self:
+					chunkOf[node] = len(chunks)
+					chunks.append([node])
+					uncutSizes[node] = 0
+				else:
+					uncutSizes[node] = size
+			else:
+				stack.append((node, True))
+				stack.extend((child, False) for child in reversed(node._children))
+
+		# Encode each chunk as a post-order list of operations. References to child chunks are resolved at submission.
+		operationLists: List[List[Tuple[int, Any, int]]] = []
+		parentChunk: Dict[int, int] = {}
+		pendingChildren: List[int] = []
+		nodeKind = _MAPREDUCE_SERIALIZED if serialize else _MAPREDUCE_NODE
+		for chunkIndex, members in enumerate(chunks):
+			operations = []
+			pendingChildren.append(0)
+			stack = [(member, False) for member in reversed(members)]
+			while stack:
+				node, expanded = stack.pop()
+				if expanded:
+					payload = (node._id, node._value, node._dict) if serialize else node
+					operations.append((nodeKind, payload, len(node._children)))
+				elif (otherIndex := chunkOf.get(node, chunkIndex)) != chunkIndex:
+					if chunks[otherIndex][0] is node:  # other members of a sibling chunk are skipped
+						operations.append((_MAPREDUCE_RESULT, otherIndex, 0))
+						parentChunk[otherIndex] = chunkIndex
+						pendingChildren[chunkIndex] += 1
+				else:
+					stack.append((node, True))
+					stack.extend((child, False) for child in reversed(node._children))
+
+			operationLists.append(operations)
+
+		results: Dict[int, List[Any]] = {}
+
+		def resolve(chunkIndex: int) -> List[Tuple[int, Any, int]]:
+			operations = operationLists[chunkIndex]
+			operationLists[chunkIndex] = None
+			return [(kind, results.pop(payload) if kind == _MAPREDUCE_RESULT else payload, count) for kind, payload, count in operations]
+
+		rootIndex = len(chunks) - 1
+		if executor is None:
+			for chunkIndex in range(len(chunks)):
+				results[chunkIndex] = _MapReduceChunk(resolve(chunkIndex), mapFunc, reduceFunc)
+
+			return results[rootIndex][0]
+
+		futures: Dict[Future, int] = {}
+		for chunkIndex in range(len(chunks)):
+			if pendingChildren[chunkIndex] == 0:
+				futures[executor.submit(_MapReduceChunk, resolve(chunkIndex), mapFunc, reduceFunc)] = chunkIndex
+
+		while futures:
+			done, _ = wait(futures, return_when=FIRST_COMPLETED)
+			for future in done:
+				chunkIndex = futures.pop(future)
+				results[chunkIndex] = future.result()
+
+				if (parent := parentChunk.get(chunkIndex)) is not None:
+					pendingChildren[parent] -= 1
+					if pendingChildren[parent] == 0:
+						futures[executor.submit(_MapReduceChunk, resolve(parent), mapFunc, reduceFunc)] = parent
+
+		return results[rootIndex][0]
+
 	def _SetNewRoot(self, nodesWithIDs: Dict['Node', 'Node'], nodesWithoutIDs: List['Node']) -> None:
+		indexes = self._root._indexes
 		for nodeID, node in nodesWithIDs.items():
 			if nodeID in self._root._nodesWithID:
 				raise ValueError(f"ID '{nodeID}' already exists in this tree.")
 			else:
 				self._root._nodesWithID[nodeID] = node
 				node._root = self._root
+				if indexes:
+					node._AddToIndexes(indexes)
 
 		for node in nodesWithoutIDs:
 			self._root._nodesWithoutID.append(node)
 			node._root = self._root
+			if indexes:
+				node._AddToIndexes(indexes)
+
+	def _AddToIndex(self, index: Dict[Any, Dict['Node', None]], value: Any) -> None:
+		"""
+		Register the current node under ``value`` in a secondary index.
+
+		:meta private:
+		:param index: The index to update.
+		:param value: The indexed value of the current node.
+		"""
+		if value in index:
+			index[value][self] = None
+		else:
+			index[value] = {self: None}
+
+	def _RemoveFromIndex(self, index: Dict[Any, Dict['Node', None]], value: Any) -> None:
+		"""
+		Unregister the current node from ``value`` in a secondary index.
+
+		:meta private:
+		:param index: The index to update.
+		:param value: The indexed value of the current node.
+		"""
+		bucket = index[value]
+		del bucket[self]
+		if len(bucket) == 0:
+			del index[value]
+
+	def _AddToIndexes(self, indexes: Dict[Nullable[DictKeyType], Dict[Any, Dict['Node', None]]]) -> None:
+		"""
+		Register the current node in all secondary indexes.
+
+		:meta private:
+		:param indexes: The indexes to update.
+		"""
+		for key, index in indexes.items():
+			if key is None:
+				self._AddToIndex(index, self._value)
+			elif key in self._dict:
+				self._AddToIndex(index, self._dict[key])
+
+	def _RemoveFromIndexes(self, indexes: Dict[Nullable[DictKeyType], Dict[Any, Dict['Node', None]]]) -> None:
+		"""
+		Unregister the current node from all secondary indexes.
+
+		:meta private:
+		:param indexes: The indexes to update.
+		"""
+		for key, index in indexes.items():
+			if key is None:
+				self._RemoveFromIndex(index, self._value)
+			elif key in self._dict:
+				self._RemoveFromIndex(index, self._dict[key])
 
 	def AddChild(self, child: 'Node') -> None:
 		"""
@@ -557,8 +1104,9 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 		for node in child.GetDescendants():
 			node._level = node._parent._level + 1
 		self._SetNewRoot(child._nodesWithID, child._nodesWithoutID)
-		child._nodesWithID = child._nodesWithoutID = None
+		child._nodesWithID = child._nodesWithoutID = child._indexes = None
 		self._children.append(child)
+		self._AddToAggregates(child)
 
 	def AddChildren(self, children: Iterable['Node']) -> None:
 		"""
@@ -591,8 +1139,9 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 			for node in child.GetDescendants():
 				node._level = node._parent._level + 1
 			self._SetNewRoot(child._nodesWithID, child._nodesWithoutID)
-			child._nodesWithID = child._nodesWithoutID = None
+			child._nodesWithID = child._nodesWithoutID = child._indexes = None
 			self._children.append(child)
+			self._AddToAggregates(child)
 
 	def GetPath(self) -> Generator['Node', None, None]:
 		"""
@@ -895,8 +1444,99 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 
 		return self._root._nodesWithID[nodeID]
 
-	def Find(self, predicate: Callable) -> Generator['Node', None, None]:
-		raise NotImplementedError(f"Method 'Find' is not yet implemented.")
+	def Find(
+		self,
+		predicate: Callable[['Node'], bool],
+		prune: Nullable[Callable[['Node'], bool]] = None
+	) -> Generator['Node', None, None]:
+		"""
+		A generator to iterate all nodes in the subtree (including the current node), which satisfy a predicate.
+
+		Nodes are visited in pre-order using an explicit stack, thus deep trees don't hit Python's recursion limit. If
+		``prune`` returns ``True`` for a node, the node's descendants are skipped.
+
+		:param predicate: A function returning ``True`` for matching nodes.
+		:param prune:     An optional function returning ``True``, if the subtree below a node should not be searched.
+		:returns:         A generator to iterate all matching nodes.
+
+		.. seealso::
+
+		   :meth:`FindByKey` |br|
+		      |rarr| Lookup nodes by value or key-value-pair using a secondary index.
+		"""
+		stack = [self]
+		while stack:
+			node = stack.pop()
+			if predicate(node):
+				yield node
+
+			if prune is None or not prune(node):
+				stack.extend(reversed(node._children))
+
+	def CreateIndex(self, key: Nullable[DictKeyType] = None) -> None:
+		"""
+		Create a secondary index for the whole tree.
+
+		If ``key`` is ``None``, nodes are indexed by their :attr:`Value`, otherwise by the value of their key-value-pair
+		``key``. Nodes without such a key-value-pair aren't indexed. Indexed values need to be hashable.
+
+		The index is maintained when nodes are created, values or key-value-pairs change as well as when trees are merged
+		or split. If a tree is merged into another tree, its indexes are replaced by the indexes of the new tree.
+
+		:param key: The key-value-pair's key to index or ``None`` to index node values.
+		"""
+		indexes = self._root._indexes
+		if key in indexes:
+			return
+
+		indexes[key] = index = {}
+		for node in self._root._nodesWithID.values():
+			node._AddToIndexes({key: index})
+		for node in self._root._nodesWithoutID:
+			node._AddToIndexes({key: index})
+
+	def DropIndex(self, key: Nullable[DictKeyType] = None) -> None:
+		"""
+		Remove a secondary index from the tree.
+
+		:param key:       The indexed key-value-pair's key or ``None`` for the node value index.
+		:raises KeyError: If no index exists for ``key``.
+		"""
+		del self._root._indexes[key]
+
+	def HasIndex(self, key: Nullable[DictKeyType] = None) -> bool:
+		"""
+		Check if a secondary index exists in the tree.
+
+		:param key: The indexed key-value-pair's key or ``None`` for the node value index.
+		:returns:   ``True``, if an index exists for ``key``.
+		"""
+		return key in self._root._indexes
+
+	def FindByKey(self, key: Nullable[DictKeyType], value: Any) -> Tuple['Node', ...]:
+		"""
+		Lookup all nodes in the tree having a node value (``key`` is ``None``) or key-value-pair ``key`` equal to ``value``.
+
+		If an index was created for ``key`` by :meth:`CreateIndex`, the lookup is a dictionary access. Otherwise, all nodes
+		in the tree are scanned.
+
+		:param key:   The key-value-pair's key or ``None`` to compare node values.
+		:param value: The value to lookup.
+		:returns:     A tuple of all matching nodes in the tree.
+		"""
+		root = self._root
+		if (index := root._indexes.get(key)) is not None:
+			return tuple(index.get(value, ()))
+
+		nodes = []
+		for node in root.IteratePreOrder():
+			if key is None:
+				if node._value == value:
+					nodes.append(node)
+			elif key in node._dict and node._dict[key] == value:
+				nodes.append(node)
+
+		return tuple(nodes)
 
 	def __iter__(self) -> Iterator['Node']:
 		"""
@@ -966,29 +1606,73 @@ class Node(Generic[IDType, ValueType, DictKeyType, DictValueType], metaclass=Ext
 		:param lastNodeMarker: A string printed before every last tree node. Default: ``"└─"``.
 		:param bypassMarker:   A string printed when there are further nodes in the parent level. Default: ``"│ "``.
 		:return:               A rendered tree as multiline string.
+
+		.. seealso::
+
+		   :meth:`RenderTo` |br|
+		      |rarr| Render the tree line by line into a stream.
 		"""
-		emptyMarker = " " * len(bypassMarker)
+		buffer = StringIO()
+		self.RenderTo(buffer, prefix=prefix, lineend=lineend, nodeMarker=nodeMarker, lastNodeMarker=lastNodeMarker, bypassMarker=bypassMarker)
+
+		return buffer.getvalue()
 
-		def _render(node: Node, markers: str):
-			result = []
+	def RenderTo(
+		self,
+		stream: TextIO,
+		maxDepth: Nullable[int] = None,
+		maxChildren: Nullable[int] = None,
+		prefix: str = "",
+		lineend: str = "\n",
+		nodeMarker: str = "├─",
+		lastNodeMarker: str = "└─",
+		bypassMarker: str = "│ "
+	) -> None:
+		"""
+		Render the tree as ASCII art line by line into a stream (file-like object).
 
-			if node.HasChildren:
-				for child in node._children[:-1]:
-					nodeRepresentation = child._format(child) if child._format else str(child)
-					result.append(f"{prefix}{markers}{nodeMarker}{nodeRepresentation}{lineend}")
-					result.extend(_render(child, markers + bypassMarker))
+		In contrast to :meth:`Render`, no intermediate strings for the whole tree are built and the tree is walked with an
+		explicit stack, thus huge and deep trees can be dumped e.g. into log files.
 
-				# last child node
-				child = node._children[-1]
-				nodeRepresentation = child._format(child) if child._format else str(child)
-				result.append(f"{prefix}{markers}{lastNodeMarker}{nodeRepresentation}{lineend}")
-				result.extend(_render(child, markers + emptyMarker))
+		Large sibling groups and deep subtrees can be elided. Elided nodes are summarized by a line like ``... 9,500 more``.
 
-			return result
+		:param stream:         A file-like object with a ``write`` method.
+		:param maxDepth:       Optional maximum depth (relative to the current node) of rendered nodes.
+		:param maxChildren:    Optional maximum number of rendered children per node.
+		:param prefix:         A string printed in front of every line, e.g. for indentation. Default: ``""``.
+		:param lineend:        A string printed at the end of every line. Default: ``"\\n"``.
+		:param nodeMarker:     A string printed before every non-last tree node. Default: ``"├─"``.
+		:param lastNodeMarker: A string printed before every last tree node. Default: ``"└─"``.
+		:param bypassMarker:   A string printed when there are further nodes in the parent level. Default: ``"│ "``.
+		"""
+		emptyMarker = " " * len(bypassMarker)
+		write = stream.write
 
 		# Root element
-		nodeRepresentation = self._format(self) if self._format else str(self)
-		result = [f"{prefix}{nodeRepresentation}{lineend}"]
-		result.extend(_render(self, ""))
+		write(f"{prefix}{self._format(self) if self._format else str(self)}{lineend}")
+
+		# Stack items: (node, markers, isLast, depth, elidedCount); node is None for an elision line.
+		stack: List[Tuple[Nullable[Node], str, bool, int, int]] = [(self, "", True, 0, 0)]
+		while stack:
+			node, markers, isLast, depth, elided = stack.pop()
+			if node is None:
+				write(f"{prefix}{markers}{lastNodeMarker}... {elided:,} more{lineend}")
+				continue
+			elif node is not self:
+				nodeRepresentation = node._format(node) if node._format else str(node)
+				write(f"{prefix}{markers}{lastNodeMarker if isLast else nodeMarker}{nodeRepresentation}{lineend}")
+				markers += emptyMarker if isLast else bypassMarker
+
+			children = node._children
+			if len(children) == 0:
+				continue
+			elif maxDepth is not None and depth >= maxDepth:
+				stack.append((None, markers, True, depth, len(children)))
+				continue
 
-		return "".join(result)
+			if maxChildren is not None and len(children) > maxChildren:
+				stack.append((None, markers, True, depth, len(children) - maxChildren))
+				stack.extend((child, markers, False, depth + 1, 0) for child in reversed(children[:maxChildren]))
+			else:
+				stack.append((children[-1], markers, True, depth + 1, 0))
+				stack.extend((child, markers, False, depth + 1, 0) for child in reversed(children[:-1]))
@@ -0,0 +1,394 @@
+# ==================================================================================================================== #
+#             _____           _ _           __     __            _             _                                       #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                           #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                          #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                          #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                          #
+# |_|    |___/                          |___/                                          |___/                           #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Fixed-width integer encoding of semantic version numbers for bulk filtering.
+
+A :class:`~pyTooling.Versioning.SemanticVersion` without post, development and build number is packed into an unsigned
+64-bit integer, whose integer order equals the version order. Large amounts of version strings can be encoded without
+instantiating version objects and filtered by :class:`~pyTooling.Versioning.VersionRange`,
+:class:`~pyTooling.Versioning.VersionSpecifier` or :class:`~pyTooling.Versioning.VersionSet`. Only surviving rows
+need to be decoded.
+
+If `NumPy <https://numpy.org/>`__ is installed, filtering is vectorized, otherwise a pure Python implementation is used.
+
+.. hint::
+
+   See :ref:`high-level help <VERSIONING/Packed>` for explanations and usage examples.
+"""
+from array  import array
+from bisect import bisect_right
+from typing import Iterable, List, Tuple, Union, Sequence
+
+try:
+	import numpy
+except ImportError:  # pragma: no cover
+	numpy = None
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.Versioning  import Parts, ReleaseLevel, Version, SemanticVersion, VersionRange, VersionSet, VersionSpecifier
+from pyTooling.Versioning  import RangeBoundHandling
+
+
+MAJOR_BITS =  16  #: Number of bits for the major number.
+MINOR_BITS =  16  #: Number of bits for the minor number.
+MICRO_BITS =  16  #: Number of bits for the micro number.
+LEVEL_BITS =   3  #: Number of bits for the release level.
+NUMBER_BITS = 13  #: Number of bits for the release number.
+
+INVALID = (1 << 64) - 1  #: Packed value of rows, which couldn't be encoded. It's never contained in a range or set.
+
+_MINOR_SHIFT =  LEVEL_BITS + NUMBER_BITS + MICRO_BITS
+_MAJOR_SHIFT =  _MINOR_SHIFT + MINOR_BITS
+_MICRO_SHIFT =  LEVEL_BITS + NUMBER_BITS
+_LEVEL_SHIFT =  NUMBER_BITS
+_MAX_PACKED =   INVALID - 1
+
+_LEVELS = (
+	ReleaseLevel.Alpha,
+	ReleaseLevel.Beta,
+	ReleaseLevel.Gamma,
+	ReleaseLevel.Development,
+	ReleaseLevel.ReleaseCandidate,
+	ReleaseLevel.Final
+)  #: Release levels ordered from lowest to highest.
+_LEVEL_RANKS = {level: rank for rank, level in enumerate(_LEVELS)}
+
+
+def _pack(major: int, minor: int, micro: int, rank: int, number: int) -> int:
+	"""
+	Private helper function to pack version number parts into an integer.
+
+	:param major:       Major number.
+	:param minor:       Minor number.
+	:param micro:       Micro number.
+	:param rank:        Rank of the release level.
+	:param number:      Release number.
+	:returns:           Packed version number.
+	:raises ValueError: If a part exceeds its bit width.
+	"""
+	if major >> MAJOR_BITS or minor >> MINOR_BITS or micro >> MICRO_BITS or number >> NUMBER_BITS:
+		raise ValueError(f"Version number '{major}.{minor}.{micro}' exceeds the packed bit widths.")
+
+	return (major << _MAJOR_SHIFT) | (minor << _MINOR_SHIFT) | (micro << _MICRO_SHIFT) | (rank << _LEVEL_SHIFT) | number
+
+
+def _packBase(version: Version) -> Tuple[int, bool]:
+	"""
+	Private helper function to pack a version number ignoring its post, development and build number.
+
+	:param version:     Version number to pack.
+	:returns:           A 2-tuple of the packed version number and ``True``, if post, development or build number were
+	                    dropped.
+	:raises ValueError: If a part exceeds its bit width.
+	"""
+	packed = _pack(version._major, version._minor, version._micro, _LEVEL_RANKS[version._releaseLevel], version._releaseNumber)
+	return packed, (version._post > 0 or version._dev > 0 or version._build > 0)
+
+
+@export
+def packVersion(version: SemanticVersion) -> int:
+	"""
+	Pack a semantic version number into an unsigned 64-bit integer.
+
+	Packed version numbers compare like their version numbers. Prefix and postfix aren't encoded.
+
+	:param version:     Version number to pack.
+	:returns:           Packed version number.
+	:raises TypeError:  If parameter ``version`` is not of type :class:`~pyTooling.Versioning.SemanticVersion`.
+	:raises ValueError: If the version has a post, development or build number or a part exceeds its bit width.
+	"""
+	if not isinstance(version, SemanticVersion):
+		ex = TypeError(f"Parameter 'version' is not of type 'SemanticVersion'.")
+		ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
+		raise ex
+
+	packed, dropped = _packBase(version)
+	if dropped:
+		raise ValueError(f"Version '{version}' with post, development or build number can't be packed.")
+
+	return packed
+
+
+@export
+def unpackVersion(packed: int, versionClass: type = SemanticVersion) -> SemanticVersion:
+	"""
+	Unpack an unsigned 64-bit integer into a semantic version number.
+
+	:param packed:       Packed version number.
+	:param versionClass: Version class to instantiate.
+	:returns:            Unpacked version number.
+	:raises ValueError:  If parameter ``packed`` is :data:`INVALID` or out of range.
+	"""
+	if not (0 <= packed <= _MAX_PACKED):
+		raise ValueError(f"Parameter 'packed' is not a valid packed version number.")
+
+	level = _LEVELS[(packed >> _LEVEL_SHIFT) & ((1 << LEVEL_BITS) - 1)]
+	number = packed & ((1 << NUMBER_BITS) - 1)
+	return versionClass(
+		packed >> _MAJOR_SHIFT,
+		(packed >> _MINOR_SHIFT) & ((1 << MINOR_BITS) - 1),
+		(packed >> _MICRO_SHIFT) & ((1 << MICRO_BITS) - 1),
+		level,
+		None if level is ReleaseLevel.Final else number
+	)
+
+
+def _packedIntervals(constraint: Union[VersionRange, VersionSpecifier]) -> Tuple[List[int], List[int]]:
+	"""
+	Private helper function to translate a version range or specifier into inclusive intervals of packed integers.
+
+	Bounds with post, development or build number are translated exactly, as packed rows never have these parts.
+
+	:param constraint:  Version range or specifier.
+	:returns:           A 2-tuple of ordered lists of lower and upper inclusive bounds.
+	:raises ValueError: If a bound exceeds the packed bit widths.
+	"""
+	if isinstance(constraint, VersionRange):
+		intervals = [(
+			constraint._lowerBound,
+			RangeBoundHandling.LowerBoundExclusive not in constraint._boundHandling,
+			constraint._upperBound,
+			RangeBoundHandling.UpperBoundExclusive not in constraint._boundHandling
+		)]
+	else:
+		intervals = constraint._intervals
+
+	lowers = []
+	uppers = []
+	for lower, lowerInclusive, upper, upperInclusive in intervals:
+		if lower is None:
+			low = 0
+		else:
+			low, dropped = _packBase(lower)
+			if dropped or not lowerInclusive:
+				low += 1
+
+		if upper is None:
+			high = _MAX_PACKED
+		else:
+			high, dropped = _packBase(upper)
+			if not dropped and not upperInclusive:
+				high -= 1
+
+		if low <= high:
+			lowers.append(low)
+			uppers.append(high)
+
+	return lowers, uppers
+
+
+@export
+class PackedVersionArray(metaclass=ExtendedType, slots=True):
+	"""
+	An array of packed semantic version numbers (unsigned 64-bit integers).
+
+	Rows, which can't be encoded (invalid version strings, post, development or build numbers, too large parts), are
+	stored as :data:`INVALID`. Invalid rows are never contained in a range or set.
+	"""
+	_packed:       array  #: Array of packed version numbers (typecode ``Q``).
+	_versionClass: type   #: Version class used for decoding.
+
+	def __init__(self, packed: Iterable[int] = (), versionClass: type = SemanticVersion) -> None:
+		"""
+		Initializes an array of packed version numbers.
+
+		:param packed:       Iterable of packed version numbers.
+		:param versionClass: Version class used for decoding.
+		:raises TypeError:   If parameter ``versionClass`` is not a subclass of :class:`~pyTooling.Versioning.SemanticVersion`.
+		"""
+		if not (isinstance(versionClass, type) and issubclass(versionClass, SemanticVersion)):
+			ex = TypeError(f"Parameter 'versionClass' is not a subclass of 'SemanticVersion'.")
+			ex.add_note(f"Got '{versionClass}'.")
+			raise ex
+
+		self._packed = array("Q", packed)
+		self._versionClass = versionClass
+
+	@classmethod
+	def FromStrings(cls, versionStrings: Iterable[str], versionClass: type = SemanticVersion) -> "PackedVersionArray":
+		"""
+		Encode version strings into packed version numbers.
+
+		Version strings of the common shape ``MAJOR[.MINOR[.MICRO]]`` are encoded without instantiating version objects.
+		Only other version strings are parsed by :meth:`~pyTooling.Versioning.SemanticVersion.Parse`.
+
+		:param versionStrings: Iterable of version strings.
+		:param versionClass:   Version class used for parsing and decoding.
+		:returns:              Array of packed version numbers in order of ``versionStrings``.
+		"""
+		packed = []
+		append = packed.append
+		for versionString in versionStrings:
+			try:
+				split = versionString.split(".")
+				if len(split) <= 3 and versionString.replace(".", "").isdecimal() and "" not in split:
+					split += ("0", "0")
+					append(_pack(int(split[0]), int(split[1]), int(split[2]), 5, 0))
+				else:
+					packed_, dropped = _packBase(versionClass.Parse(versionString))
+					append(INVALID if dropped else packed_)
+			except (AttributeError, TypeError, ValueError):
+				append(INVALID)
+
+		return cls(packed, versionClass)
+
+	@classmethod
+	def FromVersions(cls, versions: Iterable[SemanticVersion], versionClass: type = SemanticVersion) -> "PackedVersionArray":
+		"""
+		Encode version numbers into packed version numbers.
+
+		:param versions:     Iterable of version numbers.
+		:param versionClass: Version class used for decoding.
+		:returns:            Array of packed version numbers in order of ``versions``.
+		"""
+		packed = []
+		for version in versions:
+			try:
+				packed.append(packVersion(version))
+			except (TypeError, ValueError):
+				packed.append(INVALID)
+
+		return cls(packed, versionClass)
+
+	@readonly
+	def Packed(self) -> array:
+		"""
+		Read-only property to access the underlying array of packed version numbers.
+
+		:return: Array of unsigned 64-bit integers (typecode ``Q``).
+		"""
+		return self._packed
+
+	@readonly
+	def VersionClass(self) -> type:
+		"""
+		Read-only property to access the version class used for decoding.
+
+		:return: The version class.
+		"""
+		return self._versionClass
+
+	def Mask(self, constraint: Union[VersionRange, VersionSpecifier, VersionSet]) -> Sequence[bool]:
+		"""
+		Compute for all rows, if the row's version is contained in a version range, specifier or set.
+
+		If NumPy is installed, the computation is vectorized and a boolean :class:`numpy.ndarray` is returned. Otherwise,
+		a list of booleans is returned.
+
+		.. note::
+
+		   Membership in a version set ignores the members' postfixes. Members with post, development or build number can't
+		   match any row.
+
+		:param constraint:  Version range, version specifier or version set.
+		:returns:           One boolean per row.
+		:raises TypeError:  If parameter ``constraint`` is not of a supported type.
+		:raises ValueError: If a bound exceeds the packed bit widths.
+		"""
+		if isinstance(constraint, VersionSet):
+			members = set()
+			for version in constraint:
+				try:
+					members.add(packVersion(version))
+				except (TypeError, ValueError):
+					pass
+
+			if numpy is not None:
+				return numpy.isin(numpy.frombuffer(self._packed, dtype=numpy.uint64), numpy.fromiter(members, dtype=numpy.uint64, count=len(members)))
+
+			return [packed in members for packed in self._packed]
+		elif not isinstance(constraint, (VersionRange, VersionSpecifier)):
+			ex = TypeError(f"Parameter 'constraint' is not of type 'VersionRange', 'VersionSpecifier' or 'VersionSet'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(constraint)}'.")
+			raise ex
+
+		lowers, uppers = _packedIntervals(constraint)
+		if numpy is not None:
+			packed = numpy.frombuffer(self._packed, dtype=numpy.uint64)
+			if len(lowers) == 0:
+				return numpy.zeros(len(packed), dtype=bool)
+
+			lowerArray = numpy.array(lowers, dtype=numpy.uint64)
+			upperArray = numpy.array(uppers, dtype=numpy.uint64)
+			index = numpy.searchsorted(lowerArray, packed, side="right") - 1
+			return (index >= 0) & (packed <= upperArray[index.clip(0)])
+
+		if len(lowers) == 0:
+			return [False] * len(self._packed)
+		elif len(lowers) == 1:
+			low = lowers[0]
+			high = uppers[0]
+			return [low <= packed <= high for packed in self._packed]
+
+		result = []
+		for packed in self._packed:
+			index = bisect_right(lowers, packed) - 1
+			result.append(index >= 0 and packed <= uppers[index])
+
+		return result
+
+	def Select(self, constraint: Union[VersionRange, VersionSpecifier, VersionSet]) -> List[int]:
+		"""
+		Return the indices of all rows, whose version is contained in a version range, specifier or set.
+
+		:param constraint: Version range, version specifier or version set.
+		:returns:          Ordered list of row indices.
+		"""
+		return [index for index, contained in enumerate(self.Mask(constraint)) if contained]
+
+	def Decode(self, indices: Iterable[int]) -> List[SemanticVersion]:
+		"""
+		Decode selected rows into version numbers.
+
+		:param indices:     Row indices to decode (e.g. returned by :meth:`Select`).
+		:returns:           List of version numbers in order of ``indices``.
+		:raises ValueError: If a selected row is :data:`INVALID`.
+		"""
+		return [unpackVersion(self._packed[index], self._versionClass) for index in indices]
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of rows.
+
+		:returns: Number of rows.
+		"""
+		return len(self._packed)
+
+	def __getitem__(self, index: int) -> int:
+		"""
+		Access a packed version number by index.
+
+		:param index: Row index.
+		:returns:     Packed version number.
+		"""
+		return self._packed[index]
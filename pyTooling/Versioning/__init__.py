@@ -35,12 +35,15 @@ Implementation of semantic and date versioning version-numbers.
 
    See :ref:`high-level help <VERSIONING>` for explanations and usage examples.
 """
+from bisect          import bisect_left, bisect_right
 from collections.abc import Iterable as abc_Iterable
 from enum            import Flag, Enum
+from itertools       import chain
 from re              import compile as re_compile
-from typing          import Optional as Nullable, Union, Callable, Any, Generic, TypeVar, Iterable, Iterator, List
+from typing          import Optional as Nullable, Union, Callable, Any, Generic, TypeVar, Iterable, Iterator, List, Tuple, ClassVar, Literal
 
 from pyTooling.Decorators  import export, readonly
+from pyTooling.Caching     import CacheStatistics, LRUCache
 from pyTooling.MetaClasses import ExtendedType, abstractmethod, mustoverride
 from pyTooling.Exceptions  import ToolingException
 from pyTooling.Common      import getFullyQualifiedName
@@ -312,9 +315,17 @@ def MaxValueValidator(
 
 @export
 class Version(metaclass=ExtendedType, slots=True):
-	"""Base-class for a version representation."""
+	"""
+	Base-class for a version representation.
+
+	Version instances are immutable. Therefore, parsed version numbers are shared via a bounded parse cache (see
+	:meth:`ConfigureParseCache`).
+	"""
+
+	_parseCache:    ClassVar[Nullable[LRUCache]] = LRUCache(4096, threadSafe=True)  #: Shared cache of parsed version numbers keyed by ``(cls, versionString)``.
 
-	__hash:         Nullable[int]  #: once computed hash of the object
+	__hash:         Nullable[int]              #: once computed hash of the object
+	__sortKey:      Nullable[Tuple[int, ...]]  #: once computed sort key of the object
 
 	_parts:         Parts          #: Integer flag enumeration of present parts in a version number.
 	_prefix:        str            #: Prefix string
@@ -373,6 +384,7 @@ class Version(metaclass=ExtendedType, slots=True):
 		:raises TypeError:  If parameter 'postfix' is not of type str.
 		"""
 		self.__hash = None
+		self.__sortKey = None
 
 		if not isinstance(major, int):
 			raise TypeError("Parameter 'major' is not of type 'int'.")
@@ -501,6 +513,44 @@ class Version(metaclass=ExtendedType, slots=True):
 	def Parse(cls, versionString: Nullable[str], validator: Nullable[Callable[["SemanticVersion"], bool]] = None) -> "Version":
 		"""Parse a version string and return a Version instance."""
 
+	@staticmethod
+	def ConfigureParseCache(maxSize: int = 4096) -> None:
+		"""
+		Resize or disable the parse cache shared by all version classes and :class:`VersionSpecifier`.
+
+		Any previously cached version numbers and the cache statistics are discarded.
+
+		:param maxSize:     Maximum number of cached version numbers. ``0`` disables the parse cache.
+		:raises TypeError:  If parameter 'maxSize' is not of type :class:`int`.
+		:raises ValueError: If parameter 'maxSize' is negative.
+		"""
+		if not isinstance(maxSize, int):
+			ex = TypeError(f"Parameter 'maxSize' is not of type 'int'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(maxSize)}'.")
+			raise ex
+		elif maxSize < 0:
+			raise ValueError(f"Parameter 'maxSize' is negative.")
+
+		Version._parseCache = LRUCache(maxSize, threadSafe=True) if maxSize > 0 else None
+
+	@staticmethod
+	def ClearParseCache() -> None:
+		"""Remove all entries from the parse cache shared by all version classes."""
+		if Version._parseCache is not None:
+			Version._parseCache.Clear()
+
+	@staticmethod
+	def GetParseCacheStatistics() -> Nullable[CacheStatistics]:
+		"""
+		Return the statistics of the parse cache shared by all version classes.
+
+		:returns: Cache statistics or ``None``, if the parse cache is disabled.
+		"""
+		if Version._parseCache is None:
+			return None
+
+		return Version._parseCache.Statistics
+
 	@readonly
 	def Parts(self) -> Parts:
 		"""
@@ -618,6 +668,37 @@ class Version(metaclass=ExtendedType, slots=True):
 		"""
 		return self._flags
 
+	@readonly
+	def SortKey(self) -> Tuple[int, ...]:
+		"""
+		Read-only property to access the version number's sort key.
+
+		The sort key is a tuple of integers, which is computed once per instance. Comparing two sort keys gives the same
+		order as comparing the two version numbers.
+
+		:return: The sort key.
+		"""
+		if self.__sortKey is None:
+			self.__sortKey = self._SortKey()
+		return self.__sortKey
+
+	def _SortKey(self) -> Tuple[int, ...]:
+		"""
+		Private helper method to compute the sort key of a :class:`Version` instance.
+
+		:returns: A tuple of all parts relevant for ordering version numbers.
+		"""
+		return (
+			self._major,
+			self._minor,
+			self._micro,
+			self._releaseLevel.value,
+			self._releaseNumber,
+			self._post,
+			self._dev,
+			self._build
+		)
+
 	def _equal(self, left: "Version", right: "Version") -> Nullable[bool]:
 		"""
 		Private helper method to compute the equality of two :class:`Version` instances.
@@ -626,17 +707,7 @@ class Version(metaclass=ExtendedType, slots=True):
 		:param right: Right operand.
 		:returns:     ``True``, if ``left`` is equal to ``right``, otherwise it's ``False``.
 		"""
-		return (
-			(left._major == right._major) and
-			(left._minor == right._minor) and
-			(left._micro == right._micro) and
-			(left._releaseLevel == right._releaseLevel) and
-			(left._releaseNumber == right._releaseNumber) and
-			(left._post == right._post) and
-			(left._dev == right._dev) and
-			(left._build == right._build) and
-			(left._postfix == right._postfix)
-		)
+		return (left.SortKey == right.SortKey) and (left._postfix == right._postfix)
 
 	def _compare(self, left: "Version", right: "Version") -> Nullable[bool]:
 		"""
@@ -648,44 +719,11 @@ class Version(metaclass=ExtendedType, slots=True):
 		              False if ``left`` is greater than ``right``. |br|
 		              Otherwise it's None (both operands are equal).
 		"""
-		if left._major < right._major:
+		leftKey = left.SortKey
+		rightKey = right.SortKey
+		if leftKey < rightKey:
 			return True
-		elif left._major > right._major:
-			return False
-
-		if left._minor < right._minor:
-			return True
-		elif left._minor > right._minor:
-			return False
-
-		if left._micro < right._micro:
-			return True
-		elif left._micro > right._micro:
-			return False
-
-		if left._releaseLevel < right._releaseLevel:
-			return True
-		elif left._releaseLevel > right._releaseLevel:
-			return False
-
-		if left._releaseNumber < right._releaseNumber:
-			return True
-		elif left._releaseNumber > right._releaseNumber:
-			return False
-
-		if left._post < right._post:
-			return True
-		elif left._post > right._post:
-			return False
-
-		if left._dev < right._dev:
-			return True
-		elif left._dev > right._dev:
-			return False
-
-		if left._build < right._build:
-			return True
-		elif left._build > right._build:
+		elif leftKey > rightKey:
 			return False
 
 		return None
@@ -828,7 +866,8 @@ class Version(metaclass=ExtendedType, slots=True):
 		elif ((sC := self.__class__) is (oC := other.__class__) or issubclass(sC, oC) or issubclass(oC, sC)):
 			pass
 		elif isinstance(other, VersionRange):
-			other = other._lowerBound
+			if (other := other._lowerBound) is None:
+				return False
 		elif isinstance(other, VersionSet):
 			other = other._items[0]
 		elif isinstance(other, str):
@@ -840,7 +879,7 @@ class Version(metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Supported types for second operand: {self.__class__.__name__}, VersionRange, VersionSet, str, int")
 			raise ex
 
-		return self._compare(self, other) is True
+		return self.SortKey < other.SortKey
 
 	@mustoverride
 	def __le__(self, other: Union["Version", str, int, None]) -> bool:
@@ -867,7 +906,8 @@ class Version(metaclass=ExtendedType, slots=True):
 			pass
 		elif isinstance(other, VersionRange):
 			equalValue = RangeBoundHandling.LowerBoundExclusive not in other._boundHandling
-			other = other._lowerBound
+			if (other := other._lowerBound) is None:
+				return False
 		elif isinstance(other, VersionSet):
 			other = other._items[0]
 		elif isinstance(other, str):
@@ -879,8 +919,7 @@ class Version(metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Supported types for second operand: {self.__class__.__name__}, VersionRange, VersionSet, str, int")
 			raise ex
 
-		result = self._compare(self, other)
-		return result if result is not None else equalValue
+		return (self.SortKey <= other.SortKey) if equalValue else (self.SortKey < other.SortKey)
 
 	@mustoverride
 	def __gt__(self, other: Union["Version", str, int, None]) -> bool:
@@ -905,7 +944,8 @@ class Version(metaclass=ExtendedType, slots=True):
 		elif ((sC := self.__class__) is (oC := other.__class__) or issubclass(sC, oC) or issubclass(oC, sC)):
 			pass
 		elif isinstance(other, VersionRange):
-			other = other._upperBound
+			if (other := other._upperBound) is None:
+				return False
 		elif isinstance(other, VersionSet):
 			other = other._items[-1]
 		elif isinstance(other, str):
@@ -917,7 +957,7 @@ class Version(metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Supported types for second operand: {self.__class__.__name__}, VersionRange, VersionSet, str, int")
 			raise ex
 
-		return self._compare(self, other) is False
+		return self.SortKey > other.SortKey
 
 	@mustoverride
 	def __ge__(self, other: Union["Version", str, int, None]) -> bool:
@@ -944,7 +984,8 @@ class Version(metaclass=ExtendedType, slots=True):
 			pass
 		elif isinstance(other, VersionRange):
 			equalValue = RangeBoundHandling.UpperBoundExclusive not in other._boundHandling
-			other = other._upperBound
+			if (other := other._upperBound) is None:
+				return False
 		elif isinstance(other, VersionSet):
 			other = other._items[-1]
 		elif isinstance(other, str):
@@ -956,8 +997,7 @@ class Version(metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Supported types for second operand: {self.__class__.__name__}, VersionRange, VersionSet, str, int")
 			raise ex
 
-		result = self._compare(self, other)
-		return not result if result is not None else equalValue
+		return (self.SortKey >= other.SortKey) if equalValue else (self.SortKey > other.SortKey)
 
 	def __rshift__(self, other: Union["Version", str, int, None]) -> bool:
 		if other is None:
@@ -1092,7 +1132,36 @@ class SemanticVersion(Version):
 			ex = TypeError(f"Parameter 'versionString' is not of type 'str'.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(versionString)}'.")
 			raise ex
-		elif (versionString := versionString.strip()) == "":
+
+		cacheKey = (cls, versionString)
+		if (cache := Version._parseCache) is not None and (version := cache.Get(cacheKey)) is not None:
+			if validator is not None and not validator(version):
+				raise ValueError(f"Failed to validate version string '{versionString}'.")
+
+			return version
+
+		version = cls._ParseString(versionString)
+		if cache is not None:
+			cache.Set(cacheKey, version)
+
+		if validator is not None and not validator(version):
+			# TODO: VersionValidatorException
+			raise ValueError(f"Failed to validate version string '{versionString}'.")
+
+		return version
+
+	@classmethod
+	def _ParseString(cls, versionString: str) -> "SemanticVersion":
+		"""
+		Private helper method to parse a version string using the full regular expression.
+
+		In contrast to :meth:`Parse`, neither the parse cache nor a validator is used.
+
+		:param versionString: The version string to parse.
+		:returns:             An object representing a semantic version.
+		:raises ValueError:   When parameter ``versionString`` is empty or has a syntax error.
+		"""
+		if (versionString := versionString.strip()) == "":
 			raise ValueError("Parameter 'versionString' is empty.")
 
 		if (match := cls._PATTERN.match(versionString)) is None:
@@ -1132,7 +1201,7 @@ class SemanticVersion(Version):
 			else:
 				releaseLevel = ReleaseLevel.Final
 
-		version = cls(
+		return cls(
 			major=toInt(match["major"]),
 			minor=toInt(match["minor"]),
 			micro=toInt(match["micro"]),
@@ -1147,11 +1216,69 @@ class SemanticVersion(Version):
 			flags=Flags.Clean
 		)
 
-		if validator is not None and not validator(version):
-			# TODO: VersionValidatorException
-			raise ValueError(f"Failed to validate version string '{versionString}'.")
+	@classmethod
+	def ParseMany(
+		cls,
+		versionStrings: Iterable[str],
+		onError: Literal["skip", "raise", "collect"] = "skip"
+	) -> Tuple[List["SemanticVersion"], List[Tuple[Any, Exception]]]:
+		"""
+		Parse many version strings at once and return a list of :class:`SemanticVersion` instances.
+
+		Version strings of the common shape ``MAJOR[.MINOR[.MICRO]]`` are split by a fast tokenizer. Only other version
+		strings are parsed by the full regular expression. Parsed version numbers are shared via the parse cache.
+
+		Handling of invalid version strings depends on parameter ``onError``:
+
+		* ``skip`` - invalid version strings are dropped silently.
+		* ``raise`` - the first error is raised.
+		* ``collect`` - invalid version strings are returned as a list of ``(versionString, exception)`` tuples.
+
+		:param versionStrings: Iterable of version strings to parse.
+		:param onError:        Handling of invalid version strings.
+		:returns:              A 2-tuple of parsed versions (in order of ``versionStrings``) and failures.
+		:raises ValueError:    If parameter ``onError`` is not one of ``skip``, ``raise`` or ``collect``.
+		:raises TypeError:     If ``onError`` is ``raise`` and an element of ``versionStrings`` is not a string.
+		:raises ValueError:    If ``onError`` is ``raise`` and an element of ``versionStrings`` is not a valid version string.
+		"""
+		if onError not in ("skip", "raise", "collect"):
+			ex = ValueError(f"Parameter 'onError' is not one of 'skip', 'raise' or 'collect'.")
+			ex.add_note(f"Got '{onError}'.")
+			raise ex
+
+		cache = Version._parseCache
+		versions = []
+		failures = []
+		for versionString in versionStrings:
+			try:
+				if not isinstance(versionString, str):
+					ex = TypeError(f"Version string is not of type 'str'.")
+					ex.add_note(f"Got type '{getFullyQualifiedName(versionString)}'.")
+					raise ex
+
+				cacheKey = (cls, versionString)
+				if cache is not None and (version := cache.Get(cacheKey)) is not None:
+					versions.append(version)
+					continue
+
+				split = versionString.split(".")
+				if len(split) <= 3 and versionString.replace(".", "").isdecimal() and "" not in split:
+					version = cls(*[int(part) for part in split], prefix="", flags=Flags.Clean)
+				else:
+					version = cls._ParseString(versionString)
+
+				if cache is not None:
+					cache.Set(cacheKey, version)
+
+				versions.append(version)
+			except (TypeError, ValueError) as ex:
+				if onError == "raise":
+					raise
+				elif onError == "collect":
+					failures.append((versionString, ex))
+
+		return versions, failures
 
-		return version
 
 	@readonly
 	def Patch(self) -> int:
@@ -1463,6 +1590,13 @@ class CalendarVersion(Version):
 		elif versionString == "":
 			raise ValueError("Parameter 'versionString' is empty.")
 
+		cacheKey = (cls, versionString)
+		if (cache := Version._parseCache) is not None and (version := cache.Get(cacheKey)) is not None:
+			if validator is not None and not validator(version):
+				raise ValueError(f"Failed to validate version string '{versionString}'.")  # pragma: no cover
+
+			return version
+
 		split = versionString.split(".")
 		length = len(split)
 		major = int(split[0])
@@ -1476,6 +1610,9 @@ class CalendarVersion(Version):
 		flags = Flags.Clean
 
 		version = cls(major, minor, flags=flags)
+		if cache is not None:
+			cache.Set(cacheKey, version)
+
 		if validator is not None and not validator(version):
 			raise ValueError(f"Failed to validate version string '{versionString}'.")  # pragma: no cover
 
@@ -1490,6 +1627,14 @@ class CalendarVersion(Version):
 		"""
 		return self._major
 
+	def _SortKey(self) -> Tuple[int, ...]:
+		"""
+		Private helper method to compute the sort key of a :class:`CalendarVersion` instance.
+
+		:returns: A tuple of major, minor and micro number.
+		"""
+		return self._major, self._minor, self._micro
+
 	def _equal(self, left: "CalendarVersion", right: "CalendarVersion") -> Nullable[bool]:
 		"""
 		Private helper method to compute the equality of two :class:`CalendarVersion` instances.
@@ -1498,7 +1643,7 @@ class CalendarVersion(Version):
 		:param right: Right parameter.
 		:returns:     ``True``, if ``left`` is equal to ``right``, otherwise it's ``False``.
 		"""
-		return (left._major == right._major) and (left._minor == right._minor) and (left._micro == right._micro)
+		return left.SortKey == right.SortKey
 
 	def _compare(self, left: "CalendarVersion", right: "CalendarVersion") -> Nullable[bool]:
 		"""
@@ -1510,22 +1655,7 @@ class CalendarVersion(Version):
 		              False if ``left`` is greater than ``right``. |br|
 		              Otherwise it's None (both parameters are equal).
 		"""
-		if left._major < right._major:
-			return True
-		elif left._major > right._major:
-			return False
-
-		if left._minor < right._minor:
-			return True
-		elif left._minor > right._minor:
-			return False
-
-		if left._micro < right._micro:
-			return True
-		elif left._micro > right._micro:
-			return False
-
-		return None
+		return super()._compare(left, right)
 
 	def __eq__(self, other: Union["CalendarVersion", str, int, None]) -> bool:
 		"""
@@ -1908,38 +2038,41 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 	Representation of a version range described by a lower bound and upper bound version.
 
 	This version range works with :class:`SemanticVersion` and :class:`CalendarVersion` and its derived classes.
+
+	A bound can be ``None``, which describes an unbounded (open-ended) range on that side, e.g. ``>=1.2``.
 	"""
-	_lowerBound:    V
-	_upperBound:    V
+	_lowerBound:    Nullable[V]
+	_upperBound:    Nullable[V]
 	_boundHandling: RangeBoundHandling
 
-	def __init__(self, lowerBound: V, upperBound: V, boundHandling: RangeBoundHandling = RangeBoundHandling.BothBoundsInclusive) -> None:
+	def __init__(self, lowerBound: Nullable[V], upperBound: Nullable[V], boundHandling: RangeBoundHandling = RangeBoundHandling.BothBoundsInclusive) -> None:
 		"""
 		Initializes a version range described by a lower and upper bound.
 
-		:param lowerBound:  lowest version (inclusive).
-		:param upperBound:  hightest version (inclusive).
+		:param lowerBound:  lowest version (inclusive) or ``None`` if unbounded.
+		:param upperBound:  hightest version (inclusive) or ``None`` if unbounded.
 		:raises TypeError:  If parameter ``lowerBound`` is not of type :class:`Version`.
 		:raises TypeError:  If parameter ``upperBound`` is not of type :class:`Version`.
 		:raises TypeError:  If parameter ``lowerBound`` and ``upperBound`` are unrelated types.
 		:raises ValueError: If parameter ``lowerBound`` isn't less than or equal to ``upperBound``.
 		"""
-		if not isinstance(lowerBound, Version):
+		if lowerBound is not None and not isinstance(lowerBound, Version):
 			ex = TypeError(f"Parameter 'lowerBound' is not of type 'Version'.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(lowerBound)}'.")
 			raise ex
 
-		if not isinstance(upperBound, Version):
+		if upperBound is not None and not isinstance(upperBound, Version):
 			ex = TypeError(f"Parameter 'upperBound' is not of type 'Version'.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(upperBound)}'.")
 			raise ex
 
-		if not ((lBC := lowerBound.__class__) is (uBC := upperBound.__class__) or issubclass(lBC, uBC) or issubclass(uBC, lBC)):
+		if lowerBound is None or upperBound is None:
+			pass
+		elif not ((lBC := lowerBound.__class__) is (uBC := upperBound.__class__) or issubclass(lBC, uBC) or issubclass(uBC, lBC)):
 			ex = TypeError(f"Parameters 'lowerBound' and 'upperBound' are not compatible with each other.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(lowerBound)}' for lowerBound and type '{getFullyQualifiedName(upperBound)}' for upperBound.")
 			raise ex
-
-		if not (lowerBound <= upperBound):
+		elif not (lowerBound <= upperBound):
 			ex = ValueError(f"Parameter 'lowerBound' isn't less than parameter 'upperBound'.")
 			ex.add_note(f"Got '{lowerBound}' for lowerBound and '{upperBound}' for upperBound.")
 			raise ex
@@ -1949,17 +2082,17 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 		self._boundHandling = boundHandling
 
 	@property
-	def LowerBound(self) -> V:
+	def LowerBound(self) -> Nullable[V]:
 		"""
 		Property to access the range's lower bound.
 
-		:return: Lower bound of the version range.
+		:return: Lower bound of the version range or ``None`` if unbounded.
 		"""
 		return self._lowerBound
 
 	@LowerBound.setter
-	def LowerBound(self, value: V) -> None:
-		if not isinstance(value, Version):
+	def LowerBound(self, value: Nullable[V]) -> None:
+		if value is not None and not isinstance(value, Version):
 			ex = TypeError(f"Parameter 'value' is not of type 'Version'.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(value)}'.")
 			raise ex
@@ -1967,17 +2100,17 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 		self._lowerBound = value
 
 	@readonly
-	def UpperBound(self) -> V:
+	def UpperBound(self) -> Nullable[V]:
 		"""
 		Property to access the range's upper bound.
 
-		:return: Upper bound of the version range.
+		:return: Upper bound of the version range or ``None`` if unbounded.
 		"""
 		return self._upperBound
 
 	@UpperBound.setter
-	def UpperBound(self, value: V) -> None:
-		if not isinstance(value, Version):
+	def UpperBound(self, value: Nullable[V]) -> None:
+		if value is not None and not isinstance(value, Version):
 			ex = TypeError(f"Parameter 'value' is not of type 'Version'.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(value)}'.")
 			raise ex
@@ -2016,20 +2149,26 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if not (isinstance(other._lowerBound, self._lowerBound.__class__) and isinstance(self._lowerBound, other._lowerBound.__class__)):
+		if self._lowerBound is None or other._lowerBound is None:
+			pass
+		elif not (isinstance(other._lowerBound, self._lowerBound.__class__) and isinstance(self._lowerBound, other._lowerBound.__class__)):
 			ex = TypeError(f"Parameter 'other's LowerBound and this range's 'LowerBound' are not compatible with each other.")
 			ex.add_note(
 					f"Got type '{getFullyQualifiedName(other._lowerBound)}' for other.LowerBound and type '{getFullyQualifiedName(self._lowerBound)}' for self.LowerBound.")
 			raise ex
 
-		if other._lowerBound < self._lowerBound:
+		if other._lowerBound is None:
+			lBound = self._lowerBound
+		elif self._lowerBound is not None and other._lowerBound < self._lowerBound:
 			lBound = self._lowerBound
 		elif other._lowerBound in self:
 			lBound = other._lowerBound
 		else:
 			raise ValueError()
 
-		if other._upperBound > self._upperBound:
+		if other._upperBound is None:
+			uBound = self._upperBound
+		elif self._upperBound is not None and other._upperBound > self._upperBound:
 			uBound = self._upperBound
 		elif other._upperBound in self:
 			uBound = other._upperBound
@@ -2053,11 +2192,14 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if not (isinstance(other, self._lowerBound.__class__) and isinstance(self._lowerBound, other.__class__)):
+		if self._lowerBound is not None and not (isinstance(other, self._lowerBound.__class__) and isinstance(self._lowerBound, other.__class__)):
 			ex = TypeError(f"Parameter 'other' is not compatible with version range.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
+		if self._upperBound is None:
+			return False
+
 		return self._upperBound < other
 
 	def __le__(self, other: Any) -> bool:
@@ -2075,12 +2217,14 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if not (isinstance(other, self._lowerBound.__class__) and isinstance(self._lowerBound, other.__class__)):
+		if self._lowerBound is not None and not (isinstance(other, self._lowerBound.__class__) and isinstance(self._lowerBound, other.__class__)):
 			ex = TypeError(f"Parameter 'other' is not compatible with version range.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if RangeBoundHandling.UpperBoundExclusive in self._boundHandling:
+		if self._upperBound is None:
+			return False
+		elif RangeBoundHandling.UpperBoundExclusive in self._boundHandling:
 			return self._upperBound < other
 		else:
 			return self._upperBound <= other
@@ -2100,11 +2244,14 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if not (isinstance(other, self._upperBound.__class__) and isinstance(self._upperBound, other.__class__)):
+		if self._upperBound is not None and not (isinstance(other, self._upperBound.__class__) and isinstance(self._upperBound, other.__class__)):
 			ex = TypeError(f"Parameter 'other' is not compatible with version range.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
+		if self._lowerBound is None:
+			return False
+
 		return self._lowerBound > other
 
 	def __ge__(self, other: Any) -> bool:
@@ -2122,12 +2269,14 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if not (isinstance(other, self._upperBound.__class__) and isinstance(self._upperBound, other.__class__)):
+		if self._upperBound is not None and not (isinstance(other, self._upperBound.__class__) and isinstance(self._upperBound, other.__class__)):
 			ex = TypeError(f"Parameter 'other' is not compatible with version range.")
 			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
 			raise ex
 
-		if RangeBoundHandling.LowerBoundExclusive in self._boundHandling:
+		if self._lowerBound is None:
+			return False
+		elif RangeBoundHandling.LowerBoundExclusive in self._boundHandling:
 			return self._lowerBound > other
 		else:
 			return self._lowerBound >= other
@@ -2145,14 +2294,22 @@ class VersionRange(Generic[V], metaclass=ExtendedType, slots=True):
 			ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
 			raise ex
 
-		if self._boundHandling is RangeBoundHandling.BothBoundsInclusive:
-			return self._lowerBound <= version <= self._upperBound
-		elif self._boundHandling is (RangeBoundHandling.LowerBoundInclusive | RangeBoundHandling.UpperBoundExclusive):
-			return self._lowerBound <= version < self._upperBound
-		elif self._boundHandling is (RangeBoundHandling.LowerBoundExclusive | RangeBoundHandling.UpperBoundInclusive):
-			return self._lowerBound < version <= self._upperBound
-		else:
-			return self._lowerBound < version < self._upperBound
+		key = version.SortKey
+		if self._lowerBound is not None:
+			if RangeBoundHandling.LowerBoundExclusive in self._boundHandling:
+				if not (self._lowerBound.SortKey < key):
+					return False
+			elif not (self._lowerBound.SortKey <= key):
+				return False
+
+		if self._upperBound is not None:
+			if RangeBoundHandling.UpperBoundExclusive in self._boundHandling:
+				if not (key < self._upperBound.SortKey):
+					return False
+			elif not (key <= self._upperBound.SortKey):
+				return False
+
+		return True
 
 
 @export
@@ -2161,8 +2318,12 @@ class VersionSet(Generic[V], metaclass=ExtendedType, slots=True):
 	Representation of an ordered set of versions.
 
 	This version set works with :class:`SemanticVersion` and :class:`CalendarVersion` and its derived classes.
+
+	Besides the ordered list of members, the set keeps the members' sort keys (see :attr:`Version.SortKey`). Thus,
+	membership checks and lookups like :meth:`Floor`, :meth:`Ceiling` or :meth:`Slice` use a binary search.
 	"""
-	_items: List[V]  #: An ordered list of set members.
+	_items: List[V]                  #: An ordered list of set members.
+	_keys:  List[Tuple[int, ...]]    #: An ordered list of the members' sort keys.
 
 	def __init__(self, versions: Union[Version, Iterable[V]]) -> None:
 		"""
@@ -2179,12 +2340,14 @@ class VersionSet(Generic[V], metaclass=ExtendedType, slots=True):
 
 		if isinstance(versions, Version):
 			self._items = [versions]
+			self._keys = [versions.SortKey]
 		elif isinstance(versions, abc_Iterable):
 			iterator = iter(versions)
 			try:
 				firstVersion = next(iterator)
 			except StopIteration:
 				self._items = []
+				self._keys = []
 				return
 
 			if not isinstance(firstVersion, Version):
@@ -2195,7 +2358,8 @@ class VersionSet(Generic[V], metaclass=ExtendedType, slots=True):
 				if not isinstance(version, baseType):
 					raise TypeError(f"Element from parameter 'versions' is not of type {baseType.__name__}")
 
-			self._items = list(sorted(versions))
+			self._items = sorted(versions, key=lambda version: version.SortKey)
+			self._keys = [version.SortKey for version in self._items]
 		else:
 			raise TypeError(f"Parameter 'versions' is not an Iterable.")
 
@@ -2361,14 +2525,142 @@ class VersionSet(Generic[V], metaclass=ExtendedType, slots=True):
 
 		return self._items[0] >= other
 
+	def _IndexRange(self, versionRange: VersionRange) -> Tuple[int, int]:
+		"""
+		Private helper method to compute the index range of set members within a version range.
+
+		:param versionRange: The version range.
+		:returns:            A 2-tuple of start index (inclusive) and stop index (exclusive).
+		:raises TypeError:   If parameter ``versionRange`` is not of type :class:`VersionRange`.
+		"""
+		if not isinstance(versionRange, VersionRange):
+			ex = TypeError(f"Parameter 'versionRange' is not of type 'VersionRange'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(versionRange)}'.")
+			raise ex
+
+		if versionRange._lowerBound is None:
+			start = 0
+		elif RangeBoundHandling.LowerBoundExclusive in versionRange._boundHandling:
+			start = bisect_right(self._keys, versionRange._lowerBound.SortKey)
+		else:
+			start = bisect_left(self._keys, versionRange._lowerBound.SortKey)
+
+		if versionRange._upperBound is None:
+			stop = len(self._keys)
+		elif RangeBoundHandling.UpperBoundExclusive in versionRange._boundHandling:
+			stop = bisect_left(self._keys, versionRange._upperBound.SortKey, start)
+		else:
+			stop = bisect_right(self._keys, versionRange._upperBound.SortKey, start)
+
+		return start, stop
+
+	def Slice(self, versionRange: VersionRange) -> "VersionSetView[V]":
+		"""
+		Return a view on all members within a version range.
+
+		The members aren't copied. The view's boundaries are found by a binary search.
+
+		:param versionRange: The version range.
+		:returns:            A view on all members within the version range.
+		:raises TypeError:   If parameter ``versionRange`` is not of type :class:`VersionRange`.
+		"""
+		start, stop = self._IndexRange(versionRange)
+		return VersionSetView(self, start, stop)
+
+	def Filter(self, versionRange: VersionRange, predicate: Nullable[Callable[[V], bool]] = None) -> Iterator[V]:
+		"""
+		Iterate all members within a version range, which optionally fulfill a predicate.
+
+		The members aren't copied. The range's boundaries are found by a binary search, then the predicate is applied
+		to each member within the range.
+
+		:param versionRange: The version range.
+		:param predicate:    Optional, a filter function.
+		:returns:            An iterator from lowest to highest version within the version range.
+		:raises TypeError:   If parameter ``versionRange`` is not of type :class:`VersionRange`.
+		"""
+		start, stop = self._IndexRange(versionRange)
+		iterator = map(self._items.__getitem__, range(start, stop))
+
+		if predicate is None:
+			return iterator
+
+		return filter(predicate, iterator)
+
+	def Floor(self, version: V) -> Nullable[V]:
+		"""
+		Return the highest member, which is less than or equal to the given version.
+
+		:param version:    The version to look up.
+		:returns:          The highest member less than or equal to ``version``, otherwise ``None``.
+		:raises TypeError: If parameter ``version`` is not of type :class:`Version`.
+		"""
+		if not isinstance(version, Version):
+			ex = TypeError(f"Parameter 'version' is not of type 'Version'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
+			raise ex
+
+		if (index := bisect_right(self._keys, version.SortKey)) == 0:
+			return None
+
+		return self._items[index - 1]
+
+	def Ceiling(self, version: V) -> Nullable[V]:
+		"""
+		Return the lowest member, which is greater than or equal to the given version.
+
+		:param version:    The version to look up.
+		:returns:          The lowest member greater than or equal to ``version``, otherwise ``None``.
+		:raises TypeError: If parameter ``version`` is not of type :class:`Version`.
+		"""
+		if not isinstance(version, Version):
+			ex = TypeError(f"Parameter 'version' is not of type 'Version'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
+			raise ex
+
+		if (index := bisect_left(self._keys, version.SortKey)) == len(self._keys):
+			return None
+
+		return self._items[index]
+
+	def Latest(self, predicate: Nullable[Callable[[V], bool]] = None) -> Nullable[V]:
+		"""
+		Return the highest member, which optionally fulfills a predicate.
+
+		Members are checked from highest to lowest version, thus the search stops at the first match.
+
+		:param predicate: Optional, a filter function.
+		:returns:         The highest (matching) member, otherwise ``None``.
+		"""
+		if predicate is None:
+			return self._items[-1] if len(self._items) > 0 else None
+
+		for version in reversed(self._items):
+			if predicate(version):
+				return version
+
+		return None
+
 	def __contains__(self, version: V) -> bool:
 		"""
 		Checks if the version a member of the set.
 
+		Versions are looked up by a binary search on the members' sort keys.
+
 		:param version: The version to check.
 		:returns:       ``True``, if the version is a member of the set.
 		"""
-		return version in self._items
+		if not isinstance(version, Version):
+			return version in self._items
+
+		key = version.SortKey
+		index = bisect_left(self._keys, key)
+		while index < len(self._keys) and self._keys[index] == key:
+			if self._items[index] == version:
+				return True
+			index += 1
+
+		return False
 
 	def __len__(self) -> int:
 		"""
@@ -2398,3 +2690,596 @@ class VersionSet(Generic[V], metaclass=ExtendedType, slots=True):
 		   Versions are ordered from lowest to highest version number.
 		"""
 		return self._items[index]
+
+
+@export
+class VersionSetView(Generic[V], metaclass=ExtendedType, slots=True):
+	"""
+	A read-only view on a contiguous range of members of a :class:`VersionSet`.
+
+	A view doesn't copy the members. It's created by :meth:`VersionSet.Slice`.
+	"""
+	_versionSet: VersionSet[V]  #: The viewed version set.
+	_start:      int            #: Index of the first member in the view.
+	_stop:       int            #: Index after the last member in the view.
+
+	def __init__(self, versionSet: VersionSet[V], start: int, stop: int) -> None:
+		"""
+		Initializes a view on a contiguous range of members of a version set.
+
+		:param versionSet: The viewed version set.
+		:param start:      Index of the first member in the view.
+		:param stop:       Index after the last member in the view.
+		"""
+		self._versionSet = versionSet
+		self._start = start
+		self._stop = max(start, stop)
+
+	@readonly
+	def VersionSet(self) -> VersionSet[V]:
+		"""
+		Read-only property to access the viewed version set.
+
+		:return: The viewed version set.
+		"""
+		return self._versionSet
+
+	def ToVersionSet(self) -> "VersionSet[V]":
+		"""
+		Copy all members in the view into a new version set.
+
+		:returns: New version set.
+		"""
+		return VersionSet(self._versionSet._items[self._start:self._stop])
+
+	def __contains__(self, version: V) -> bool:
+		"""
+		Checks if the version a member of the view.
+
+		:param version: The version to check.
+		:returns:       ``True``, if the version is a member of the view.
+		"""
+		if not isinstance(version, Version):
+			return version in self._versionSet._items[self._start:self._stop]
+
+		keys = self._versionSet._keys
+		key = version.SortKey
+		index = bisect_left(keys, key, self._start, self._stop)
+		while index < self._stop and keys[index] == key:
+			if self._versionSet._items[index] == version:
+				return True
+			index += 1
+
+		return False
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of members in the view.
+
+		:returns: Number of members in the view.
+		"""
+		return self._stop - self._start
+
+	def __iter__(self) -> Iterator[V]:
+		"""
+		Returns an iterator to iterate all versions of this view from lowest to highest.
+
+		:returns: Iterator to iterate versions.
+		"""
+		return map(self._versionSet._items.__getitem__, range(self._start, self._stop))
+
+	def __reversed__(self) -> Iterator[V]:
+		"""
+		Returns an iterator to iterate all versions of this view from highest to lowest.
+
+		:returns: Iterator to iterate versions.
+		"""
+		return map(self._versionSet._items.__getitem__, range(self._stop - 1, self._start - 1, -1))
+
+	def __getitem__(self, index: int) -> V:
+		"""
+		Access to a version of a view by index.
+
+		:param index:       The index of the version to access.
+		:returns:           The indexed version.
+		:raises IndexError: If the index is out of range.
+		"""
+		length = self._stop - self._start
+		if index < 0:
+			index += length
+
+		if not (0 <= index < length):
+			raise IndexError(f"Index '{index}' is out of range.")
+
+		return self._versionSet._items[self._start + index]
+
+
+_Interval = Tuple[Nullable[Version], bool, Nullable[Version], bool]  #: Lower bound, lower bound inclusive, upper bound, upper bound inclusive.
+
+
+def _LowerKey(interval: _Interval) -> Tuple:
+	"""
+	Private helper function to order intervals by their lower bound (unbounded first).
+
+	:param interval: The interval.
+	:returns:        A tuple usable as a sort key.
+	"""
+	lower, lowerInclusive, _, _ = interval
+	return (0, ) if lower is None else (1, lower.SortKey, 0 if lowerInclusive else 1)
+
+
+def _UpperKey(interval: _Interval) -> Tuple:
+	"""
+	Private helper function to order intervals by their upper bound (unbounded last).
+
+	:param interval: The interval.
+	:returns:        A tuple usable as a sort key.
+	"""
+	_, _, upper, upperInclusive = interval
+	return (1, ) if upper is None else (0, upper.SortKey, 1 if upperInclusive else 0)
+
+
+def _IsEmpty(interval: _Interval) -> bool:
+	"""
+	Private helper function to check if an interval contains no version.
+
+	:param interval: The interval.
+	:returns:        ``True``, if the interval is empty.
+	"""
+	lower, lowerInclusive, upper, upperInclusive = interval
+	if lower is None or upper is None:
+		return False
+
+	lowerKey = lower.SortKey
+	upperKey = upper.SortKey
+	if lowerKey < upperKey:
+		return False
+	elif lowerKey == upperKey:
+		return not (lowerInclusive and upperInclusive)
+
+	return True
+
+
+def _Normalize(intervals: Iterable[_Interval]) -> List[_Interval]:
+	"""
+	Private helper function to normalize a union of intervals.
+
+	Empty intervals are dropped, the remaining intervals are sorted by lower bound and overlapping or adjacent intervals
+	are merged.
+
+	:param intervals: The intervals to normalize.
+	:returns:         An ordered list of disjoint intervals.
+	"""
+	result = []
+	for interval in sorted((i for i in intervals if not _IsEmpty(i)), key=_LowerKey):
+		if len(result) > 0:
+			lastLower, lastLowerInclusive, lastUpper, lastUpperInclusive = result[-1]
+			lower, lowerInclusive, upper, upperInclusive = interval
+			if lastUpper is None:
+				continue
+			elif lower is None or lower.SortKey < lastUpper.SortKey or (lower.SortKey == lastUpper.SortKey and (lowerInclusive or lastUpperInclusive)):
+				if _UpperKey(interval) > _UpperKey(result[-1]):
+					result[-1] = (lastLower, lastLowerInclusive, upper, upperInclusive)
+				continue
+
+		result.append(interval)
+
+	return result
+
+
+@export
+class VersionSpecifier(Generic[V], metaclass=ExtendedType, slots=True):
+	"""
+	Representation of version constraints as a normalized union of :class:`VersionRange`.
+
+	A specifier is parsed from a string by :meth:`Parse`. Clauses separated by ``,`` are intersected, alternatives
+	separated by ``||`` are united. Supported clauses:
+
+	* ``==V``, ``===V``, ``V`` - exact version
+	* ``==V.*``, ``!=V.*`` - all versions (not) starting with the prefix ``V``
+	* ``!=V``, ``<V``, ``<=V``, ``>V``, ``>=V`` - ordered comparisons
+	* ``~=V`` - compatible release (PEP 440), e.g. ``~=1.4.5`` is ``>=1.4.5, ==1.4.*``
+	* ``^V`` - caret, allows changes not modifying the left-most non-zero part, e.g. ``^1.2.3`` is ``>=1.2.3, <2.0.0``
+	* ``~V`` - tilde, allows micro changes, e.g. ``~1.2.3`` is ``>=1.2.3, <1.3.0``
+	* ``*`` or an empty string - any version
+
+	Exclusive upper bounds derived from a prefix (wildcards, ``~=``, ``^``, ``~``) and ``<V`` for a final release exclude
+	the pre-releases of that upper bound, e.g. ``<2.0`` doesn't contain ``2.0.rc1``.
+
+	Specifiers are immutable, thus parsed specifiers are shared via the parse cache (see
+	:meth:`Version.ConfigureParseCache`).
+	"""
+	_versionClass: type                  #: Version class used for parsing versions.
+	_intervals:    List[_Interval]       #: Ordered list of disjoint intervals.
+	_lowerKeys:    List[Tuple]           #: Ordered list of the intervals' lower bound keys.
+	__hash:        Nullable[int]         #: once computed hash of the object
+
+	def __init__(self, ranges: Iterable[VersionRange[V]] = (), versionClass: type = SemanticVersion) -> None:
+		"""
+		Initializes a version specifier as the union of version ranges.
+
+		:param ranges:       An iterable of version ranges.
+		:param versionClass: Version class used for parsing versions (e.g. by ``in`` with a string operand).
+		:raises TypeError:   If parameter ``ranges`` contains elements, which are not of type :class:`VersionRange`.
+		:raises TypeError:   If parameter ``versionClass`` is not a subclass of :class:`Version`.
+		"""
+		if not (isinstance(versionClass, type) and issubclass(versionClass, Version)):
+			ex = TypeError(f"Parameter 'versionClass' is not a subclass of 'Version'.")
+			ex.add_note(f"Got '{versionClass}'.")
+			raise ex
+
+		intervals = []
+		for versionRange in ranges:
+			if not isinstance(versionRange, VersionRange):
+				ex = TypeError(f"Element of parameter 'ranges' is not of type 'VersionRange'.")
+				ex.add_note(f"Got type '{getFullyQualifiedName(versionRange)}'.")
+				raise ex
+
+			intervals.append((
+				versionRange._lowerBound,
+				RangeBoundHandling.LowerBoundExclusive not in versionRange._boundHandling,
+				versionRange._upperBound,
+				RangeBoundHandling.UpperBoundExclusive not in versionRange._boundHandling
+			))
+
+		self._Initialize(versionClass, _Normalize(intervals))
+
+	def _Initialize(self, versionClass: type, intervals: List[_Interval]) -> None:
+		"""
+		Private helper method to initialize all fields from already normalized intervals.
+
+		:param versionClass: Version class used for parsing versions.
+		:param intervals:    Ordered list of disjoint intervals.
+		"""
+		self.__hash = None
+		self._versionClass = versionClass
+		self._intervals = intervals
+		self._lowerKeys = [_LowerKey(interval) for interval in intervals]
+
+	@classmethod
+	def _FromIntervals(cls, versionClass: type, intervals: List[_Interval]) -> "VersionSpecifier[V]":
+		"""
+		Private helper method to create a version specifier from already normalized intervals.
+
+		:param versionClass: Version class used for parsing versions.
+		:param intervals:    Ordered list of disjoint intervals.
+		:returns:            New version specifier.
+		"""
+		specifier = cls.__new__(cls)
+		specifier._Initialize(versionClass, intervals)
+		return specifier
+
+	@classmethod
+	def Parse(cls, specifierString: str, versionClass: type = SemanticVersion) -> "VersionSpecifier[V]":
+		"""
+		Parse a specifier string like ``>=1.2, <2.0, !=1.5.*`` and return a :class:`VersionSpecifier` instance.
+
+		:param specifierString: The specifier string to parse.
+		:param versionClass:    Version class used for parsing versions. Must be a subclass of :class:`SemanticVersion`.
+		:returns:               A normalized union of version ranges.
+		:raises TypeError:      If parameter ``specifierString`` is not a string.
+		:raises TypeError:      If parameter ``versionClass`` is not a subclass of :class:`SemanticVersion`.
+		:raises ValueError:     If parameter ``specifierString`` contains an invalid clause.
+		"""
+		if not isinstance(specifierString, str):
+			ex = TypeError(f"Parameter 'specifierString' is not of type 'str'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(specifierString)}'.")
+			raise ex
+		elif not (isinstance(versionClass, type) and issubclass(versionClass, SemanticVersion)):
+			ex = TypeError(f"Parameter 'versionClass' is not a subclass of 'SemanticVersion'.")
+			ex.add_note(f"Got '{versionClass}'.")
+			raise ex
+
+		cacheKey = (cls, versionClass, specifierString)
+		if (cache := Version._parseCache) is not None and (specifier := cache.Get(cacheKey)) is not None:
+			return specifier
+
+		alternatives = []
+		for alternative in specifierString.split("||"):
+			intervals = [(None, False, None, False)]
+			for clause in alternative.split(","):
+				if (clause := clause.strip()) in ("", "*"):
+					continue
+
+				intervals = cls._Intersect(intervals, cls._ParseClause(clause, versionClass, specifierString))
+
+			alternatives.extend(intervals)
+
+		specifier = cls._FromIntervals(versionClass, _Normalize(alternatives))
+		if cache is not None:
+			cache.Set(cacheKey, specifier)
+
+		return specifier
+
+	@staticmethod
+	def _ParseClause(clause: str, versionClass: type, specifierString: str) -> List[_Interval]:
+		"""
+		Private helper method to translate a single clause into a union of intervals.
+
+		:param clause:          The clause to translate.
+		:param versionClass:    Version class used for parsing versions.
+		:param specifierString: The whole specifier string (used for error messages).
+		:returns:               An ordered list of disjoint intervals.
+		:raises ValueError:     If the clause is invalid.
+		"""
+		for operator in ("===", "==", "!=", "~=", ">=", "<=", ">", "<", "^", "~", "="):
+			if clause.startswith(operator):
+				versionString = clause[len(operator):].strip()
+				break
+		else:
+			operator = "=="
+			versionString = clause
+
+		def lowest(major: int, minor: int = 0, micro: int = 0) -> Version:
+			return versionClass(major, minor, micro, ReleaseLevel.Alpha, 0)
+
+		if versionString.endswith(".*"):
+			if operator not in ("==", "!="):
+				raise ValueError(f"Wildcard is only supported by '==' and '!=' in clause '{clause}' of specifier '{specifierString}'.")
+
+			try:
+				prefix = versionClass.Parse(versionString[:-2])
+			except ValueError as ex:
+				raise ValueError(f"Invalid version in clause '{clause}' of specifier '{specifierString}'.") from ex
+
+			if Parts.Micro in prefix._parts:
+				upper = lowest(prefix._major, prefix._minor, prefix._micro + 1)
+			elif Parts.Minor in prefix._parts:
+				upper = lowest(prefix._major, prefix._minor + 1)
+			else:
+				upper = lowest(prefix._major + 1)
+			lower = lowest(prefix._major, prefix._minor, prefix._micro)
+
+			if operator == "==":
+				return [(lower, True, upper, False)]
+			else:
+				return [(None, False, lower, False), (upper, True, None, False)]
+
+		try:
+			version = versionClass.Parse(versionString)
+		except ValueError as ex:
+			raise ValueError(f"Invalid version in clause '{clause}' of specifier '{specifierString}'.") from ex
+
+		if operator in ("==", "===", "="):
+			return [(version, True, version, True)]
+		elif operator == "!=":
+			return [(None, False, version, False), (version, False, None, False)]
+		elif operator == ">=":
+			return [(version, True, None, False)]
+		elif operator == ">":
+			return [(version, False, None, False)]
+		elif operator == "<=":
+			return [(None, False, version, True)]
+		elif operator == "<":
+			if version._releaseLevel is ReleaseLevel.Final and Parts.Post not in version._parts and Parts.Dev not in version._parts:
+				return [(None, False, lowest(version._major, version._minor, version._micro), False)]
+			return [(None, False, version, False)]
+		elif operator == "~=":
+			if Parts.Minor not in version._parts:
+				raise ValueError(f"Compatible release clause '{clause}' requires at least a major and minor number in specifier '{specifierString}'.")
+			elif Parts.Micro in version._parts:
+				upper = lowest(version._major, version._minor + 1)
+			else:
+				upper = lowest(version._major + 1)
+		elif operator == "^":
+			if version._major > 0 or Parts.Minor not in version._parts:
+				upper = lowest(version._major + 1)
+			elif version._minor > 0 or Parts.Micro not in version._parts:
+				upper = lowest(0, version._minor + 1)
+			else:
+				upper = lowest(0, 0, version._micro + 1)
+		else:  # operator == "~"
+			if Parts.Minor in version._parts:
+				upper = lowest(version._major, version._minor + 1)
+			else:
+				upper = lowest(version._major + 1)
+
+		return [(version, True, upper, False)]
+
+	@staticmethod
+	def _Intersect(left: List[_Interval], right: List[_Interval]) -> List[_Interval]:
+		"""
+		Private helper method to intersect two ordered lists of disjoint intervals.
+
+		:param left:  First ordered list of disjoint intervals.
+		:param right: Second ordered list of disjoint intervals.
+		:returns:     Ordered list of disjoint intervals.
+		"""
+		result = []
+		leftIndex = 0
+		rightIndex = 0
+		while leftIndex < len(left) and rightIndex < len(right):
+			leftInterval = left[leftIndex]
+			rightInterval = right[rightIndex]
+
+			lower = leftInterval if _LowerKey(leftInterval) >= _LowerKey(rightInterval) else rightInterval
+			if _UpperKey(leftInterval) <= _UpperKey(rightInterval):
+				upper = leftInterval
+				leftIndex += 1
+			else:
+				upper = rightInterval
+				rightIndex += 1
+
+			interval = (lower[0], lower[1], upper[2], upper[3])
+			if not _IsEmpty(interval):
+				result.append(interval)
+
+		return result
+
+	@readonly
+	def VersionClass(self) -> type:
+		"""
+		Read-only property to access the version class used for parsing versions.
+
+		:return: The version class.
+		"""
+		return self._versionClass
+
+	@readonly
+	def Ranges(self) -> List[VersionRange[V]]:
+		"""
+		Read-only property to access the normalized union of version ranges.
+
+		The ranges are ordered, disjoint and not adjacent. An unbounded side is represented by a ``None`` bound.
+
+		:return: A new list of version ranges.
+		"""
+		ranges = []
+		for lower, lowerInclusive, upper, upperInclusive in self._intervals:
+			boundHandling = RangeBoundHandling.BothBoundsInclusive
+			if not lowerInclusive:
+				boundHandling |= RangeBoundHandling.LowerBoundExclusive
+			if not upperInclusive:
+				boundHandling |= RangeBoundHandling.UpperBoundExclusive
+
+			ranges.append(VersionRange(lower, upper, boundHandling))
+
+		return ranges
+
+	@readonly
+	def IsEmpty(self) -> bool:
+		"""
+		Read-only property to check if no version satisfies the specifier.
+
+		:return: ``True``, if the specifier can't be satisfied.
+		"""
+		return len(self._intervals) == 0
+
+	@readonly
+	def IsAny(self) -> bool:
+		"""
+		Read-only property to check if all versions satisfy the specifier.
+
+		:return: ``True``, if the specifier is unconstrained.
+		"""
+		return len(self._intervals) == 1 and self._intervals[0][0] is None and self._intervals[0][2] is None
+
+	def Filter(self, versions: VersionSet[V]) -> Iterator[V]:
+		"""
+		Iterate all members of a version set satisfying the specifier.
+
+		Each range is looked up by a binary search in the version set, thus no version outside the specifier is visited.
+
+		:param versions:   The version set to filter.
+		:returns:          An iterator from lowest to highest satisfying version.
+		:raises TypeError: If parameter ``versions`` is not of type :class:`VersionSet`.
+		"""
+		if not isinstance(versions, VersionSet):
+			ex = TypeError(f"Parameter 'versions' is not of type 'VersionSet'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(versions)}'.")
+			raise ex
+
+		return chain.from_iterable(versions.Filter(versionRange) for versionRange in self.Ranges)
+
+	def __contains__(self, version: Union[V, str]) -> bool:
+		"""
+		Check if a version satisfies the specifier.
+
+		The candidate range is found by a binary search over the ranges' lower bounds.
+
+		:param version:    The version to check. A string is parsed by the specifier's version class.
+		:returns:          ``True``, if the version satisfies the specifier.
+		:raises TypeError: If parameter ``version`` is neither of type :class:`Version` nor :class:`str`.
+		"""
+		if isinstance(version, str):
+			version = self._versionClass.Parse(version)
+		elif not isinstance(version, Version):
+			ex = TypeError(f"Parameter 'version' is not of type 'Version' or 'str'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
+			raise ex
+
+		key = version.SortKey
+		if (index := bisect_right(self._lowerKeys, (1, key, 0)) - 1) < 0:
+			return False
+
+		_, _, upper, upperInclusive = self._intervals[index]
+		if upper is None:
+			return True
+
+		upperKey = upper.SortKey
+		return key < upperKey or (upperInclusive and key == upperKey)
+
+	def __and__(self, other: "VersionSpecifier[V]") -> "VersionSpecifier[V]":
+		"""
+		Compute the intersection of two version specifiers.
+
+		:param other:      Second version specifier.
+		:returns:          New version specifier satisfied by versions satisfying both specifiers.
+		:raises TypeError: If parameter ``other`` is not of type :class:`VersionSpecifier`.
+		"""
+		if not isinstance(other, VersionSpecifier):
+			ex = TypeError(f"Parameter 'other' is not of type 'VersionSpecifier'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
+			raise ex
+
+		return self._FromIntervals(self._versionClass, self._Intersect(self._intervals, other._intervals))
+
+	def __or__(self, other: "VersionSpecifier[V]") -> "VersionSpecifier[V]":
+		"""
+		Compute the union of two version specifiers.
+
+		:param other:      Second version specifier.
+		:returns:          New version specifier satisfied by versions satisfying any of both specifiers.
+		:raises TypeError: If parameter ``other`` is not of type :class:`VersionSpecifier`.
+		"""
+		if not isinstance(other, VersionSpecifier):
+			ex = TypeError(f"Parameter 'other' is not of type 'VersionSpecifier'.")
+			ex.add_note(f"Got type '{getFullyQualifiedName(other)}'.")
+			raise ex
+
+		return self._FromIntervals(self._versionClass, _Normalize(self._intervals + other._intervals))
+
+	def __eq__(self, other: Any) -> bool:
+		"""
+		Compare two version specifiers for equality.
+
+		Specifiers are equal, if their normalized ranges are equal.
+
+		:param other: Second version specifier.
+		:returns:     ``True``, if both specifiers are satisfied by the same versions.
+		"""
+		if not isinstance(other, VersionSpecifier):
+			return NotImplemented
+
+		return self._lowerKeys == other._lowerKeys and [_UpperKey(i) for i in self._intervals] == [_UpperKey(i) for i in other._intervals]
+
+	def __hash__(self) -> int:
+		if self.__hash is None:
+			self.__hash = hash((tuple(self._lowerKeys), tuple(_UpperKey(i) for i in self._intervals)))
+		return self.__hash
+
+	def __bool__(self) -> bool:
+		"""
+		Check if any version satisfies the specifier.
+
+		:returns: ``True``, if the specifier isn't empty.
+		"""
+		return len(self._intervals) > 0
+
+	def __str__(self) -> str:
+		"""
+		Return a canonical string representation of the normalized ranges.
+
+		:returns: Ranges separated by ``||``, ``*`` if any version is allowed or ``<empty>`` if no version is allowed.
+		"""
+		if len(self._intervals) == 0:
+			return "<empty>"
+
+		alternatives = []
+		for lower, lowerInclusive, upper, upperInclusive in self._intervals:
+			if lower is not None and upper is not None and lower.SortKey == upper.SortKey:
+				alternatives.append(f"=={lower}")
+				continue
+
+			clauses = []
+			if lower is not None:
+				clauses.append(f"{'>=' if lowerInclusive else '>'}{lower}")
+			if upper is not None:
+				clauses.append(f"{'<=' if upperInclusive else '<'}{upper}")
+
+			alternatives.append(", ".join(clauses) if len(clauses) > 0 else "*")
+
+		return " || ".join(alternatives)
+
+	def __repr__(self) -> str:
+		return f"VersionSpecifier('{self}')"
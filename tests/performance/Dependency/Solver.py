@@ -0,0 +1,75 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Performance tests for pyTooling.Dependency.Solver."""
+from pyTooling.Exceptions import ToolingException
+from pyTooling.Dependency import SolverAlgorithm
+from . import PerformanceTest
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class DeepConflict(PerformanceTest):
+	def _Solve(self, algorithm: SolverAlgorithm) -> None:
+		def wrapper(count: int):
+			root = self.ConstructDeepConflict(count)
+
+			def func():
+				try:
+					root.SolveLatest(algorithm)
+				except ToolingException:
+					pass
+
+			return func
+
+		self.runSizedTests(wrapper, self.counts)
+
+	def test_Backtracking(self) -> None:
+		self._Solve(SolverAlgorithm.Backtracking)
+
+	def test_ConflictDriven(self) -> None:
+		self._Solve(SolverAlgorithm.ConflictDriven)
+
+
+class RandomGraph(PerformanceTest):
+	def test_Backtracking(self) -> None:
+		def wrapper(count: int):
+			root = self.ConstructRandomGraph(count * 20)
+
+			def func():
+				root.SolveLatest()
+
+			return func
+
+		self.runSizedTests(wrapper, self.counts)
@@ -0,0 +1,98 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Performance tests for pyTooling.Dependency."""
+import timeit
+from random     import Random
+from statistics import median
+from typing     import Callable, Iterable
+from unittest   import TestCase
+
+from pyTooling.Dependency import PackageDependencyGraph, PackageStorage, PackageVersion
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class PerformanceTest(TestCase):
+	counts: Iterable[int] = (6, 8, 10)
+
+	@staticmethod
+	def ConstructDeepConflict(count: int, versionCount: int = 4) -> PackageVersion:
+		"""
+		Create a chain of packages, where each version depends on all versions of the next package. All versions of the
+		second last package require the oldest version of the last package, but the root requires its latest version.
+		"""
+		graph = PackageDependencyGraph("DeepConflict")
+		storage = PackageStorage("storage", graph=graph)
+		packages = [storage.CreatePackageVersions(f"pack{i}", [f"v1.{v}" for v in range(versionCount)]) for i in range(count)]
+
+		for i, (fromVersions, toVersions) in enumerate(zip(packages[:-1], packages[1:])):
+			for fromVersion in fromVersions:
+				if i == count - 2:
+					fromVersion.AddDependencyToPackageVersion(toVersions[0])
+				else:
+					fromVersion.AddDependencyToPackageVersions(toVersions)
+
+		root = packages[0][-1]
+		root.AddDependencyToPackageVersion(packages[-1][-1])
+
+		graph.SortPackageVersions()
+		return root
+
+	@staticmethod
+	def ConstructRandomGraph(count: int, versionCount: int = 6, seed: int = 0) -> PackageVersion:
+		"""
+		Create a random acyclic graph, where each package version depends on a window of versions of three later packages.
+		"""
+		random = Random(seed)
+		graph = PackageDependencyGraph("Random")
+		storage = PackageStorage("storage", graph=graph)
+		packages = [storage.CreatePackageVersions(f"pack{i}", [f"v1.{v}" for v in range(versionCount)]) for i in range(count)]
+
+		for i, fromVersions in enumerate(packages):
+			for fromVersion in fromVersions:
+				for j in random.sample(range(i + 1, count), min(3, count - i - 1)):
+					start = random.randrange(3)
+					fromVersion.AddDependencyToPackageVersions(packages[j][start:start + random.randint(3, 6)])
+
+		graph.SortPackageVersions()
+		return packages[0][-1]
+
+	def runSizedTests(self, func: Callable[[int], Callable[[], None]], counts: Iterable[int]):
+		print()
+		print(f"         min           median        max")
+		for count in counts:
+			results = timeit.repeat(func(count), repeat=5, number=1)
+
+			print(f"{count:>6}x: {min(results):.6f} s    {median(results):.6f} s    {max(results):.6f} s")
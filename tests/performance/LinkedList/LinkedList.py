@@ -100,3 +100,17 @@ class Remove(PerformanceTest):
 			return func
 
 		self.runSizedTests(wrapper, self.counts[:-1])
+
+
+class Iteration(PerformanceTest):
+	def test_IterateFromFirst(self) -> None:
+		def wrapper(count: int):
+			ll = pt_LinkedList(pt_Node(i) for i in range(1, count))
+
+			def func():
+				for _ in ll.IterateFromFirst():
+					pass
+
+			return func
+
+		self.runSizedTests(wrapper, self.counts)
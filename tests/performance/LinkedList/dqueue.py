@@ -64,3 +64,17 @@ class Insertion(PerformanceTest):
 			return func
 
 		self.runSizedTests(wrapper, self.counts)
+
+
+class Iteration(PerformanceTest):
+	def test_IterateFromFirst(self) -> None:
+		def wrapper(count: int):
+			dq = deque(range(1, count))
+
+			def func():
+				for _ in dq:
+					pass
+
+			return func
+
+		self.runSizedTests(wrapper, self.counts)
@@ -171,3 +171,17 @@ class Remove(PerformanceTest):
 			return func
 
 		self.runSizedTests(wrapper, self.counts[:-1])
+
+
+class Iteration(PerformanceTest):
+	def test_IterateFromFirst(self) -> None:
+		def wrapper(count: int):
+			lst = list(range(1, count))
+
+			def func():
+				for _ in lst:
+					pass
+
+			return func
+
+		self.runSizedTests(wrapper, self.counts)
@@ -0,0 +1,416 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____           _     _                                                 #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  / ___|__ _  ___| |__ (_)_ __   __ _                                     #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` || |   / _` |/ __| '_ \| | '_ \ / _` |                                    #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| || |__| (_| | (__| | | | | | | | (_| |                                    #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____\__,_|\___|_| |_|_|_| |_|\__, |                                    #
+# |_|    |___/                          |___/                                |___/                                     #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for pyTooling.Caching."""
+
+from threading import Thread
+from unittest  import TestCase
+
+from pyTooling.MetaClasses import AbstractClassError
+from pyTooling.Caching     import Cache, LRUCache, LFUCache, TTLCache, cached
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Timer:
+	now: float
+
+	def __init__(self) -> None:
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+class Instantiation(TestCase):
+	def test_AbstractCache(self) -> None:
+		with self.assertRaises(AbstractClassError):
+			_ = Cache(4)
+
+	def test_LRUCache(self) -> None:
+		cache = LRUCache(4)
+
+		self.assertEqual(4, cache.MaxSize)
+		self.assertEqual(0, cache.Count)
+		self.assertEqual(0, len(cache))
+		self.assertFalse(cache.IsThreadSafe)
+		self.assertEqual(0, cache.Statistics.Lookups)
+		self.assertEqual(0.0, cache.Statistics.HitRatio)
+
+	def test_ThreadSafe(self) -> None:
+		cache = LFUCache(4, threadSafe=True)
+
+		self.assertTrue(cache.IsThreadSafe)
+
+	def test_TTLCache(self) -> None:
+		cache = TTLCache(4, 1.5)
+
+		self.assertEqual(1.5, cache.TTL)
+
+	def test_WrongMaxSize(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = LRUCache("4")
+
+		with self.assertRaises(ValueError):
+			_ = LRUCache(0)
+
+	def test_WrongTTL(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = TTLCache(4, "1")
+
+		with self.assertRaises(ValueError):
+			_ = TTLCache(4, 0)
+
+	def test_NoneKey(self) -> None:
+		cache = LRUCache(4)
+
+		with self.assertRaises(ValueError):
+			cache[None] = 1
+
+
+class LRU(TestCase):
+	def test_GetSet(self) -> None:
+		cache = LRUCache(2)
+		cache["a"] = 1
+		cache["b"] = None
+
+		self.assertEqual(1, cache["a"])
+		self.assertIsNone(cache["b"])
+		self.assertEqual(5, cache.Get("c", 5))
+		with self.assertRaises(KeyError):
+			_ = cache["c"]
+
+		self.assertEqual(2, cache.Statistics.Hits)
+		self.assertEqual(2, cache.Statistics.Misses)
+		self.assertEqual(0.5, cache.Statistics.HitRatio)
+
+	def test_Eviction(self) -> None:
+		cache = LRUCache(3)
+		for key in "abc":
+			cache[key] = key.upper()
+
+		_ = cache["a"]
+		cache["d"] = "D"
+
+		self.assertNotIn("b", cache)
+		self.assertIn("a", cache)
+		self.assertEqual(3, len(cache))
+		self.assertEqual(1, cache.Statistics.Evictions)
+
+		cache["c"] = "C2"
+		cache["e"] = "E"
+
+		self.assertNotIn("a", cache)
+		self.assertEqual("C2", cache["c"])
+
+	def test_ContainsDoesNotTouch(self) -> None:
+		cache = LRUCache(2)
+		cache["a"] = 1
+		cache["b"] = 2
+
+		self.assertIn("a", cache)
+		cache["c"] = 3
+
+		self.assertNotIn("a", cache)
+		self.assertEqual(0, cache.Statistics.Lookups)
+
+	def test_RemoveClear(self) -> None:
+		cache = LRUCache(2)
+		cache["a"] = 1
+		cache["b"] = 2
+
+		self.assertEqual(1, cache.Remove("a"))
+		del cache["b"]
+		with self.assertRaises(KeyError):
+			cache.Remove("a")
+
+		cache["c"] = 3
+		cache.Clear()
+
+		self.assertEqual(0, len(cache))
+
+
+class LFU(TestCase):
+	def test_Eviction(self) -> None:
+		cache = LFUCache(3)
+		for key in "abc":
+			cache[key] = key.upper()
+
+		_ = cache["a"]
+		_ = cache["a"]
+		_ = cache["c"]
+		cache["d"] = "D"
+
+		self.assertNotIn("b", cache)
+		self.assertEqual(3, cache.GetFrequency("a"))
+		self.assertEqual(2, cache.GetFrequency("c"))
+		self.assertEqual(1, cache.GetFrequency("d"))
+
+		cache["e"] = "E"
+
+		self.assertNotIn("d", cache)
+		self.assertEqual(2, cache.Statistics.Evictions)
+
+	def test_TieBrokenByRecency(self) -> None:
+		cache = LFUCache(3)
+		for key in "abc":
+			cache[key] = key
+
+		for key in "cba":
+			_ = cache[key]
+
+		cache["d"] = "d"
+
+		self.assertNotIn("c", cache)
+		self.assertIn("a", cache)
+		self.assertIn("b", cache)
+
+	def test_Update(self) -> None:
+		cache = LFUCache(2)
+		cache["a"] = 1
+		cache["a"] = 2
+
+		self.assertEqual(2, cache["a"])
+		self.assertEqual(3, cache.GetFrequency("a"))
+
+	def test_RemoveClear(self) -> None:
+		cache = LFUCache(3)
+		for key in "abc":
+			cache[key] = key
+
+		_ = cache["b"]
+
+		self.assertEqual("b", cache.Remove("b"))
+		self.assertEqual(2, len(cache))
+		with self.assertRaises(KeyError):
+			cache.GetFrequency("b")
+
+		cache.Clear()
+		cache["x"] = 1
+
+		self.assertEqual(1, len(cache))
+		self.assertEqual(1, cache.GetFrequency("x"))
+
+
+class TTL(TestCase):
+	def test_Expiration(self) -> None:
+		timer = Timer()
+		cache = TTLCache(4, 10, timer=timer)
+		cache["a"] = 1
+		timer.now = 5
+		cache["b"] = 2
+
+		timer.now = 9.5
+		self.assertEqual(1, cache["a"])
+		self.assertIn("a", cache)
+
+		timer.now = 10
+		self.assertNotIn("a", cache)
+		self.assertIsNone(cache.Get("a"))
+		self.assertEqual(2, cache["b"])
+		self.assertEqual(1, cache.Statistics.Expirations)
+
+	def test_Refresh(self) -> None:
+		timer = Timer()
+		cache = TTLCache(4, 10, timer=timer)
+		cache["a"] = 1
+		cache["b"] = 2
+		timer.now = 8
+		cache["a"] = 3
+
+		timer.now = 12
+		self.assertNotIn("b", cache)
+		self.assertEqual(3, cache["a"])
+
+	def test_Expire(self) -> None:
+		timer = Timer()
+		cache = TTLCache(4, 10, timer=timer)
+		for i, key in enumerate("abc"):
+			timer.now = i
+			cache[key] = i
+
+		timer.now = 11.5
+		self.assertEqual(2, cache.Expire())
+		self.assertEqual(1, len(cache))
+		self.assertEqual(2, cache.Statistics.Expirations)
+
+	def test_EvictionAndPurge(self) -> None:
+		timer = Timer()
+		cache = TTLCache(2, 10, timer=timer)
+		cache["a"] = 1
+		timer.now = 1
+		cache["b"] = 2
+		cache["c"] = 3
+
+		self.assertNotIn("a", cache)
+		self.assertEqual(1, cache.Statistics.Evictions)
+
+		timer.now = 20
+		cache["d"] = 4
+
+		self.assertEqual(1, len(cache))
+		self.assertEqual(2, cache.Statistics.Expirations)
+		self.assertEqual(1, cache.Statistics.Evictions)
+
+
+class Decorator(TestCase):
+	def test_Function(self) -> None:
+		calls = []
+
+		@cached(maxSize=2)
+		def square(value: int) -> int:
+			calls.append(value)
+			return value * value
+
+		self.assertEqual(4, square(2))
+		self.assertEqual(4, square(2))
+		self.assertEqual(9, square(3))
+		self.assertEqual(16, square(4))
+		self.assertEqual(4, square(2))
+		self.assertListEqual([2, 3, 4, 2], calls)
+
+		self.assertEqual("square", square.__name__)
+		self.assertIsInstance(square.__cache__, LRUCache)
+		self.assertEqual(1, square.__cache__.Statistics.Hits)
+		self.assertEqual(4, square.__cache__.Statistics.Misses)
+		self.assertEqual(2, square.__cache__.Statistics.Evictions)
+
+	def test_KeywordArguments(self) -> None:
+		calls = []
+
+		@cached()
+		def join(a: str, b: str = "", *, sep: str = "") -> str:
+			calls.append((a, b, sep))
+			return sep.join((a, b))
+
+		self.assertEqual("ab", join("a", "b"))
+		self.assertEqual("a-b", join("a", "b", sep="-"))
+		self.assertEqual("a-b", join("a", "b", sep="-"))
+		self.assertEqual(2, len(calls))
+
+	def test_ReusedDecorator(self) -> None:
+		memo = cached()
+
+		@memo
+		def double(value: int) -> int:
+			return 2 * value
+
+		@memo
+		def triple(value: int) -> int:
+			return 3 * value
+
+		self.assertEqual(2, double(1))
+		self.assertEqual(3, triple(1))
+		self.assertIsNot(double.__cache__, triple.__cache__)
+
+	def test_Typed(self) -> None:
+		@cached()
+		def untyped(value, other):
+			return type(value)
+
+		@cached(typed=True)
+		def typed(value, other):
+			return type(value)
+
+		self.assertIs(int, untyped(1, 0))
+		self.assertIs(int, untyped(True, 0))
+		self.assertIs(int, typed(1, 0))
+		self.assertIs(bool, typed(True, 0))
+		self.assertIs(float, typed(1.0, other=0))
+		self.assertIs(int, typed(1, other=0))
+
+	def test_CachedNone(self) -> None:
+		calls = []
+
+		@cached(policy=LFUCache)
+		def nothing(value: int) -> None:
+			calls.append(value)
+
+		nothing(1)
+		nothing(1)
+
+		self.assertEqual(1, len(calls))
+		self.assertIsInstance(nothing.__cache__, LFUCache)
+
+	def test_TTL(self) -> None:
+		@cached(ttl=60)
+		def identity(value: int) -> int:
+			return value
+
+		self.assertEqual(1, identity(1))
+		self.assertIsInstance(identity.__cache__, TTLCache)
+		self.assertEqual(60, identity.__cache__.TTL)
+
+		with self.assertRaises(ValueError):
+			cached(ttl=60, policy=LRUCache)
+
+	def test_Method(self) -> None:
+		class Data:
+			calls: int
+
+			def __init__(self) -> None:
+				self.calls = 0
+
+			@cached(maxSize=8)
+			def Compute(self, value: int) -> int:
+				self.calls += 1
+				return value + 1
+
+		data1 = Data()
+		data2 = Data()
+
+		self.assertEqual(2, data1.Compute(1))
+		self.assertEqual(2, data1.Compute(1))
+		self.assertEqual(2, data2.Compute(1))
+		self.assertEqual(1, data1.calls)
+		self.assertEqual(1, data2.calls)
+
+	def test_ThreadSafety(self) -> None:
+		@cached(maxSize=16)
+		def identity(value: int) -> int:
+			return value
+
+		def worker() -> None:
+			for i in range(2000):
+				self.assertEqual(i % 32, identity(i % 32))
+
+		threads = [Thread(target=worker) for _ in range(4)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		statistics = identity.__cache__.Statistics
+		self.assertEqual(8000, statistics.Lookups)
+		self.assertLessEqual(len(identity.__cache__), 16)
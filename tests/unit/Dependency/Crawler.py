@@ -0,0 +1,263 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for :mod:`pyTooling.Dependency.Crawler`."""
+from asyncio                        import run as asyncio_run, gather as asyncio_gather, get_running_loop
+from http.server                    import ThreadingHTTPServer, BaseHTTPRequestHandler
+from json                           import dumps
+from tempfile                       import TemporaryDirectory
+from threading                      import Thread, Lock
+from time                           import sleep
+from unittest                       import TestCase
+
+from pyTooling.Exceptions           import ToolingException
+from pyTooling.Dependency.Crawler   import HostRateLimiter, PackageIndexCrawler
+from pyTooling.Dependency.HTTPCache import DirectoryResponseStore
+from pyTooling.Dependency.Python    import PythonPackageDependencyGraph, PythonPackageIndex
+
+from .Fixtures                      import project as fixtureProject
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def project(name: str, versions, requirements=()):
+	return fixtureProject(name, versions, requirements, baseURL="https://index.org/", keyPrefix="/pypi/", lowerCaseKey=True)
+
+
+class StandInIndex(ThreadingHTTPServer):
+	"""A local HTTP server serving fixture JSON documents like the PyPI JSON API."""
+	daemon_threads = True
+
+	def __init__(self, fixtures, delay: float = 0.0) -> None:
+		super().__init__(("127.0.0.1", 0), StandInHandler)
+
+		self.fixtures = {path: dumps(document).encode("utf-8") for path, document in fixtures.items()}
+		self.failures = {}      # path -> number of remaining 503 answers
+		self.delay = delay
+		self.lock = Lock()
+		self.requests = []
+		self.notModified = 0
+		self.inFlight = 0
+		self.maxInFlight = 0
+
+	@property
+	def API(self) -> str:
+		return f"http://127.0.0.1:{self.server_address[1]}/pypi/"
+
+	def __enter__(self):
+		Thread(target=self.serve_forever, daemon=True).start()
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.shutdown()
+		self.server_close()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+	def do_GET(self) -> None:
+		server: StandInIndex = self.server
+		with server.lock:
+			server.requests.append(self.path)
+			server.inFlight += 1
+			server.maxInFlight = max(server.maxInFlight, server.inFlight)
+			failures = server.failures.get(self.path, 0)
+			if failures > 0:
+				server.failures[self.path] = failures - 1
+
+		try:
+			sleep(server.delay)
+
+			body = server.fixtures.get(self.path)
+			etag = f"\"{hash(body)}\""
+			if failures > 0:
+				self.send_response(503)
+				self.send_header("Content-Length", "0")
+				self.end_headers()
+			elif body is None:
+				self.send_response(404)
+				self.send_header("Content-Length", "0")
+				self.end_headers()
+			elif self.headers.get("If-None-Match") == etag:
+				with server.lock:
+					server.notModified += 1
+				self.send_response(304)
+				self.end_headers()
+			else:
+				self.send_response(200)
+				self.send_header("Content-Type", "application/json")
+				self.send_header("Content-Length", str(len(body)))
+				self.send_header("ETag", etag)
+				self.end_headers()
+				self.wfile.write(body)
+		finally:
+			with server.lock:
+				server.inFlight -= 1
+
+	def log_message(self, format, *args) -> None:
+		pass
+
+
+FIXTURES = {
+	**project("app", ["1.0.0", "2.0.0"], ["Lib-A>=1.0", "lib_b"]),
+	**project("lib-a", ["1.0.0", "1.1.0"], ["lib-c<2"]),
+	**project("lib-b", ["0.9.0"]),
+	**project("lib-c", ["1.0.0", "2.0.0"]),
+}
+
+
+def newIndex(api: str, **kwargs) -> PythonPackageIndex:
+	graph = PythonPackageDependencyGraph("graph")
+	return PythonPackageIndex("index", "https://index.org/", api, graph=graph, **kwargs)
+
+
+class RateLimiting(TestCase):
+	def test_Interval(self) -> None:
+		limiter = HostRateLimiter(50)
+
+		async def measure():
+			loop = get_running_loop()
+			start = loop.time()
+			await asyncio_gather(*(limiter.Wait("index.org") for _ in range(5)))
+			await limiter.Wait("other.org")
+			return loop.time() - start
+
+		self.assertAlmostEqual(0.02, limiter.Interval)
+		self.assertGreaterEqual(asyncio_run(measure()), 0.075)
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			HostRateLimiter("10")
+
+		with self.assertRaises(ValueError):
+			HostRateLimiter(0)
+
+
+class Crawling(TestCase):
+	def test_TransitiveClosure(self) -> None:
+		with StandInIndex(FIXTURES) as server:
+			index = newIndex(server.API)
+			crawler = PackageIndexCrawler(index, concurrency=4)
+			projects = crawler.Crawl("app")
+
+		self.assertSetEqual({"app", "lib-a", "lib-b", "lib-c"}, set(projects.keys()))
+		self.assertEqual(11, crawler.RequestCount)
+		self.assertEqual(0, len(crawler.Failures))
+
+		# breadth-first: all projects of a level are requested before the next level
+		projectRequests = [path for path in server.requests if path.count("/") == 3]
+		self.assertEqual("/pypi/app/json", projectRequests[0])
+		self.assertEqual("/pypi/lib-c/json", projectRequests[-1])
+
+		app = projects["app"]
+		self.assertEqual(2, app.ReleaseCount)
+		latest = app.LatestRelease
+		self.assertEqual(2, len(latest.DependsOn))
+		self.assertEqual(["1.1.0", "1.0.0"], [str(v) for v in latest.DependsOn[projects["lib-a"]]])
+
+		solution = latest.SolveLatest()
+		self.assertListEqual(["app 2.0.0", "lib-a 1.1.0", "lib-b 0.9.0", "lib-c 1.0.0"], sorted(f"{pv.Package.Name} {pv.Version}" for pv in solution))
+
+	def test_MaxDepth(self) -> None:
+		with StandInIndex(FIXTURES) as server:
+			projects = PackageIndexCrawler(newIndex(server.API)).Crawl(["app"], maxDepth=1)
+
+		self.assertSetEqual({"app", "lib-a", "lib-b"}, set(projects.keys()))
+		self.assertEqual(0, len(projects["lib-a"].LatestRelease.DependsOn))
+
+	def test_ConcurrencyLimit(self) -> None:
+		with StandInIndex(FIXTURES, delay=0.02) as server:
+			PackageIndexCrawler(newIndex(server.API), concurrency=2).Crawl(["app"])
+
+		self.assertEqual(2, server.maxInFlight)
+
+	def test_Retry(self) -> None:
+		with StandInIndex(FIXTURES) as server:
+			server.failures["/pypi/lib-b/json"] = 2
+
+			crawler = PackageIndexCrawler(newIndex(server.API), retries=2, backoff=0.001)
+			projects = crawler.Crawl(["app"])
+
+		self.assertIn("lib-b", projects)
+		self.assertEqual(2, crawler.RetryCount)
+		self.assertEqual(13, crawler.RequestCount)
+
+	def test_RetriesExhausted(self) -> None:
+		with StandInIndex(FIXTURES) as server:
+			server.failures["/pypi/lib-b/json"] = 3
+			server.failures["/pypi/lib-a/1.0.0/json"] = 3
+
+			crawler = PackageIndexCrawler(newIndex(server.API), retries=1, backoff=0.001)
+			projects = crawler.Crawl(["app"])
+
+			server.failures["/pypi/app/json"] = 3
+			with self.assertRaises(ToolingException):
+				PackageIndexCrawler(newIndex(server.API), retries=1, backoff=0.001).Crawl(["app"])
+
+		self.assertNotIn("lib-b", projects)
+		self.assertSetEqual({"lib-b", "lib-a==1.0.0"}, set(crawler.Failures.keys()))
+		self.assertEqual(1, projects["lib-a"].ReleaseCount)
+
+	def test_NotFound(self) -> None:
+		with StandInIndex(FIXTURES) as server:
+			with self.assertRaises(ToolingException):
+				PackageIndexCrawler(newIndex(server.API)).Crawl(["unknown"])
+
+		self.assertEqual(1, len(server.requests))
+
+	def test_ConditionalRequests(self) -> None:
+		with TemporaryDirectory() as directory, StandInIndex(FIXTURES) as server:
+			cache = DirectoryResponseStore(directory)
+			PackageIndexCrawler(newIndex(server.API, responseCache=cache)).Crawl(["app"])
+			self.assertEqual(11, len(cache))
+			self.assertEqual(0, server.notModified)
+
+			projects = PackageIndexCrawler(newIndex(server.API, responseCache=cache)).Crawl(["app"])
+			self.assertEqual(11, server.notModified)
+
+			requestCount = len(server.requests)
+			offline = PackageIndexCrawler(newIndex(server.API, responseCache=cache, offline=True)).Crawl(["app"])
+			self.assertEqual(requestCount, len(server.requests))
+
+		self.assertSetEqual(set(projects.keys()), set(offline.keys()))
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			PackageIndexCrawler(None)
+
+		index = newIndex("http://127.0.0.1/pypi/")
+		with self.assertRaises(ValueError):
+			PackageIndexCrawler(index, concurrency=0)
+
+		with self.assertRaises(ValueError):
+			PackageIndexCrawler(index, retries=-1)
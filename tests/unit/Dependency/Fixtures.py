@@ -0,0 +1,78 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Fixture documents of the PyPI JSON API for unit tests of :mod:`pyTooling.Dependency`.
+
+:copyright: Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany
+:license: Apache License, Version 2.0
+"""
+from typing import Any, Dict, Iterable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def project(
+	name:         str,
+	versions:     Iterable[str],
+	requirements: Iterable[str] = (),
+	*,
+	baseURL:      str = "https://pypi.org/",
+	keyPrefix:    str = "",
+	lowerCaseKey: bool = False
+) -> Dict[str, Dict[str, Any]]:
+	"""
+	Create the JSON documents of a project and its releases.
+
+	:param name:         Project name as stated in the documents.
+	:param versions:     Release versions.
+	:param requirements: Requirements (``requires_dist``) of every release.
+	:param baseURL:      Base URL of project pages and release files.
+	:param keyPrefix:    Prefix of every document key, e.g. an URL path.
+	:param lowerCaseKey: If true, the project name is lower-cased in document keys.
+	:returns:            Dictionary of documents by key: ``<prefix><name>/json`` and ``<prefix><name>/<version>/json``.
+	"""
+	versions = list(versions)
+	requirements = list(requirements)
+
+	projectNode = {
+		"info": {"name": name, "project_url": f"{baseURL}project/{name}/"},
+		"releases": {version: [{"filename": f"{name}-{version}.tar.gz", "url": f"{baseURL}{name}-{version}.tar.gz", "upload_time_iso_8601": "2026-01-01T00:00:00+00:00"}] for version in versions}
+	}
+	releaseNode = {"info": {"provides_extra": None, "requires_dist": requirements if len(requirements) > 0 else None}}
+
+	key = f"{keyPrefix}{name.lower() if lowerCaseKey else name}"
+	documents = {f"{key}/json": projectNode}
+	documents.update({f"{key}/{version}/json": releaseNode for version in versions})
+	return documents
@@ -0,0 +1,193 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for :mod:`pyTooling.Dependency.HTTPCache`."""
+from pathlib                        import Path
+from tempfile                       import TemporaryDirectory
+from threading                      import Thread
+from unittest                       import TestCase
+
+from pyTooling.Dependency.HTTPCache import CachedResponse, DirectoryResponseStore, SQLiteResponseStore
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+URL1 = "https://pypi.org/pypi/pytooling/json"
+URL2 = "https://pypi.org/pypi/pyversioning/json"
+
+
+class Response(TestCase):
+	def test_ConditionalHeaders(self) -> None:
+		response = CachedResponse(URL1, b"{}", "\"abc\"", "Sat, 17 Oct 2026 10:00:00 GMT")
+
+		self.assertDictEqual({"If-None-Match": "\"abc\"", "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT"}, response.ConditionalHeaders)
+		self.assertDictEqual({}, CachedResponse(URL1, b"{}").ConditionalHeaders)
+
+	def test_JSON(self) -> None:
+		response = CachedResponse(URL1, b'{"info": {"name": "pyTooling"}}')
+
+		self.assertEqual("pyTooling", response.JSON()["info"]["name"])
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			CachedResponse(1, b"")
+
+		with self.assertRaises(TypeError):
+			CachedResponse(URL1, "{}")
+
+
+class Stores(TestCase):
+	def _CheckStore(self, store) -> None:
+		self.assertEqual(0, len(store))
+		self.assertIsNone(store.Lookup(URL1))
+
+		store.Store(URL1, b'{"version": 1}', "\"v1\"", "Sat, 17 Oct 2026 10:00:00 GMT")
+		store.Store(URL2, b'{"version": 2}')
+
+		self.assertEqual(2, len(store))
+		self.assertIn(URL1, store)
+
+		response = store.Lookup(URL1)
+		self.assertEqual(URL1, response.URL)
+		self.assertEqual(b'{"version": 1}', response.Body)
+		self.assertEqual("\"v1\"", response.ETag)
+		self.assertEqual("Sat, 17 Oct 2026 10:00:00 GMT", response.LastModified)
+		self.assertIsNone(store.Lookup(URL2).ETag)
+
+		store.Store(URL1, b'{"version": 3}', "\"v3\"")
+		self.assertEqual(2, len(store))
+		response = store.Lookup(URL1)
+		self.assertEqual(3, response.JSON()["version"])
+
+		revalidated = store.Revalidated(response)
+		self.assertGreaterEqual(revalidated.Timestamp, response.Timestamp)
+		response = store.Lookup(URL1)
+		self.assertEqual(b'{"version": 3}', response.Body)
+		self.assertEqual("\"v3\"", response.ETag)
+		self.assertAlmostEqual(revalidated.Timestamp, response.Timestamp, places=3)
+
+		self.assertEqual(4, store.Statistics.Hits)
+		self.assertEqual(1, store.Statistics.Misses)
+
+		self.assertTrue(store.Remove(URL2))
+		self.assertFalse(store.Remove(URL2))
+		self.assertEqual(1, len(store))
+
+		store.Clear()
+		self.assertEqual(0, len(store))
+		self.assertEqual(0, store.Statistics.Lookups)
+
+	def test_Directory(self) -> None:
+		with TemporaryDirectory() as directory:
+			store = DirectoryResponseStore(Path(directory) / "cache")
+			self._CheckStore(store)
+
+	def test_DirectoryConcurrentWriters(self) -> None:
+		errors = []
+
+		def worker(store: DirectoryResponseStore, version: int) -> None:
+			try:
+				for _ in range(200):
+					store.Store(URL1, f'{{"version": {version}}}'.encode("utf-8"))
+			except Exception as ex:  # pragma: no cover
+				errors.append(ex)
+
+		with TemporaryDirectory() as directory:
+			# Separate store instances don't share a lock, like stores in separate processes.
+			threads = [Thread(target=worker, args=(DirectoryResponseStore(directory), version)) for version in range(4)]
+			for thread in threads:
+				thread.start()
+			for thread in threads:
+				thread.join()
+
+			self.assertListEqual([], errors)
+			self.assertIn(DirectoryResponseStore(directory).Lookup(URL1).JSON()["version"], range(4))
+			self.assertListEqual([], list(Path(directory).glob("*.tmp")))
+
+	def test_DirectoryCorruptEntry(self) -> None:
+		with TemporaryDirectory() as directory:
+			store = DirectoryResponseStore(directory)
+			store.Store(URL1, b'{"version": 1}')
+			path = store._GetPath(URL1)
+
+			for content in (b'{"url": "', b'["url"]', b'\xff\xfe'):
+				with self.subTest(content=content):
+					path.write_bytes(content)
+
+					self.assertIsNone(store.Lookup(URL1))
+					self.assertFalse(path.exists())
+
+					store.Store(URL1, b'{"version": 1}')
+
+			self.assertEqual(3, store.Statistics.Misses)
+
+	def test_RevalidatedRemoved(self) -> None:
+		with TemporaryDirectory() as directory:
+			for store in (DirectoryResponseStore(directory), SQLiteResponseStore(Path(directory) / "cache.sqlite")):
+				with self.subTest(store=store):
+					response = store.Store(URL1, b'{"version": 1}', "\"v1\"")
+					store.Remove(URL1)
+					store.Revalidated(response)
+
+					self.assertEqual("\"v1\"", store.Lookup(URL1).ETag)
+
+			store.Close()
+
+	def test_SQLite(self) -> None:
+		with TemporaryDirectory() as directory:
+			store = SQLiteResponseStore(Path(directory) / "cache.sqlite")
+			self._CheckStore(store)
+			store.Close()
+
+	def test_Persistence(self) -> None:
+		with TemporaryDirectory() as directory:
+			store = DirectoryResponseStore(directory)
+			store.Store(URL1, b'{"name": "pyTooling"}', "\"abc\"")
+			self.assertEqual("\"abc\"", DirectoryResponseStore(directory).Lookup(URL1).ETag)
+
+			path = Path(directory) / "cache.sqlite"
+			store = SQLiteResponseStore(path)
+			store.Store(URL1, b'{"name": "pyTooling"}', "\"abc\"")
+			store.Close()
+
+			store = SQLiteResponseStore(str(path))
+			self.assertEqual("\"abc\"", store.Lookup(URL1).ETag)
+			store.Close()
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			DirectoryResponseStore(1)
+
+		with self.assertRaises(TypeError):
+			SQLiteResponseStore(1)
@@ -0,0 +1,261 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for :mod:`pyTooling.Dependency.Lockfile`."""
+from pathlib                       import Path
+from tempfile                      import TemporaryDirectory
+from unittest                      import TestCase
+
+from pyTooling.Versioning          import SemanticVersion
+from pyTooling.Dependency          import PackageDependencyGraph, PackageStorage, PackageVersion, SolverAlgorithm
+from pyTooling.Dependency.Lockfile import Lockfile, LockedPackageVersion, LockfileMismatchError
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def createGraph():
+	graph = PackageDependencyGraph("graph")
+	storage = PackageStorage("storage", graph=graph)
+	root = storage.CreatePackageVersion("app", "v1.0")
+
+	storage.CreatePackageVersions("packA", ("v1.0", "v2.0"))
+	storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+
+	root.AddDependencyTo("packA", ("v1.0", "v2.0"))
+	root.AddDependencyTo("packB", ("v1.0", "v2.0"))
+	storage["packA"]["v2.0"].AddDependencyTo("packB", "v1.0")
+
+	graph.SortPackageVersions()
+	return graph, storage, root
+
+
+class Serialization(TestCase):
+	def test_Deterministic(self) -> None:
+		graph1, _, root1 = createGraph()
+		graph2, _, root2 = createGraph()
+
+		lockfile1 = Lockfile.FromSolution(root1, root1.SolveLatest())
+		lockfile2 = Lockfile.FromSolution(root2, reversed(root2.SolveLatest()))
+
+		self.assertEqual(lockfile1, lockfile2)
+		self.assertEqual(lockfile1.ToTOML(), lockfile2.ToTOML())
+		self.assertEqual(lockfile1.ToJSON(), lockfile2.ToJSON())
+		self.assertListEqual(["app", "packA", "packB"], [package.Package for package in lockfile1.Packages])
+		self.assertTrue(lockfile1.ContentHash.startswith("sha256:"))
+
+	def test_RoundTrip(self) -> None:
+		graph, _, root = createGraph()
+		lockfile = Lockfile.FromSolution(root, root.SolveLatest(), SolverAlgorithm.ConflictDriven)
+
+		for format, content in (("toml", lockfile.ToTOML()), ("json", lockfile.ToJSON())):
+			with self.subTest(format=format):
+				parsed = Lockfile.Parse(content, format)
+
+				self.assertEqual(lockfile, parsed)
+				self.assertIs(SolverAlgorithm.ConflictDriven, parsed.Algorithm)
+				self.assertEqual(lockfile.Root, parsed.Root)
+				self.assertTupleEqual(lockfile.Packages, parsed.Packages)
+
+	def test_Files(self) -> None:
+		graph, _, root = createGraph()
+		lockfile = Lockfile.FromSolution(root, root.SolveLatest())
+
+		with TemporaryDirectory() as directory:
+			for name in ("deps.lock.toml", "deps.lock.json"):
+				path = Path(directory) / name
+				lockfile.Write(path)
+				self.assertEqual(lockfile, Lockfile.Read(path))
+
+			with self.assertRaises(ValueError):
+				lockfile.Write(Path(directory) / "deps.lock")
+
+	def test_Malformed(self) -> None:
+		graph, _, root = createGraph()
+		content = Lockfile.FromSolution(root, root.SolveLatest()).ToJSON()
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.Parse(content.replace("packB", "packC"), "json")
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.Parse(content.replace('"version": 1', '"version": 2'), "json")
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.Parse("{", "json")
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.Parse("version = ", "toml")
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.Parse('{"version": 1}', "json")
+
+		with self.assertRaises(ValueError):
+			Lockfile.Parse(content, "yaml")
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			LockedPackageVersion("storage", "package", 1, "sha256:")
+
+		with self.assertRaises(TypeError):
+			Lockfile(None, [])
+
+		root = LockedPackageVersion("storage", "package", "1.0", "sha256:")
+		with self.assertRaises(TypeError):
+			Lockfile(root, [], "Backtracking")
+
+
+class Verification(TestCase):
+	def test_Verify(self) -> None:
+		graph, storage, root = createGraph()
+		solution = root.SolveLatest()
+		lockfile = Lockfile.Parse(Lockfile.FromSolution(root, solution).ToTOML(), "toml")
+
+		graph2, storage2, root2 = createGraph()
+		cache = graph2.ResolutionCache
+		verified = lockfile.Verify(graph2)
+
+		self.assertIs(root2, verified[0])
+		self.assertSetEqual({(pv.Package.Name, pv.Version) for pv in solution}, {(pv.Package.Name, pv.Version) for pv in verified})
+		self.assertEqual(0, cache.SolutionCount)
+
+	def test_VerifiedIsNotLatest(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+		storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+		storage.CreatePackageVersions("packC", ("v1.0", "v2.0"))
+		root.AddDependencyTo("packB", ("v1.0", "v2.0"))
+		root.AddDependencyTo("packC", "v2.0")
+		storage["packB"]["v2.0"].AddDependencyTo("packC", "v1.0")
+		graph.SortPackageVersions()
+
+		lockfile = Lockfile.FromSolution(root, root.SolveLatest())
+		self.assertEqual("v1.0", {pv.Package.Name: pv.Version for pv in lockfile.Verify(graph)}["packB"])
+
+		# packB v2.0 isn't locked, thus its changed declaration doesn't invalidate the lockfile ...
+		storage["packB"]["v2.0"].AddDependencyTo("packC", "v2.0")
+		self.assertEqual("v1.0", {pv.Package.Name: pv.Version for pv in lockfile.Verify(graph)}["packB"])
+
+		# ... but SolveLatest must not return the stale locked solution.
+		self.assertEqual("v2.0", {pv.Package.Name: pv.Version for pv in root.SolveLatest()}["packB"])
+
+	def test_ChangedDependencies(self) -> None:
+		graph, storage, root = createGraph()
+		lockfile = Lockfile.FromSolution(root, root.SolveLatest())
+
+		PackageVersion(SemanticVersion.Parse("v3.0"), storage["packA"])
+		self.assertTrue(lockfile.IsValid(graph))
+
+		root.AddDependencyTo("packA", "v3.0")
+		with self.assertRaises(LockfileMismatchError) as context:
+			lockfile.Verify(graph)
+
+		self.assertEqual(1, len(context.exception.Mismatches))
+		self.assertIn("Dependencies of package version 'storage/app@", context.exception.Mismatches[0])
+
+	def test_MissingPackage(self) -> None:
+		graph, storage, root = createGraph()
+		lockfile = Lockfile.FromSolution(root, root.SolveLatest())
+
+		graph2 = PackageDependencyGraph("graph")
+		storage2 = PackageStorage("storage", graph=graph2)
+		storage2.CreatePackageVersion("app", "v1.0")
+
+		self.assertFalse(lockfile.IsValid(graph2))
+
+	def test_Inconsistent(self) -> None:
+		graph, storage, root = createGraph()
+		inconsistent = [root, storage["packA"]["v2.0"], storage["packB"]["v2.0"]]
+		lockfile = Lockfile.FromSolution(root, inconsistent)
+
+		with self.assertRaises(LockfileMismatchError) as context:
+			lockfile.Verify(graph)
+
+		self.assertEqual(1, len(context.exception.Mismatches))
+		self.assertIn("Locked version 'v2.0' of 'packB'", context.exception.Mismatches[0])
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.FromSolution(root, inconsistent[:2]).Verify(graph)
+
+		with self.assertRaises(LockfileMismatchError):
+			Lockfile.FromSolution(root, inconsistent[1:]).Verify(graph)
+
+
+class Graph(TestCase):
+	def test_WriteAndRead(self) -> None:
+		graph, storage, root = createGraph()
+
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / "deps.lock.toml"
+			lockfile = graph.WriteLockfile(path, root)
+
+			self.assertEqual(lockfile, Lockfile.Read(path))
+
+			graph2, storage2, root2 = createGraph()
+			solution = graph2.ReadLockfile(path)
+
+		self.assertIs(root2, solution[0])
+		self.assertEqual(3, len(solution))
+
+	def test_SolveLocked(self) -> None:
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / "deps.lock.json"
+
+			graph, storage, root = createGraph()
+			solution = graph.SolveLocked(path, root)
+			content = path.read_text()
+
+			graph2, storage2, root2 = createGraph()
+			solution2 = graph2.SolveLocked(path, root2)
+			self.assertEqual(0, graph2.ResolutionCache.SolutionCount)
+			self.assertEqual(0, graph2.ResolutionCache.SolutionStatistics.Misses)
+			self.assertEqual(content, path.read_text())
+
+			root2.AddDependencyTo("packB", "v2.0")  # packB v2.0 is already allowed: no change
+			storage2["packA"]["v2.0"].AddDependencyTo("packB", "v2.0")
+			solution3 = graph2.SolveLocked(path, root2)
+			self.assertNotEqual(content, path.read_text())
+
+		self.assertSetEqual({(pv.Package.Name, pv.Version) for pv in solution}, {(pv.Package.Name, pv.Version) for pv in solution2})
+		self.assertEqual("v2.0", {pv.Package.Name: pv.Version for pv in solution3}["packB"])
+
+	def test_InvalidParameters(self) -> None:
+		graph, storage, root = createGraph()
+		graph2, storage2, root2 = createGraph()
+
+		with TemporaryDirectory() as directory:
+			with self.assertRaises(TypeError):
+				graph.WriteLockfile(Path(directory) / "deps.lock.toml", None)
+
+			with self.assertRaises(ValueError):
+				graph.WriteLockfile(Path(directory) / "deps.lock.toml", root2)
@@ -29,13 +29,16 @@
 # ==================================================================================================================== #
 #
 """Unit tests for :mod:`pyTooling.Dependency`."""
-from datetime                    import datetime
-from unittest                    import TestCase
+from datetime                       import datetime
+from json                           import dumps
+from tempfile                       import TemporaryDirectory
+from unittest                       import TestCase
 
-from pytest                      import mark
+from pytest                         import mark
 
-from pyTooling.Dependency.Python import PythonPackageDependencyGraph, PythonPackageIndex, Project, Release, LazyLoaderState
-from pyTooling.Versioning        import PythonVersion
+from pyTooling.Dependency.HTTPCache import DirectoryResponseStore, OfflineCacheMissError
+from pyTooling.Dependency.Python    import PythonPackageDependencyGraph, PythonPackageIndex, Project, Release, LazyLoaderState
+from pyTooling.Versioning           import PythonVersion
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -72,6 +75,107 @@ class Instantiation(TestCase):
 		self.assertEqual(now, release.ReleasedAt)
 
 
+class Requirements(TestCase):
+	def test_Classify(self) -> None:
+		classified = Release._ClassifyRequirements(
+			["doc", "Test_X"],
+			[
+				"a >= 1.0",
+				"b; extra == 'doc'",
+				"c; extra == 'test-x'",
+				"d; python_version >= '3.0' and extra == 'doc'",
+				"e; python_version < '3.0' and extra == 'doc'",
+				"f; extra == 'unknown'",
+				"g; extra == 'unknown' or extra == 'test_x'",
+			]
+		)
+
+		self.assertListEqual(["doc", "Test_X", None, 0], list(classified.keys()))
+		self.assertListEqual(["a"], [r.name for r in classified[None]])
+		self.assertListEqual(["b", "d"], [r.name for r in classified["doc"]])
+		self.assertListEqual(["c", "g"], [r.name for r in classified["Test_X"]])
+		self.assertListEqual(["e", "f"], [r.name for r in classified[0]])
+
+	def test_NoRequirements(self) -> None:
+		self.assertDictEqual({None: []}, Release._ClassifyRequirements(None, None))
+		self.assertDictEqual({"doc": [], None: []}, Release._ClassifyRequirements(["doc"], None))
+
+	def test_Cache(self) -> None:
+		Release.ClearRequirementCache()
+		hits = Release.GetRequirementCacheStatistics().Hits
+
+		first = Release._ParseRequirement("pytest >= 8.0; extra == 'test'")
+		second = Release._ParseRequirement("pytest >= 8.0; extra == 'test'")
+
+		self.assertIs(first, second)
+		self.assertEqual("test", first[1])
+		self.assertTrue(first[2])
+		self.assertEqual(hits + 1, Release.GetRequirementCacheStatistics().Hits)
+
+	def test_ConfigureCache(self) -> None:
+		try:
+			Release.ConfigureRequirementCache(0)
+			self.assertIsNone(Release.GetRequirementCacheStatistics())
+			self.assertIsNot(Release._ParseRequirement("a"), Release._ParseRequirement("a"))
+
+			with self.assertRaises(TypeError):
+				Release.ConfigureRequirementCache("1")
+			with self.assertRaises(ValueError):
+				Release.ConfigureRequirementCache(-1)
+		finally:
+			Release.ConfigureRequirementCache()
+
+	def test_Batch(self) -> None:
+		graph = PythonPackageDependencyGraph("graph")
+		index = PythonPackageIndex("index", "https://index.org/", "https://api.index.org/v4/", graph=graph)
+		project = Project("project", "https://index.org/project/", index=index)
+		releases = [Release(PythonVersion.Parse(f"v1.{minor}.0"), datetime.now(), project=project) for minor in range(3)]
+
+		json = {"info": {"provides_extra": ["doc"], "requires_dist": ["a", "b; extra == 'doc'"]}}
+		project.UpdateReleaseDetailsFromPyPIJSON({release: json for release in releases})
+
+		for release in releases:
+			self.assertEqual(LazyLoaderState.FullyLoaded, release.__lazy_state__)
+			self.assertListEqual(["a"], [r.name for r in release.Requirements[None]])
+			self.assertListEqual(["b"], [r.name for r in release.Requirements["doc"]])
+
+		self.assertIsNot(releases[0].Requirements[None], releases[1].Requirements[None])
+
+
+class Offline(TestCase):
+	def test_ServeFromCache(self) -> None:
+		json = {
+			"info": {"project_url": "https://index.org/project/project/"},
+			"releases": {
+				"1.0.0": [{"filename": "project-1.0.0.tar.gz", "url": "https://index.org/project-1.0.0.tar.gz", "upload_time_iso_8601": "2026-01-01T00:00:00+00:00"}],
+				"1.1.0": [{"filename": "project-1.1.0.tar.gz", "url": "https://index.org/project-1.1.0.tar.gz", "upload_time_iso_8601": "2026-02-01T00:00:00+00:00"}],
+				"1.2.0": []
+			}
+		}
+
+		with TemporaryDirectory() as directory:
+			cache = DirectoryResponseStore(directory)
+			cache.Store("https://api.index.org/v4/project/json", dumps(json).encode("utf-8"), "\"abc\"")
+
+			graph = PythonPackageDependencyGraph("graph")
+			index = PythonPackageIndex("index", "https://index.org/", "https://api.index.org/v4/", graph=graph, responseCache=cache, offline=True)
+
+			project = index.DownloadProject("project", LazyLoaderState.PartiallyLoaded)
+
+			self.assertEqual("https://index.org/project/project/", str(project.URL))
+			self.assertEqual(2, project.ReleaseCount)
+			self.assertEqual(1, cache.Statistics.Hits)
+
+			with self.assertRaises(OfflineCacheMissError):
+				index.DownloadProject("other", LazyLoaderState.PartiallyLoaded)
+
+	def test_OfflineRequiresCache(self) -> None:
+		graph = PythonPackageDependencyGraph("graph")
+
+		with self.assertRaises(ValueError):
+			PythonPackageIndex("index", "https://index.org/", "https://api.index.org/v4/", graph=graph, offline=True)
+
+
 class PyPI(TestCase):
 	def test_pyTooling(self) -> None:
 		print()
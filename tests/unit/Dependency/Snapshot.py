@@ -0,0 +1,151 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for :mod:`pyTooling.Dependency.Snapshot`."""
+from pathlib                       import Path
+from tempfile                      import TemporaryDirectory
+from unittest                      import TestCase
+
+from pyTooling.Exceptions          import ToolingException
+from pyTooling.Dependency.Crawler  import PackageIndexCrawler
+from pyTooling.Dependency.Python   import PythonPackageDependencyGraph, LazyLoaderState
+from pyTooling.Dependency.Snapshot import MirrorDirectory, JSONSnapshot, SQLiteSnapshot, LocalPackageIndex
+
+from .Fixtures                     import project
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+DOCUMENTS = {
+	**project("App", ["1.0.0", "2.0.0"], ["lib-a>=1.0", "Lib_B"]),
+	**project("lib-a", ["1.0.0", "1.1.0"], ["lib-c<2"]),
+	**project("lib_b", ["0.9.0"]),
+	**project("lib-c", ["1.0.0", "2.0.0"]),
+}
+
+
+class Snapshots(TestCase):
+	def _CheckSnapshot(self, snapshot) -> None:
+		self.assertEqual(11, len(snapshot))
+		self.assertListEqual(["app", "lib-a", "lib-b", "lib-c"], snapshot.ProjectNames())
+
+		self.assertEqual("App", snapshot.Load("App/json")["info"]["name"])
+		self.assertEqual("lib_b", snapshot.Load("lib_b/json")["info"]["name"])
+		self.assertListEqual(["lib-c<2"], snapshot.Load("lib-a/1.1.0/json")["info"]["requires_dist"])
+		self.assertIsNone(snapshot.Load("unknown/json"))
+		self.assertIsNone(snapshot.Load("app/3.0.0/json"))
+
+	def test_MirrorDirectory(self) -> None:
+		with TemporaryDirectory() as directory:
+			self._CheckSnapshot(MirrorDirectory.Create(Path(directory) / "plain", DOCUMENTS))
+			self._CheckSnapshot(MirrorDirectory.Create(Path(directory) / "compressed", DOCUMENTS, compress=True))
+			self._CheckSnapshot(MirrorDirectory(directory + "/plain"))
+
+	def test_JSONSnapshot(self) -> None:
+		with TemporaryDirectory() as directory:
+			for suffix in (".json", ".json.gz", ".json.xz", ".json.bz2"):
+				with self.subTest(suffix=suffix):
+					self._CheckSnapshot(JSONSnapshot.Create(Path(directory) / f"snapshot{suffix}", DOCUMENTS))
+
+	def test_SQLiteSnapshot(self) -> None:
+		with TemporaryDirectory() as directory:
+			snapshot = SQLiteSnapshot.Create(Path(directory) / "snapshot.sqlite", DOCUMENTS)
+			self._CheckSnapshot(snapshot)
+			snapshot.Close()
+
+	def test_Missing(self) -> None:
+		with TemporaryDirectory() as directory:
+			with self.assertRaises(ToolingException):
+				MirrorDirectory(Path(directory) / "missing")
+
+			with self.assertRaises(ToolingException):
+				JSONSnapshot(Path(directory) / "missing.json.gz")
+
+			with self.assertRaises(ToolingException):
+				SQLiteSnapshot(Path(directory) / "missing.sqlite")
+
+		with self.assertRaises(TypeError):
+			JSONSnapshot(1)
+
+
+class LocalIndex(TestCase):
+	def test_DownloadProject(self) -> None:
+		with TemporaryDirectory() as directory:
+			snapshot = JSONSnapshot.Create(Path(directory) / "snapshot.json.gz", DOCUMENTS)
+			index = LocalPackageIndex("local", snapshot, PythonPackageDependencyGraph("graph"))
+
+			project = index.DownloadProject("App", LazyLoaderState.Initialized)
+			self.assertEqual(LazyLoaderState.Initialized, project.__lazy_state__)
+
+			self.assertEqual(2, project.ReleaseCount)
+			self.assertEqual(LazyLoaderState.FullyLoaded, project.__lazy_state__)
+			self.assertEqual("https://pypi.org/project/App/", str(project.URL))
+			self.assertTrue(index.Offline)
+
+			release = project.LatestRelease
+			self.assertEqual(LazyLoaderState.Initialized, release.__lazy_state__)
+			self.assertListEqual(["lib-a>=1.0", "Lib_B"], [str(r) for r in release.Requirements[None]])
+
+			with self.assertRaises(ToolingException):
+				index.DownloadProject("unknown")
+
+	def test_ReleaseDetails(self) -> None:
+		with TemporaryDirectory() as directory:
+			snapshot = MirrorDirectory.Create(directory, DOCUMENTS)
+			index = LocalPackageIndex("local", snapshot, PythonPackageDependencyGraph("graph"))
+
+			project = index.DownloadProject("lib-a", LazyLoaderState.PostProcessed)
+
+			self.assertEqual(LazyLoaderState.PostProcessed, project.__lazy_state__)
+			for release in project:
+				self.assertEqual(LazyLoaderState.FullyLoaded, release.__lazy_state__)
+
+	def test_Resolve(self) -> None:
+		with TemporaryDirectory() as directory:
+			snapshot = SQLiteSnapshot.Create(Path(directory) / "snapshot.sqlite", DOCUMENTS)
+			index = LocalPackageIndex("local", snapshot, PythonPackageDependencyGraph("graph"))
+
+			crawler = PackageIndexCrawler(index)
+			projects = crawler.Crawl("app")
+			snapshot.Close()
+
+		self.assertEqual(0, crawler.RequestCount)
+		self.assertSetEqual({"app", "lib-a", "lib-b", "lib-c"}, set(projects.keys()))
+
+		solution = projects["app"].LatestRelease.SolveLatest()
+		self.assertListEqual(["App 2.0.0", "lib-a 1.1.0", "lib-c 1.0.0", "lib_b 0.9.0"], sorted(f"{pv.Package.Name} {pv.Version}" for pv in solution))
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			LocalPackageIndex("local", None, PythonPackageDependencyGraph("graph"))
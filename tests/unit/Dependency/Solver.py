@@ -0,0 +1,211 @@
+# ==================================================================================================================== #
+#             _____           _ _               ____                            _                                      #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  |  _ \  ___ _ __   ___ _ __   __| | ___ _ __   ___ _   _                #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | | | |/ _ \ '_ \ / _ \ '_ \ / _` |/ _ \ '_ \ / __| | | |               #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |_| |  __/ |_) |  __/ | | | (_| |  __/ | | | (__| |_| |               #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)____/ \___| .__/ \___|_| |_|\__,_|\___|_| |_|\___|\__, |               #
+# |_|    |___/                          |___/             |_|                                     |___/                #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for :mod:`pyTooling.Dependency.Solver`."""
+from unittest                    import TestCase
+
+from pyTooling.Exceptions        import ToolingException
+from pyTooling.Dependency        import PackageDependencyGraph, PackageStorage, SolverAlgorithm
+from pyTooling.Dependency.Solver import Term, Incompatibility, IncompatibilityCause, ConflictDrivenSolver
+from pyTooling.Dependency.Solver import UnsolvableDependencyError
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Terms(TestCase):
+	def setUp(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		self.v10, self.v11, self.v12 = storage.CreatePackageVersions("packA", ("v1.0", "v1.1", "v1.2"))
+		self.package = self.v10.Package
+
+	def test_Intersect(self) -> None:
+		positive = Term(self.package, (self.v10, self.v11))
+		negative = Term(self.package, (self.v11, ), False)
+
+		self.assertSetEqual({self.v10}, set(positive.Intersect(negative).Versions))
+		self.assertSetEqual({self.v10}, set(negative.Intersect(positive).Versions))
+		self.assertTrue(positive.Intersect(negative).IsPositive)
+		self.assertFalse(negative.Intersect(Term(self.package, (self.v12, ), False)).IsPositive)
+		self.assertTrue(positive.Intersect(Term(self.package, (self.v12, ))).IsEmpty)
+
+	def test_Satisfies(self) -> None:
+		single = Term(self.package, (self.v10, ))
+		double = Term(self.package, (self.v10, self.v11))
+
+		self.assertTrue(single.Satisfies(double))
+		self.assertFalse(double.Satisfies(single))
+		self.assertTrue(single.Satisfies(Term(self.package, (self.v12, ), False)))
+		self.assertFalse(Term(self.package, (self.v12, ), False).Satisfies(single))
+
+	def test_Contradicts(self) -> None:
+		single = Term(self.package, (self.v10, ))
+
+		self.assertTrue(single.Contradicts(Term(self.package, (self.v11, ))))
+		self.assertTrue(single.Contradicts(single.Negate()))
+		self.assertFalse(single.Negate().Contradicts(Term(self.package, (self.v11, ), False)))
+
+	def test_Str(self) -> None:
+		self.assertEqual("packA v1.0", str(Term(self.package, (self.v10, ))))
+		self.assertEqual("not packA in [v1.0, v1.1]", str(Term(self.package, (self.v11, self.v10), False)))
+		self.assertEqual("any version of packA", str(Term(self.package, (self.v10, self.v11, self.v12))))
+
+	def test_IncompatibilityMerge(self) -> None:
+		incompatibility = Incompatibility(
+			(Term(self.package, (self.v10, self.v11)), Term(self.package, (self.v11, ), False), Term(self.package, (), False)),
+			IncompatibilityCause.Conflict
+		)
+
+		self.assertEqual(1, len(incompatibility.Terms))
+		self.assertSetEqual({self.v10}, set(incompatibility.Terms[self.package].Versions))
+		self.assertEqual("packA v1.0 is forbidden", str(incompatibility))
+
+
+class ConflictDriven(TestCase):
+	def test_Simple(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+
+		packA = storage.CreatePackageVersions("packA", ("v1.0", "v1.1", "v1.2"))
+		root.AddDependencyToPackageVersions(packA)
+
+		graph.SortPackageVersions()
+		solution = root.SolveLatest(SolverAlgorithm.ConflictDriven)
+
+		self.assertListEqual([root, packA[2]], solution)
+
+	def test_ConflictBacktracking(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+
+		storage.CreatePackageVersions("packA", ("v1.0", "v2.0"))
+		storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+
+		root.AddDependencyTo("packA", ("v1.0", "v2.0"))
+		root.AddDependencyTo("packB", "v1.0")
+		storage["packA"]["v2.0"].AddDependencyTo("packB", "v2.0")
+		storage["packA"]["v1.0"].AddDependencyTo("packB", "v1.0")
+
+		graph.SortPackageVersions()
+		solution = {pv.Package.Name: pv.Version for pv in root.SolveLatest(SolverAlgorithm.ConflictDriven)}
+
+		self.assertDictEqual({"app": "v1.0", "packA": "v1.0", "packB": "v1.0"}, solution)
+
+	def test_CircularDependency(self) -> None:
+		graph = PackageDependencyGraph("Circular")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+
+		pAv10 = storage.CreatePackageVersion("packA", "v1.0")
+		pBv10 = storage.CreatePackageVersion("packB", "v1.0")
+
+		root.AddDependencyToPackageVersion(pAv10)
+		pAv10.AddDependencyToPackageVersion(pBv10)
+		pBv10.AddDependencyToPackageVersion(pAv10)
+
+		graph.SortPackageVersions()
+		solution = root.SolveLatest(SolverAlgorithm.ConflictDriven)
+
+		self.assertListEqual([root, pAv10, pBv10], solution)
+
+	def test_UnusedPackagesNotSelected(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+
+		storage.CreatePackageVersions("packA", ("v1.0", "v2.0"))
+		storage.CreatePackageVersions("packB", ("v1.0", ))
+
+		root.AddDependencyTo("packA", ("v1.0", "v2.0"))
+		storage["packA"]["v1.0"].AddDependencyTo("packB", "v1.0")
+
+		graph.SortPackageVersions()
+		solution = {pv.Package.Name: pv.Version for pv in root.SolveLatest(SolverAlgorithm.ConflictDriven)}
+
+		self.assertDictEqual({"app": "v1.0", "packA": "v2.0"}, solution)
+
+	def test_DeepChain(self) -> None:
+		graph = PackageDependencyGraph("Chain")
+		storage = PackageStorage("storage", graph=graph)
+		packages = [storage.CreatePackageVersions(f"pack{i}", ("v1.0", "v1.1")) for i in range(2000)]
+		for fromVersions, toVersions in zip(packages[:-1], packages[1:]):
+			for fromVersion in fromVersions:
+				fromVersion.AddDependencyToPackageVersions(toVersions)
+
+		graph.SortPackageVersions()
+		solution = packages[0][1].SolveLatest(SolverAlgorithm.ConflictDriven)
+
+		self.assertEqual(2000, len(solution))
+		self.assertTrue(all(packageVersion.Version == "v1.1" for packageVersion in solution))
+
+	def test_FailureDeepConflict(self) -> None:
+		graph = PackageDependencyGraph("ComplexFailure")
+		storage = PackageStorage("storage", graph=graph)
+		for package in storage.CreatePackages([f"pack{i}" for i in range(10)]):
+			storage.CreatePackageVersions(package.Name, ("v1.0", "v1.1", "v1.2", "v1.3"))
+
+		root = storage["pack0"]["v1.3"]
+		for i in range(9):
+			fromPackage = storage[f"pack{i}"]
+			toPackage = storage[f"pack{i + 1}"]
+			for fromPackageVersion in fromPackage:
+				if i == 8:
+					fromPackageVersion.AddDependencyToPackageVersion(toPackage["v1.0"])
+				else:
+					fromPackageVersion.AddDependencyToPackageVersions(toPackage)
+		root.AddDependencyTo("pack9", "v1.3")
+
+		graph.SortPackageVersions()
+		solver = ConflictDrivenSolver(root)
+		with self.assertRaises(UnsolvableDependencyError) as ex:
+			solver.Solve()
+
+		self.assertIsInstance(ex.exception, ToolingException)
+		self.assertIn("Could not resolve dependencies", str(ex.exception))
+		self.assertTrue(ex.exception.Incompatibility.IsFailure(root))
+		self.assertTrue(ex.exception.HasNotes)
+		self.assertTrue(ex.exception.Explanation[-1].endswith("pack0 v1.3 is forbidden."))
+		self.assertLess(solver.ConflictCount, 20)
+
+	def test_InvalidParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			ConflictDrivenSolver("app")
+
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+		with self.assertRaises(TypeError):
+			root.SolveLatest("ConflictDriven")
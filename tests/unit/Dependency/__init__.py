@@ -29,12 +29,13 @@
 # ==================================================================================================================== #
 #
 """Unit tests for :mod:`pyTooling.Dependency`."""
+from traceback            import extract_tb
 from unittest             import TestCase
 
 from pyTooling.Exceptions import ToolingException
 from pyTooling.Versioning import SemanticVersion
 
-from pyTooling.Dependency import PackageDependencyGraph, PackageStorage, Package, PackageVersion
+from pyTooling.Dependency import PackageDependencyGraph, PackageStorage, Package, PackageVersion, SolverAlgorithm
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -337,6 +338,51 @@ class SolveLatest(TestCase):
 		self.assertEqual(solution["packA"], "v1.0")
 		self.assertEqual(solution["packB"], "v1.0")
 
+	def test_SelfContradiction(self) -> None:
+		graph = PackageDependencyGraph("SelfContradiction")
+		storage = PackageStorage("storage", graph=graph)
+		storage.CreatePackageVersions("packA", ("v1.0", "v2.0"))
+		root = storage["packA"]["v2.0"]
+		root.AddDependencyTo("packA", "v1.0")
+
+		graph.SortPackageVersions()
+		for algorithm in SolverAlgorithm:
+			with self.subTest(algorithm=algorithm.name):
+				with self.assertRaises(ToolingException):
+					_ = root.SolveLatest(algorithm)
+
+	def test_DeepChain(self) -> None:
+		graph = PackageDependencyGraph("Chain")
+		storage = PackageStorage("storage", graph=graph)
+		packages = [storage.CreatePackageVersions(f"pack{i}", ("v1.0", "v1.1")) for i in range(2000)]
+		for fromVersions, toVersions in zip(packages[:-1], packages[1:]):
+			for fromVersion in fromVersions:
+				fromVersion.AddDependencyToPackageVersions(toVersions)
+
+		graph.SortPackageVersions()
+		solution = packages[0][1].SolveLatest()
+
+		self.assertEqual(2000, len(solution))
+		self.assertTrue(all(packageVersion.Version == "v1.1" for packageVersion in solution))
+
+	def test_MostConstrainedFirst(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+
+		storage.CreatePackageVersions("packA", ("v1.0", "v1.1", "v1.2", "v1.3"))
+		storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+
+		# packB allows only one version, thus it's resolved first and excludes packA v1.3 and v1.2.
+		root.AddDependencyTo("packA", ("v1.0", "v1.1", "v1.2", "v1.3"))
+		root.AddDependencyTo("packB", "v1.0")
+		storage["packB"]["v1.0"].AddDependencyTo("packA", ("v1.0", "v1.1"))
+
+		graph.SortPackageVersions()
+		solution = {pv.Package.Name: pv.Version for pv in root.SolveLatest()}
+
+		self.assertDictEqual({"app": "v1.0", "packA": "v1.1", "packB": "v1.0"}, solution)
+
 	def test_ComplexSuccessWithBacktracking(self) -> None:
 		# Created by Google Gemini
 		graph = PackageDependencyGraph("ComplexSuccess")
@@ -415,3 +461,199 @@ class SolveLatest(TestCase):
 			_ = root.SolveLatest()
 
 		self.assertIn("Could not resolve dependencies", str(ex.exception))
+
+
+class Caching(TestCase):
+	def _CreateGraph(self):
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+
+		storage.CreatePackageVersions("packA", ("v1.0", "v2.0"))
+		storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+
+		root.AddDependencyTo("packA", ("v1.0", "v2.0"))
+		root.AddDependencyTo("packB", ("v1.0", "v2.0"))
+		storage["packA"]["v2.0"].AddDependencyTo("packB", "v1.0")
+
+		graph.SortPackageVersions()
+		return graph, storage, root
+
+	def test_SolutionReused(self) -> None:
+		graph, storage, root = self._CreateGraph()
+		cache = graph.ResolutionCache
+
+		first = root.SolveLatest()
+		hits = cache.SolutionStatistics.Hits
+		second = root.SolveLatest()
+
+		self.assertListEqual(first, second)
+		self.assertIsNot(first, second)
+		self.assertEqual(hits + 1, cache.SolutionStatistics.Hits)
+		self.assertEqual(1, cache.SolutionCount)
+
+	def test_InvalidateOnAddDependency(self) -> None:
+		graph, storage, root = self._CreateGraph()
+
+		solution = {pv.Package.Name: pv.Version for pv in root.SolveLatest()}
+		self.assertDictEqual({"app": "v1.0", "packA": "v2.0", "packB": "v1.0"}, solution)
+
+		storage["packB"]["v1.0"].AddDependencyTo("packA", "v1.0")
+
+		self.assertEqual(0, graph.ResolutionCache.SolutionCount)
+		solution = {pv.Package.Name: pv.Version for pv in root.SolveLatest()}
+		self.assertDictEqual({"app": "v1.0", "packA": "v1.0", "packB": "v2.0"}, solution)
+
+	def test_InvalidateOnCreatePackageVersion(self) -> None:
+		graph, storage, root = self._CreateGraph()
+
+		root.SolveLatest()
+		storage.CreatePackageVersion("packA", "v3.0")
+
+		self.assertEqual(0, graph.ResolutionCache.SolutionCount)
+
+	def test_FailureReused(self) -> None:
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+		root = storage.CreatePackageVersion("app", "v1.0")
+		storage.CreatePackageVersions("packA", ("v1.0", ))
+		storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+
+		root.AddDependencyTo("packA", "v1.0")
+		root.AddDependencyTo("packB", "v2.0")
+		storage["packA"]["v1.0"].AddDependencyTo("packB", "v1.0")
+
+		for algorithm in SolverAlgorithm:
+			with self.subTest(algorithm=algorithm.name):
+				with self.assertRaises(ToolingException) as first:
+					root.SolveLatest(algorithm)
+
+				tracebacks = []
+				for _ in range(3):
+					with self.assertRaises(ToolingException) as again:
+						root.SolveLatest(algorithm)
+
+					self.assertIsNot(first.exception, again.exception)
+					self.assertIs(type(first.exception), type(again.exception))
+					self.assertEqual(str(first.exception), str(again.exception))
+					self.assertTupleEqual(first.exception.Notes, again.exception.Notes)
+					tracebacks.append(len(extract_tb(again.exception.__traceback__)))
+
+				self.assertEqual(1, len(set(tracebacks)))
+
+		self.assertEqual(2, graph.ResolutionCache.SolutionCount)
+
+	def test_Intersect(self) -> None:
+		graph, storage, root = self._CreateGraph()
+		cache = graph.ResolutionCache
+
+		constraints = cache.Constraints(root)
+		self.assertIs(constraints, cache.Constraints(root))
+		self.assertSetEqual({SemanticVersion.Parse("v1.0"), SemanticVersion.Parse("v2.0")}, set(constraints[storage["packA"]]))
+
+		first = frozenset((SemanticVersion(1, 0, 0), SemanticVersion(2, 0, 0)))
+		second = frozenset((SemanticVersion(2, 0, 0), SemanticVersion(3, 0, 0)))
+		result = cache.Intersect(first, second)
+
+		self.assertSetEqual({SemanticVersion(2, 0, 0)}, set(result))
+		self.assertIs(result, cache.Intersect(first, second))
+
+		self.assertEqual(1, cache.IntersectionStatistics.Hits)
+		self.assertEqual(1, cache.IntersectionStatistics.Misses)
+		self.assertEqual(0, cache.SolutionStatistics.Lookups)
+
+		cache.Clear()
+		self.assertEqual(0, cache.IntersectionStatistics.Lookups)
+
+
+class SolveMany(TestCase):
+	def _CreateGraph(self):
+		graph = PackageDependencyGraph("graph")
+		storage = PackageStorage("storage", graph=graph)
+
+		storage.CreatePackageVersions("app", ("v1.0", "v2.0", "v3.0"))
+		storage.CreatePackageVersions("packA", ("v1.0", "v2.0"))
+		storage.CreatePackageVersions("packB", ("v1.0", "v2.0"))
+
+		storage["app"]["v1.0"].AddDependencyTo("packA", ("v1.0", "v2.0"))
+		storage["app"]["v2.0"].AddDependencyTo("packA", "v2.0")
+		storage["app"]["v2.0"].AddDependencyTo("packB", "v1.0")
+		storage["app"]["v3.0"].AddDependencyTo("packA", "v1.0")
+		storage["app"]["v3.0"].AddDependencyTo("packB", "v2.0")
+		storage["packA"]["v1.0"].AddDependencyTo("packB", "v1.0")
+		storage["packA"]["v2.0"].AddDependencyTo("packB", "v2.0")
+
+		graph.SortPackageVersions()
+		return graph, storage
+
+	def _Check(self, storage, results) -> None:
+		self.assertEqual(7, len(results))
+
+		solution = {pv.Package.Name: pv.Version for pv in results[storage["app"]["v1.0"]]}
+		self.assertDictEqual({"app": "v1.0", "packA": "v2.0", "packB": "v2.0"}, solution)
+		self.assertIsInstance(results[storage["app"]["v2.0"]], ToolingException)
+		self.assertIsInstance(results[storage["app"]["v3.0"]], ToolingException)
+		self.assertIn("Could not resolve dependencies", str(results[storage["app"]["v3.0"]]))
+		self.assertListEqual([storage["packB"]["v1.0"]], results[storage["packB"]["v1.0"]])
+
+	def test_Sequential(self) -> None:
+		graph, storage = self._CreateGraph()
+		roots = [packageVersion for package in storage for packageVersion in package]
+
+		self._Check(storage, dict(graph.SolveMany(roots, workers=1)))
+		self.assertEqual(7, graph.ResolutionCache.SolutionCount)
+
+	def test_ProcessPool(self) -> None:
+		graph, storage = self._CreateGraph()
+		roots = [packageVersion for package in storage for packageVersion in package]
+
+		self._Check(storage, dict(graph.SolveMany(roots, workers=2, chunkSize=2)))
+		self.assertEqual(7, graph.ResolutionCache.SolutionCount)
+
+		# All results are memoized now.
+		self._Check(storage, dict(graph.SolveMany(roots, workers=2)))
+
+	def test_ConflictDrivenFailures(self) -> None:
+		from pyTooling.Dependency.Solver import UnsolvableDependencyError
+
+		graph, storage = self._CreateGraph()
+		roots = [storage["app"]["v2.0"], storage["app"]["v3.0"]]
+		sequential = dict(graph.SolveMany(roots, workers=1, algorithm=SolverAlgorithm.ConflictDriven))
+
+		graph.ResolutionCache.Clear()
+		parallel = dict(graph.SolveMany(roots, workers=2, chunkSize=1, algorithm=SolverAlgorithm.ConflictDriven))
+
+		for root in roots:
+			self.assertIsInstance(sequential[root], UnsolvableDependencyError)
+			self.assertIsInstance(parallel[root], UnsolvableDependencyError)
+			self.assertEqual(str(sequential[root]), str(parallel[root]))
+			self.assertTupleEqual(sequential[root].Notes, parallel[root].Notes)
+			self.assertListEqual(sequential[root].Explanation, parallel[root].Explanation)
+			self.assertTrue(parallel[root].Incompatibility.IsFailure(root))
+
+	def test_View(self) -> None:
+		graph, storage = self._CreateGraph()
+		view, ids = graph._ToView()
+		packageVersions = PackageDependencyGraph._FromView(view)
+
+		self.assertEqual(len(ids), len(packageVersions))
+		for original, copy in zip(ids, packageVersions):
+			self.assertEqual(original.Package.Name, copy.Package.Name)
+			self.assertEqual(original.Version, copy.Version)
+			self.assertSetEqual(
+				{(package.Name, version) for package, versions in original.DependsOn.items() for version in versions},
+				{(package.Name, version) for package, versions in copy.DependsOn.items() for version in versions}
+			)
+
+	def test_InvalidParameters(self) -> None:
+		graph, storage = self._CreateGraph()
+		otherGraph, otherStorage = self._CreateGraph()
+
+		with self.assertRaises(TypeError):
+			graph.SolveMany([], workers="2")
+		with self.assertRaises(ValueError):
+			graph.SolveMany([], workers=0)
+		with self.assertRaises(TypeError):
+			graph.SolveMany([], algorithm="ConflictDriven")
+		with self.assertRaises(ValueError):
+			graph.SolveMany([otherStorage["app"]["v1.0"]])
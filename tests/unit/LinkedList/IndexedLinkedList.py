@@ -0,0 +1,207 @@
+# ==================================================================================================================== #
+#             _____           _ _               _     _       _            _ _     _     _                             #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  | |   (_)_ __ | | _____  __| | |   (_)___| |_                           #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | |   | | '_ \| |/ / _ \/ _` | |   | / __| __|                          #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |___| | | | |   <  __/ (_| | |___| \__ \ |_                           #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)_____|_|_| |_|_|\_\___|\__,_|_____|_|___/\__|                          #
+# |_|    |___/                          |___/                                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for pyTooling.LinkedList.IndexedLinkedList."""
+from random   import Random
+from unittest import TestCase
+
+from pyTooling.LinkedList import Node, LinkedList, IndexedNode, IndexedLinkedList, LinkedListException
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Instantiation(TestCase):
+	def test_IndexedLinkedList(self) -> None:
+		ll = IndexedLinkedList()
+
+		self.assertTrue(ll.IsEmpty)
+		self.assertEqual(0, ll.Count)
+
+	def test_IndexedLinkedList_Tuple(self) -> None:
+		ll = IndexedLinkedList(tuple(IndexedNode(i) for i in range(100)))
+
+		self.assertEqual(100, ll.Count)
+		self.assertListEqual(list(range(100)), ll.ToList())
+
+	def test_IndexedLinkedList_WrongNodeType(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = IndexedLinkedList((IndexedNode(0), Node(1)))
+
+	def test_InsertWrongNodeType(self) -> None:
+		ll = IndexedLinkedList()
+
+		with self.assertRaises(TypeError):
+			ll.InsertAfterLast(Node(0))
+
+		node = IndexedNode(0)
+		ll.InsertAfterLast(node)
+		with self.assertRaises(TypeError):
+			node.InsertNodeAfter(Node(1))
+
+
+class IndexedAccess(TestCase):
+	def test_GetNodeByIndex(self) -> None:
+		nodes = [IndexedNode(i) for i in range(1000)]
+		ll = IndexedLinkedList(nodes)
+
+		for i, node in enumerate(nodes):
+			self.assertIs(node, ll.GetNodeByIndex(i))
+			self.assertEqual(i, ll.GetIndexOfNode(node))
+			self.assertEqual(i, ll[i])
+
+	def test_GetNodeByIndex_OutOfRange(self) -> None:
+		ll = IndexedLinkedList()
+		with self.assertRaises(ValueError):
+			_ = ll[0]
+
+		ll.InsertAfterLast(IndexedNode(0))
+		with self.assertRaises(ValueError):
+			_ = ll[1]
+		with self.assertRaises(ValueError):
+			_ = ll[-1]
+
+	def test_GetIndexOfNode_OtherList(self) -> None:
+		ll = IndexedLinkedList((IndexedNode(0), ))
+
+		with self.assertRaises(LinkedListException):
+			ll.GetIndexOfNode(IndexedNode(1))
+
+	def test_SetItem(self) -> None:
+		ll = IndexedLinkedList([IndexedNode(i) for i in range(10)])
+		ll[5] = 50
+
+		self.assertEqual(50, ll[5])
+
+	def test_InsertAtIndex(self) -> None:
+		ll = IndexedLinkedList()
+		ll.InsertAtIndex(0, IndexedNode(1))
+		ll.InsertAtIndex(0, IndexedNode(0))
+		ll.InsertAtIndex(2, IndexedNode(3))
+		ll.InsertAtIndex(2, IndexedNode(2))
+
+		self.assertListEqual([0, 1, 2, 3], ll.ToList())
+
+
+class KeyIndex(TestCase):
+	def test_MoveToFrontAndBack(self) -> None:
+		ll = IndexedLinkedList([IndexedNode(i, key=i) for i in range(100)], keyIndex=True)
+
+		ll.MoveToFront(50)
+		ll.MoveToBack(10)
+		ll.RemoveByKey(20)
+
+		reference = [50] + [i for i in range(100) if i not in (10, 20, 50)] + [10]
+		self.assertListEqual(reference, ll.ToList())
+		for i, value in enumerate(reference):
+			self.assertEqual(value, ll[i])
+			self.assertEqual(i, ll.GetIndexOfNode(ll.GetNodeByKey(value)))
+
+
+class Splicing(TestCase):
+	def test_SpliceAndSplit(self) -> None:
+		ll1 = IndexedLinkedList([IndexedNode(i) for i in (0, 1, 5)])
+		ll2 = IndexedLinkedList([IndexedNode(i) for i in (2, 3, 4)])
+
+		ll1.Splice(ll2, ll1.GetNodeByIndex(1))
+		ll3 = ll1.SplitAt(ll1.GetNodeByIndex(4))
+
+		self.assertIsInstance(ll3, IndexedLinkedList)
+		self.assertEqual(0, ll2.Count)
+		for ll, reference in ((ll1, [0, 1, 2, 3]), (ll3, [4, 5])):
+			self.assertListEqual(reference, ll.ToList())
+			for i, value in enumerate(reference):
+				self.assertEqual(value, ll[i])
+				self.assertEqual(i, ll.GetIndexOfNode(ll.GetNodeByIndex(i)))
+
+		with self.assertRaises(TypeError):
+			ll1.Extend(LinkedList())
+
+
+class Differential(TestCase):
+	def _Check(self, ll: IndexedLinkedList, reference: list) -> None:
+		self.assertEqual(len(reference), ll.Count)
+		self.assertListEqual(reference, ll.ToList())
+		self.assertListEqual(reference[::-1], ll.ToList(reverse=True))
+		for i, value in enumerate(reference):
+			node = ll.GetNodeByIndex(i)
+			self.assertEqual(value, node.Value)
+			self.assertEqual(i, ll.GetIndexOfNode(node))
+
+	def test_RandomOperations(self) -> None:
+		rng = Random(42)
+
+		for _ in range(20):
+			reference = list(range(rng.randint(0, 30)))
+			ll = IndexedLinkedList([IndexedNode(i) for i in reference])
+			value = 1000
+			for _ in range(100):
+				value += 1
+				operation = rng.randint(0, 8)
+				if operation == 0:
+					ll.InsertBeforeFirst(IndexedNode(value))
+					reference.insert(0, value)
+				elif operation == 1:
+					ll.InsertAfterLast(IndexedNode(value))
+					reference.append(value)
+				elif operation == 2 and reference:
+					i = rng.randrange(len(reference))
+					ll.GetNodeByIndex(i).InsertNodeAfter(IndexedNode(value))
+					reference.insert(i + 1, value)
+				elif operation == 3 and reference:
+					i = rng.randrange(len(reference))
+					ll.GetNodeByIndex(i).InsertNodeBefore(IndexedNode(value))
+					reference.insert(i, value)
+				elif operation == 4 and reference:
+					i = rng.randrange(len(reference))
+					del ll[i]
+					del reference[i]
+				elif operation == 5 and reference:
+					ll.RemoveFirst()
+					reference.pop(0)
+				elif operation == 6 and reference:
+					ll.RemoveLast()
+					reference.pop()
+				elif operation == 7:
+					i = rng.randint(0, len(reference))
+					ll.InsertAtIndex(i, IndexedNode(value))
+					reference.insert(i, value)
+				elif operation == 8:
+					if rng.random() < 0.5:
+						ll.Reverse()
+						reference.reverse()
+					else:
+						ll.Sort()
+						reference.sort()
+
+				self._Check(ll, reference)
@@ -0,0 +1,252 @@
+# ==================================================================================================================== #
+#             _____           _ _               _     _       _            _ _     _     _                             #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  | |   (_)_ __ | | _____  __| | |   (_)___| |_                           #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | |   | | '_ \| |/ / _ \/ _` | |   | / __| __|                          #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |___| | | | |   <  __/ (_| | |___| \__ \ |_                           #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)_____|_|_| |_|_|\_\___|\__,_|_____|_|___/\__|                          #
+# |_|    |___/                          |___/                                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for pyTooling.LinkedList.LinkedQueue."""
+
+from asyncio   import run as asyncio_run, gather, sleep as asyncio_sleep, to_thread
+from threading import Thread
+from time      import sleep
+from unittest  import TestCase
+
+from pyTooling.LinkedList import LinkedQueue, LinkedListException
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Instantiation(TestCase):
+	def test_Unbounded(self) -> None:
+		queue = LinkedQueue()
+
+		self.assertIsNone(queue.Capacity)
+		self.assertEqual(0, queue.Count)
+		self.assertEqual(0, len(queue))
+		self.assertTrue(queue.IsEmpty)
+		self.assertFalse(queue.IsFull)
+		self.assertFalse(queue.IsClosed)
+
+	def test_Bounded(self) -> None:
+		queue = LinkedQueue(capacity=2)
+
+		self.assertEqual(2, queue.Capacity)
+
+	def test_WrongCapacity(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = LinkedQueue("2")
+
+		with self.assertRaises(ValueError):
+			_ = LinkedQueue(0)
+
+
+class Operations(TestCase):
+	def test_FIFO(self) -> None:
+		queue = LinkedQueue()
+		for i in range(10):
+			queue.PushLast(i)
+
+		self.assertEqual(10, queue.Count)
+		self.assertListEqual(list(range(10)), [queue.PopFirst() for _ in range(10)])
+		self.assertTrue(queue.IsEmpty)
+
+	def test_PopTimeout(self) -> None:
+		queue = LinkedQueue()
+
+		with self.assertRaises(TimeoutError):
+			queue.PopFirst(timeout=0)
+
+		with self.assertRaises(TimeoutError):
+			queue.PopFirst(timeout=0.01)
+
+	def test_PushTimeout(self) -> None:
+		queue = LinkedQueue(capacity=2)
+		queue.PushLast(1)
+		queue.PushLast(2)
+
+		self.assertTrue(queue.IsFull)
+		with self.assertRaises(TimeoutError):
+			queue.PushLast(3, timeout=0)
+
+		self.assertEqual(1, queue.PopFirst())
+		queue.PushLast(3, timeout=0)
+		self.assertListEqual([2, 3], [queue.PopFirst(), queue.PopFirst()])
+
+	def test_Close(self) -> None:
+		queue = LinkedQueue()
+		queue.PushLast(1)
+		queue.Close()
+
+		self.assertTrue(queue.IsClosed)
+		with self.assertRaises(LinkedListException):
+			queue.PushLast(2)
+
+		self.assertEqual(1, queue.PopFirst())
+		with self.assertRaises(LinkedListException):
+			queue.PopFirst()
+
+	def test_CloseWakesConsumer(self) -> None:
+		queue = LinkedQueue()
+		errors = []
+
+		def consumer() -> None:
+			try:
+				queue.PopFirst()
+			except LinkedListException as ex:
+				errors.append(ex)
+
+		thread = Thread(target=consumer)
+		thread.start()
+		sleep(0.05)
+		queue.Close()
+		thread.join(timeout=5)
+
+		self.assertFalse(thread.is_alive())
+		self.assertEqual(1, len(errors))
+
+
+class ProducerConsumer(TestCase):
+	def test_Threads(self) -> None:
+		queue = LinkedQueue(capacity=4)
+		producers = 4
+		consumers = 3
+		count = 2000
+		results = [[] for _ in range(consumers)]
+
+		def produce(offset: int) -> None:
+			for i in range(count):
+				queue.PushLast(offset * count + i)
+
+		def consume(result: list) -> None:
+			try:
+				while True:
+					result.append(queue.PopFirst())
+			except LinkedListException:
+				pass
+
+		consumerThreads = [Thread(target=consume, args=(result, )) for result in results]
+		producerThreads = [Thread(target=produce, args=(i, )) for i in range(producers)]
+		for thread in consumerThreads + producerThreads:
+			thread.start()
+		for thread in producerThreads:
+			thread.join(timeout=30)
+		queue.Close()
+		for thread in consumerThreads:
+			thread.join(timeout=30)
+
+		values = sorted(value for result in results for value in result)
+		self.assertListEqual(list(range(producers * count)), values)
+		for result in results:
+			for offset in range(producers):
+				own = [value for value in result if offset * count <= value < (offset + 1) * count]
+				self.assertListEqual(sorted(own), own)
+
+		self.assertEqual(0, queue.Count)
+
+
+class Async(TestCase):
+	def test_Coroutines(self) -> None:
+		queue = LinkedQueue(capacity=2)
+
+		async def produce() -> None:
+			for i in range(100):
+				await queue.PushLastAsync(i)
+			queue.Close()
+
+		async def consume() -> list:
+			result = []
+			try:
+				while True:
+					result.append(await queue.PopFirstAsync())
+			except LinkedListException:
+				return result
+
+		async def main() -> list:
+			_, result = await gather(produce(), consume())
+			return result
+
+		self.assertListEqual(list(range(100)), asyncio_run(main()))
+
+	def test_Timeout(self) -> None:
+		queue = LinkedQueue(capacity=1)
+
+		async def main() -> None:
+			with self.assertRaises(TimeoutError):
+				await queue.PopFirstAsync(timeout=0.01)
+
+			await queue.PushLastAsync(1)
+			with self.assertRaises(TimeoutError):
+				await queue.PushLastAsync(2, timeout=0.01)
+
+			self.assertEqual(1, await queue.PopFirstAsync(timeout=0.01))
+
+		asyncio_run(main())
+
+	def test_ThreadsAndCoroutines(self) -> None:
+		queue = LinkedQueue(capacity=8)
+		count = 1000
+
+		def produce() -> None:
+			for i in range(count):
+				queue.PushLast(i)
+
+		async def consume() -> list:
+			result = []
+			for _ in range(count):
+				result.append(await queue.PopFirstAsync(timeout=10))
+			return result
+
+		async def main() -> list:
+			_, result = await gather(to_thread(produce), consume())
+			return result
+
+		self.assertListEqual(list(range(count)), asyncio_run(main()))
+
+	def test_CoroutinesFeedThreads(self) -> None:
+		queue = LinkedQueue(capacity=3)
+		count = 500
+		result = []
+
+		def consume() -> None:
+			for _ in range(count):
+				result.append(queue.PopFirst(timeout=10))
+
+		async def main() -> None:
+			thread = Thread(target=consume)
+			thread.start()
+			for i in range(count):
+				await queue.PushLastAsync(i, timeout=10)
+				if i % 100 == 0:
+					await asyncio_sleep(0)
+			await to_thread(thread.join, 10)
+
+		asyncio_run(main())
+		self.assertListEqual(list(range(count)), result)
@@ -0,0 +1,210 @@
+# ==================================================================================================================== #
+#             _____           _ _               _     _       _            _ _     _     _                             #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ _  | |   (_)_ __ | | _____  __| | |   (_)___| |_                           #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` | | |   | | '_ \| |/ / _ \/ _` | |   | / __| __|                          #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |_| |___| | | | |   <  __/ (_| | |___| \__ \ |_                           #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)_____|_|_| |_|_|\_\___|\__,_|_____|_|___/\__|                          #
+# |_|    |___/                          |___/                                                                          #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for pyTooling.LinkedList.UnrolledLinkedList."""
+
+from random   import Random
+from unittest import TestCase
+
+from pyTooling.LinkedList import UnrolledLinkedList, LinkedListException
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Instantiation(TestCase):
+	def test_Empty(self) -> None:
+		ll = UnrolledLinkedList()
+
+		self.assertTrue(ll.IsEmpty)
+		self.assertEqual(0, ll.Count)
+		self.assertEqual(0, len(ll))
+		self.assertEqual(64, ll.ChunkSize)
+		self.assertEqual(0, ll.ChunkCount)
+		self.assertIsNone(ll.FirstChunk)
+		self.assertIsNone(ll.LastChunk)
+		self.assertListEqual([], ll.ToList())
+
+	def test_Values(self) -> None:
+		ll = UnrolledLinkedList(range(10), chunkSize=4)
+
+		self.assertFalse(ll.IsEmpty)
+		self.assertEqual(10, ll.Count)
+		self.assertEqual(3, ll.ChunkCount)
+		self.assertEqual(4, ll.FirstChunk.Count)
+		self.assertEqual(2, ll.LastChunk.Count)
+		self.assertIs(ll.LastChunk, ll.FirstChunk.NextChunk.NextChunk)
+		self.assertIs(ll.FirstChunk, ll.FirstChunk.NextChunk.PreviousChunk)
+		self.assertListEqual(list(range(10)), ll.ToList())
+		self.assertTupleEqual(tuple(range(9, -1, -1)), ll.ToTuple(reverse=True))
+
+	def test_WrongParameters(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = UnrolledLinkedList(5)
+
+		with self.assertRaises(TypeError):
+			_ = UnrolledLinkedList(chunkSize="4")
+
+		with self.assertRaises(ValueError):
+			_ = UnrolledLinkedList(chunkSize=0)
+
+
+class Operations(TestCase):
+	def test_InsertAndRemove(self) -> None:
+		ll = UnrolledLinkedList(chunkSize=3)
+
+		for i in range(5):
+			ll.InsertAfterLast(i)
+			ll.InsertBeforeFirst(-i - 1)
+
+		self.assertEqual(10, ll.Count)
+		self.assertEqual(4, ll.ChunkCount)
+		self.assertListEqual([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4], ll.ToList())
+		self.assertListEqual([4, 3, 2, 1, 0, -1, -2, -3, -4, -5], list(ll.IterateFromLast()))
+
+		self.assertEqual(-5, ll.RemoveFirst())
+		self.assertEqual(4, ll.RemoveLast())
+		self.assertEqual(8, len(ll))
+
+		while not ll.IsEmpty:
+			ll.RemoveLast()
+
+		self.assertIsNone(ll.FirstChunk)
+		self.assertIsNone(ll.LastChunk)
+		with self.assertRaises(LinkedListException):
+			ll.RemoveFirst()
+		with self.assertRaises(LinkedListException):
+			ll.RemoveLast()
+
+	def test_GetItem(self) -> None:
+		ll = UnrolledLinkedList(range(100), chunkSize=7)
+		ll.RemoveFirst()
+		ll.InsertBeforeFirst(0)
+
+		self.assertListEqual(list(range(100)), [ll[i] for i in range(100)])
+		with self.assertRaises(ValueError):
+			_ = ll[100]
+
+	def test_ReverseAndSort(self) -> None:
+		ll = UnrolledLinkedList([5, 3, 8, 1, 9, 2], chunkSize=4)
+
+		ll.Reverse()
+		self.assertListEqual([2, 9, 1, 8, 3, 5], ll.ToList())
+		self.assertListEqual([5, 3, 8, 1, 9, 2], ll.ToList(reverse=True))
+
+		ll.Sort()
+		self.assertListEqual([1, 2, 3, 5, 8, 9], ll.ToList())
+
+		ll.Sort(key=lambda value: value % 3, reverse=True)
+		self.assertListEqual([2, 5, 8, 1, 3, 9], ll.ToList())
+
+	def test_Clear(self) -> None:
+		ll = UnrolledLinkedList(range(10))
+
+		ll.Clear()
+
+		self.assertEqual(0, ll.Count)
+		self.assertListEqual([], ll.ToList())
+
+
+class CursorIteration(TestCase):
+	def test_Remove(self) -> None:
+		ll = UnrolledLinkedList(range(20), chunkSize=3)
+
+		for cursor in ll.IterateCursorFromFirst():
+			if cursor.Value % 3 != 0:
+				self.assertEqual(cursor.Value, cursor.Remove())
+
+		self.assertListEqual([0, 3, 6, 9, 12, 15, 18], ll.ToList())
+		self.assertListEqual([18, 15, 12, 9, 6, 3, 0], ll.ToList(reverse=True))
+		self.assertEqual(7, ll.Count)
+		self.assertEqual(7, ll.ChunkCount)
+
+		ll.Compact()
+
+		self.assertEqual(3, ll.ChunkCount)
+		self.assertListEqual([0, 3, 6, 9, 12, 15, 18], ll.ToList())
+
+	def test_RemoveAll(self) -> None:
+		ll = UnrolledLinkedList(range(10), chunkSize=4)
+
+		for cursor in ll.IterateCursorFromFirst():
+			cursor.Remove()
+
+			with self.assertRaises(LinkedListException):
+				_ = cursor.Value
+			with self.assertRaises(LinkedListException):
+				cursor.Remove()
+
+		self.assertTrue(ll.IsEmpty)
+		self.assertIsNone(ll.FirstChunk)
+		self.assertIsNone(ll.LastChunk)
+
+	def test_Replace(self) -> None:
+		ll = UnrolledLinkedList(range(5), chunkSize=2)
+
+		for cursor in ll.IterateCursorFromFirst():
+			cursor.Value *= 10
+
+		self.assertListEqual([0, 10, 20, 30, 40], ll.ToList())
+
+
+class Differential(TestCase):
+	def test_RandomOperations(self) -> None:
+		rng = Random(42)
+
+		for chunkSize in (1, 2, 5, 16):
+			reference = list(range(rng.randint(0, 30)))
+			ll = UnrolledLinkedList(reference, chunkSize=chunkSize)
+			for value in range(1000, 1300):
+				operation = rng.randint(0, 4)
+				if operation == 0:
+					ll.InsertBeforeFirst(value)
+					reference.insert(0, value)
+				elif operation == 1:
+					ll.InsertAfterLast(value)
+					reference.append(value)
+				elif operation == 2 and reference:
+					self.assertEqual(reference.pop(0), ll.RemoveFirst())
+				elif operation == 3 and reference:
+					self.assertEqual(reference.pop(), ll.RemoveLast())
+				elif operation == 4:
+					modulo = rng.randint(2, 5)
+					for cursor in ll.IterateCursorFromFirst():
+						if cursor.Value % modulo == 0:
+							cursor.Remove()
+					reference = [v for v in reference if v % modulo != 0]
+
+				self.assertEqual(len(reference), ll.Count)
+				self.assertListEqual(reference, ll.ToList())
+				self.assertListEqual(reference[::-1], list(ll.IterateFromLast()))
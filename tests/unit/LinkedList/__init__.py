@@ -30,6 +30,7 @@
 #
 """Unit tests for pyTooling.LinkedList."""
 
+from random   import Random
 from unittest import TestCase
 
 from pyTooling.LinkedList import Node, LinkedList, LinkedListException
@@ -670,6 +671,7 @@ class MiscOperations(TestCase):
 		self.assertIs(node1, ll.LastNode)
 		self.assertIsNone(node3.PreviousNode)
 		self.assertIsNone(node1.NextNode)
+		self.assertListEqual([1, 2, 3], ll.ToList(reverse=True))
 
 	def test_Sort_Empty(self) -> None:
 		ll = LinkedList()
@@ -732,6 +734,149 @@ class MiscOperations(TestCase):
 
 		self.assertListEqual([i for i in range(1, len(sequence) + 1)], [n._value for n in ll.ToList()])
 
+	def test_Sort_Stable(self) -> None:
+		sequence = [(3, "a"), (1, "b"), (3, "c"), (2, "d"), (1, "e"), (3, "f"), (2, "g")]
+		ll = LinkedList([Node(item) for item in sequence])
+
+		ll.Sort(key=lambda node: node._value[0])
+		self.assertListEqual(sorted(sequence, key=lambda item: item[0]), ll.ToList())
+
+		ll = LinkedList([Node(item) for item in sequence])
+
+		ll.Sort(key=lambda node: node._value[0], reverse=True)
+		self.assertListEqual(sorted(sequence, key=lambda item: item[0], reverse=True), ll.ToList())
+
+	def test_Sort_Random(self) -> None:
+		rng = Random(42)
+
+		for count in (2, 3, 17, 256, 1000):
+			sequence = [rng.randint(0, count // 2) for _ in range(count)]
+			ll = LinkedList([Node(i) for i in sequence])
+
+			ll.Sort()
+
+			self.assertEqual(count, ll.Count)
+			self.assertListEqual(sorted(sequence), ll.ToList())
+			self.assertListEqual(sorted(sequence, reverse=True), ll.ToList(reverse=True))
+			self.assertIsNone(ll.FirstNode.PreviousNode)
+			self.assertIsNone(ll.LastNode.NextNode)
+
+	def test_Sort_Runs(self) -> None:
+		ll = LinkedList([Node(i) for i in range(0, 100, 2)])
+		ll.Extend(LinkedList([Node(i) for i in range(1, 100, 2)]))
+
+		ll.Sort()
+
+		self.assertListEqual(list(range(100)), ll.ToList())
+		self.assertListEqual(list(range(99, -1, -1)), ll.ToList(reverse=True))
+
+
+class Splicing(TestCase):
+	def test_Splice(self) -> None:
+		ll1 = LinkedList([Node(i) for i in (1, 2, 6)])
+		ll2 = LinkedList([Node(i) for i in (3, 4, 5)])
+
+		ll1.Splice(ll2, ll1.GetNodeByIndex(1))
+
+		self.assertEqual(6, ll1.Count)
+		self.assertListEqual([1, 2, 3, 4, 5, 6], ll1.ToList())
+		self.assertListEqual([6, 5, 4, 3, 2, 1], ll1.ToList(reverse=True))
+		self.assertTrue(all(node.List is ll1 for node in ll1.IterateFromFirst()))
+		self.assertEqual(0, ll2.Count)
+		self.assertIsNone(ll2.FirstNode)
+		self.assertIsNone(ll2.LastNode)
+
+	def test_SpliceAtFront(self) -> None:
+		ll1 = LinkedList([Node(i) for i in (3, 4)])
+		ll2 = LinkedList([Node(i) for i in (1, 2)])
+
+		ll1.Splice(ll2)
+
+		self.assertListEqual([1, 2, 3, 4], ll1.ToList())
+		self.assertListEqual([4, 3, 2, 1], ll1.ToList(reverse=True))
+
+	def test_SpliceIntoEmpty(self) -> None:
+		ll1 = LinkedList()
+		ll2 = LinkedList([Node(i) for i in (1, 2)])
+
+		ll1.Splice(ll2)
+		ll1.Splice(LinkedList())
+
+		self.assertEqual(2, ll1.Count)
+		self.assertListEqual([1, 2], ll1.ToList())
+		self.assertIs(ll1.LastNode, ll1.GetNodeByIndex(1))
+
+	def test_Extend(self) -> None:
+		ll1 = LinkedList([Node(i) for i in (1, 2)])
+		ll2 = LinkedList([Node(i) for i in (3, 4)])
+
+		ll1.Extend(ll2)
+		ll1.InsertAfterLast(Node(5))
+
+		self.assertListEqual([1, 2, 3, 4, 5], ll1.ToList())
+		self.assertListEqual([5, 4, 3, 2, 1], ll1.ToList(reverse=True))
+
+	def test_SpliceErrors(self) -> None:
+		ll1 = LinkedList([Node(1)])
+		ll2 = LinkedList([Node(2)])
+
+		with self.assertRaises(TypeError):
+			ll1.Splice([Node(3)])
+
+		with self.assertRaises(TypeError):
+			ll1.Splice(ll2, 1)
+
+		with self.assertRaises(LinkedListException):
+			ll1.Splice(ll1)
+
+		with self.assertRaises(LinkedListException):
+			ll1.Splice(ll2, ll2.FirstNode)
+
+	def test_SpliceKeyIndex(self) -> None:
+		ll1 = LinkedList([Node(i) for i in (1, 2, 3)], keyIndex=True)
+		ll2 = LinkedList([Node(i) for i in (4, 5, 2)])
+
+		with self.assertRaises(ValueError):
+			ll1.Splice(ll2)
+
+		self.assertListEqual([1, 2, 3], ll1.ToList())
+		self.assertListEqual([4, 5, 2], ll2.ToList())
+		self.assertNotIn(4, ll1)
+
+		ll2.RemoveLast()
+		ll1.Extend(ll2)
+
+		self.assertIs(ll1.LastNode, ll1.GetNodeByKey(5))
+		self.assertIn(4, ll1)
+
+	def test_SplitAt(self) -> None:
+		ll1 = LinkedList([Node(i) for i in range(6)], keyIndex=True)
+
+		ll2 = ll1.SplitAt(ll1.GetNodeByKey(4))
+
+		self.assertEqual(4, ll1.Count)
+		self.assertEqual(2, ll2.Count)
+		self.assertListEqual([0, 1, 2, 3], ll1.ToList())
+		self.assertListEqual([3, 2, 1, 0], ll1.ToList(reverse=True))
+		self.assertListEqual([4, 5], ll2.ToList())
+		self.assertListEqual([5, 4], ll2.ToList(reverse=True))
+		self.assertTrue(ll2.HasKeyIndex)
+		self.assertNotIn(4, ll1)
+		self.assertIs(ll2, ll2.GetNodeByKey(4).List)
+
+	def test_SplitAtFirst(self) -> None:
+		ll1 = LinkedList([Node(i) for i in range(3)])
+
+		ll2 = ll1.SplitAt(ll1.FirstNode)
+
+		self.assertEqual(0, ll1.Count)
+		self.assertIsNone(ll1.FirstNode)
+		self.assertIsNone(ll1.LastNode)
+		self.assertListEqual([0, 1, 2], ll2.ToList())
+
+		with self.assertRaises(LinkedListException):
+			ll1.SplitAt(ll2.FirstNode)
+
 
 class GetNode(TestCase):
 	def test_GetFirst(self) -> None:
@@ -1124,6 +1269,98 @@ class Conversion(TestCase):
 		self.assertListEqual(sequence, l)
 
 
+class KeyIndex(TestCase):
+	def test_DefaultKey(self) -> None:
+		node1 = Node(1)
+		node2 = Node(2, key="two")
+
+		self.assertEqual(1, node1.Key)
+		self.assertEqual("two", node2.Key)
+
+	def test_KeyIndex(self) -> None:
+		nodes = [Node(i, key=f"k{i}") for i in range(5)]
+		ll = LinkedList(nodes, keyIndex=True)
+
+		self.assertTrue(ll.HasKeyIndex)
+		self.assertIn("k3", ll)
+		self.assertNotIn("k9", ll)
+		self.assertIs(nodes[3], ll.GetNodeByKey("k3"))
+
+		with self.assertRaises(KeyError):
+			ll.GetNodeByKey("k9")
+
+	def test_WithoutKeyIndex(self) -> None:
+		nodes = [Node(i, key=f"k{i}") for i in range(5)]
+		ll = LinkedList(nodes)
+
+		self.assertFalse(ll.HasKeyIndex)
+		self.assertIn("k3", ll)
+		self.assertNotIn("k9", ll)
+		self.assertIs(nodes[3], ll.GetNodeByKey("k3"))
+		self.assertIs(nodes[4], ll.MoveToFront("k4"))
+		self.assertListEqual([4, 0, 1, 2, 3], ll.ToList())
+
+		with self.assertRaises(KeyError):
+			ll.GetNodeByKey("k9")
+
+	def test_DuplicateKey(self) -> None:
+		with self.assertRaises(ValueError):
+			_ = LinkedList((Node(1, key="a"), Node(2, key="a")), keyIndex=True)
+
+		ll = LinkedList((Node(1, key="a"), ), keyIndex=True)
+		with self.assertRaises(ValueError):
+			ll.InsertAfterLast(Node(2, key="a"))
+		with self.assertRaises(ValueError):
+			ll.FirstNode.InsertNodeAfter(Node(2, key="a"))
+		self.assertEqual(1, ll.Count)
+
+	def test_Maintenance(self) -> None:
+		ll = LinkedList(keyIndex=True)
+		ll.InsertAfterLast(Node(1, key="a"))
+		ll.InsertBeforeFirst(Node(0, key="b"))
+		ll.FirstNode.InsertNodeAfter(Node(2, key="c"))
+		ll.LastNode.InsertNodeBefore(Node(3, key="d"))
+		_ = Node(4, key="e", previousNode=ll.LastNode)
+
+		self.assertListEqual([0, 2, 3, 1, 4], ll.ToList())
+		for key in "abcde":
+			self.assertIn(key, ll)
+
+		ll.RemoveFirst()
+		ll.RemoveLast()
+		ll.GetNodeByKey("c").Remove()
+		self.assertNotIn("b", ll)
+		self.assertNotIn("e", ll)
+		self.assertNotIn("c", ll)
+
+		ll.GetNodeByKey("d").Key = "x"
+		self.assertNotIn("d", ll)
+		self.assertEqual(3, ll.GetNodeByKey("x").Value)
+
+		removed = ll.RemoveByKey("x")
+		self.assertEqual(3, removed.Value)
+		self.assertListEqual([1], ll.ToList())
+
+		ll.Clear()
+		self.assertNotIn("a", ll)
+
+	def test_MoveToFrontAndBack(self) -> None:
+		ll = LinkedList([Node(i, key=i) for i in range(5)], keyIndex=True)
+
+		ll.MoveToFront(3)
+		self.assertListEqual([3, 0, 1, 2, 4], ll.ToList())
+		ll.MoveToFront(4)
+		self.assertListEqual([4, 3, 0, 1, 2], ll.ToList())
+		ll.MoveToBack(4)
+		self.assertListEqual([3, 0, 1, 2, 4], ll.ToList())
+		ll.MoveToBack(0)
+		self.assertListEqual([3, 1, 2, 4, 0], ll.ToList())
+		ll.MoveToBack(3)
+		ll.MoveToFront(1)
+		self.assertListEqual([1, 2, 4, 0, 3], ll.ToList())
+		self.assertListEqual([3, 0, 4, 2, 1], ll.ToList(reverse=True))
+
+
 class Usecases(TestCase):
 	def test_FillBuckets(self) -> None:
 		print()
@@ -29,6 +29,8 @@
 # ==================================================================================================================== #
 #
 """Unit tests for pyTooling.Tree."""
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from io       import StringIO
 from typing   import Any, Optional as Nullable, List, Tuple, Dict
 from unittest import TestCase
 
@@ -43,6 +45,14 @@ if __name__ == "__main__":  # pragma: no cover
 	exit(1)
 
 
+def mapValue(node: Node) -> int:
+	return node.Value
+
+
+def reduceSum(value: int, childResults: List[int]) -> int:
+	return value + sum(childResults)
+
+
 class Construction(TestCase):
 	def test_SingleNode(self) -> None:
 		root: Node[Nullable[Any], int, str, Any] = Node()
@@ -658,6 +668,279 @@ class Iteration(TestCase):
 		], [node.ID for node in self._root.IterateLeafs()])
 
 
+class Aggregates(TestCase):
+	def _CreateTree(self) -> Node:
+		root = Node(1, value=1)
+		children = [Node(2, value=2, parent=root), Node(3, value=3, parent=root)]
+		grandChildren = [Node(4, value=4, parent=children[0]), Node(5, value=5, parent=children[0])]
+		Node(6, value=6, parent=grandChildren[1])
+
+		return root
+
+	def test_Unmaintained(self) -> None:
+		root = self._CreateTree()
+
+		self.assertFalse(root.AggregatesEnabled)
+		self.assertEqual(6, root.SubtreeSize)
+		self.assertEqual(3, root.SubtreeHeight)
+		self.assertEqual(3, root.LeafCount)
+		self.assertEqual(4, root.GetNodeByID(2).SubtreeSize)
+		self.assertEqual(0, root.GetNodeByID(3).SubtreeHeight)
+
+	def test_EnableAggregates(self) -> None:
+		root = self._CreateTree()
+		root.GetNodeByID(5).EnableAggregates()
+
+		self.assertTrue(root.AggregatesEnabled)
+		self.assertTrue(root.GetNodeByID(6).AggregatesEnabled)
+		self.assertEqual(6, root.SubtreeSize)
+		self.assertEqual(3, root.SubtreeHeight)
+		self.assertEqual(3, root.LeafCount)
+		self.assertEqual(4, root.GetNodeByID(2).SubtreeSize)
+		self.assertEqual(2, root.GetNodeByID(2).SubtreeHeight)
+		self.assertEqual(2, root.GetNodeByID(2).LeafCount)
+
+		root.DisableAggregates()
+		self.assertFalse(root.AggregatesEnabled)
+		self.assertFalse(root.GetNodeByID(6).AggregatesEnabled)
+
+	def test_IncrementalAdd(self) -> None:
+		root = self._CreateTree()
+		root.EnableAggregates()
+
+		Node(7, parent=root.GetNodeByID(3))
+		self.assertEqual(7, root.SubtreeSize)
+		self.assertEqual(3, root.LeafCount)
+		self.assertEqual(3, root.SubtreeHeight)
+
+		subtree = Node(8)
+		Node(9, parent=Node(10, parent=subtree))
+		root.GetNodeByID(6).AddChild(subtree)
+		self.assertEqual(10, root.SubtreeSize)
+		self.assertEqual(3, root.LeafCount)
+		self.assertEqual(6, root.SubtreeHeight)
+		self.assertEqual(3, subtree.SubtreeSize)
+		self.assertTrue(subtree.AggregatesEnabled)
+
+		other = Node(11)
+		other.Parent = root.GetNodeByID(4)
+		self.assertEqual(11, root.SubtreeSize)
+		self.assertEqual(3, root.LeafCount)
+
+		root.GetNodeByID(7).AddChildren([Node(12), Node(13)])
+		self.assertEqual(13, root.SubtreeSize)
+		self.assertEqual(4, root.LeafCount)
+
+	def test_IncrementalRemove(self) -> None:
+		root = self._CreateTree()
+		root.EnableAggregates()
+
+		node5 = root.GetNodeByID(5)
+		node5.Parent = None
+		self.assertEqual(4, root.SubtreeSize)
+		self.assertEqual(2, root.SubtreeHeight)
+		self.assertEqual(2, root.LeafCount)
+		self.assertEqual(2, root.GetNodeByID(2).SubtreeSize)
+		self.assertEqual(2, node5.SubtreeSize)
+		self.assertEqual(1, node5.SubtreeHeight)
+
+	def test_MergeIntoUnmaintainedTree(self) -> None:
+		root = self._CreateTree()
+		subtree = Node(7)
+		Node(8, parent=subtree)
+		subtree.EnableAggregates()
+
+		root.AddChild(subtree)
+		self.assertFalse(subtree.AggregatesEnabled)
+		self.assertFalse(root.GetNodeByID(8).AggregatesEnabled)
+		self.assertEqual(2, subtree.SubtreeSize)
+		self.assertEqual(8, root.SubtreeSize)
+
+	def test_Aggregate(self) -> None:
+		calls = []
+
+		def sumValues(node: Node, childResults: List[int]) -> int:
+			calls.append(node.ID)
+			return node.Value + sum(childResults)
+
+		root = self._CreateTree()
+		self.assertEqual(21, root.Aggregate(sumValues))
+		self.assertEqual(6, len(calls))
+		self.assertEqual(17, root.GetNodeByID(2).Aggregate(sumValues))
+		self.assertEqual(6, len(calls))
+
+		root.GetNodeByID(6).Value = 10
+		self.assertEqual(25, root.Aggregate(sumValues))
+		self.assertListEqual([6, 5, 2, 1], calls[6:])
+
+		Node(7, value=7, parent=root.GetNodeByID(3))
+		self.assertEqual(32, root.Aggregate(sumValues))
+		self.assertListEqual([7, 3, 1], calls[10:])
+
+		root.GetNodeByID(2).Parent = None
+		self.assertEqual(11, root.Aggregate(sumValues))
+
+
+class Search(TestCase):
+	def _CreateTree(self) -> Node:
+		root = Node(0, value="root", keyValuePairs={"kind": "dir"})
+		lib = Node(1, value="lib", keyValuePairs={"kind": "dir"}, parent=root)
+		Node(2, value="a.py", keyValuePairs={"kind": "file"}, parent=lib)
+		Node(3, value="b.py", keyValuePairs={"kind": "file"}, parent=lib)
+		doc = Node(4, value="doc", keyValuePairs={"kind": "dir"}, parent=root)
+		Node(5, value="a.py", keyValuePairs={"kind": "file"}, parent=doc)
+		Node(6, value="README", parent=root)
+
+		return root
+
+	def test_Find(self) -> None:
+		root = self._CreateTree()
+
+		self.assertListEqual([2, 3, 5], [node.ID for node in root.Find(lambda n: n.Value.endswith(".py"))])
+		self.assertListEqual([2, 3], [node.ID for node in root.GetNodeByID(1).Find(lambda n: n.Value.endswith(".py"))])
+		self.assertListEqual([0, 1, 2, 3, 4, 5, 6], [node.ID for node in root.Find(lambda n: True)])
+
+	def test_FindWithPrune(self) -> None:
+		root = self._CreateTree()
+
+		found = root.Find(lambda n: n.Value.endswith(".py"), prune=lambda n: n.Value == "lib")
+		self.assertListEqual([5], [node.ID for node in found])
+
+	def test_FindByKeyWithoutIndex(self) -> None:
+		root = self._CreateTree()
+
+		self.assertFalse(root.HasIndex())
+		self.assertListEqual([2, 5], [node.ID for node in root.FindByKey(None, "a.py")])
+		self.assertListEqual([0, 1, 4], [node.ID for node in root.FindByKey("kind", "dir")])
+		self.assertTupleEqual((), root.FindByKey("kind", "link"))
+
+	def test_FindByKeyWithIndex(self) -> None:
+		root = self._CreateTree()
+		root.CreateIndex()
+		root.GetNodeByID(3).CreateIndex("kind")
+
+		self.assertTrue(root.HasIndex())
+		self.assertTrue(root.HasIndex("kind"))
+		self.assertSetEqual({2, 5}, {node.ID for node in root.FindByKey(None, "a.py")})
+		self.assertSetEqual({0, 1, 4}, {node.ID for node in root.FindByKey("kind", "dir")})
+		self.assertTupleEqual((), root.FindByKey("kind", "link"))
+
+		root.DropIndex("kind")
+		self.assertFalse(root.HasIndex("kind"))
+
+	def test_IndexMaintenance(self) -> None:
+		root = self._CreateTree()
+		root.CreateIndex()
+		root.CreateIndex("kind")
+
+		node = Node(7, value="c.py", keyValuePairs={"kind": "file"}, parent=root.GetNodeByID(4))
+		self.assertTupleEqual((node, ), root.FindByKey(None, "c.py"))
+		self.assertEqual(4, len(root.FindByKey("kind", "file")))
+
+		node.Value = "d.py"
+		node["kind"] = "link"
+		self.assertTupleEqual((), root.FindByKey(None, "c.py"))
+		self.assertTupleEqual((node, ), root.FindByKey(None, "d.py"))
+		self.assertTupleEqual((node, ), root.FindByKey("kind", "link"))
+
+		del node["kind"]
+		self.assertTupleEqual((), root.FindByKey("kind", "link"))
+
+	def test_IndexMergeAndSplit(self) -> None:
+		root = self._CreateTree()
+		root.CreateIndex()
+
+		subtree = Node(10, value="src")
+		Node(11, value="a.py", parent=subtree)
+		subtree.CreateIndex("kind")
+		root.AddChild(subtree)
+
+		self.assertEqual(3, len(root.FindByKey(None, "a.py")))
+		self.assertFalse(root.HasIndex("kind"))
+
+		doc = root.GetNodeByID(4)
+		doc.Parent = None
+		self.assertEqual(2, len(root.FindByKey(None, "a.py")))
+		self.assertTrue(doc.HasIndex())
+		self.assertTupleEqual((doc.GetNodeByID(5), ), doc.FindByKey(None, "a.py"))
+
+
+class MapReduce(TestCase):
+	def _CreateTree(self, count: int = 1000) -> Node:
+		root = Node(0, value=0)
+		nodes = [root]
+		for i in range(1, count):
+			nodes.append(Node(i, value=i, parent=nodes[(i * 7) // 10]))
+
+		return root
+
+	def test_Sequential(self) -> None:
+		root = self._CreateTree()
+
+		self.assertEqual(sum(range(1000)), root.MapReduce(mapValue, reduceSum))
+		self.assertEqual(sum(range(1000)), root.MapReduce(mapValue, reduceSum, chunkSize=1))
+		self.assertEqual(sum(range(1000)), root.MapReduce(mapValue, reduceSum, chunkSize=5000))
+
+	def test_Subtree(self) -> None:
+		root = self._CreateTree()
+		node = root.GetNodeByID(3)
+
+		self.assertEqual(node.Aggregate(lambda n, results: n.Value + sum(results)), node.MapReduce(mapValue, reduceSum, chunkSize=10))
+
+	def test_ChildOrder(self) -> None:
+		root = self._CreateTree(200)
+
+		def mapID(node: Node) -> str:
+			return str(node.ID)
+
+		def reduceConcat(value: str, childResults: List[str]) -> str:
+			return f"{value}({','.join(childResults)})"
+
+		expected = root.MapReduce(mapID, reduceConcat, chunkSize=1000)
+		self.assertEqual(expected, root.MapReduce(mapID, reduceConcat, chunkSize=7))
+		with ThreadPoolExecutor(max_workers=4) as executor:
+			self.assertEqual(expected, root.MapReduce(mapID, reduceConcat, executor=executor, chunkSize=7))
+
+	def test_WideTree(self) -> None:
+		root = Node(0, value=0)
+		for i in range(1, 1001):
+			Node(i, value=i, parent=root)
+
+		submissions = []
+
+		class CountingExecutor(ThreadPoolExecutor):
+			def submit(self, fn, /, *args, **kwargs):
+				submissions.append(len(args[0]))
+				return super().submit(fn, *args, **kwargs)
+
+		def mapID(node: Node) -> str:
+			return str(node.ID)
+
+		def reduceConcat(value: str, childResults: List[str]) -> str:
+			return f"{value}({','.join(childResults)})"
+
+		expected = root.MapReduce(mapID, reduceConcat, chunkSize=5000)
+		self.assertEqual(expected, root.MapReduce(mapID, reduceConcat, chunkSize=100))
+		with CountingExecutor(max_workers=4) as executor:
+			self.assertEqual(expected, root.MapReduce(mapID, reduceConcat, executor=executor, chunkSize=100))
+			self.assertEqual(sum(range(1001)), root.MapReduce(mapValue, reduceSum, executor=executor, chunkSize=100))
+
+		# 10 chunks of 100 leaves each and the root chunk referencing them.
+		self.assertListEqual([100] * 10 + [11], submissions[:11])
+
+	def test_ThreadPool(self) -> None:
+		root = self._CreateTree()
+
+		with ThreadPoolExecutor(max_workers=4) as executor:
+			self.assertEqual(sum(range(1000)), root.MapReduce(mapValue, reduceSum, executor=executor, chunkSize=50))
+
+	def test_ProcessPool(self) -> None:
+		root = self._CreateTree()
+
+		with ProcessPoolExecutor(max_workers=2) as executor:
+			self.assertEqual(sum(range(1000)), root.MapReduce(mapValue, reduceSum, executor=executor, chunkSize=100))
+
+
 class Exceptions(TestCase):
 	def test_NewNodeWithWrongParent(self) -> None:
 		with self.assertRaises(TypeError):
@@ -812,3 +1095,32 @@ class Rendering(TestCase):
 		print(rendering, end="")
 		print("=" * 40)
 		self.assertEqual(len(self._tree) + 2, len(rendering.split("\n")))
+
+	def test_RenderTo(self) -> None:
+		root = Node(nodeID=0, value="<Root 0>", keyValuePairs={"time": 85.3})
+		for parentID, childID, kvp in self._tree:
+			Node(nodeID=childID, value=f"<Node {childID}>", keyValuePairs=kvp, parent=root.GetNodeByID(parentID))
+
+		stream = StringIO()
+		root.RenderTo(stream, bypassMarker="|   ", nodeMarker="o-- ", lastNodeMarker="`-- ")
+
+		self.assertEqual(root.Render(bypassMarker="|   ", nodeMarker="o-- ", lastNodeMarker="`-- "), stream.getvalue())
+
+	def test_RenderToWithElision(self) -> None:
+		root = Node(nodeID=0)
+		for i in range(1, 10001):
+			Node(nodeID=i, parent=root)
+		Node(nodeID=20000, parent=Node(nodeID=10001, parent=root.GetNodeByID(1)))
+
+		stream = StringIO()
+		root.RenderTo(stream, maxDepth=2, maxChildren=2)
+
+		expected = (
+			"0\n"
+			"├─1\n"
+			"│ └─10001\n"
+			"│   └─... 1 more\n"
+			"├─2\n"
+			"└─... 9,998 more\n"
+		)
+		self.assertEqual(expected, stream.getvalue())
@@ -32,7 +32,7 @@
 from unittest             import TestCase
 from pytest               import mark
 
-from pyTooling.Versioning import Flags, CalendarVersion, WordSizeValidator, MaxValueValidator
+from pyTooling.Versioning import Flags, Version, CalendarVersion, WordSizeValidator, MaxValueValidator
 from pyTooling.Versioning import YearMonthVersion, YearWeekVersion, YearReleaseVersion, YearMonthDayVersion
 
 
@@ -250,6 +250,28 @@ class HashVersions(TestCase):
 		self.assertIsNotNone(version.__hash__())
 
 
+class ParseCache(TestCase):
+	def test_SharedInstance(self) -> None:
+		Version.ConfigureParseCache()
+
+		self.assertIs(CalendarVersion.Parse("2024.2"), CalendarVersion.Parse("2024.2"))
+		self.assertEqual(1, Version.GetParseCacheStatistics().Hits)
+
+
+class SortKey(TestCase):
+	def test_CalendarVersion(self) -> None:
+		version = CalendarVersion.Parse("2024.2")
+
+		self.assertTupleEqual((2024, 2, 0), version.SortKey)
+		self.assertIs(version.SortKey, version.SortKey)
+
+	def test_Sorted(self) -> None:
+		versions = [YearMonthDayVersion(2024, 8, 25), YearMonthDayVersion(2023, 12, 1), YearMonthDayVersion(2024, 8, 3)]
+
+		self.assertListEqual(sorted(versions, key=lambda version: version.SortKey), sorted(versions))
+		self.assertEqual(YearMonthDayVersion(2023, 12, 1), sorted(versions)[0])
+
+
 class CompareNone(TestCase):
 	def test_Equal(self) -> None:
 		version = CalendarVersion(1, 2)
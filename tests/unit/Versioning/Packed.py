@@ -0,0 +1,183 @@
+# ==================================================================================================================== #
+#             _____           _ _           __     __            _             _                                       #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                           #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                          #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                          #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                          #
+# |_|    |___/                          |___/                                          |___/                           #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for module :mod:`pyTooling.Versioning.Packed`."""
+from unittest                    import TestCase
+from unittest.mock               import patch
+
+from pyTooling.Versioning        import SemanticVersion, PythonVersion, ReleaseLevel, VersionRange, RangeBoundHandling
+from pyTooling.Versioning        import VersionSet, VersionSpecifier
+from pyTooling.Versioning.Packed import INVALID, PackedVersionArray, packVersion, unpackVersion
+from pyTooling.Versioning        import Packed
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Packing(TestCase):
+	def test_RoundTrip(self) -> None:
+		for versionString in ("0.0.0", "1.2.3", "65535.65535.65535", "1.2.3.alpha4", "2.0.0.rc1", "3.1.4.beta2"):
+			with self.subTest(versionString=versionString):
+				version = SemanticVersion.Parse(versionString)
+
+				self.assertEqual(version, unpackVersion(packVersion(version)))
+
+	def test_Order(self) -> None:
+		versionStrings = ("1.0.0.alpha1", "1.0.0.alpha2", "1.0.0.beta1", "1.0.0.rc1", "1.0.0", "1.0.1", "1.1.0", "2.0.0")
+		packed = [packVersion(SemanticVersion.Parse(versionString)) for versionString in versionStrings]
+
+		self.assertListEqual(sorted(packed), packed)
+
+	def test_Unpackable(self) -> None:
+		for version in (SemanticVersion(65536, 0, 0), SemanticVersion.Parse("1.2.3.post1"), SemanticVersion.Parse("1.2.3.4")):
+			with self.subTest(version=version):
+				with self.assertRaises(ValueError):
+					packVersion(version)
+
+		with self.assertRaises(TypeError):
+			packVersion("1.2.3")
+
+		with self.assertRaises(ValueError):
+			unpackVersion(INVALID)
+
+	def test_VersionClass(self) -> None:
+		version = unpackVersion(packVersion(SemanticVersion(3, 12, 1)), PythonVersion)
+
+		self.assertIsInstance(version, PythonVersion)
+		self.assertEqual(SemanticVersion(3, 12, 1), version)
+
+
+class Array(TestCase):
+	def test_FromStrings(self) -> None:
+		packed = PackedVersionArray.FromStrings(["1", "1.2", "1.2.3", "v1.2.4", "1.2.3.post1", "invalid", "1..2", "70000.0.0"])
+
+		self.assertEqual(8, len(packed))
+		self.assertEqual(packVersion(SemanticVersion(1, 0, 0)), packed[0])
+		self.assertEqual(packVersion(SemanticVersion(1, 2, 0)), packed[1])
+		self.assertEqual(packVersion(SemanticVersion(1, 2, 3)), packed[2])
+		self.assertEqual(packVersion(SemanticVersion(1, 2, 4)), packed[3])
+		for index in range(4, 8):
+			with self.subTest(index=index):
+				self.assertEqual(INVALID, packed[index])
+
+	def test_FromVersions(self) -> None:
+		packed = PackedVersionArray.FromVersions([SemanticVersion(1, 2, 3), SemanticVersion.Parse("1.2.3.4")])
+
+		self.assertEqual(packVersion(SemanticVersion(1, 2, 3)), packed[0])
+		self.assertEqual(INVALID, packed[1])
+
+	def test_VersionClass(self) -> None:
+		with self.assertRaises(TypeError):
+			PackedVersionArray(versionClass=str)
+
+	def test_Decode(self) -> None:
+		packed = PackedVersionArray.FromStrings(["1.0", "invalid", "2.0"], PythonVersion)
+		versions = packed.Decode([2, 0])
+
+		self.assertListEqual([SemanticVersion(2, 0, 0), SemanticVersion(1, 0, 0)], versions)
+		self.assertIsInstance(versions[0], PythonVersion)
+
+		with self.assertRaises(ValueError):
+			packed.Decode([1])
+
+
+class Membership(TestCase):
+	_versionStrings = ("1.0.0", "1.2.0.alpha1", "1.2.0", "1.2.4", "1.5.0", "1.5.3", "1.6.0", "2.0.0.rc1", "2.0.0", "invalid")
+
+	def _expected(self, constraint) -> list:
+		result = []
+		for versionString in self._versionStrings:
+			try:
+				version = SemanticVersion.Parse(versionString)
+			except ValueError:
+				result.append(False)
+				continue
+
+			result.append(version in constraint)
+
+		return result
+
+	def test_Range(self) -> None:
+		packed = PackedVersionArray.FromStrings(self._versionStrings)
+		for versionRange in (
+			VersionRange(SemanticVersion(1, 2, 0), SemanticVersion(1, 6, 0)),
+			VersionRange(SemanticVersion(1, 2, 0), SemanticVersion(1, 6, 0), RangeBoundHandling.BothBoundsExclusive),
+			VersionRange(None, SemanticVersion(1, 5, 0)),
+			VersionRange(SemanticVersion(1, 5, 0), None, RangeBoundHandling.LowerBoundExclusive),
+		):
+			with self.subTest(versionRange=versionRange):
+				self.assertListEqual(self._expected(versionRange), [bool(contained) for contained in packed.Mask(versionRange)])
+
+	def test_Specifier(self) -> None:
+		packed = PackedVersionArray.FromStrings(self._versionStrings)
+		for specifierString in (">=1.2, <2.0, !=1.5.*", "^1.2 || >=2.0", "~1.5", "==1.2.4", "<1.2", "*", ">1.0.0.post3, <=1.2.0.dev1", ">3, <2"):
+			with self.subTest(specifierString=specifierString):
+				specifier = VersionSpecifier.Parse(specifierString)
+
+				self.assertListEqual(self._expected(specifier), [bool(contained) for contained in packed.Mask(specifier)])
+
+	def test_Set(self) -> None:
+		packed = PackedVersionArray.FromStrings(self._versionStrings)
+		versionSet = VersionSet([SemanticVersion(1, 2, 4), SemanticVersion(2, 0, 0), SemanticVersion(3, 0, 0)])
+
+		self.assertListEqual([3, 8], packed.Select(versionSet))
+
+	def test_Select(self) -> None:
+		packed = PackedVersionArray.FromStrings(self._versionStrings)
+		indices = packed.Select(VersionSpecifier.Parse(">=1.2, <2.0, !=1.5.*"))
+
+		self.assertListEqual([2, 3, 6], indices)
+		self.assertListEqual([SemanticVersion(1, 2, 0), SemanticVersion(1, 2, 4), SemanticVersion(1, 6, 0)], packed.Decode(indices))
+
+	def test_InvalidConstraint(self) -> None:
+		packed = PackedVersionArray.FromStrings(self._versionStrings)
+
+		with self.assertRaises(TypeError):
+			packed.Mask("1.2.3")
+
+	def test_ResultType(self) -> None:
+		packed = PackedVersionArray.FromStrings(self._versionStrings)
+		expectedType = list if Packed.numpy is None else Packed.numpy.ndarray
+
+		for constraint in (VersionSpecifier.Parse(">=1.2"), VersionSpecifier.Parse(">3, <2"), VersionSet([SemanticVersion(1, 2, 4)])):
+			with self.subTest(constraint=constraint):
+				self.assertIsInstance(packed.Mask(constraint), expectedType)
+
+
+class MembershipWithoutNumPy(Membership):
+	"""Run all membership tests through the pure Python implementation."""
+
+	def setUp(self) -> None:
+		patcher = patch.object(Packed, "numpy", None)
+		patcher.start()
+		self.addCleanup(patcher.stop)
@@ -274,3 +274,33 @@ class Intersection(TestCase):
 
 		self.assertEqual(vA1, intersection.LowerBound)
 		self.assertEqual(vB2, intersection.UpperBound)
+
+
+class Unbounded(TestCase):
+	def test_LowerUnbounded(self) -> None:
+		vr = VersionRange(None, SemanticVersion(2, 0, 0), RangeBoundHandling.UpperBoundExclusive)
+
+		self.assertIsNone(vr.LowerBound)
+		self.assertIn(SemanticVersion(0, 0, 1), vr)
+		self.assertNotIn(SemanticVersion(2, 0, 0), vr)
+		self.assertFalse(SemanticVersion(0, 0, 1) < vr)
+		self.assertFalse(vr > SemanticVersion(0, 0, 1))
+
+	def test_UpperUnbounded(self) -> None:
+		vr = VersionRange(SemanticVersion(1, 0, 0), None)
+
+		self.assertIsNone(vr.UpperBound)
+		self.assertIn(SemanticVersion(99, 0, 0), vr)
+		self.assertNotIn(SemanticVersion(0, 9, 0), vr)
+		self.assertFalse(SemanticVersion(99, 0, 0) > vr)
+		self.assertFalse(vr < SemanticVersion(99, 0, 0))
+
+	def test_Intersection(self) -> None:
+		vrA = VersionRange(SemanticVersion(1, 0, 0), None)
+		vrB = VersionRange(None, SemanticVersion(2, 0, 0))
+
+		intersection = vrA & vrB
+
+		self.assertEqual(SemanticVersion(1, 0, 0), intersection.LowerBound)
+		self.assertEqual(SemanticVersion(2, 0, 0), intersection.UpperBound)
+
@@ -31,7 +31,7 @@
 """Unit tests for package :mod:`pyTooling.Versioning`."""
 from unittest             import TestCase
 
-from pyTooling.Versioning import Flags, ReleaseLevel, SemanticVersion, WordSizeValidator, MaxValueValidator
+from pyTooling.Versioning import Flags, ReleaseLevel, Version, SemanticVersion, PythonVersion, WordSizeValidator, MaxValueValidator
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -435,6 +435,143 @@ class Parsing(TestCase):
 		self.assertEqual(2, version.ReleaseNumber)
 
 
+class ParseMany(TestCase):
+	def test_Empty(self) -> None:
+		versions, failures = SemanticVersion.ParseMany([])
+
+		self.assertListEqual([], versions)
+		self.assertListEqual([], failures)
+
+	def test_Simple(self) -> None:
+		versionStrings = ("1", "1.2", "1.2.3", "10.20.30")
+		versions, failures = SemanticVersion.ParseMany(versionStrings)
+
+		self.assertListEqual([SemanticVersion.Parse(v) for v in versionStrings], versions)
+		self.assertListEqual([], failures)
+
+	def test_FastPathEqualsParse(self) -> None:
+		Version.ConfigureParseCache(0)
+		try:
+			for versionString in ("1", "1.2", "1.2.3"):
+				with self.subTest(versionString=versionString):
+					expected = SemanticVersion.Parse(versionString)
+					(version, ), _ = SemanticVersion.ParseMany([versionString])
+
+					self.assertEqual(expected, version)
+					self.assertEqual(expected.Parts, version.Parts)
+					self.assertEqual(expected.Flags, version.Flags)
+					self.assertEqual(hash(expected), hash(version))
+					self.assertEqual(str(expected), str(version))
+		finally:
+			Version.ConfigureParseCache()
+
+	def test_Complex(self) -> None:
+		versions, failures = SemanticVersion.ParseMany(["v1.2.3", "1.2.3.rc1", "1.2.8.post2.dev4", " 2.0 "])
+
+		self.assertEqual(4, len(versions))
+		self.assertEqual(ReleaseLevel.ReleaseCandidate, versions[1].ReleaseLevel)
+		self.assertEqual(2, versions[2].Post)
+		self.assertEqual(SemanticVersion(2, 0), versions[3])
+		self.assertListEqual([], failures)
+
+	def test_Skip(self) -> None:
+		versions, failures = SemanticVersion.ParseMany(["1.0", "None", "1..2", None, "2.0"])
+
+		self.assertListEqual([SemanticVersion(1, 0), SemanticVersion(2, 0)], versions)
+		self.assertListEqual([], failures)
+
+	def test_Collect(self) -> None:
+		versions, failures = SemanticVersion.ParseMany(["1.0", "None", "", None, "2.0"], onError="collect")
+
+		self.assertListEqual([SemanticVersion(1, 0), SemanticVersion(2, 0)], versions)
+		self.assertListEqual(["None", "", None], [versionString for versionString, _ in failures])
+		self.assertIsInstance(failures[0][1], ValueError)
+		self.assertIsInstance(failures[1][1], ValueError)
+		self.assertIsInstance(failures[2][1], TypeError)
+
+	def test_Raise(self) -> None:
+		with self.assertRaises(ValueError):
+			_ = SemanticVersion.ParseMany(["1.0", "None", "2.0"], onError="raise")
+
+		with self.assertRaises(TypeError):
+			_ = SemanticVersion.ParseMany(["1.0", 2], onError="raise")
+
+	def test_InvalidOnError(self) -> None:
+		with self.assertRaises(ValueError):
+			_ = SemanticVersion.ParseMany(["1.0"], onError="ignore")
+
+	def test_PythonVersion(self) -> None:
+		versions, _ = PythonVersion.ParseMany(["3.12.1", "3.13.0rc2"])
+
+		self.assertTrue(all(isinstance(version, PythonVersion) for version in versions))
+
+
+class ParseCache(TestCase):
+	def setUp(self) -> None:
+		Version.ConfigureParseCache()
+
+	def tearDown(self) -> None:
+		Version.ConfigureParseCache()
+
+	def test_SharedInstance(self) -> None:
+		version1 = SemanticVersion.Parse("v1.2.3")
+		version2 = SemanticVersion.Parse("v1.2.3")
+
+		self.assertIs(version1, version2)
+
+		statistics = Version.GetParseCacheStatistics()
+		self.assertEqual(1, statistics.Hits)
+		self.assertEqual(1, statistics.Misses)
+
+	def test_KeyedByClass(self) -> None:
+		version1 = SemanticVersion.Parse("3.12.1")
+		version2 = PythonVersion.Parse("3.12.1")
+
+		self.assertIsNot(version1, version2)
+		self.assertIs(SemanticVersion, version1.__class__)
+		self.assertIs(PythonVersion, version2.__class__)
+
+	def test_InvalidNotCached(self) -> None:
+		with self.assertRaises(ValueError):
+			_ = SemanticVersion.Parse("None")
+		with self.assertRaises(ValueError):
+			_ = SemanticVersion.Parse("None")
+
+		self.assertEqual(0, Version.GetParseCacheStatistics().Hits)
+
+	def test_ValidatorOnHit(self) -> None:
+		_ = SemanticVersion.Parse("v1.2.3")
+
+		with self.assertRaises(ValueError):
+			_ = SemanticVersion.Parse("v1.2.3", validator=lambda v: v.Major > 1)
+
+	def test_Resize(self) -> None:
+		Version.ConfigureParseCache(2)
+
+		for versionString in ("1.0.0", "2.0.0", "3.0.0"):
+			_ = SemanticVersion.Parse(versionString)
+
+		self.assertEqual(1, Version.GetParseCacheStatistics().Evictions)
+
+	def test_Disable(self) -> None:
+		Version.ConfigureParseCache(0)
+
+		self.assertIsNone(Version.GetParseCacheStatistics())
+		self.assertIsNot(SemanticVersion.Parse("v1.2.3"), SemanticVersion.Parse("v1.2.3"))
+
+	def test_Clear(self) -> None:
+		version = SemanticVersion.Parse("v1.2.3")
+		Version.ClearParseCache()
+
+		self.assertIsNot(version, SemanticVersion.Parse("v1.2.3"))
+
+	def test_InvalidSize(self) -> None:
+		with self.assertRaises(TypeError):
+			Version.ConfigureParseCache("10")
+		with self.assertRaises(ValueError):
+			Version.ConfigureParseCache(-1)
+
+
 class HashVersions(TestCase):
 	def test_SemanticVersion(self) -> None:
 		version = SemanticVersion.Parse("v1.2.3")
@@ -442,6 +579,46 @@ class HashVersions(TestCase):
 		self.assertIsNotNone(version.__hash__())
 
 
+class SortKey(TestCase):
+	def test_SortKey(self) -> None:
+		version = SemanticVersion.Parse("v1.2.3")
+
+		self.assertTupleEqual((1, 2, 3, ReleaseLevel.Final.value, 0, 0, 0, 0), version.SortKey)
+		self.assertIs(version.SortKey, version.SortKey)
+
+	def test_ReleaseLevel(self) -> None:
+		alpha = SemanticVersion(1, 2, 3, ReleaseLevel.Alpha, 1)
+		beta = SemanticVersion(1, 2, 3, ReleaseLevel.Beta, 1)
+		rc = SemanticVersion(1, 2, 3, ReleaseLevel.ReleaseCandidate, 2)
+		final = SemanticVersion(1, 2, 3)
+
+		self.assertLess(alpha.SortKey, beta.SortKey)
+		self.assertLess(beta.SortKey, rc.SortKey)
+		self.assertLess(rc.SortKey, final.SortKey)
+
+	def test_Sorted(self) -> None:
+		versionStrings = ("2.0.0", "1.10.0", "1.2.10", "1.2.3", "0.9.9", "1.2.3.rc1", "1.2.3.a2", "10.0.0")
+		versions = [SemanticVersion.Parse(v) for v in versionStrings]
+
+		byOperator = sorted(versions)
+		byKey = sorted(versions, key=lambda version: version.SortKey)
+
+		self.assertListEqual(byKey, byOperator)
+		for left, right in zip(byOperator[:-1], byOperator[1:]):
+			self.assertLessEqual(left, right)
+
+	def test_PostfixIgnoredForOrdering(self) -> None:
+		version1 = SemanticVersion(1, 2, 3, postfix="foo")
+		version2 = SemanticVersion(1, 2, 3, postfix="bar")
+
+		self.assertEqual(version1.SortKey, version2.SortKey)
+		self.assertNotEqual(version1, version2)
+		self.assertLessEqual(version1, version2)
+		self.assertGreaterEqual(version1, version2)
+		self.assertFalse(version1 < version2)
+		self.assertFalse(version1 > version2)
+
+
 class CompareVersions(TestCase):
 	def test_Equal(self) -> None:
 		l = [
@@ -33,7 +33,8 @@ from unittest             import TestCase
 
 from pytest               import mark
 
-from pyTooling.Versioning import SemanticVersion, PythonVersion, CalendarVersion, VersionSet
+from pyTooling.Versioning import SemanticVersion, PythonVersion, CalendarVersion, VersionSet, VersionSetView
+from pyTooling.Versioning import VersionRange, RangeBoundHandling
 
 if __name__ == "__main__":  # pragma: no cover
 	print("ERROR: you called a testcase declaration file as an executable module.")
@@ -183,6 +184,22 @@ class Comparison(TestCase):
 		self.assertTrue(v2 in vs)
 		self.assertFalse(vF in vs)
 
+	def test_In_Postfix(self) -> None:
+		v1 = SemanticVersion(1, 0, 0, postfix="deb11")
+		v2 = SemanticVersion(1, 0, 0, postfix="deb12")
+		v3 = SemanticVersion(1, 0, 0)
+
+		vs = VersionSet((v1, v2))
+
+		self.assertIn(SemanticVersion(1, 0, 0, postfix="deb12"), vs)
+		self.assertNotIn(v3, vs)
+
+	def test_In_String(self) -> None:
+		vs = VersionSet((SemanticVersion(1, 0, 0), SemanticVersion(1, 5, 0)))
+
+		self.assertIn("1.5.0", vs)
+		self.assertNotIn("1.6.0", vs)
+
 
 class Ordering(TestCase):
 	def test_Index(self) -> None:
@@ -301,3 +318,86 @@ class Union(TestCase):
 		union = vsA | vsB
 
 		self.assertEqual(6, len(union))
+
+
+class Lookup(TestCase):
+	_versionSet: VersionSet
+
+	def setUp(self) -> None:
+		self._versionSet = VersionSet([SemanticVersion(1, minor, micro) for minor in range(10) for micro in range(0, 10, 2)])
+
+	def test_Floor(self) -> None:
+		self.assertEqual(SemanticVersion(1, 2, 4), self._versionSet.Floor(SemanticVersion(1, 2, 4)))
+		self.assertEqual(SemanticVersion(1, 2, 4), self._versionSet.Floor(SemanticVersion(1, 2, 5)))
+		self.assertEqual(SemanticVersion(1, 9, 8), self._versionSet.Floor(SemanticVersion(3, 0, 0)))
+		self.assertIsNone(self._versionSet.Floor(SemanticVersion(0, 9, 0)))
+
+	def test_Ceiling(self) -> None:
+		self.assertEqual(SemanticVersion(1, 2, 4), self._versionSet.Ceiling(SemanticVersion(1, 2, 4)))
+		self.assertEqual(SemanticVersion(1, 2, 6), self._versionSet.Ceiling(SemanticVersion(1, 2, 5)))
+		self.assertEqual(SemanticVersion(1, 0, 0), self._versionSet.Ceiling(SemanticVersion(0, 9, 0)))
+		self.assertIsNone(self._versionSet.Ceiling(SemanticVersion(2, 0, 0)))
+
+	def test_Floor_WrongType(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = self._versionSet.Floor("1.2.3")
+
+		with self.assertRaises(TypeError):
+			_ = self._versionSet.Ceiling("1.2.3")
+
+	def test_Latest(self) -> None:
+		self.assertEqual(SemanticVersion(1, 9, 8), self._versionSet.Latest())
+		self.assertEqual(SemanticVersion(1, 4, 8), self._versionSet.Latest(lambda v: v.Minor < 5))
+		self.assertIsNone(self._versionSet.Latest(lambda v: v.Major > 1))
+		self.assertIsNone(VersionSet([]).Latest())
+
+	def test_Slice_Inclusive(self) -> None:
+		view = self._versionSet.Slice(VersionRange(SemanticVersion(1, 2, 0), SemanticVersion(1, 3, 0)))
+
+		self.assertIsInstance(view, VersionSetView)
+		self.assertIs(self._versionSet, view.VersionSet)
+		self.assertEqual(6, len(view))
+		self.assertEqual(SemanticVersion(1, 2, 0), view[0])
+		self.assertEqual(SemanticVersion(1, 3, 0), view[-1])
+		self.assertListEqual([v for v in self._versionSet if SemanticVersion(1, 2, 0) <= v <= SemanticVersion(1, 3, 0)], list(view))
+		self.assertListEqual(list(reversed(list(view))), list(reversed(view)))
+
+	def test_Slice_Exclusive(self) -> None:
+		versionRange = VersionRange(SemanticVersion(1, 2, 0), SemanticVersion(1, 3, 0), RangeBoundHandling.BothBoundsExclusive)
+		view = self._versionSet.Slice(versionRange)
+
+		self.assertEqual(4, len(view))
+		self.assertEqual(SemanticVersion(1, 2, 2), view[0])
+		self.assertEqual(SemanticVersion(1, 2, 8), view[-1])
+		self.assertIn(SemanticVersion(1, 2, 4), view)
+		self.assertNotIn(SemanticVersion(1, 3, 0), view)
+		self.assertNotIn(SemanticVersion(1, 2, 5), view)
+
+		with self.assertRaises(IndexError):
+			_ = view[4]
+
+	def test_Slice_Empty(self) -> None:
+		view = self._versionSet.Slice(VersionRange(SemanticVersion(2, 0, 0), SemanticVersion(3, 0, 0)))
+
+		self.assertEqual(0, len(view))
+		self.assertListEqual([], list(view))
+		self.assertEqual(0, len(view.ToVersionSet()))
+
+	def test_Slice_WrongType(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = self._versionSet.Slice((SemanticVersion(1, 0, 0), SemanticVersion(2, 0, 0)))
+
+	def test_ToVersionSet(self) -> None:
+		versionSet = self._versionSet.Slice(VersionRange(SemanticVersion(1, 2, 0), SemanticVersion(1, 3, 0))).ToVersionSet()
+
+		self.assertIsInstance(versionSet, VersionSet)
+		self.assertEqual(6, len(versionSet))
+
+	def test_Filter(self) -> None:
+		versionRange = VersionRange(SemanticVersion(1, 2, 0), SemanticVersion(1, 4, 0), RangeBoundHandling.UpperBoundExclusive)
+
+		self.assertEqual(10, len(list(self._versionSet.Filter(versionRange))))
+		self.assertListEqual(
+			[SemanticVersion(1, 2, 4), SemanticVersion(1, 3, 4)],
+			list(self._versionSet.Filter(versionRange, lambda v: v.Micro == 4))
+		)
@@ -0,0 +1,249 @@
+# ==================================================================================================================== #
+#             _____           _ _           __     __            _             _                                       #
+#  _ __  _   |_   _|__   ___ | (_)_ __   __ \ \   / /__ _ __ ___(_) ___  _ __ (_)_ __   __ _                           #
+# | '_ \| | | || |/ _ \ / _ \| | | '_ \ / _` \ \ / / _ \ '__/ __| |/ _ \| '_ \| | '_ \ / _` |                          #
+# | |_) | |_| || | (_) | (_) | | | | | | (_| |\ V /  __/ |  \__ \ | (_) | | | | | | | | (_| |                          #
+# | .__/ \__, ||_|\___/ \___/|_|_|_| |_|\__, (_)_/ \___|_|  |___/_|\___/|_| |_|_|_| |_|\__, |                          #
+# |_|    |___/                          |___/                                          |___/                           #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2025-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for package :mod:`pyTooling.Versioning`."""
+from unittest             import TestCase
+
+from pyTooling.Versioning import SemanticVersion, PythonVersion, CalendarVersion, VersionRange, RangeBoundHandling
+from pyTooling.Versioning import VersionSet, VersionSpecifier
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Parsing(TestCase):
+	def test_Any(self) -> None:
+		for specifierString in ("", "*", " * "):
+			with self.subTest(specifierString=specifierString):
+				specifier = VersionSpecifier.Parse(specifierString)
+
+				self.assertTrue(specifier.IsAny)
+				self.assertFalse(specifier.IsEmpty)
+				self.assertIn("0.0.1", specifier)
+				self.assertEqual("*", str(specifier))
+
+	def test_Exact(self) -> None:
+		for specifierString in ("1.2.3", "==1.2.3", "===1.2.3", "= 1.2.3"):
+			with self.subTest(specifierString=specifierString):
+				specifier = VersionSpecifier.Parse(specifierString)
+
+				self.assertIn("1.2.3", specifier)
+				self.assertNotIn("1.2.4", specifier)
+				self.assertEqual("==1.2.3", str(specifier))
+
+	def test_Ordered(self) -> None:
+		self.assertIn("1.2", VersionSpecifier.Parse(">=1.2"))
+		self.assertNotIn("1.2", VersionSpecifier.Parse(">1.2"))
+		self.assertIn("1.2.1", VersionSpecifier.Parse(">1.2"))
+		self.assertIn("1.2", VersionSpecifier.Parse("<=1.2"))
+		self.assertNotIn("1.2", VersionSpecifier.Parse("<1.2"))
+		self.assertIn("1.1.9", VersionSpecifier.Parse("<1.2"))
+
+	def test_LessThanExcludesPreReleases(self) -> None:
+		specifier = VersionSpecifier.Parse("<2.0")
+
+		self.assertIn("1.9.9", specifier)
+		self.assertNotIn("2.0.rc1", specifier)
+		self.assertIn("2.0.rc1", VersionSpecifier.Parse("<2.0.rc2"))
+
+	def test_Unequal(self) -> None:
+		specifier = VersionSpecifier.Parse("!=1.5")
+
+		self.assertEqual(2, len(specifier.Ranges))
+		self.assertIn("1.4", specifier)
+		self.assertNotIn("1.5.0", specifier)
+		self.assertIn("1.5.1", specifier)
+
+	def test_Wildcard(self) -> None:
+		specifier = VersionSpecifier.Parse("==1.5.*")
+
+		self.assertNotIn("1.4.9", specifier)
+		self.assertIn("1.5.0.rc1", specifier)
+		self.assertIn("1.5.0", specifier)
+		self.assertIn("1.5.99", specifier)
+		self.assertNotIn("1.6.0", specifier)
+
+		specifier = VersionSpecifier.Parse("!=1.5.*")
+
+		self.assertIn("1.4.9", specifier)
+		self.assertNotIn("1.5.3", specifier)
+		self.assertIn("1.6.0", specifier)
+
+	def test_Wildcard_WrongOperator(self) -> None:
+		with self.assertRaises(ValueError):
+			_ = VersionSpecifier.Parse(">=1.5.*")
+
+	def test_CompatibleRelease(self) -> None:
+		specifier = VersionSpecifier.Parse("~=1.4.5")
+
+		self.assertNotIn("1.4.4", specifier)
+		self.assertIn("1.4.5", specifier)
+		self.assertIn("1.4.99", specifier)
+		self.assertNotIn("1.5.0", specifier)
+
+		specifier = VersionSpecifier.Parse("~=1.4")
+
+		self.assertIn("1.9", specifier)
+		self.assertNotIn("2.0", specifier)
+
+		with self.assertRaises(ValueError):
+			_ = VersionSpecifier.Parse("~=1")
+
+	def test_Caret(self) -> None:
+		cases = (
+			("^1.2.3", "1.2.3", "1.99.0", "2.0.0"),
+			("^0.2.3", "0.2.3", "0.2.99", "0.3.0"),
+			("^0.0.3", "0.0.3", "0.0.3", "0.0.4"),
+			("^0.0", "0.0.0", "0.0.99", "0.1.0"),
+			("^1", "1.0.0", "1.99.99", "2.0.0"),
+		)
+		for specifierString, lowest, highest, excluded in cases:
+			with self.subTest(specifierString=specifierString):
+				specifier = VersionSpecifier.Parse(specifierString)
+
+				self.assertIn(lowest, specifier)
+				self.assertIn(highest, specifier)
+				self.assertNotIn(excluded, specifier)
+
+	def test_Tilde(self) -> None:
+		self.assertIn("1.2.9", VersionSpecifier.Parse("~1.2.3"))
+		self.assertNotIn("1.3.0", VersionSpecifier.Parse("~1.2.3"))
+		self.assertIn("1.9.0", VersionSpecifier.Parse("~1"))
+		self.assertNotIn("2.0.0", VersionSpecifier.Parse("~1"))
+
+	def test_Combined(self) -> None:
+		specifier = VersionSpecifier.Parse(">=1.2,<2.0,!=1.5.*")
+
+		self.assertEqual(2, len(specifier.Ranges))
+		for version in ("1.2", "1.4.9", "1.6", "1.99"):
+			with self.subTest(version=version):
+				self.assertIn(version, specifier)
+		for version in ("1.1", "1.5.0", "1.5.9", "2.0", "2.0.rc1"):
+			with self.subTest(version=version):
+				self.assertNotIn(version, specifier)
+
+	def test_Alternatives(self) -> None:
+		specifier = VersionSpecifier.Parse("<1.0 || >=2.0, <3.0 || ==5.0")
+
+		self.assertEqual(3, len(specifier.Ranges))
+		self.assertIn("0.9", specifier)
+		self.assertNotIn("1.5", specifier)
+		self.assertIn("2.5", specifier)
+		self.assertIn("5.0", specifier)
+
+	def test_Empty(self) -> None:
+		specifier = VersionSpecifier.Parse(">=2.0, <1.0")
+
+		self.assertTrue(specifier.IsEmpty)
+		self.assertFalse(specifier)
+		self.assertNotIn("1.5", specifier)
+		self.assertEqual("<empty>", str(specifier))
+
+	def test_InvalidVersion(self) -> None:
+		for specifierString in (">=abc", "==abc.*", "!=a.b.*"):
+			with self.subTest(specifierString=specifierString):
+				with self.assertRaises(ValueError) as ex:
+					_ = VersionSpecifier.Parse(specifierString)
+
+				self.assertIn(f"Invalid version in clause '{specifierString}'", str(ex.exception))
+
+	def test_WrongTypes(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = VersionSpecifier.Parse(None)
+
+		with self.assertRaises(TypeError):
+			_ = VersionSpecifier.Parse(">=2024.1", CalendarVersion)
+
+	def test_Cache(self) -> None:
+		self.assertIs(VersionSpecifier.Parse(">=1.2, <2"), VersionSpecifier.Parse(">=1.2, <2"))
+		self.assertIsNot(VersionSpecifier.Parse(">=1.2, <2"), VersionSpecifier.Parse(">=1.2, <2", PythonVersion))
+
+	def test_PythonVersion(self) -> None:
+		specifier = VersionSpecifier.Parse(">=3.10", PythonVersion)
+
+		self.assertIs(PythonVersion, specifier.VersionClass)
+		self.assertIn("3.12.1", specifier)
+
+
+class Operations(TestCase):
+	def test_Intersection(self) -> None:
+		specifier = VersionSpecifier.Parse(">=1.2") & VersionSpecifier.Parse("<2.0, !=1.5")
+
+		self.assertEqual(VersionSpecifier.Parse(">=1.2, <2.0, !=1.5"), specifier)
+		self.assertTrue((VersionSpecifier.Parse("<1") & VersionSpecifier.Parse(">=1")).IsEmpty)
+
+	def test_Union(self) -> None:
+		specifier = VersionSpecifier.Parse(">=1.0, <2.0") | VersionSpecifier.Parse(">=1.5, <3.0")
+
+		self.assertEqual(1, len(specifier.Ranges))
+		self.assertEqual(VersionSpecifier.Parse(">=1.0, <3.0"), specifier)
+
+	def test_Union_Adjacent(self) -> None:
+		specifier = VersionSpecifier.Parse("<=1.5") | VersionSpecifier.Parse(">1.5")
+
+		self.assertTrue(specifier.IsAny)
+
+	def test_WrongType(self) -> None:
+		with self.assertRaises(TypeError):
+			_ = VersionSpecifier.Parse(">=1.0") & ">=2.0"
+
+		with self.assertRaises(TypeError):
+			_ = VersionSpecifier.Parse(">=1.0") | ">=2.0"
+
+		with self.assertRaises(TypeError):
+			_ = 1 in VersionSpecifier.Parse(">=1.0")
+
+	def test_Hash(self) -> None:
+		self.assertEqual(hash(VersionSpecifier.Parse(">=1.0,<2.0")), hash(VersionSpecifier.Parse("<2.0, >=1.0")))
+
+	def test_FromRanges(self) -> None:
+		specifier = VersionSpecifier((
+			VersionRange(SemanticVersion(2, 0), SemanticVersion(3, 0), RangeBoundHandling.UpperBoundExclusive),
+			VersionRange(SemanticVersion(1, 0), SemanticVersion(2, 0), RangeBoundHandling.UpperBoundExclusive),
+		))
+
+		self.assertEqual(1, len(specifier.Ranges))
+		self.assertEqual(SemanticVersion(1, 0), specifier.Ranges[0].LowerBound)
+		self.assertEqual(SemanticVersion(3, 0), specifier.Ranges[0].UpperBound)
+
+		with self.assertRaises(TypeError):
+			_ = VersionSpecifier((SemanticVersion(1, 0), ))
+
+	def test_Filter(self) -> None:
+		versions = VersionSet([SemanticVersion(1, minor, micro) for minor in range(10) for micro in range(3)])
+		specifier = VersionSpecifier.Parse(">=1.2, <1.5, !=1.3.1")
+
+		self.assertListEqual([v for v in versions if v in specifier], list(specifier.Filter(versions)))
+
+		with self.assertRaises(TypeError):
+			_ = specifier.Filter([SemanticVersion(1, 0)])